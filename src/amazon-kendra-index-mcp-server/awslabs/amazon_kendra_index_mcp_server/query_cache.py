@@ -0,0 +1,149 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+"""Cache of Amazon Kendra query responses."""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+
+# Seconds during which a response is reused, 0 to disable the cache
+DEFAULT_QUERY_CACHE_TTL = 300
+# Maximum number of cached responses
+DEFAULT_QUERY_CACHE_SIZE = 256
+
+
+def query_cache_key(
+    api: str,
+    region: str,
+    index_id: str,
+    query: str,
+    attribute_filter: Optional[Dict[str, Any]],
+    page_number: int,
+    page_size: int,
+) -> Tuple[Hashable, ...]:
+    """Build the cache key of a page of results of a Kendra Query or Retrieve call."""
+    filter_key = json.dumps(attribute_filter, sort_keys=True, default=str)
+    return (api, region, index_id, query, filter_key, page_number, page_size)
+
+
+class QueryCache:
+    """Least recently used cache of Kendra responses, expiring after a TTL.
+
+    A response being fetched is shared by every caller asking for it, so that a page prefetched
+    in the background is not requested again when it is asked for before the prefetch completes.
+    Failed calls are not cached.
+    """
+
+    def __init__(
+        self, ttl: float = DEFAULT_QUERY_CACHE_TTL, max_size: int = DEFAULT_QUERY_CACHE_SIZE
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds during which a response is reused, 0 to disable the cache
+            max_size: Maximum number of cached responses
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._pending: Dict[Hashable, asyncio.Task] = {}
+        # Background prefetches, referenced until they complete
+        self._prefetches: Set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are cached."""
+        return self.ttl > 0 and self.max_size > 0
+
+    def _lookup(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _store(self, key: Hashable, response: Dict[str, Any]):
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check whether a response is cached or being fetched."""
+        return key in self._pending or self._lookup(key) is not None
+
+    async def get(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Get a cached response, or fetch and cache it.
+
+        Args:
+            key: Cache key of the response
+            fetch: Fetches the response
+
+        Returns:
+            The response
+        """
+        if not self.enabled:
+            return await fetch()
+
+        response = self._lookup(key)
+        if response is not None:
+            self.hits += 1
+            return response
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        task = asyncio.ensure_future(self._fetch(key, fetch))
+        self._pending[key] = task
+        return await asyncio.shield(task)
+
+    def prefetch(self, key: Hashable, fetch: Callable[[], Awaitable[Dict[str, Any]]]):
+        """Fetch and cache a response in the background, unless it is cached or being fetched.
+
+        Args:
+            key: Cache key of the response
+            fetch: Fetches the response
+        """
+        if not self.enabled or key in self:
+            return
+        task = asyncio.ensure_future(self._fetch(key, fetch))
+        self._pending[key] = task
+        self._prefetches.add(task)
+        # Failed prefetches are not reported, the page is fetched again when asked for
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        task.add_done_callback(self._prefetches.discard)
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Dict[str, Any]]]):
+        try:
+            response = await fetch()
+            self._store(key, response)
+            return response
+        finally:
+            self._pending.pop(key, None)
+
+    def clear(self):
+        """Forget all the cached responses and statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -11,10 +11,28 @@
 
 """awslabs amazon-kendra-index-mcp-server MCP Server implementation."""
 
+import asyncio
 import os
+from awslabs.amazon_kendra_index_mcp_server.query_cache import (
+    DEFAULT_QUERY_CACHE_SIZE,
+    DEFAULT_QUERY_CACHE_TTL,
+    QueryCache,
+    query_cache_key,
+)
 from awslabs.amazon_kendra_index_mcp_server.util import get_kendra_client
 from mcp.server.fastmcp import FastMCP
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
+
+
+# Largest page of results of a Query or Retrieve call
+MAX_PAGE_SIZE = 100
+# Kendra returns at most this many results of a query, over all pages
+MAX_QUERY_RESULTS = 100
+
+kendra_query_cache = QueryCache(
+    ttl=float(os.environ.get('KENDRA_QUERY_CACHE_TTL', DEFAULT_QUERY_CACHE_TTL)),
+    max_size=int(os.environ.get('KENDRA_QUERY_CACHE_SIZE', DEFAULT_QUERY_CACHE_SIZE)),
+)
 
 
 mcp = FastMCP(
@@ -98,40 +116,120 @@ async def kendra_list_indexes_tool(
         return {'error': str(e), 'region': region or os.environ.get('AWS_REGION', 'us-east-1')}
 
 
+async def get_results_page(
+    api: Literal['query', 'retrieve'],
+    query: str,
+    index_id: str,
+    region: Optional[str],
+    attribute_filter: Optional[Dict[str, Any]],
+    page_number: int,
+    page_size: int,
+) -> Dict[str, Any]:
+    """Get a page of results of a Kendra Query or Retrieve call, through the query cache.
+
+    Once a page is returned, the next page, if any, is fetched in the background, so that it is
+    cached when asked for.
+
+    Parameters:
+        api (str): The Kendra API to call, 'query' or 'retrieve'.
+        query (str): The search query to send to Amazon Kendra.
+        index_id (str): The indexId of the Kendra index to send the search query to.
+        region (str, optional): The region of the Kendra Index, the configured region if not set.
+        attribute_filter (dict, optional): The Kendra AttributeFilter of the documents to search.
+        page_number (int): The number of the page of results, starting at 1.
+        page_size (int): The number of results of each page.
+
+    Returns:
+        The Kendra response.
+    """
+    if page_number < 1:
+        raise ValueError('page_number must be at least 1.')
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f'page_size must be between 1 and {MAX_PAGE_SIZE}.')
+    cache_region = region or os.environ.get('AWS_REGION', 'us-east-1')
+
+    def page(number: int):
+        async def fetch() -> Dict[str, Any]:
+            if region:
+                kendra_client = get_kendra_client(region)
+            else:
+                kendra_client = get_kendra_client()
+            request: Dict[str, Any] = {
+                'IndexId': index_id,
+                'QueryText': query,
+                'PageNumber': number,
+                'PageSize': page_size,
+            }
+            if attribute_filter:
+                request['AttributeFilter'] = attribute_filter
+            return await asyncio.to_thread(getattr(kendra_client, api), **request)
+
+        key = query_cache_key(
+            api, cache_region, index_id, query, attribute_filter, number, page_size
+        )
+        return key, fetch
+
+    response = await kendra_query_cache.get(*page(page_number))
+
+    fetched = page_number * page_size
+    if api == 'query':
+        has_next_page = fetched < min(response.get('TotalNumberOfResults', 0), MAX_QUERY_RESULTS)
+    else:
+        # Retrieve does not count the results, a full page may be followed by another one
+        has_next_page = (
+            len(response.get('ResultItems', [])) == page_size and fetched < MAX_QUERY_RESULTS
+        )
+    if has_next_page:
+        kendra_query_cache.prefetch(*page(page_number + 1))
+    return response
+
+
 @mcp.tool(name='KendraQueryTool')
 async def kendra_query_tool(
     query: str,
     region: Optional[str] = None,
     indexId: Optional[str] = None,
+    page_number: int = 1,
+    page_size: int = 10,
+    attribute_filter: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """Query Amazon Kendra and retrieve content from the response.
 
     This tool queries the specified Amazon Kendra index with the provided query
     and returns the search results. The specified Kendra Index is either provided by the user in the chat, or the default index configured in the environemnt variables
 
+    Results are returned one page at a time. When total_results_count is larger than the results
+    seen so far, call the tool again with the next page_number to get more results. Responses
+    are cached, so asking the same query again, or for the next page, does not query Kendra
+    again.
+
     Parameters:
         query (str): The search query to send to Amazon Kendra.
         region (str): The region of the Kendra Index to send the search query to.
         indexId (str): The indexId of the Kendra index to send the search query to.
+        page_number (int): The number of the page of results to return, starting at 1.
+        page_size (int): The number of results of each page, at most 100.
+        attribute_filter (dict, optional): A Kendra AttributeFilter to only search some documents,
+            e.g. {"EqualsTo": {"Key": "_language_code", "Value": {"StringValue": "en"}}}.
 
     Returns:
         Dict containing the query results from Amazon Kendra.
     """
     kendra_index_id = indexId or os.getenv('KENDRA_INDEX_ID')
     try:
-        if region:
-            kendra_client = get_kendra_client(region)
-        else:
-            kendra_client = get_kendra_client()
         if not kendra_index_id:
             raise ValueError('KENDRA_INDEX_ID environment variable is not set.')
         # Query the Kendra index
-        response = kendra_client.query(IndexId=kendra_index_id, QueryText=query)
+        response = await get_results_page(
+            'query', query, kendra_index_id, region, attribute_filter, page_number, page_size
+        )
 
         # Process and return the results
         results = {
             'query': query,
             'total_results_count': response.get('TotalNumberOfResults', 0),
+            'page_number': page_number,
+            'page_size': page_size,
             'results': [],
         }
 
@@ -161,6 +259,66 @@ async def kendra_query_tool(
         return {'error': str(e), 'query': query, 'index_id': kendra_index_id}
 
 
+@mcp.tool(name='KendraRetrieveTool')
+async def kendra_retrieve_tool(
+    query: str,
+    region: Optional[str] = None,
+    indexId: Optional[str] = None,
+    page_number: int = 1,
+    page_size: int = 10,
+    attribute_filter: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Retrieve relevant passages from an Amazon Kendra index.
+
+    This tool uses the Kendra Retrieve API, which returns longer passages of the most relevant
+    documents than the excerpts of the KendraQueryTool, and more of them, which makes it better
+    suited to gather context for an answer. It does not return suggested answers or FAQs.
+
+    Results are returned one page at a time, call the tool again with the next page_number to get
+    more passages. Responses are cached, so asking the same query again, or for the next page,
+    does not query Kendra again.
+
+    Parameters:
+        query (str): The search query to send to Amazon Kendra.
+        region (str): The region of the Kendra Index to send the search query to.
+        indexId (str): The indexId of the Kendra index to send the search query to.
+        page_number (int): The number of the page of passages to return, starting at 1.
+        page_size (int): The number of passages of each page, at most 100.
+        attribute_filter (dict, optional): A Kendra AttributeFilter to only search some documents.
+
+    Returns:
+        Dict containing the passages retrieved from Amazon Kendra.
+    """
+    kendra_index_id = indexId or os.getenv('KENDRA_INDEX_ID')
+    try:
+        if not kendra_index_id:
+            raise ValueError('KENDRA_INDEX_ID environment variable is not set.')
+        response = await get_results_page(
+            'retrieve', query, kendra_index_id, region, attribute_filter, page_number, page_size
+        )
+
+        results = {
+            'query': query,
+            'page_number': page_number,
+            'page_size': page_size,
+            'results': [
+                {
+                    'id': item.get('Id'),
+                    'document_id': item.get('DocumentId'),
+                    'document_title': item.get('DocumentTitle', ''),
+                    'document_uri': item.get('DocumentURI', ''),
+                    'content': item.get('Content', ''),
+                    'score': item.get('ScoreAttributes', {}).get('ScoreConfidence', ''),
+                }
+                for item in response.get('ResultItems', [])
+            ],
+        }
+        return results
+
+    except Exception as e:
+        return {'error': str(e), 'query': query, 'index_id': kendra_index_id}
+
+
 def main():
     """Run the MCP server with CLI argument support."""
     mcp.run()
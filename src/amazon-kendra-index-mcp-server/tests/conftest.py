@@ -0,0 +1,22 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+"""Test fixtures for the amazon-kendra-index-mcp-server tests."""
+
+import pytest
+from awslabs.amazon_kendra_index_mcp_server.server import kendra_query_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_query_cache():
+    """Query Kendra again in each test."""
+    kendra_query_cache.clear()
+    yield
+    kendra_query_cache.clear()
@@ -0,0 +1,109 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+"""Tests for the query cache of the amazon-kendra-index-mcp-server MCP Server."""
+
+import asyncio
+import pytest
+from awslabs.amazon_kendra_index_mcp_server.query_cache import QueryCache, query_cache_key
+
+
+def test_query_cache_key_ignores_filter_key_order():
+    """Test that filters with the same content have the same key."""
+    first = query_cache_key('query', 'us-east-1', 'index-1', 'q', {'a': 1, 'b': 2}, 1, 10)
+    second = query_cache_key('query', 'us-east-1', 'index-1', 'q', {'b': 2, 'a': 1}, 1, 10)
+    assert first == second
+    assert first != query_cache_key('retrieve', 'us-east-1', 'index-1', 'q', {'a': 1}, 1, 10)
+
+
+@pytest.mark.asyncio
+async def test_query_cache_expires_entries(mocker):
+    """Test that responses are fetched again once the TTL has expired."""
+    cache = QueryCache(ttl=60)
+    fetch = mocker.AsyncMock(return_value={'ResultItems': []})
+    monotonic = mocker.patch(
+        'awslabs.amazon_kendra_index_mcp_server.query_cache.time.monotonic', return_value=0
+    )
+
+    await cache.get('key', fetch)
+    monotonic.return_value = 59
+    await cache.get('key', fetch)
+    assert fetch.await_count == 1
+
+    monotonic.return_value = 61
+    await cache.get('key', fetch)
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_query_cache_evicts_least_recently_used(mocker):
+    """Test that the least recently used response is evicted when the cache is full."""
+    cache = QueryCache(max_size=2)
+    fetch = mocker.AsyncMock(return_value={})
+
+    await cache.get('a', fetch)
+    await cache.get('b', fetch)
+    await cache.get('a', fetch)
+    await cache.get('c', fetch)
+
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+
+
+@pytest.mark.asyncio
+async def test_query_cache_shares_pending_fetch():
+    """Test that a prefetched response is not fetched again while it is pending."""
+    cache = QueryCache()
+    released = asyncio.Event()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await released.wait()
+        return {'page': 2}
+
+    cache.prefetch('page-2', fetch)
+    cache.prefetch('page-2', fetch)
+    waiting = asyncio.ensure_future(cache.get('page-2', fetch))
+    await asyncio.sleep(0)
+    released.set()
+
+    assert await waiting == {'page': 2}
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_query_cache_does_not_cache_errors(mocker):
+    """Test that failed fetches are not cached, and failed prefetches are retried."""
+    cache = QueryCache()
+    fetch = mocker.AsyncMock(side_effect=[Exception('throttled'), Exception('throttled'), {}])
+
+    with pytest.raises(Exception, match='throttled'):
+        await cache.get('key', fetch)
+    cache.prefetch('key', fetch)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert await cache.get('key', fetch) == {}
+    assert fetch.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_query_cache_disabled(mocker):
+    """Test that a TTL of 0 fetches every response."""
+    cache = QueryCache(ttl=0)
+    fetch = mocker.AsyncMock(return_value={})
+
+    await cache.get('key', fetch)
+    await cache.get('key', fetch)
+    cache.prefetch('key', fetch)
+
+    assert fetch.await_count == 2
@@ -10,10 +10,13 @@
 # and limitations under the License.
 """Tests for the amazon-kendra-index-mcp-server MCP Server."""
 
+import asyncio
 import pytest
 from awslabs.amazon_kendra_index_mcp_server.server import (
     kendra_list_indexes_tool,
+    kendra_query_cache,
     kendra_query_tool,
+    kendra_retrieve_tool,
 )
 from datetime import datetime
 
@@ -62,6 +65,8 @@ async def test_kendra_query_tool(mocker):
     expected_result = {
         'query': test_query,
         'total_results_count': 2,
+        'page_number': 1,
+        'page_size': 10,
         'results': [
             {
                 'id': 'result-1',
@@ -294,3 +299,147 @@ async def test_lkendra_list_indexes_tool_error_handling(mocker):
     # Assert
     assert result == expected_error_response
     mock_kendra_client.list_indices.assert_called_once()
+
+
+def make_query_response(total, page_number, page_size):
+    """Create a Kendra Query response holding a page of results."""
+    first = (page_number - 1) * page_size
+    return {
+        'TotalNumberOfResults': total,
+        'ResultItems': [
+            {
+                'Id': f'result-{i}',
+                'Type': 'DOCUMENT',
+                'DocumentTitle': {'Text': f'Document {i}'},
+                'DocumentURI': f'https://example.com/doc{i}',
+                'ScoreAttributes': {'ScoreConfidence': 'HIGH'},
+            }
+            for i in range(first, min(first + page_size, total))
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_kendra_query_tool_caches_results(mocker):
+    """Test that asking the same query again returns the cached results."""
+    mocker.patch.dict('os.environ', {'KENDRA_INDEX_ID': 'index-1'})
+    mock_kendra_client = mocker.Mock()
+    mock_kendra_client.query.return_value = make_query_response(2, 1, 10)
+    mocker.patch('boto3.client', return_value=mock_kendra_client)
+
+    first = await kendra_query_tool('test query')
+    second = await kendra_query_tool('test query')
+    filtered = await kendra_query_tool(
+        'test query',
+        attribute_filter={'EqualsTo': {'Key': 'lang', 'Value': {'StringValue': 'en'}}},
+    )
+
+    assert first == second == filtered
+    assert mock_kendra_client.query.call_count == 2
+    assert kendra_query_cache.hits == 1
+    assert mock_kendra_client.query.call_args.kwargs['AttributeFilter'] == {
+        'EqualsTo': {'Key': 'lang', 'Value': {'StringValue': 'en'}}
+    }
+
+
+@pytest.mark.asyncio
+async def test_kendra_query_tool_prefetches_next_page(mocker):
+    """Test that the next page of results is fetched in the background and then reused."""
+    mocker.patch.dict('os.environ', {'KENDRA_INDEX_ID': 'index-1'})
+    mock_kendra_client = mocker.Mock()
+    mock_kendra_client.query.side_effect = lambda PageNumber, PageSize, **kwargs: (
+        make_query_response(25, PageNumber, PageSize)
+    )
+    mocker.patch('boto3.client', return_value=mock_kendra_client)
+
+    first_page = await kendra_query_tool('test query', page_size=10)
+    second_page = await kendra_query_tool('test query', page_number=2, page_size=10)
+    third_page = await kendra_query_tool('test query', page_number=3, page_size=10)
+    await asyncio.sleep(0)
+
+    assert [item['id'] for item in first_page['results']] == [f'result-{i}' for i in range(10)]
+    assert second_page['page_number'] == 2
+    assert second_page['results'][0]['id'] == 'result-10'
+    assert [item['id'] for item in third_page['results']] == [f'result-{i}' for i in range(20, 25)]
+    # The last page holds the last results, so no fourth page is fetched
+    assert [call.kwargs['PageNumber'] for call in mock_kendra_client.query.call_args_list] == [
+        1,
+        2,
+        3,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_kendra_query_tool_invalid_page_size(mocker):
+    """Test that a page size above the Kendra limit is reported as an error."""
+    mocker.patch.dict('os.environ', {'KENDRA_INDEX_ID': 'index-1'})
+    mock_kendra_client = mocker.Mock()
+    mocker.patch('boto3.client', return_value=mock_kendra_client)
+
+    result = await kendra_query_tool('test query', page_size=101)
+
+    assert result == {
+        'error': 'page_size must be between 1 and 100.',
+        'query': 'test query',
+        'index_id': 'index-1',
+    }
+    mock_kendra_client.query.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_kendra_retrieve_tool(mocker):
+    """Test the kendra_retrieve_tool function returns the passages of the Retrieve API."""
+    mocker.patch.dict('os.environ', {'KENDRA_INDEX_ID': 'index-1'})
+    mock_kendra_client = mocker.Mock()
+    mock_kendra_client.retrieve.return_value = {
+        'QueryId': 'query-1',
+        'ResultItems': [
+            {
+                'Id': 'passage-1',
+                'DocumentId': 'doc-1',
+                'DocumentTitle': 'Test Document 1',
+                'DocumentURI': 'https://example.com/doc1',
+                'Content': 'A longer passage of document 1',
+                'ScoreAttributes': {'ScoreConfidence': 'VERY_HIGH'},
+            }
+        ],
+    }
+    mocker.patch('boto3.client', return_value=mock_kendra_client)
+
+    result = await kendra_retrieve_tool('test query', page_size=5)
+
+    assert result == {
+        'query': 'test query',
+        'page_number': 1,
+        'page_size': 5,
+        'results': [
+            {
+                'id': 'passage-1',
+                'document_id': 'doc-1',
+                'document_title': 'Test Document 1',
+                'document_uri': 'https://example.com/doc1',
+                'content': 'A longer passage of document 1',
+                'score': 'VERY_HIGH',
+            }
+        ],
+    }
+    mock_kendra_client.retrieve.assert_called_once_with(
+        IndexId='index-1', QueryText='test query', PageNumber=1, PageSize=5
+    )
+
+
+@pytest.mark.asyncio
+async def test_kendra_retrieve_tool_error_handling(mocker):
+    """Test the kendra_retrieve_tool function handles errors from Kendra client."""
+    mocker.patch.dict('os.environ', {'KENDRA_INDEX_ID': 'index-1'})
+    mock_kendra_client = mocker.Mock()
+    mock_kendra_client.retrieve.side_effect = Exception('Kendra service error')
+    mocker.patch('boto3.client', return_value=mock_kendra_client)
+
+    result = await kendra_retrieve_tool('test query')
+
+    assert result == {
+        'error': 'Kendra service error',
+        'query': 'test query',
+        'index_id': 'index-1',
+    }
@@ -16,6 +16,7 @@
 import boto3
 import botocore.session
 import inspect
+import json
 import os
 import sys
 from botocore.exceptions import ClientError
@@ -28,6 +29,16 @@ from typing import Annotated, Any, Callable, Dict, List
 BOTO3_CLIENT_GETTER = Callable[[str], Any]
 OVERRIDE_FUNC_TYPE = Callable[[FastMCP, BOTO3_CLIENT_GETTER, str], None]
 VALIDATOR = Callable[[FastMCP, Any, Dict[str, Any]], tuple[bool, str | None]]
+# Name, type, whether it is required and documentation of an input parameter of an operation
+INPUT_PARAMETER = tuple[str, str, bool, str]
+
+OPERATION_METADATA_VERSION = 1
+
+# Directory of the operation metadata files, empty to read the botocore service model on every start
+OPERATION_METADATA_CACHE_DIR = os.environ.get(
+    'OPERATION_METADATA_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'awslabs-amazon-mq-mcp-server'),
+)
 
 
 class AWSToolGenerator:
@@ -55,6 +66,8 @@ class AWSToolGenerator:
         self.service_display_name = service_display_name or service_name.upper()
         self.mcp = mcp
         self.clients: Dict[str, Any] = {}
+        # botocore model of the service, loaded on first use
+        self.service_model: Any = None
         self.tool_configuration = tool_configuration or {}
         self.skip_param_documentation = skip_param_documentation
         self.__validate_tool_configuration()
@@ -68,28 +81,93 @@ class AWSToolGenerator:
         return self.mcp
 
     def __register_operations(self):
-        for operation in self.__get_operations():
-            if operation not in self.tool_configuration:
-                func = self.__create_operation_function(operation)
-                if func is not None:
-                    self.mcp.tool(description=func.__doc__)(func)
-            else:
-                config = self.tool_configuration[operation]
-                if config.get('ignore'):
-                    continue
-                if config.get('func_override') is not None:
-                    fn = config.get('func_override')
-                    assert fn is not None
-                    self.__handle_function_override(operation, fn)
-                    continue
-                func = self.__create_operation_function(
-                    operation,
-                    config.get('documentation_override'),
-                    config.get('validator'),
+        for operation, input_parameters in self.__get_operation_metadata().items():
+            config = self.tool_configuration.get(operation, {})
+            if config.get('ignore'):
+                continue
+            if config.get('func_override') is not None:
+                fn = config.get('func_override')
+                assert fn is not None
+                self.__handle_function_override(operation, fn)
+                continue
+            if input_parameters is None:
+                print(
+                    f'operation model for: {operation} not found, skipping tool creation',
+                    file=sys.stderr,
                 )
-                if func is not None:
-                    self.mcp.tool(description=func.__doc__)(func)
                 continue
+            func = self.__create_operation_function(
+                operation,
+                config.get('documentation_override'),
+                config.get('validator'),
+                input_parameters=input_parameters,
+            )
+            if func is not None:
+                self.mcp.tool(description=func.__doc__)(func)
+
+    def __get_operation_metadata(self) -> Dict[str, List[INPUT_PARAMETER] | None]:
+        """Get the input parameters of all the operations, None for those without a model.
+
+        They are read from the botocore service model the first time the server runs with a
+        given botocore version, then loaded from a cache file, so that starting the server
+        neither creates a client nor loads the service model.
+        """
+        path = self.__get_operation_metadata_path()
+        operations = self.__load_operation_metadata_file(path) if path else None
+        if operations is None:
+            operations = {}
+            for operation in self.__get_operations():
+                try:
+                    operations[operation] = self.__get_operation_input_parameters(operation)
+                except Exception:
+                    operations[operation] = None
+            if path:
+                self.__save_operation_metadata_file(path, operations)
+        return operations
+
+    def __get_operation_metadata_path(self) -> str | None:
+        """Get the path of the operation metadata file of the installed botocore version."""
+        if not OPERATION_METADATA_CACHE_DIR:
+            return None
+        documentation = '-nodoc' if self.skip_param_documentation else ''
+        return os.path.join(
+            OPERATION_METADATA_CACHE_DIR,
+            f'{self.service_name}-botocore-{botocore.__version__}{documentation}.json',
+        )
+
+    def __load_operation_metadata_file(
+        self, path: str
+    ) -> Dict[str, List[INPUT_PARAMETER] | None] | None:
+        """Load the operation metadata file, None if it does not exist or is not valid."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('version') != OPERATION_METADATA_VERSION:
+                return None
+            return {
+                operation: None
+                if parameters is None
+                else [tuple(parameter) for parameter in parameters]
+                for operation, parameters in cache['operations'].items()
+            }
+        except Exception as e:
+            print(f'Error loading operation metadata from {path}: {e}', file=sys.stderr)
+            return None
+
+    def __save_operation_metadata_file(
+        self, path: str, operations: Dict[str, List[INPUT_PARAMETER] | None]
+    ):
+        """Write the operation metadata file."""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temporary_path = f'{path}.{os.getpid()}.tmp'
+            with open(temporary_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': OPERATION_METADATA_VERSION, 'operations': operations}, f)
+            os.replace(temporary_path, path)
+        except Exception as e:
+            print(f'Error saving operation metadata to {path}: {e}', file=sys.stderr)
 
     def __get_client(self, region: str = 'us-east-1') -> Any:
         """Get or create a service client for the specified region."""
@@ -126,6 +204,7 @@ class AWSToolGenerator:
         operation: str,
         documentation_override: str | None = None,
         validator: Any = None,
+        input_parameters: List[INPUT_PARAMETER] | None = None,
     ) -> Callable | None:
         """Create a function for a specific service operation."""
         # Get information about parameters and their types
@@ -143,7 +222,8 @@ class AWSToolGenerator:
             'map': {},
         }
         try:
-            input_parameters = self.__get_operation_input_parameters(operation)
+            if input_parameters is None:
+                input_parameters = self.__get_operation_input_parameters(operation)
             for param_tuple in input_parameters:
                 param_name = param_tuple[0]
                 param_type = param_tuple[1]
@@ -226,13 +306,12 @@ class AWSToolGenerator:
 
         return operation_function
 
-    def __get_operation_input_parameters(
-        self, operation_name: str
-    ) -> List[tuple[str, str, bool, str]]:
+    def __get_operation_input_parameters(self, operation_name: str) -> List[INPUT_PARAMETER]:
         """Return a list of input parameter names for a given operation."""
-        session = botocore.session.get_session()
-        service_model = session.get_service_model(self.service_name)
-        op_model = service_model.operation_model(self.__snake_to_camel(operation_name))
+        if self.service_model is None:
+            session = botocore.session.get_session()
+            self.service_model = session.get_service_model(self.service_name)
+        op_model = self.service_model.operation_model(self.__snake_to_camel(operation_name))
         input_shape = op_model.input_shape
         if not input_shape:
             return []
@@ -0,0 +1,52 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+"""Script to measure the time to register all tools, with and without the operation metadata cache."""
+
+import tempfile
+import time
+from awslabs.amazon_mq_mcp_server import aws_service_mcp_generator
+from awslabs.amazon_mq_mcp_server.aws_service_mcp_generator import AWSToolGenerator
+from mcp.server.fastmcp import FastMCP
+
+
+def measure(cache_dir: str) -> float:
+    """Register the Amazon MQ tools on a new server, returning the elapsed seconds."""
+    aws_service_mcp_generator.OPERATION_METADATA_CACHE_DIR = cache_dir
+    started = time.perf_counter()
+    generator = AWSToolGenerator(
+        service_name='mq',
+        service_display_name='AmazonMQ',
+        mcp=FastMCP(),
+        tool_configuration={
+            operation: {'ignore': True}
+            for operation in [
+                'close',
+                'can_paginate',
+                'generate_presigned_url',
+                'get_paginator',
+                'get_waiter',
+            ]
+        },
+    )
+    generator.generate()
+    return time.perf_counter() - started
+
+
+def main():
+    """Print the registration time without cache, with an empty cache and with a filled cache."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        print(f'Without cache:    {measure(""):.3f}s')
+        print(f'Empty cache:      {measure(cache_dir):.3f}s')
+        print(f'Filled cache:     {measure(cache_dir):.3f}s')
+
+
+if __name__ == '__main__':
+    main()
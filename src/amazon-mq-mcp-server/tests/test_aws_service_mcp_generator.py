@@ -491,6 +491,58 @@ class TestAWSToolGenerator(unittest.TestCase):
         # Verify that documentation is empty when skip_param_documentation=True
         self.assertEqual(params_without_docs[0][3], '')
 
+    @patch('awslabs.amazon_mq_mcp_server.aws_service_mcp_generator.boto3.Session')
+    @patch('awslabs.amazon_mq_mcp_server.aws_service_mcp_generator.botocore.session.get_session')
+    def test_operation_metadata_cache(self, mock_botocore_session, mock_boto3_session):
+        """Test that operation metadata is read from the service model only once."""
+        import os
+        from awslabs.amazon_mq_mcp_server.aws_service_mcp_generator import (
+            OPERATION_METADATA_CACHE_DIR,
+        )
+
+        mock_boto3_session.return_value = self.boto3_session_mock
+        member_shape_mock = MagicMock(type_name='integer', documentation='Test documentation')
+        input_shape_mock = MagicMock()
+        input_shape_mock.members = {'param1': member_shape_mock}
+        input_shape_mock.required_members = ['param1']
+        service_model_mock = MagicMock()
+        service_model_mock.operation_model.side_effect = lambda name: (
+            MagicMock(input_shape=input_shape_mock) if name == 'GetQueueUrl' else 1 / 0
+        )
+        mock_botocore_session.return_value.get_service_model.return_value = service_model_mock
+        self.boto3_client_mock.get_queue_url = MagicMock()
+        self.boto3_client_mock.close = MagicMock()
+        self.boto3_client_mock.__dir__ = MagicMock(return_value=['close', 'get_queue_url'])
+
+        def generate():
+            mcp_mock = MagicMock()
+            mcp_mock.tool = MagicMock(return_value=lambda x: x)
+            generator = AWSToolGenerator(
+                service_name='sqs',
+                service_display_name='SQS',
+                mcp=mcp_mock,
+            )
+            generator.generate()
+            return [call.kwargs['description'] for call in mcp_mock.tool.call_args_list]
+
+        self.assertEqual(generate(), ['Execute the AWS SQS `get_queue_url` operation.'])
+        self.assertEqual(len(os.listdir(OPERATION_METADATA_CACHE_DIR)), 1)
+        self.assertEqual(mock_botocore_session.call_count, 1)
+
+        # Later starts neither create a client nor load the service model
+        mock_boto3_session.reset_mock()
+        mock_botocore_session.side_effect = AssertionError('service model loaded')
+        self.assertEqual(generate(), ['Execute the AWS SQS `get_queue_url` operation.'])
+        mock_boto3_session.assert_not_called()
+
+        # A corrupted file is rebuilt
+        (cache_file,) = os.listdir(OPERATION_METADATA_CACHE_DIR)
+        with open(os.path.join(OPERATION_METADATA_CACHE_DIR, cache_file), 'w') as f:
+            f.write('{')
+        mock_botocore_session.side_effect = None
+        self.assertEqual(generate(), ['Execute the AWS SQS `get_queue_url` operation.'])
+        self.assertEqual(mock_botocore_session.call_count, 2)
+
 
 def test_hello_world():
     """Basic test to verify test setup is working."""
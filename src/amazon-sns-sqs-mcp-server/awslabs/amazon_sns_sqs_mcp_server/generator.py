@@ -16,8 +16,10 @@
 import boto3
 import botocore.session
 import inspect
+import json
 import os
 import sys
+import time
 from botocore.config import Config
 from botocore.exceptions import ClientError
 from mcp.server.fastmcp import FastMCP
@@ -29,6 +31,83 @@ from typing import Annotated, Any, Callable, Dict, List
 BOTO3_CLIENT_GETTER = Callable[[str], Any]
 OVERRIDE_FUNC_TYPE = Callable[[FastMCP, BOTO3_CLIENT_GETTER, str], None]
 VALIDATOR = Callable[[FastMCP, Any, Dict[str, Any]], tuple[bool, str | None]]
+# Name, type, whether it is required and documentation of an input parameter of an operation
+INPUT_PARAMETER = tuple[str, str, bool, str]
+
+OPERATION_METADATA_VERSION = 1
+
+# Directory of the operation metadata files, empty to read the botocore service model on every start
+OPERATION_METADATA_CACHE_DIR = os.environ.get(
+    'OPERATION_METADATA_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'awslabs-amazon-sns-sqs-mcp-server'),
+)
+
+# Seconds during which a resource allowed by a validator is not checked again
+AUTHORIZATION_CACHE_TTL = 60
+
+# Number of authorization cache lookups between two reports of its statistics, 0 to never report them
+AUTHORIZATION_CACHE_STATS_INTERVAL = int(
+    os.environ.get('AUTHORIZATION_CACHE_STATS_INTERVAL', '1000')
+)
+
+
+class AuthorizationCache:
+    """Cache of the resources that validators allowed to be mutated, expiring after a TTL.
+
+    Only allowed resources are cached, so a resource that was refused, or that could not be
+    checked, is checked again on the next call. The statistics of the cache are printed to
+    stderr every stats_interval lookups.
+    """
+
+    def __init__(
+        self,
+        ttl: float = AUTHORIZATION_CACHE_TTL,
+        name: str = '',
+        stats_interval: int = AUTHORIZATION_CACHE_STATS_INTERVAL,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds during which an allowed resource is not checked again, 0 to disable the cache
+            name: Name of the cache in the reports of its statistics
+            stats_interval: Number of lookups between two reports of the statistics, 0 to never report them
+
+        """
+        self.ttl = ttl
+        self.name = name
+        self.stats_interval = stats_interval
+        # Expiry time of the allowed resources, by region, parameter name and resource
+        self.entries: Dict[tuple[str, str, str], float] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def is_allowed(self, key: tuple[str, str, str]) -> bool:
+        """Check whether a resource was allowed less than the TTL ago, counting hits and misses."""
+        expiry = self.entries.get(key)
+        allowed = expiry is not None and expiry > time.monotonic()
+        if allowed:
+            self.hits += 1
+        else:
+            if expiry is not None:
+                del self.entries[key]
+            self.misses += 1
+        if self.stats_interval > 0 and (self.hits + self.misses) % self.stats_interval == 0:
+            print(f'{self.name} authorization cache: {self.stats()}', file=sys.stderr)
+        return allowed
+
+    def allow(self, key: tuple[str, str, str]):
+        """Record that a resource was allowed."""
+        if self.ttl > 0:
+            self.entries[key] = time.monotonic() + self.ttl
+
+    def invalidate(self, resource: str):
+        """Forget a resource in every region, such as after its tags changed or it was deleted."""
+        for key in [key for key in self.entries if key[2] == resource]:
+            del self.entries[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of cache hits, misses and cached resources."""
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self.entries)}
 
 
 class AWSToolGenerator:
@@ -42,6 +121,7 @@ class AWSToolGenerator:
         mcp_server_version: str,
         tool_configuration: Dict[str, Dict[str, Any]] | None = None,
         skip_param_documentation: bool = False,
+        authorization_cache_ttl: float = AUTHORIZATION_CACHE_TTL,
     ):
         """Initialize the AWS Service Tool.
 
@@ -52,14 +132,20 @@ class AWSToolGenerator:
             mcp_server_version: The mcp server version used which will be passed in to the boto3 clients
             tool_configuration: Configuration for each tool
             skip_param_documentation: If True, parameter documentation will be skipped
+            authorization_cache_ttl: Seconds during which a resource allowed by a validator is not checked again
 
         """
         self.service_name = service_name
         self.service_display_name = service_display_name or service_name.upper()
         self.mcp = mcp
         self.clients: Dict[str, Any] = {}
+        # botocore model of the service, loaded on first use
+        self.service_model: Any = None
         self.tool_configuration = tool_configuration or {}
         self.skip_param_documentation = skip_param_documentation
+        self.authorization_cache = AuthorizationCache(
+            authorization_cache_ttl, self.service_display_name
+        )
         self.__validate_tool_configuration()
         self.config = Config(
             user_agent_extra=f'awslabs/mcp/{self.service_name}/{mcp_server_version}'
@@ -73,30 +159,131 @@ class AWSToolGenerator:
         """Return the MCP server instance."""
         return self.mcp
 
+    def get_client(self, region: str = 'us-east-1') -> Any:
+        """Return the service client of a region, shared with the generated tools."""
+        return self.__get_client(region)
+
+    def validate(
+        self,
+        validator: VALIDATOR,
+        region: str,
+        kwargs: Dict[str, Any],
+        validator_cache_key: str | None = None,
+    ) -> tuple[bool, str | None]:
+        """Run a validator on the arguments of a call, unless it allowed the same resource recently.
+
+        Args:
+            validator: Validator checking whether the resource can be mutated
+            region: Region of the resource
+            kwargs: Arguments of the boto3 call
+            validator_cache_key: Parameter identifying the resource, None to not cache the result
+
+        Returns:
+            Whether the call is allowed, and the reason when it is not
+
+        """
+        resource = kwargs.get(validator_cache_key) if validator_cache_key else None
+        cache_key = (
+            (region, validator_cache_key, resource) if validator_cache_key and resource else None
+        )
+        if cache_key and self.authorization_cache.is_allowed(cache_key):
+            return True, None
+        status, msg = validator(self.mcp, self.__get_client(region), kwargs)
+        if status is not False and cache_key:
+            self.authorization_cache.allow(cache_key)
+        return status, msg
+
     def __register_operations(self):
-        for operation in self.__get_operations():
-            if operation not in self.tool_configuration:
-                func = self.__create_operation_function(operation)
-                if func is not None:
-                    self.mcp.tool(description=func.__doc__)(func)
-            else:
-                config = self.tool_configuration[operation]
-                if config.get('ignore'):
-                    continue
-                if config.get('func_override') is not None:
-                    func_override = config.get('func_override')
-                    if func_override is not None:  # Extra check to satisfy type checker
-                        self.__handle_function_override(operation, func_override)
-                    continue
-                func = self.__create_operation_function(
-                    operation,
-                    config.get('name_override'),
-                    config.get('documentation_override'),
-                    config.get('validator'),
+        for operation, input_parameters in self.__get_operation_metadata().items():
+            config = self.tool_configuration.get(operation, {})
+            if config.get('ignore'):
+                continue
+            if config.get('func_override') is not None:
+                func_override = config.get('func_override')
+                if func_override is not None:  # Extra check to satisfy type checker
+                    self.__handle_function_override(operation, func_override)
+                continue
+            if input_parameters is None:
+                print(
+                    f'operation model for: {operation} not found, skipping tool creation',
+                    file=sys.stderr,
                 )
-                if func is not None:
-                    self.mcp.tool(description=func.__doc__)(func)
                 continue
+            func = self.__create_operation_function(
+                operation,
+                config.get('name_override'),
+                config.get('documentation_override'),
+                config.get('validator'),
+                config.get('validator_cache_key'),
+                config.get('invalidates_authorization', False),
+                input_parameters=input_parameters,
+            )
+            if func is not None:
+                self.mcp.tool(description=func.__doc__)(func)
+
+    def __get_operation_metadata(self) -> Dict[str, List[INPUT_PARAMETER] | None]:
+        """Get the input parameters of all the operations, None for those without a model.
+
+        They are read from the botocore service model the first time the server runs with a
+        given botocore version, then loaded from a cache file, so that starting the server
+        neither creates a client nor loads the service model.
+        """
+        path = self.__get_operation_metadata_path()
+        operations = self.__load_operation_metadata_file(path) if path else None
+        if operations is None:
+            operations = {}
+            for operation in self.__get_operations():
+                try:
+                    operations[operation] = self.__get_operation_input_parameters(operation)
+                except Exception:
+                    operations[operation] = None
+            if path:
+                self.__save_operation_metadata_file(path, operations)
+        return operations
+
+    def __get_operation_metadata_path(self) -> str | None:
+        """Get the path of the operation metadata file of the installed botocore version."""
+        if not OPERATION_METADATA_CACHE_DIR:
+            return None
+        documentation = '-nodoc' if self.skip_param_documentation else ''
+        return os.path.join(
+            OPERATION_METADATA_CACHE_DIR,
+            f'{self.service_name}-botocore-{botocore.__version__}{documentation}.json',
+        )
+
+    def __load_operation_metadata_file(
+        self, path: str
+    ) -> Dict[str, List[INPUT_PARAMETER] | None] | None:
+        """Load the operation metadata file, None if it does not exist or is not valid."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('version') != OPERATION_METADATA_VERSION:
+                return None
+            return {
+                operation: None
+                if parameters is None
+                else [tuple(parameter) for parameter in parameters]
+                for operation, parameters in cache['operations'].items()
+            }
+        except Exception as e:
+            print(f'Error loading operation metadata from {path}: {e}', file=sys.stderr)
+            return None
+
+    def __save_operation_metadata_file(
+        self, path: str, operations: Dict[str, List[INPUT_PARAMETER] | None]
+    ):
+        """Write the operation metadata file."""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temporary_path = f'{path}.{os.getpid()}.tmp'
+            with open(temporary_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': OPERATION_METADATA_VERSION, 'operations': operations}, f)
+            os.replace(temporary_path, path)
+        except Exception as e:
+            print(f'Error saving operation metadata to {path}: {e}', file=sys.stderr)
 
     def __get_client(self, region: str = 'us-east-1') -> Any:
         """Get or create a service client for the specified region."""
@@ -138,8 +325,16 @@ class AWSToolGenerator:
         name_override: str | None = None,
         documentation_override: str | None = None,
         validator: VALIDATOR | None = None,
+        validator_cache_key: str | None = None,
+        invalidates_authorization: bool = False,
+        input_parameters: List[INPUT_PARAMETER] | None = None,
     ) -> Callable | None:
-        """Create a function for a specific service operation."""
+        """Create a function for a specific service operation.
+
+        When validator_cache_key names the parameter identifying the resource, the resources
+        allowed by the validator are cached. Operations that change the tags of their resource,
+        or delete it, set invalidates_authorization so that it is checked again next time.
+        """
         # Get information about parameters and their types
         parameters = []
         type_conversion = {
@@ -149,7 +344,8 @@ class AWSToolGenerator:
             'map': dict[Any, Any],
         }
         try:
-            input_parameters = self.__get_operation_input_parameters(operation)
+            if input_parameters is None:
+                input_parameters = self.__get_operation_input_parameters(operation)
             for param_tuple in input_parameters:
                 param_name = param_tuple[0]
                 param_type = param_tuple[1]
@@ -202,11 +398,16 @@ class AWSToolGenerator:
                 method = getattr(client, operation)
                 kwargs = {k: v for k, v in bound_args.arguments.items() if v is not None}
                 del kwargs['region']  # region is not a valid argument to the boto3 API
+                resource = kwargs.get(validator_cache_key) if validator_cache_key else None
                 if validator is not None:
-                    status, msg = validator(self.mcp, client, kwargs)
+                    status, msg = self.validate(
+                        validator, bound_args.arguments['region'], kwargs, validator_cache_key
+                    )
                     if status is False:
                         return {'error': msg}
                 response = method(**kwargs)
+                if resource and invalidates_authorization:
+                    self.authorization_cache.invalidate(resource)
                 if 'ResponseMetadata' in response:
                     del response['ResponseMetadata']
                 return response
@@ -232,13 +433,12 @@ class AWSToolGenerator:
 
         return operation_function
 
-    def __get_operation_input_parameters(
-        self, operation_name: str
-    ) -> List[tuple[str, str, bool, str]]:
+    def __get_operation_input_parameters(self, operation_name: str) -> List[INPUT_PARAMETER]:
         """Return a list of input parameter names for a given operation."""
-        session = botocore.session.get_session()
-        service_model = session.get_service_model(self.service_name)
-        op_model = service_model.operation_model(self.__snake_to_camel(operation_name))
+        if self.service_model is None:
+            session = botocore.session.get_session()
+            self.service_model = session.get_service_model(self.service_name)
+        op_model = self.service_model.operation_model(self.__snake_to_camel(operation_name))
         input_shape = op_model.input_shape
         if not input_shape:
             return []
@@ -290,3 +490,10 @@ class AWSToolGenerator:
                 and configuration.get('validator') is None
             ):
                 raise ValueError(f'For tool {operation}, cannot specify empty override')
+            if (
+                configuration.get('validator_cache_key') is not None
+                and configuration.get('validator') is None
+            ):
+                raise ValueError(
+                    f'For tool {operation}, cannot specify validator_cache_key without a validator'
+                )
@@ -0,0 +1,259 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+
+"""Batched sending and parallel receiving of Amazon SQS messages."""
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+
+# Limits of a SendMessageBatch, ReceiveMessage and DeleteMessageBatch call
+MAX_BATCH_ENTRIES = 10
+MAX_BATCH_BYTES = 262_144
+
+# Default number of concurrent SendMessageBatch calls
+DEFAULT_SENDERS = 8
+# Default number of concurrent long-polling receivers
+DEFAULT_RECEIVERS = 4
+# Longest wait of a ReceiveMessage call for messages to arrive
+MAX_WAIT_TIME_SECONDS = 20
+
+
+def message_size(entry: Dict[str, Any]) -> int:
+    """Compute the size of a message as counted by Amazon SQS: body and message attributes."""
+    size = len(entry['MessageBody'].encode('utf-8'))
+    for name, attribute in entry.get('MessageAttributes', {}).items():
+        size += len(name.encode('utf-8')) + len(attribute.get('DataType', '').encode('utf-8'))
+        if 'StringValue' in attribute:
+            size += len(attribute['StringValue'].encode('utf-8'))
+        if 'BinaryValue' in attribute:
+            size += len(attribute['BinaryValue'])
+    return size
+
+
+def split_batches(
+    entries: List[Dict[str, Any]],
+) -> tuple[List[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """Split messages into batches of at most 10 messages and 256 KiB, keeping their order.
+
+    Args:
+        entries: SendMessageBatch entries, with their position in the request as Id
+
+    Returns:
+        The batches, and the failures of the messages too large to be sent
+
+    """
+    batches: List[List[Dict[str, Any]]] = []
+    failed = []
+    batch: List[Dict[str, Any]] = []
+    batch_bytes = 0
+    for entry in entries:
+        size = message_size(entry)
+        if size > MAX_BATCH_BYTES:
+            failed.append(
+                {
+                    'Id': entry['Id'],
+                    'Code': 'MessageTooLong',
+                    'Message': f'The message is {size} bytes, the maximum is {MAX_BATCH_BYTES}',
+                    'SenderFault': True,
+                }
+            )
+            continue
+        if batch and (len(batch) == MAX_BATCH_ENTRIES or batch_bytes + size > MAX_BATCH_BYTES):
+            batches.append(batch)
+            batch = []
+            batch_bytes = 0
+        batch.append(entry)
+        batch_bytes += size
+    if batch:
+        batches.append(batch)
+    return batches, failed
+
+
+def throughput(count: int, started: float) -> Dict[str, float]:
+    """Compute the elapsed time and rate of an operation started at a time.monotonic() value."""
+    elapsed = time.monotonic() - started
+    return {
+        'ElapsedSeconds': round(elapsed, 3),
+        'MessagesPerSecond': round(count / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+
+
+async def send_messages(
+    sqs_client: Any,
+    queue_url: str,
+    messages: List[str | Dict[str, Any]],
+    senders: int = DEFAULT_SENDERS,
+) -> Dict[str, Any]:
+    """Send any number of messages to a queue with concurrent SendMessageBatch calls.
+
+    Batches to a FIFO queue are sent one at a time, to keep the order of the messages.
+
+    Args:
+        sqs_client: boto3 SQS client
+        queue_url: URL of the queue
+        messages: Message bodies, or SendMessageBatch entries without Id
+        senders: Maximum number of concurrent SendMessageBatch calls
+
+    Returns:
+        The number of sent and failed messages, the failures, and throughput statistics
+
+    """
+    started = time.monotonic()
+    entries = [
+        {**({'MessageBody': message} if isinstance(message, str) else message), 'Id': str(i)}
+        for i, message in enumerate(messages)
+    ]
+    batches, failed = split_batches(entries)
+
+    semaphore = asyncio.Semaphore(1 if queue_url.endswith('.fifo') else max(senders, 1))
+
+    async def send(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        async with semaphore:
+            try:
+                response = await asyncio.to_thread(
+                    sqs_client.send_message_batch, QueueUrl=queue_url, Entries=batch
+                )
+            except Exception as e:
+                return [
+                    {'Id': entry['Id'], 'Code': type(e).__name__, 'Message': str(e)}
+                    for entry in batch
+                ]
+            return response.get('Failed', [])
+
+    for batch_failed in await asyncio.gather(*(send(batch) for batch in batches)):
+        failed.extend(batch_failed)
+
+    failures = sorted(
+        (
+            {
+                'Index': int(failure['Id']),
+                'Code': failure.get('Code'),
+                'Message': failure.get('Message'),
+            }
+            for failure in failed
+        ),
+        key=lambda failure: failure['Index'],
+    )
+    sent = len(entries) - len(failures)
+    return {
+        'Sent': sent,
+        'Failed': len(failures),
+        'Failures': failures,
+        'Batches': len(batches),
+        **throughput(sent, started),
+    }
+
+
+async def drain_messages(
+    sqs_client: Any,
+    queue_url: str,
+    max_messages: int,
+    receivers: int = DEFAULT_RECEIVERS,
+    wait_time_seconds: int = MAX_WAIT_TIME_SECONDS,
+    visibility_timeout: int | None = None,
+    delete: bool = True,
+) -> Dict[str, Any]:
+    """Receive up to a number of messages from a queue with parallel long-polling receivers.
+
+    Each receiver stops when the maximum number of messages is reached, or when a long poll
+    returns no message. The messages of each receive are deleted with one DeleteMessageBatch
+    call while the other receivers keep polling.
+
+    Args:
+        sqs_client: boto3 SQS client
+        queue_url: URL of the queue
+        max_messages: Maximum number of messages to receive
+        receivers: Number of concurrent long-polling receivers
+        wait_time_seconds: Longest wait of a receive for messages to arrive
+        visibility_timeout: Seconds during which received messages are hidden from other consumers
+        delete: Delete the received messages, else return them with their receipt handles
+
+    Returns:
+        The received messages, the deletions that failed with the ID of their message, the errors
+        that stopped receivers, and receive, deletion and throughput statistics
+
+    """
+    started = time.monotonic()
+    messages: List[Dict[str, Any]] = []
+    delete_failures: List[Dict[str, Any]] = []
+    errors: List[str] = []
+    # Messages that receivers may still ask for, reserved before each receive
+    remaining = max_messages
+    stats = {'Receives': 0, 'EmptyReceives': 0, 'Deleted': 0}
+
+    async def receive():
+        nonlocal remaining
+        while remaining > 0:
+            count = min(remaining, MAX_BATCH_ENTRIES)
+            remaining -= count
+            request: Dict[str, Any] = {
+                'QueueUrl': queue_url,
+                'MaxNumberOfMessages': count,
+                'WaitTimeSeconds': wait_time_seconds,
+                'MessageAttributeNames': ['All'],
+                'MessageSystemAttributeNames': ['All'],
+            }
+            if visibility_timeout is not None:
+                request['VisibilityTimeout'] = visibility_timeout
+            try:
+                response = await asyncio.to_thread(sqs_client.receive_message, **request)
+            except Exception as e:
+                # Stop this receiver, the others keep going
+                errors.append(str(e))
+                remaining += count
+                return
+            received = response.get('Messages', [])
+            stats['Receives'] += 1
+            remaining += count - len(received)
+            if not received:
+                stats['EmptyReceives'] += 1
+                return
+
+            # Receipt handles are only useful to the caller of messages left in the queue
+            messages.extend(
+                {key: value for key, value in message.items() if key != 'ReceiptHandle'}
+                if delete
+                else message
+                for message in received
+            )
+            if delete:
+                entries = [
+                    {'Id': message['MessageId'], 'ReceiptHandle': message['ReceiptHandle']}
+                    for message in received
+                ]
+                try:
+                    response = await asyncio.to_thread(
+                        sqs_client.delete_message_batch, QueueUrl=queue_url, Entries=entries
+                    )
+                except Exception as e:
+                    response = {
+                        'Failed': [
+                            {'Id': entry['Id'], 'Code': type(e).__name__, 'Message': str(e)}
+                            for entry in entries
+                        ]
+                    }
+                stats['Deleted'] += len(response.get('Successful', []))
+                delete_failures.extend(response.get('Failed', []))
+
+    await asyncio.gather(*(receive() for _ in range(max(min(receivers, max_messages), 1))))
+
+    return {
+        'Messages': messages,
+        'Received': len(messages),
+        **stats,
+        'DeleteFailures': delete_failures,
+        'Errors': errors,
+        **throughput(len(messages), started),
+    }
@@ -125,16 +125,34 @@ def register_sns_tools(mcp: FastMCP, disallow_resource_creation: bool = False):
         'add_permission': {'name_override': 'add_sns_permission'},
         'remove_permission': {'name_override': 'remove_sns_permission'},
         'create_topic': {'func_override': create_topic_override},
-        'delete_topic': {'validator': is_mutative_action_allowed},
-        'set_topic_attributes': {'validator': is_mutative_action_allowed},
+        'delete_topic': {
+            'validator': is_mutative_action_allowed,
+            'validator_cache_key': 'TopicArn',
+            'invalidates_authorization': True,
+        },
+        'set_topic_attributes': {
+            'validator': is_mutative_action_allowed,
+            'validator_cache_key': 'TopicArn',
+        },
         'subscribe': {
             'validator': is_mutative_action_allowed,
+            'validator_cache_key': 'TopicArn',
             'documentation_override': 'Execute AWS SNS Subscribe. Ensure that you set correct permission policies if required.',
         },
-        'unsubscribe': {'validator': is_unsubscribe_allowed},
-        'confirm_subscription': {'validator': is_mutative_action_allowed},
-        'publish': {'validator': is_mutative_action_allowed},
-        'publish_batch': {'validator': is_mutative_action_allowed},
+        'unsubscribe': {
+            'validator': is_unsubscribe_allowed,
+            'validator_cache_key': 'SubscriptionArn',
+            'invalidates_authorization': True,
+        },
+        'confirm_subscription': {
+            'validator': is_mutative_action_allowed,
+            'validator_cache_key': 'TopicArn',
+        },
+        'publish': {'validator': is_mutative_action_allowed, 'validator_cache_key': 'TopicArn'},
+        'publish_batch': {
+            'validator': is_mutative_action_allowed,
+            'validator_cache_key': 'TopicArn',
+        },
     }
 
     # Add all operations to ignore to the tool configuration
@@ -19,8 +19,14 @@ from awslabs.amazon_sns_sqs_mcp_server.common import (
 )
 from awslabs.amazon_sns_sqs_mcp_server.consts import MCP_SERVER_VERSION
 from awslabs.amazon_sns_sqs_mcp_server.generator import BOTO3_CLIENT_GETTER, AWSToolGenerator
+from awslabs.amazon_sns_sqs_mcp_server.message_pump import (
+    DEFAULT_RECEIVERS,
+    MAX_WAIT_TIME_SECONDS,
+    drain_messages,
+    send_messages,
+)
 from mcp.server.fastmcp import FastMCP
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 
 # override create_queue tool to tag resources
@@ -72,6 +78,61 @@ def is_mutative_action_allowed(
         return False, str(e)
 
 
+def register_message_pump_tools(mcp: FastMCP, sqs_generator: AWSToolGenerator):
+    """Register the tools sending and receiving many SQS messages in a single call.
+
+    The queue tags are checked through the authorization cache of the generated SQS tools.
+    """
+
+    @mcp.tool()
+    async def send_messages_bulk(
+        queue_url: str,
+        messages: List[str | Dict[str, Any]],
+        region: str = 'us-east-1',
+    ) -> Dict[str, Any]:
+        """Send any number of messages to an Amazon SQS queue.
+
+        Messages are message bodies, or SendMessageBatch entries without Id (e.g. with MessageBody, MessageAttributes, MessageGroupId). They are split into batches of 10 messages and 256 KB sent concurrently, or in order for FIFO queues. Returns the number of sent and failed messages, the failures with the index of their message, and the throughput.
+        """
+        allowed, message = sqs_generator.validate(
+            is_mutative_action_allowed, region, {'QueueUrl': queue_url}, 'QueueUrl'
+        )
+        if not allowed:
+            return {'error': message}
+        sqs_client = sqs_generator.get_client(region)
+        return await send_messages(sqs_client, queue_url, messages)
+
+    @mcp.tool()
+    async def drain_queue(
+        queue_url: str,
+        max_messages: int = 100,
+        receivers: int = DEFAULT_RECEIVERS,
+        wait_time_seconds: int = MAX_WAIT_TIME_SECONDS,
+        visibility_timeout: int | None = None,
+        delete: bool = True,
+        region: str = 'us-east-1',
+    ) -> Dict[str, Any]:
+        """Receive up to max_messages messages from an Amazon SQS queue, deleting them once received.
+
+        Several receivers long poll the queue in parallel until max_messages are received or the queue has no message for wait_time_seconds. Set delete to False to leave the messages in the queue, where they are visible again after the visibility timeout, and return them with their ReceiptHandle. Returns the messages and the receive, deletion and throughput statistics.
+        """
+        allowed, message = sqs_generator.validate(
+            is_mutative_action_allowed, region, {'QueueUrl': queue_url}, 'QueueUrl'
+        )
+        if not allowed:
+            return {'error': message}
+        sqs_client = sqs_generator.get_client(region)
+        return await drain_messages(
+            sqs_client,
+            queue_url,
+            max_messages,
+            receivers=receivers,
+            wait_time_seconds=min(max(wait_time_seconds, 0), MAX_WAIT_TIME_SECONDS),
+            visibility_timeout=visibility_timeout,
+            delete=delete,
+        )
+
+
 def register_sqs_tools(mcp: FastMCP, disallow_resource_creation: bool = False):
     """Register SQS tools with the MCP server."""
     # Generate SQS tools
@@ -93,12 +154,31 @@ def register_sqs_tools(mcp: FastMCP, disallow_resource_creation: bool = False):
         'add_permission': {'name_override': 'add_sqs_permission'},
         'remove_permission': {'name_override': 'remove_sqs_permission'},
         'create_queue': {'func_override': create_queue_override},
-        'delete_queue': {'validator': is_mutative_action_allowed},
-        'set_queue_attributes': {'validator': is_mutative_action_allowed},
-        'send_message': {'validator': is_mutative_action_allowed},
-        'receive_message': {'validator': is_mutative_action_allowed},
-        'send_message_batch': {'validator': is_mutative_action_allowed},
-        'delete_message': {'validator': is_mutative_action_allowed},
+        'delete_queue': {
+            'validator': is_mutative_action_allowed,
+            'validator_cache_key': 'QueueUrl',
+            'invalidates_authorization': True,
+        },
+        'set_queue_attributes': {
+            'validator': is_mutative_action_allowed,
+            'validator_cache_key': 'QueueUrl',
+        },
+        'send_message': {
+            'validator': is_mutative_action_allowed,
+            'validator_cache_key': 'QueueUrl',
+        },
+        'receive_message': {
+            'validator': is_mutative_action_allowed,
+            'validator_cache_key': 'QueueUrl',
+        },
+        'send_message_batch': {
+            'validator': is_mutative_action_allowed,
+            'validator_cache_key': 'QueueUrl',
+        },
+        'delete_message': {
+            'validator': is_mutative_action_allowed,
+            'validator_cache_key': 'QueueUrl',
+        },
     }
 
     # Add all operations to ignore to the tool configuration
@@ -117,3 +197,4 @@ def register_sqs_tools(mcp: FastMCP, disallow_resource_creation: bool = False):
         skip_param_documentation=True,
     )
     sqs_generator.generate()
+    register_message_pump_tools(mcp, sqs_generator)
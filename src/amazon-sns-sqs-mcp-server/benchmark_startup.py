@@ -0,0 +1,43 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+
+"""Script to measure the time to register all tools, with and without the operation metadata cache."""
+
+import tempfile
+import time
+from awslabs.amazon_sns_sqs_mcp_server import generator
+from awslabs.amazon_sns_sqs_mcp_server.sns import register_sns_tools
+from awslabs.amazon_sns_sqs_mcp_server.sqs import register_sqs_tools
+from mcp.server.fastmcp import FastMCP
+
+
+def measure(cache_dir: str) -> float:
+    """Register the SNS and SQS tools on a new server, returning the elapsed seconds."""
+    generator.OPERATION_METADATA_CACHE_DIR = cache_dir
+    started = time.perf_counter()
+    mcp = FastMCP()
+    register_sns_tools(mcp)
+    register_sqs_tools(mcp)
+    return time.perf_counter() - started
+
+
+def main():
+    """Print the registration time without cache, with an empty cache and with a filled cache."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        print(f'Without cache:    {measure(""):.3f}s')
+        print(f'Empty cache:      {measure(cache_dir):.3f}s')
+        print(f'Filled cache:     {measure(cache_dir):.3f}s')
+
+
+if __name__ == '__main__':
+    main()
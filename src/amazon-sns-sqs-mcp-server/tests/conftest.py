@@ -0,0 +1,24 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Test fixtures for the Amazon SNS and SQS MCP server tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def operation_metadata_cache_dir(tmp_path, monkeypatch) -> str:
+    """Give each test an empty operation metadata cache outside the cache directory of the user."""
+    cache_dir = str(tmp_path / 'operation-metadata')
+    monkeypatch.setattr(
+        'awslabs.amazon_sns_sqs_mcp_server.generator.OPERATION_METADATA_CACHE_DIR', cache_dir
+    )
+    return cache_dir
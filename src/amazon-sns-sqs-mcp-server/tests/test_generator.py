@@ -1,6 +1,6 @@
 # pyright: reportPrivateUsage=false, reportAttributeAccessIssue=false, reportFunctionMemberAccess=false, reportGeneralTypeIssues=false
 import unittest
-from awslabs.amazon_sns_sqs_mcp_server.generator import AWSToolGenerator
+from awslabs.amazon_sns_sqs_mcp_server.generator import AuthorizationCache, AWSToolGenerator
 from unittest.mock import MagicMock, patch
 
 
@@ -616,6 +616,165 @@ class TestAWSToolGenerator(unittest.TestCase):
         # Check if the default value is None
         self.assertEqual(optional_param.default, None)
 
+    @patch('awslabs.amazon_sns_sqs_mcp_server.generator.boto3.Session')
+    @patch('awslabs.amazon_sns_sqs_mcp_server.generator.botocore.session.get_session')
+    def test_validator_authorization_cache(self, mock_botocore_session, mock_boto3_session):
+        """Test that allowed resources are not validated again until invalidated."""
+        import asyncio
+
+        mock_boto3_session.return_value = self.boto3_session_mock
+        member_shape = MagicMock(type_name='string')
+        input_shape_mock = MagicMock()
+        input_shape_mock.members = {'QueueUrl': member_shape}
+        input_shape_mock.required_members = ['QueueUrl']
+        botocore_session_mock = MagicMock()
+        mock_botocore_session.return_value = botocore_session_mock
+        botocore_session_mock.get_service_model.return_value.operation_model.return_value.input_shape = input_shape_mock
+
+        self.boto3_client_mock.send_message = MagicMock(return_value={'MessageId': 'id'})
+        self.boto3_client_mock.delete_queue = MagicMock(return_value={})
+        validator_mock = MagicMock(return_value=(True, None))
+
+        generator = AWSToolGenerator(
+            service_name='sqs',
+            service_display_name='SQS',
+            mcp=self.mcp_mock,
+            mcp_server_version='10.15.99',
+        )
+        send_message = generator._AWSToolGenerator__create_operation_function(
+            'send_message', validator=validator_mock, validator_cache_key='QueueUrl'
+        )
+        delete_queue = generator._AWSToolGenerator__create_operation_function(
+            'delete_queue',
+            validator=validator_mock,
+            validator_cache_key='QueueUrl',
+            invalidates_authorization=True,
+        )
+
+        for _ in range(3):
+            asyncio.run(send_message(QueueUrl='queue-a'))
+        asyncio.run(send_message(QueueUrl='queue-a', region='us-west-2'))
+        self.assertEqual(validator_mock.call_count, 2)
+        self.assertEqual(
+            generator.authorization_cache.stats(), {'hits': 2, 'misses': 2, 'size': 2}
+        )
+
+        # Deleting the queue forgets it in every region
+        asyncio.run(delete_queue(QueueUrl='queue-a'))
+        self.assertEqual(generator.authorization_cache.stats()['size'], 0)
+        asyncio.run(send_message(QueueUrl='queue-a'))
+        self.assertEqual(validator_mock.call_count, 3)
+
+        # Refused resources are checked on every call
+        validator_mock.return_value = (False, 'Validation failed')
+        result = asyncio.run(send_message(QueueUrl='queue-b'))
+        self.assertEqual(result, {'error': 'Validation failed'})
+        asyncio.run(send_message(QueueUrl='queue-b'))
+        self.assertEqual(validator_mock.call_count, 5)
+
+    def test_authorization_cache_expiry(self):
+        """Test that cached authorizations expire after the TTL."""
+        key = ('us-east-1', 'QueueUrl', 'queue')
+        with patch('awslabs.amazon_sns_sqs_mcp_server.generator.time.monotonic') as mock_time:
+            mock_time.return_value = 100.0
+            cache = AuthorizationCache(ttl=60)
+            cache.allow(key)
+            mock_time.return_value = 159.0
+            self.assertTrue(cache.is_allowed(key))
+            mock_time.return_value = 161.0
+            self.assertFalse(cache.is_allowed(key))
+            self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1, 'size': 0})
+
+        disabled = AuthorizationCache(ttl=0)
+        disabled.allow(key)
+        self.assertFalse(disabled.is_allowed(key))
+
+    def test_authorization_cache_stats_report(self):
+        """Test that the cache statistics are reported every stats_interval lookups."""
+        key = ('us-east-1', 'QueueUrl', 'queue')
+        cache = AuthorizationCache(ttl=60, name='SQS', stats_interval=2)
+        with patch('builtins.print') as mock_print:
+            cache.is_allowed(key)
+            mock_print.assert_not_called()
+            cache.allow(key)
+            cache.is_allowed(key)
+            mock_print.assert_called_once()
+            self.assertEqual(
+                mock_print.call_args.args[0],
+                "SQS authorization cache: {'hits': 1, 'misses': 1, 'size': 1}",
+            )
+
+            silent = AuthorizationCache(ttl=60, stats_interval=0)
+            for _ in range(3):
+                silent.is_allowed(key)
+            mock_print.assert_called_once()
+
+    @patch('awslabs.amazon_sns_sqs_mcp_server.generator.boto3.Session')
+    def test_validator_cache_key_requires_validator(self, mock_session):
+        """Test that a validator cache key cannot be configured without a validator."""
+        mock_session.return_value = self.boto3_session_mock
+        with self.assertRaises(ValueError):
+            AWSToolGenerator(
+                service_name='sqs',
+                service_display_name='SQS',
+                mcp=self.mcp_mock,
+                mcp_server_version='10.15.99',
+                tool_configuration={
+                    'send_message': {'name_override': 'send', 'validator_cache_key': 'QueueUrl'}
+                },
+            )
+
+    @patch('awslabs.amazon_sns_sqs_mcp_server.generator.boto3.Session')
+    @patch('awslabs.amazon_sns_sqs_mcp_server.generator.botocore.session.get_session')
+    def test_operation_metadata_cache(self, mock_botocore_session, mock_boto3_session):
+        """Test that operation metadata is read from the service model only once."""
+        import os
+        from awslabs.amazon_sns_sqs_mcp_server.generator import OPERATION_METADATA_CACHE_DIR
+
+        mock_boto3_session.return_value = self.boto3_session_mock
+        member_shape_mock = MagicMock(type_name='integer', documentation='Test documentation')
+        input_shape_mock = MagicMock()
+        input_shape_mock.members = {'param1': member_shape_mock}
+        input_shape_mock.required_members = ['param1']
+        service_model_mock = MagicMock()
+        service_model_mock.operation_model.side_effect = lambda name: (
+            MagicMock(input_shape=input_shape_mock) if name == 'GetQueueUrl' else 1 / 0
+        )
+        mock_botocore_session.return_value.get_service_model.return_value = service_model_mock
+        self.boto3_client_mock.get_queue_url = MagicMock()
+        self.boto3_client_mock.close = MagicMock()
+        self.boto3_client_mock.__dir__ = MagicMock(return_value=['close', 'get_queue_url'])
+
+        def generate():
+            mcp_mock = MagicMock()
+            mcp_mock.tool = MagicMock(return_value=lambda x: x)
+            generator = AWSToolGenerator(
+                service_name='sqs',
+                service_display_name='SQS',
+                mcp=mcp_mock,
+                mcp_server_version='10.15.99',
+            )
+            generator.generate()
+            return [call.kwargs['description'] for call in mcp_mock.tool.call_args_list]
+
+        self.assertEqual(generate(), ['Execute the AWS SQS `get_queue_url` operation.'])
+        self.assertEqual(len(os.listdir(OPERATION_METADATA_CACHE_DIR)), 1)
+        self.assertEqual(mock_botocore_session.call_count, 1)
+
+        # Later starts neither create a client nor load the service model
+        mock_boto3_session.reset_mock()
+        mock_botocore_session.side_effect = AssertionError('service model loaded')
+        self.assertEqual(generate(), ['Execute the AWS SQS `get_queue_url` operation.'])
+        mock_boto3_session.assert_not_called()
+
+        # A corrupted file is rebuilt
+        (cache_file,) = os.listdir(OPERATION_METADATA_CACHE_DIR)
+        with open(os.path.join(OPERATION_METADATA_CACHE_DIR, cache_file), 'w') as f:
+            f.write('{')
+        mock_botocore_session.side_effect = None
+        self.assertEqual(generate(), ['Execute the AWS SQS `get_queue_url` operation.'])
+        self.assertEqual(mock_botocore_session.call_count, 2)
+
 
 def test_hello_world():
     """Basic test to verify test setup is working."""
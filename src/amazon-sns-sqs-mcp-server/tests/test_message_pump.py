@@ -0,0 +1,151 @@
+"""Tests for the message_pump module of amazon-sns-sqs-mcp-server."""
+
+from awslabs.amazon_sns_sqs_mcp_server.message_pump import (
+    MAX_BATCH_BYTES,
+    drain_messages,
+    message_size,
+    send_messages,
+    split_batches,
+)
+from unittest.mock import MagicMock
+
+
+QUEUE_URL = 'https://sqs.us-east-1.amazonaws.com/123456789012/test-queue'
+
+
+def entries(*sizes):
+    """Create SendMessageBatch entries with bodies of the given sizes."""
+    return [{'Id': str(i), 'MessageBody': 'x' * size} for i, size in enumerate(sizes)]
+
+
+class FakeQueue:
+    """SQS client serving the messages of a queue."""
+
+    def __init__(self, count):
+        """Initialize the queue with a number of messages."""
+        self.messages = [
+            {'MessageId': f'm{i}', 'ReceiptHandle': f'r{i}', 'Body': str(i)} for i in range(count)
+        ]
+        self.receive_requests = []
+        self.deleted = []
+
+    def receive_message(self, **kwargs):
+        """Return up to MaxNumberOfMessages messages."""
+        self.receive_requests.append(kwargs)
+        count = kwargs['MaxNumberOfMessages']
+        received, self.messages = self.messages[:count], self.messages[count:]
+        return {'Messages': received} if received else {}
+
+    def delete_message_batch(self, QueueUrl, Entries):
+        """Delete messages by receipt handle."""
+        self.deleted.extend(entry['ReceiptHandle'] for entry in Entries)
+        return {'Successful': [{'Id': entry['Id']} for entry in Entries], 'Failed': []}
+
+
+class TestMessagePump:
+    """Test the batched sending and receiving of messages."""
+
+    def test_message_size(self):
+        """Test that message attributes count in the size of a message."""
+        entry = {
+            'MessageBody': 'héllo',
+            'MessageAttributes': {
+                'kind': {'DataType': 'String', 'StringValue': 'a'},
+                'raw': {'DataType': 'Binary', 'BinaryValue': b'12'},
+            },
+        }
+        assert message_size(entry) == 6 + (4 + 6 + 1) + (3 + 6 + 2)
+
+    def test_split_batches(self):
+        """Test splitting messages by count and size, rejecting messages too large."""
+        batches, failed = split_batches(entries(*([10] * 12)))
+        assert [len(batch) for batch in batches] == [10, 2]
+        assert failed == []
+
+        half = MAX_BATCH_BYTES // 2
+        batches, failed = split_batches(entries(half, half, 1, MAX_BATCH_BYTES + 1, 5))
+        assert [[entry['Id'] for entry in batch] for batch in batches] == [['0', '1'], ['2', '4']]
+        assert [failure['Id'] for failure in failed] == ['3']
+        assert failed[0]['Code'] == 'MessageTooLong'
+
+    async def test_send_messages(self):
+        """Test sending messages in concurrent batches and reporting failures."""
+        sqs_client = MagicMock()
+
+        def send_message_batch(QueueUrl, Entries):
+            if Entries[0]['Id'] == '20':
+                raise Exception('Throttled')
+            return {
+                'Successful': [{'Id': entry['Id']} for entry in Entries if entry['Id'] != '3'],
+                'Failed': [{'Id': '3', 'Code': 'InvalidParameterValue', 'Message': 'bad'}]
+                if Entries[0]['Id'] == '0'
+                else [],
+            }
+
+        sqs_client.send_message_batch.side_effect = send_message_batch
+        messages = [f'message {i}' for i in range(24)]
+        messages[5] = {'MessageBody': 'with group', 'MessageGroupId': 'g'}
+
+        result = await send_messages(sqs_client, QUEUE_URL, messages)
+
+        assert sqs_client.send_message_batch.call_count == 3
+        first_batch = sqs_client.send_message_batch.call_args_list[0].kwargs['Entries']
+        assert first_batch[5] == {'MessageBody': 'with group', 'MessageGroupId': 'g', 'Id': '5'}
+        assert result['Sent'] == 19
+        assert result['Failed'] == 5
+        assert [failure['Index'] for failure in result['Failures']] == [3, 20, 21, 22, 23]
+        assert result['Batches'] == 3
+        assert 'MessagesPerSecond' in result
+
+    async def test_drain_messages(self):
+        """Test receiving up to a number of messages with parallel receivers."""
+        queue = FakeQueue(25)
+
+        result = await drain_messages(queue, QUEUE_URL, 22, receivers=3, wait_time_seconds=1)
+
+        assert result['Received'] == 22
+        assert result['Deleted'] == 22
+        assert sorted(queue.deleted) == sorted(f'r{i}' for i in range(22))
+        assert all('ReceiptHandle' not in message for message in result['Messages'])
+        assert sum(request['MaxNumberOfMessages'] for request in queue.receive_requests) == 22
+        assert len(queue.messages) == 3
+        assert result['DeleteFailures'] == []
+        assert result['Errors'] == []
+
+    async def test_drain_empty_queue_without_delete(self):
+        """Test that receivers stop when the queue is empty and messages can be kept."""
+        queue = FakeQueue(4)
+
+        result = await drain_messages(
+            queue, QUEUE_URL, 100, receivers=2, visibility_timeout=0, delete=False
+        )
+
+        assert result['Received'] == 4
+        assert result['Deleted'] == 0
+        assert queue.deleted == []
+        assert sorted(message['ReceiptHandle'] for message in result['Messages']) == [
+            f'r{i}' for i in range(4)
+        ]
+        assert result['EmptyReceives'] == 2
+        assert all(request['VisibilityTimeout'] == 0 for request in queue.receive_requests)
+
+    async def test_drain_messages_errors(self):
+        """Test that receive and delete errors are reported."""
+        queue = FakeQueue(3)
+        queue.delete_message_batch = MagicMock(side_effect=Exception('AccessDenied'))
+        receive_message = queue.receive_message
+        calls = []
+
+        def failing_receive(**kwargs):
+            calls.append(kwargs)
+            if len(calls) > 1:
+                raise Exception('QueueDoesNotExist')
+            return receive_message(**kwargs)
+
+        queue.receive_message = failing_receive
+
+        result = await drain_messages(queue, QUEUE_URL, 10, receivers=1)
+
+        assert result['Received'] == 3
+        assert [failure['Id'] for failure in result['DeleteFailures']] == ['m0', 'm1', 'm2']
+        assert result['Errors'] == ['QueueDoesNotExist']
@@ -2,9 +2,11 @@
 
 from awslabs.amazon_sns_sqs_mcp_server.common import MCP_SERVER_VERSION_TAG
 from awslabs.amazon_sns_sqs_mcp_server.consts import MCP_SERVER_VERSION
+from awslabs.amazon_sns_sqs_mcp_server.generator import AWSToolGenerator
 from awslabs.amazon_sns_sqs_mcp_server.sqs import (
     create_queue_override,
     is_mutative_action_allowed,
+    register_message_pump_tools,
     register_sqs_tools,
 )
 from unittest.mock import MagicMock, patch
@@ -29,6 +31,46 @@ class TestSQSTools:
         # Assert tool was registered
         assert mock_mcp.tool.called
 
+    @patch('awslabs.amazon_sns_sqs_mcp_server.generator.boto3.Session')
+    async def test_register_message_pump_tools(self, mock_session):
+        """Test the bulk send and drain tools check the queue tags through the cache."""
+        tools = {}
+        mock_mcp = MagicMock()
+        mock_mcp.tool = MagicMock(return_value=lambda func: tools.setdefault(func.__name__, func))
+        mock_sqs_client = MagicMock()
+        mock_sqs_client.list_queue_tags.return_value = {'Tags': {MCP_SERVER_VERSION_TAG: '1.0.0'}}
+        mock_sqs_client.send_message_batch.return_value = {'Successful': [], 'Failed': []}
+        mock_sqs_client.receive_message.return_value = {}
+        mock_session.return_value.client.return_value = mock_sqs_client
+        sqs_generator = AWSToolGenerator(
+            service_name='sqs',
+            service_display_name='Amazon SQS',
+            mcp=mock_mcp,
+            mcp_server_version=MCP_SERVER_VERSION,
+        )
+        queue_url = 'https://sqs.us-east-1.amazonaws.com/123456789012/test-queue'
+
+        register_message_pump_tools(mock_mcp, sqs_generator)
+
+        result = await tools['send_messages_bulk'](queue_url, ['a', 'b'], region='eu-west-1')
+        assert mock_session.call_args.kwargs['region_name'] == 'eu-west-1'
+        assert result['Sent'] == 2
+        result = await tools['drain_queue'](queue_url, wait_time_seconds=60)
+        assert mock_sqs_client.receive_message.call_args.kwargs['WaitTimeSeconds'] == 20
+        assert result['Received'] == 0
+        await tools['drain_queue'](queue_url)
+        assert mock_sqs_client.list_queue_tags.call_count == 2
+        assert sqs_generator.authorization_cache.stats()['hits'] == 1
+
+        untagged_queue_url = 'https://sqs.us-east-1.amazonaws.com/123456789012/untagged'
+        mock_sqs_client.list_queue_tags.return_value = {'Tags': {}}
+        result = await tools['drain_queue'](untagged_queue_url)
+        assert 'error' in result
+        mock_sqs_client.send_message_batch.reset_mock()
+        result = await tools['send_messages_bulk'](untagged_queue_url, ['a'])
+        assert 'error' in result
+        mock_sqs_client.send_message_batch.assert_not_called()
+
     def test_allow_mutative_action_only_on_tagged_sqs_resource(self):
         """Test allow_mutative_action_only_on_tagged_sqs_resource function."""
         # Mock FastMCP
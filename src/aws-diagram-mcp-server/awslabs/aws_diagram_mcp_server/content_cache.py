@@ -0,0 +1,187 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+
+"""Content-addressed cache of code scans and rendered diagrams for the diagrams-mcp-server."""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Directory of the cache, empty to disable it
+DIAGRAM_CACHE_DIR = os.environ.get(
+    'DIAGRAM_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'awslabs-aws-diagram-mcp-server', 'content'),
+)
+
+# Maximum size of the cache in megabytes
+DIAGRAM_CACHE_MAX_MB = int(os.environ.get('DIAGRAM_CACHE_MAX_MB', '256'))
+
+
+def content_key(*parts: str) -> str:
+    """Get the cache key of some content.
+
+    Args:
+        parts: Parts of the content, such as its kind, the versions of the tools producing it
+            and the code it is produced from
+
+    Returns:
+        Hexadecimal SHA-256 digest of the parts
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class ContentCache:
+    """Cache of files keyed by the hash of their content, evicting the least recently used.
+
+    Each entry is a file of the cache directory. Its modification time records when it was
+    last used, so the eviction order survives restarts.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory of the cache files
+            max_bytes: Maximum total size of the cache files
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # Sizes of the cache files, least recently used first
+        self._sizes: Optional['OrderedDict[str, int]'] = None
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def _load(self) -> 'OrderedDict[str, int]':
+        """Index the cache files on first use."""
+        if self._sizes is None:
+            entries = []
+            if os.path.isdir(self.directory):
+                for name in os.listdir(self.directory):
+                    if name.endswith('.tmp'):
+                        continue
+                    try:
+                        stat = os.stat(os.path.join(self.directory, name))
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, name, stat.st_size))
+            entries.sort()
+            self._sizes = OrderedDict((name, size) for _, name, size in entries)
+            self._total = sum(self._sizes.values())
+        return self._sizes
+
+    def get(self, key: str, suffix: str) -> Optional[str]:
+        """Get the path of a cache file, marking it as recently used.
+
+        Args:
+            key: Cache key of the content
+            suffix: Extension of the file, such as '.png'
+
+        Returns:
+            Path of the file, None if the content is not cached
+        """
+        name = f'{key}{suffix}'
+        path = os.path.join(self.directory, name)
+        with self._lock:
+            sizes = self._load()
+            if name not in sizes:
+                return None
+            try:
+                os.utime(path)
+            except OSError:
+                # Removed by another process sharing the directory
+                self._total -= sizes.pop(name)
+                return None
+            sizes.move_to_end(name)
+        return path
+
+    def get_bytes(self, key: str, suffix: str) -> Optional[bytes]:
+        """Get cached content.
+
+        Args:
+            key: Cache key of the content
+            suffix: Extension of the file, such as '.json'
+
+        Returns:
+            The content, None if it is not cached
+        """
+        path = self.get(key, suffix)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, key: str, suffix: str, content: bytes):
+        """Cache content, evicting the least recently used files above the size limit.
+
+        Args:
+            key: Cache key of the content
+            suffix: Extension of the file, such as '.png'
+            content: Content to cache
+        """
+        if len(content) > self.max_bytes:
+            return
+        name = f'{key}{suffix}'
+        path = os.path.join(self.directory, name)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temporary_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(temporary_path, 'wb') as f:
+                f.write(content)
+            os.replace(temporary_path, path)
+        except OSError as e:
+            logger.warning(f'Error writing {path} to the diagram cache: {e}')
+            return
+
+        with self._lock:
+            sizes = self._load()
+            self._total += len(content) - sizes.pop(name, 0)
+            sizes[name] = len(content)
+            while self._total > self.max_bytes and sizes:
+                evicted, size = sizes.popitem(last=False)
+                self._total -= size
+                try:
+                    os.remove(os.path.join(self.directory, evicted))
+                except OSError:
+                    pass
+
+
+_content_cache: Optional[ContentCache] = None
+_content_cache_lock = threading.Lock()
+
+
+def get_content_cache() -> Optional[ContentCache]:
+    """Get the shared content cache.
+
+    Returns:
+        The content cache, None if it is disabled
+    """
+    global _content_cache
+    if not DIAGRAM_CACHE_DIR:
+        return None
+    with _content_cache_lock:
+        if _content_cache is None or _content_cache.directory != DIAGRAM_CACHE_DIR:
+            _content_cache = ContentCache(DIAGRAM_CACHE_DIR, DIAGRAM_CACHE_MAX_MB * 1024 * 1024)
+        return _content_cache
@@ -13,20 +13,23 @@
 
 """Diagram generation and example functions for the diagrams-mcp-server."""
 
-import diagrams
-import importlib
-import inspect
+import asyncio
 import logging
 import os
 import re
-import signal
+import shutil
 import uuid
+from awslabs.aws_diagram_mcp_server.content_cache import content_key, get_content_cache
+from awslabs.aws_diagram_mcp_server.icon_catalog import get_diagrams_version, get_icon_catalog
 from awslabs.aws_diagram_mcp_server.models import (
     DiagramExampleResponse,
     DiagramGenerateResponse,
+    DiagramIconMatch,
+    DiagramIconSearchResponse,
     DiagramIconsResponse,
     DiagramType,
 )
+from awslabs.aws_diagram_mcp_server.render_pool import RenderError, get_render_pool
 from awslabs.aws_diagram_mcp_server.scanner import scan_python_code
 from typing import Optional
 
@@ -34,6 +37,23 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 
+def get_render_cache_key(code: str) -> Optional[str]:
+    """Get the cache key of the diagram rendered from some code.
+
+    Code reading files or URLs, such as the icons of custom nodes, may render differently
+    from the same text, so its diagrams are not cached.
+
+    Args:
+        code: Python code string using the diagrams package DSL
+
+    Returns:
+        The cache key, None if the diagram must not be cached
+    """
+    if any(marker in code for marker in ('Custom(', 'urlretrieve', 'open(')):
+        return None
+    return content_key('render', get_diagrams_version(), code)
+
+
 async def generate_diagram(
     code: str,
     filename: Optional[str] = None,
@@ -104,155 +124,25 @@ async def generate_diagram(
         # Combine directory and filename
         output_path = os.path.join(output_dir, simple_filename)
 
-    try:
-        # Create a namespace for execution
-        namespace = {}
-
-        # Import necessary modules directly in the namespace
-        # nosec B102 - These exec calls are necessary to import modules in the namespace
-        exec(  # nosem: python.lang.security.audit.exec-detected.exec-detected
-            # nosem: python.lang.security.audit.exec-detected.exec-detected
-            'import os',
-            namespace,
-        )
-        # nosec B102 - These exec calls are necessary to import modules in the namespace
-        exec(  # nosem: python.lang.security.audit.exec-detected.exec-detected
-            'import diagrams', namespace
-        )
-        # nosec B102 - These exec calls are necessary to import modules in the namespace
-        exec(  # nosem: python.lang.security.audit.exec-detected.exec-detected
-            'from diagrams import Diagram, Cluster, Edge', namespace
-        )  # nosem: python.lang.security.audit.exec-detected.exec-detected
-        # nosec B102 - These exec calls are necessary to import modules in the namespace
-        exec(  # nosem: python.lang.security.audit.exec-detected.exec-detected
-            """from diagrams.saas.crm import *
-from diagrams.saas.identity import *
-from diagrams.saas.chat import *
-from diagrams.saas.recommendation import *
-from diagrams.saas.cdn import *
-from diagrams.saas.communication import *
-from diagrams.saas.media import *
-from diagrams.saas.logging import *
-from diagrams.saas.security import *
-from diagrams.saas.social import *
-from diagrams.saas.alerting import *
-from diagrams.saas.analytics import *
-from diagrams.saas.automation import *
-from diagrams.saas.filesharing import *
-from diagrams.onprem.vcs import *
-from diagrams.onprem.database import *
-from diagrams.onprem.gitops import *
-from diagrams.onprem.workflow import *
-from diagrams.onprem.etl import *
-from diagrams.onprem.inmemory import *
-from diagrams.onprem.identity import *
-from diagrams.onprem.network import *
-from diagrams.onprem.proxmox import *
-from diagrams.onprem.cd import *
-from diagrams.onprem.container import *
-from diagrams.onprem.certificates import *
-from diagrams.onprem.mlops import *
-from diagrams.onprem.dns import *
-from diagrams.onprem.compute import *
-from diagrams.onprem.logging import *
-from diagrams.onprem.registry import *
-from diagrams.onprem.security import *
-from diagrams.onprem.client import *
-from diagrams.onprem.groupware import *
-from diagrams.onprem.iac import *
-from diagrams.onprem.analytics import *
-from diagrams.onprem.messaging import *
-from diagrams.onprem.tracing import *
-from diagrams.onprem.ci import *
-from diagrams.onprem.search import *
-from diagrams.onprem.storage import *
-from diagrams.onprem.auth import *
-from diagrams.onprem.monitoring import *
-from diagrams.onprem.aggregator import *
-from diagrams.onprem.queue import *
-from diagrams.gis.database import *
-from diagrams.gis.cli import *
-from diagrams.gis.server import *
-from diagrams.gis.python import *
-from diagrams.gis.organization import *
-from diagrams.gis.cplusplus import *
-from diagrams.gis.mobile import *
-from diagrams.gis.javascript import *
-from diagrams.gis.desktop import *
-from diagrams.gis.ogc import *
-from diagrams.gis.java import *
-from diagrams.gis.routing import *
-from diagrams.gis.data import *
-from diagrams.gis.geocoding import *
-from diagrams.gis.format import *
-from diagrams.elastic.saas import *
-from diagrams.elastic.observability import *
-from diagrams.elastic.elasticsearch import *
-from diagrams.elastic.orchestration import *
-from diagrams.elastic.security import *
-from diagrams.elastic.beats import *
-from diagrams.elastic.enterprisesearch import *
-from diagrams.elastic.agent import *
-from diagrams.programming.runtime import *
-from diagrams.programming.framework import *
-from diagrams.programming.flowchart import *
-from diagrams.programming.language import *
-from diagrams.gcp.storage import *
-from diagrams.generic.database import *
-from diagrams.generic.blank import *
-from diagrams.generic.network import *
-from diagrams.generic.virtualization import *
-from diagrams.generic.place import *
-from diagrams.generic.device import *
-from diagrams.generic.compute import *
-from diagrams.generic.os import *
-from diagrams.generic.storage import *
-from diagrams.k8s.others import *
-from diagrams.k8s.rbac import *
-from diagrams.k8s.network import *
-from diagrams.k8s.ecosystem import *
-from diagrams.k8s.compute import *
-from diagrams.k8s.chaos import *
-from diagrams.k8s.infra import *
-from diagrams.k8s.podconfig import *
-from diagrams.k8s.controlplane import *
-from diagrams.k8s.clusterconfig import *
-from diagrams.k8s.storage import *
-from diagrams.k8s.group import *
-from diagrams.aws.cost import *
-from diagrams.aws.ar import *
-from diagrams.aws.general import *
-from diagrams.aws.database import *
-from diagrams.aws.management import *
-from diagrams.aws.ml import *
-from diagrams.aws.game import *
-from diagrams.aws.enablement import *
-from diagrams.aws.network import *
-from diagrams.aws.quantum import *
-from diagrams.aws.iot import *
-from diagrams.aws.robotics import *
-from diagrams.aws.migration import *
-from diagrams.aws.mobile import *
-from diagrams.aws.compute import *
-from diagrams.aws.media import *
-from diagrams.aws.engagement import *
-from diagrams.aws.security import *
-from diagrams.aws.devtools import *
-from diagrams.aws.integration import *
-from diagrams.aws.business import *
-from diagrams.aws.analytics import *
-from diagrams.aws.blockchain import *
-from diagrams.aws.storage import *
-from diagrams.aws.satellite import *
-from diagrams.aws.enduser import *
-""",
-            namespace,
-        )
-        # nosec B102 - These exec calls are necessary to import modules in the namespace
-        exec(  # nosem: python.lang.security.audit.exec-detected.exec-detected
-            'from urllib.request import urlretrieve', namespace
-        )  # nosem: python.lang.security.audit.exec-detected.exec-detected
+    png_path = f'{output_path}.png'
 
+    # Reuse the diagram previously rendered from the same code
+    cache = get_content_cache()
+    render_key = get_render_cache_key(code) if cache else None
+    if cache and render_key:
+        cached_path = cache.get(render_key, '.png')
+        if cached_path:
+            try:
+                shutil.copyfile(cached_path, png_path)
+                return DiagramGenerateResponse(
+                    status='success',
+                    path=png_path,
+                    message=f'Diagram generated successfully at {png_path}',
+                )
+            except OSError as e:
+                logger.warning(f'Error copying cached diagram to {png_path}: {e}')
+
+    try:
         # Process the code to ensure show=False and set the output path
         if 'with Diagram(' in code:
             # Find all instances of Diagram constructor
@@ -291,24 +181,14 @@ from diagrams.aws.enduser import *
                 # Replace in the code
                 code = code.replace(f'with Diagram({original_args})', f'with Diagram({new_args})')
 
-        # Set up a timeout handler
-        def timeout_handler(signum, frame):
-            raise TimeoutError(f'Diagram generation timed out after {timeout} seconds')
-
-        # Register the timeout handler
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout)
-
-        # Execute the code
-        # nosec B102 - This exec is necessary to run user-provided diagram code in a controlled environment
-        exec(code, namespace)  # nosem: python.lang.security.audit.exec-detected.exec-detected
-
-        # Cancel the alarm
-        signal.alarm(0)
+        # Render the diagram in a worker process with the diagrams namespace preloaded
+        await asyncio.to_thread(get_render_pool().render, code, timeout)
 
         # Check if the file was created
-        png_path = f'{output_path}.png'
         if os.path.exists(png_path):
+            if cache and render_key:
+                with open(png_path, 'rb') as f:
+                    cache.put(render_key, '.png', f.read())
             response = DiagramGenerateResponse(
                 status='success',
                 path=png_path,
@@ -323,6 +203,10 @@ from diagrams.aws.enduser import *
             )
     except TimeoutError as e:
         return DiagramGenerateResponse(status='error', message=str(e))
+    except RenderError as e:
+        return DiagramGenerateResponse(
+            status='error', message=f'Error generating diagram: {e.error_type}: {e.message}'
+        )
     except Exception as e:
         # More detailed error logging
         error_type = type(e).__name__
@@ -586,260 +470,90 @@ def list_diagram_icons(
     logger.debug(f'Filters - provider: {provider_filter}, service: {service_filter}')
 
     try:
+        catalog = get_icon_catalog()
+
         # If no filters provided, just return the list of available providers
         if not provider_filter and not service_filter:
-            # Get the base path of the diagrams package
-            diagrams_path = os.path.dirname(diagrams.__file__)
-            providers = {}
-
-            # List of provider directories to exclude
-            exclude_dirs = ['__pycache__', '_template']
-
-            # Just list the available providers without their services/icons
-            for provider_name in os.listdir(os.path.join(diagrams_path)):
-                provider_path = os.path.join(diagrams_path, provider_name)
-
-                # Skip non-directories and excluded directories
-                if (
-                    not os.path.isdir(provider_path)
-                    or provider_name.startswith('_')
-                    or provider_name in exclude_dirs
-                ):
-                    continue
-
-                # Add provider to the dictionary with empty services
-                providers[provider_name] = {}
-
+            providers = {provider_name: {} for provider_name in catalog.providers}
             return DiagramIconsResponse(providers=providers, filtered=False, filter_info=None)
 
-        # Dictionary to store filtered providers and their services/icons
-        providers = {}
-
-        # Get the base path of the diagrams package
-        diagrams_path = os.path.dirname(diagrams.__file__)
-
-        # List of provider directories to exclude
-        exclude_dirs = ['__pycache__', '_template']
-
-        # If only provider filter is specified
-        if provider_filter and not service_filter:
-            provider_path = os.path.join(diagrams_path, provider_filter)
-
-            # Check if the provider exists
-            if not os.path.isdir(provider_path) or provider_filter in exclude_dirs:
-                return DiagramIconsResponse(
-                    providers={},
-                    filtered=True,
-                    filter_info={'provider': provider_filter, 'error': 'Provider not found'},
-                )
-
-            # Add provider to the dictionary
-            providers[provider_filter] = {}
-
-            # Iterate through all service modules in the provider
-            for service_file in os.listdir(provider_path):
-                # Skip non-Python files and special files
-                if not service_file.endswith('.py') or service_file.startswith('_'):
-                    continue
-
-                service_name = service_file[:-3]  # Remove .py extension
-
-                # Import the service module
-                module_path = f'diagrams.{provider_filter}.{service_name}'
-                try:
-                    service_module = importlib.import_module(  # nosem: python.lang.security.audit.non-literal-import.non-literal-import
-                        module_path  # nosem: python.lang.security.audit.non-literal-import.non-literal-import
-                    )  # nosem: python.lang.security.audit.non-literal-import.non-literal-import
-
-                    # Find all classes in the module that are Node subclasses
-                    icons = []
-                    for name, obj in inspect.getmembers(service_module):
-                        # Skip private members and imported modules
-                        if name.startswith('_') or inspect.ismodule(obj):
-                            continue
-
-                        # Check if it's a class and likely a Node subclass
-                        if inspect.isclass(obj) and hasattr(obj, '_icon'):
-                            icons.append(name)
-
-                    # Add service and its icons to the provider
-                    if icons:
-                        providers[provider_filter][service_name] = sorted(icons)
-
-                except (ImportError, AttributeError, Exception) as e:
-                    logger.error(f'Error processing {module_path}: {str(e)}')
-                    continue
-
+        # If only service filter is specified (not supported)
+        if not provider_filter:
             return DiagramIconsResponse(
-                providers=providers, filtered=True, filter_info={'provider': provider_filter}
+                providers={},
+                filtered=True,
+                filter_info={
+                    'service': service_filter,
+                    'error': 'Service filter requires provider filter',
+                },
             )
 
-        # If both provider and service filters are specified
-        elif provider_filter and service_filter:
-            provider_path = os.path.join(diagrams_path, provider_filter)
-
-            # Check if the provider exists
-            if not os.path.isdir(provider_path) or provider_filter in exclude_dirs:
-                return DiagramIconsResponse(
-                    providers={},
-                    filtered=True,
-                    filter_info={
-                        'provider': provider_filter,
-                        'service': service_filter,
-                        'error': 'Provider not found',
-                    },
-                )
-
-            # Add provider to the dictionary
-            providers[provider_filter] = {}
-
-            # Check if the service exists
-            service_file = f'{service_filter}.py'
-            service_path = os.path.join(provider_path, service_file)
-
-            if not os.path.isfile(service_path):
-                return DiagramIconsResponse(
-                    providers={provider_filter: {}},
-                    filtered=True,
-                    filter_info={
-                        'provider': provider_filter,
-                        'service': service_filter,
-                        'error': 'Service not found',
-                    },
-                )
-
-            # Import the service module
-            module_path = f'diagrams.{provider_filter}.{service_filter}'
-            try:
-                service_module = importlib.import_module(  # nosem: python.lang.security.audit.non-literal-import.non-literal-import
-                    module_path  # nosem: python.lang.security.audit.non-literal-import.non-literal-import
-                )  # nosem: python.lang.security.audit.non-literal-import.non-literal-import
-
-                # Find all classes in the module that are Node subclasses
-                icons = []
-                for name, obj in inspect.getmembers(service_module):
-                    # Skip private members and imported modules
-                    if name.startswith('_') or inspect.ismodule(obj):
-                        continue
-
-                    # Check if it's a class and likely a Node subclass
-                    if inspect.isclass(obj) and hasattr(obj, '_icon'):
-                        icons.append(name)
-
-                # Add service and its icons to the provider
-                if icons:
-                    providers[provider_filter][service_filter] = sorted(icons)
-
-            except (ImportError, AttributeError, Exception) as e:
-                logger.error(f'Error processing {module_path}: {str(e)}')
-                return DiagramIconsResponse(
-                    providers={provider_filter: {}},
-                    filtered=True,
-                    filter_info={
-                        'provider': provider_filter,
-                        'service': service_filter,
-                        'error': f'Error loading service: {str(e)}',
-                    },
-                )
+        # Check if the provider exists
+        services = catalog.providers.get(provider_filter)
+        if services is None:
+            filter_info = {'provider': provider_filter}
+            if service_filter:
+                filter_info['service'] = service_filter
+            filter_info['error'] = 'Provider not found'
+            return DiagramIconsResponse(providers={}, filtered=True, filter_info=filter_info)
 
+        # If only provider filter is specified
+        if not service_filter:
             return DiagramIconsResponse(
-                providers=providers,
+                providers={
+                    provider_filter: {name: list(icons) for name, icons in services.items()}
+                },
                 filtered=True,
-                filter_info={'provider': provider_filter, 'service': service_filter},
+                filter_info={'provider': provider_filter},
             )
 
-        # If only service filter is specified (not supported)
-        elif service_filter:
+        # Check if the service exists
+        if service_filter not in services:
             return DiagramIconsResponse(
-                providers={},
+                providers={provider_filter: {}},
                 filtered=True,
                 filter_info={
+                    'provider': provider_filter,
                     'service': service_filter,
-                    'error': 'Service filter requires provider filter',
+                    'error': 'Service not found',
                 },
             )
 
-        # Original implementation for backward compatibility
-        else:
-            # Dictionary to store all providers and their services/icons
-            providers = {}
-
-            # Get the base path of the diagrams package
-            diagrams_path = os.path.dirname(diagrams.__file__)
-            logger.debug(f'Diagrams package path: {diagrams_path}')
-
-            # Iterate through all provider directories
-            for provider_name in os.listdir(os.path.join(diagrams_path)):
-                provider_path = os.path.join(diagrams_path, provider_name)
-
-                # Skip non-directories and excluded directories
-                if (
-                    not os.path.isdir(provider_path)
-                    or provider_name.startswith('_')
-                    or provider_name in exclude_dirs
-                ):
-                    logger.debug(f'Skipping {provider_name}: not a directory or in exclude list')
-                    continue
-
-                # Add provider to the dictionary
-                providers[provider_name] = {}
-                logger.debug(f'Processing provider: {provider_name}')
-
-                # Iterate through all service modules in the provider
-                for service_file in os.listdir(provider_path):
-                    # Skip non-Python files and special files
-                    if not service_file.endswith('.py') or service_file.startswith('_'):
-                        logger.debug(
-                            f'Skipping file {service_file}: not a Python file or starts with _'
-                        )
-                        continue
-
-                    service_name = service_file[:-3]  # Remove .py extension
-                    logger.debug(f'Processing service: {provider_name}.{service_name}')
-
-                    # Import the service module
-                    module_path = f'diagrams.{provider_name}.{service_name}'
-                    try:
-                        logger.debug(f'Attempting to import module: {module_path}')
-                        service_module = importlib.import_module(  # nosem: python.lang.security.audit.non-literal-import.non-literal-import
-                            module_path  # nosem: python.lang.security.audit.non-literal-import.non-literal-import
-                        )  # nosem: python.lang.security.audit.non-literal-import.non-literal-import
-
-                        # Find all classes in the module that are Node subclasses
-                        icons = []
-                        for name, obj in inspect.getmembers(service_module):
-                            # Skip private members and imported modules
-                            if name.startswith('_') or inspect.ismodule(obj):
-                                continue
-
-                            # Check if it's a class and likely a Node subclass
-                            if inspect.isclass(obj) and hasattr(obj, '_icon'):
-                                icons.append(name)
-                                logger.debug(f'Found icon: {name}')
-
-                        # Add service and its icons to the provider
-                        if icons:
-                            providers[provider_name][service_name] = sorted(icons)
-                            logger.debug(
-                                f'Added {len(icons)} icons for {provider_name}.{service_name}'
-                            )
-                        else:
-                            logger.warning(f'No icons found for {provider_name}.{service_name}')
-
-                    except ImportError as ie:
-                        logger.error(f'ImportError for {module_path}: {str(ie)}')
-                        continue
-                    except AttributeError as ae:
-                        logger.error(f'AttributeError for {module_path}: {str(ae)}')
-                        continue
-                    except Exception as e:
-                        logger.error(f'Unexpected error processing {module_path}: {str(e)}')
-                        continue
-
-            logger.debug(f'Completed processing. Found {len(providers)} providers')
-            return DiagramIconsResponse(providers=providers, filtered=False, filter_info=None)
+        return DiagramIconsResponse(
+            providers={provider_filter: {service_filter: list(services[service_filter])}},
+            filtered=True,
+            filter_info={'provider': provider_filter, 'service': service_filter},
+        )
 
     except Exception as e:
         logger.exception(f'Error in list_diagram_icons: {str(e)}')
         # Return empty response on error
         return DiagramIconsResponse(providers={}, filtered=False, filter_info={'error': str(e)})
+
+
+def search_diagram_icons(
+    query: str, provider_filter: Optional[str] = None, limit: int = 20
+) -> DiagramIconSearchResponse:
+    """Search the icons of the diagrams package by name, tolerating typos.
+
+    Args:
+        query: Name or part of the name of the icon (e.g., "lambda", "dynamo db")
+        provider_filter: Optional filter by provider name (e.g., "aws", "gcp")
+        limit: Maximum number of icons to return
+
+    Returns:
+        DiagramIconSearchResponse: Matching icons, best match first
+    """
+    catalog = get_icon_catalog()
+    results = [
+        DiagramIconMatch(
+            provider=entry.provider,
+            service=entry.service,
+            name=entry.name,
+            alias_of=entry.icon if entry.icon != entry.name else None,
+            score=round(score, 3),
+            import_statement=f'from diagrams.{entry.provider}.{entry.service} import {entry.name}',
+        )
+        for entry, score in catalog.search(query, provider_filter, limit)
+    ]
+    return DiagramIconSearchResponse(query=query, results=results)
@@ -0,0 +1,303 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+
+"""Catalog of the icons of the diagrams package for the diagrams-mcp-server."""
+
+import ast
+import json
+import logging
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from importlib.metadata import PackageNotFoundError, version
+from importlib.util import find_spec
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+ICON_CATALOG_VERSION = 1
+
+# Directory of the icon catalog file, empty to build the catalog in memory on every start
+ICON_CATALOG_CACHE_DIR = os.environ.get(
+    'ICON_CATALOG_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'awslabs-aws-diagram-mcp-server'),
+)
+
+# Minimum score of the icons returned by a search
+MIN_SEARCH_SCORE = 0.3
+
+
+class IconEntry(NamedTuple):
+    """A name under which an icon can be used in a diagram."""
+
+    provider: str
+    service: str
+    name: str
+    # Class the name refers to, which differs from the name for aliases
+    icon: str
+
+
+def get_diagrams_path() -> str:
+    """Get the directory of the diagrams package without importing it."""
+    spec = find_spec('diagrams')
+    if spec is None or spec.origin is None:
+        raise ImportError('The diagrams package is not installed')
+    return os.path.dirname(spec.origin)
+
+
+def get_diagrams_version() -> str:
+    """Get the installed version of the diagrams package."""
+    try:
+        return version('diagrams')
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+def parse_service_module(path: str) -> Tuple[List[str], Dict[str, str]]:
+    """Find the icons of a service module of the diagrams package without importing it.
+
+    The service modules are generated and only define node classes, followed by aliases
+    assigning some of these classes to shorter names.
+
+    Args:
+        path: Path of the service module
+
+    Returns:
+        The names of the icon classes and the aliases mapped to the class they refer to
+    """
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    classes = []
+    aliases = {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and not node.name.startswith('_'):
+            classes.append(node.name)
+        elif (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and isinstance(node.value, ast.Name)
+            and not node.targets[0].id.startswith('_')
+        ):
+            aliases[node.targets[0].id] = node.value.id
+
+    known = set(classes)
+    return classes, {alias: icon for alias, icon in aliases.items() if icon in known}
+
+
+def build_icon_catalog(diagrams_path: str) -> Dict[str, Any]:
+    """Build the icon catalog from the sources of the diagrams package.
+
+    Args:
+        diagrams_path: Directory of the diagrams package
+
+    Returns:
+        Icon classes and aliases by provider and service
+    """
+    providers: Dict[str, Dict[str, List[str]]] = {}
+    aliases: Dict[str, Dict[str, Dict[str, str]]] = {}
+
+    for provider_name in sorted(os.listdir(diagrams_path)):
+        provider_path = os.path.join(diagrams_path, provider_name)
+        if not os.path.isdir(provider_path) or provider_name.startswith('_'):
+            continue
+
+        providers[provider_name] = {}
+        for service_file in sorted(os.listdir(provider_path)):
+            if not service_file.endswith('.py') or service_file.startswith('_'):
+                continue
+            service_name = service_file[:-3]
+            try:
+                classes, service_aliases = parse_service_module(
+                    os.path.join(provider_path, service_file)
+                )
+            except (OSError, SyntaxError) as e:
+                logger.error(f'Error processing diagrams.{provider_name}.{service_name}: {e}')
+                continue
+            if classes:
+                # Aliases are module attributes too, so they can be imported like classes
+                providers[provider_name][service_name] = sorted(
+                    set(classes) | set(service_aliases)
+                )
+            if service_aliases:
+                aliases.setdefault(provider_name, {})[service_name] = service_aliases
+
+    return {'providers': providers, 'aliases': aliases}
+
+
+def normalize(name: str) -> str:
+    """Normalize a name for searching, ignoring case and separators."""
+    return re.sub(r'[^a-z0-9]', '', name.lower())
+
+
+def trigrams(text: str) -> Set[str]:
+    """Get the trigrams of a normalized text, padded so that short texts have some."""
+    padded = f'  {text} '
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class IconCatalog:
+    """Catalog of the icons of the diagrams package with a fuzzy search index."""
+
+    def __init__(self, catalog: Dict[str, Any]):
+        """Initialize the catalog and index its icons.
+
+        Args:
+            catalog: Icon classes and aliases by provider and service
+        """
+        self.providers: Dict[str, Dict[str, List[str]]] = catalog['providers']
+        self.aliases: Dict[str, Dict[str, Dict[str, str]]] = catalog['aliases']
+
+        self.entries: List[IconEntry] = []
+        self._keys: List[str] = []
+        self._sizes: List[int] = []
+        self._index: Dict[str, List[int]] = defaultdict(list)
+        for provider, services in self.providers.items():
+            for service, names in services.items():
+                service_aliases = self.aliases.get(provider, {}).get(service, {})
+                for name in names:
+                    key = normalize(name)
+                    position = len(self.entries)
+                    self.entries.append(
+                        IconEntry(provider, service, name, service_aliases.get(name, name))
+                    )
+                    key_trigrams = trigrams(key)
+                    self._keys.append(key)
+                    self._sizes.append(len(key_trigrams))
+                    for trigram in key_trigrams:
+                        self._index[trigram].append(position)
+
+    def search(
+        self, query: str, provider: Optional[str] = None, limit: int = 20
+    ) -> List[Tuple[IconEntry, float]]:
+        """Find the icons with a name similar to a query.
+
+        Names containing the query rank first, then names sharing the most trigrams with it.
+
+        Args:
+            query: Name or part of the name of an icon
+            provider: Only return the icons of this provider
+            limit: Maximum number of icons to return
+
+        Returns:
+            Icons and their score between 0 and 1, best first
+        """
+        key = normalize(query)
+        if not key:
+            return []
+
+        query_trigrams = trigrams(key)
+        shared = Counter(
+            position for trigram in query_trigrams for position in self._index.get(trigram, ())
+        )
+
+        scored = []
+        for position, count in shared.items():
+            entry = self.entries[position]
+            if provider and entry.provider != provider:
+                continue
+            name_key = self._keys[position]
+            if name_key == key:
+                score = 1.0
+            elif name_key.startswith(key):
+                score = 0.9
+            elif key in name_key:
+                score = 0.8
+            else:
+                # Dice coefficient of the trigrams, which stays below the exact matches
+                score = 1.5 * count / (len(query_trigrams) + self._sizes[position])
+            if score >= MIN_SEARCH_SCORE:
+                scored.append((entry, score))
+
+        scored.sort(key=lambda item: (-item[1], len(item[0].name), item[0].name))
+        return scored[:limit]
+
+
+_icon_catalog: Optional[IconCatalog] = None
+_icon_catalog_lock = threading.Lock()
+
+
+def get_icon_catalog_path() -> Optional[str]:
+    """Get the path of the icon catalog file of the installed diagrams package.
+
+    Returns:
+        Path of the file, None if the catalog is not cached on disk
+    """
+    if not ICON_CATALOG_CACHE_DIR:
+        return None
+    return os.path.join(
+        ICON_CATALOG_CACHE_DIR, f'icon-catalog-diagrams-{get_diagrams_version()}.json'
+    )
+
+
+def load_icon_catalog_file(path: str) -> Optional[Dict[str, Any]]:
+    """Load the icon catalog file.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        The icon catalog, None if the file does not exist or is not valid
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == ICON_CATALOG_VERSION:
+            return {'providers': cache['providers'], 'aliases': cache['aliases']}
+    except Exception as e:
+        logger.warning(f'Error loading icon catalog from {path}: {e}')
+    return None
+
+
+def save_icon_catalog_file(path: str, catalog: Dict[str, Any]):
+    """Write the icon catalog file.
+
+    Args:
+        path: Path of the file
+        catalog: Icon classes and aliases by provider and service
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = f'{path}.{os.getpid()}.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': ICON_CATALOG_VERSION, **catalog}, f)
+        os.replace(temporary_path, path)
+    except Exception as e:
+        logger.warning(f'Error saving icon catalog to {path}: {e}')
+
+
+def get_icon_catalog() -> IconCatalog:
+    """Get the icon catalog, loading it on first use.
+
+    The catalog is built from the sources of the diagrams package the first time the server
+    runs with a given version of the package, then loaded from the cache file.
+
+    Returns:
+        The icon catalog
+    """
+    global _icon_catalog
+    with _icon_catalog_lock:
+        if _icon_catalog is None:
+            path = get_icon_catalog_path()
+            catalog = load_icon_catalog_file(path) if path else None
+            if catalog is None:
+                catalog = build_icon_catalog(get_diagrams_path())
+                if path:
+                    save_icon_catalog_file(path, catalog)
+            _icon_catalog = IconCatalog(catalog)
+        return _icon_catalog
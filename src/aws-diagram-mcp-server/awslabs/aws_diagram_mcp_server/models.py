@@ -94,3 +94,21 @@ class DiagramIconsResponse(BaseModel):
     providers: Dict[str, Dict[str, List[str]]]
     filtered: bool = False
     filter_info: Optional[Dict[str, str]] = None
+
+
+class DiagramIconMatch(BaseModel):
+    """An icon found by an icon search."""
+
+    provider: str
+    service: str
+    name: str
+    alias_of: Optional[str] = None
+    score: float
+    import_statement: str
+
+
+class DiagramIconSearchResponse(BaseModel):
+    """Response model for searching diagram icons."""
+
+    query: str
+    results: List[DiagramIconMatch]
@@ -0,0 +1,442 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+
+"""Pool of pre-warmed worker processes rendering diagrams for the diagrams-mcp-server."""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from multiprocessing.connection import Connection
+from typing import Any, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Number of worker processes rendering diagrams concurrently
+RENDER_WORKERS = int(os.environ.get('DIAGRAM_RENDER_WORKERS', min(4, os.cpu_count() or 1)))
+
+# Address space limit of each worker process in megabytes, 0 for no limit
+RENDER_WORKER_MEMORY_MB = int(os.environ.get('DIAGRAM_RENDER_WORKER_MEMORY_MB', '2048'))
+
+# Number of diagrams rendered by a worker process before it is replaced by a fresh one
+MAX_JOBS_PER_WORKER = 100
+
+# Maximum number of seconds to wait for a worker process to load the diagrams namespace
+WORKER_START_TIMEOUT = 120
+
+
+class RenderError(Exception):
+    """Error raised by the code of a diagram in a worker process."""
+
+    def __init__(self, error_type: str, message: str):
+        """Initialize the render error.
+
+        Args:
+            error_type: Name of the type of the exception raised in the worker process
+            message: Message of the exception raised in the worker process
+        """
+        super().__init__(message)
+        self.error_type = error_type
+        self.message = message
+
+
+def build_namespace() -> Dict[str, Any]:
+    """Build the namespace in which the code of diagrams is executed.
+
+    Returns:
+        Namespace with the diagrams package and all of its nodes imported
+    """
+    # Create a namespace for execution
+    namespace = {}
+
+    # Import necessary modules directly in the namespace
+    # nosec B102 - These exec calls are necessary to import modules in the namespace
+    exec(  # nosem: python.lang.security.audit.exec-detected.exec-detected
+        # nosem: python.lang.security.audit.exec-detected.exec-detected
+        'import os',
+        namespace,
+    )
+    # nosec B102 - These exec calls are necessary to import modules in the namespace
+    exec(  # nosem: python.lang.security.audit.exec-detected.exec-detected
+        'import diagrams', namespace
+    )
+    # nosec B102 - These exec calls are necessary to import modules in the namespace
+    exec(  # nosem: python.lang.security.audit.exec-detected.exec-detected
+        'from diagrams import Diagram, Cluster, Edge', namespace
+    )  # nosem: python.lang.security.audit.exec-detected.exec-detected
+    # nosec B102 - These exec calls are necessary to import modules in the namespace
+    exec(  # nosem: python.lang.security.audit.exec-detected.exec-detected
+        """from diagrams.saas.crm import *
+from diagrams.saas.identity import *
+from diagrams.saas.chat import *
+from diagrams.saas.recommendation import *
+from diagrams.saas.cdn import *
+from diagrams.saas.communication import *
+from diagrams.saas.media import *
+from diagrams.saas.logging import *
+from diagrams.saas.security import *
+from diagrams.saas.social import *
+from diagrams.saas.alerting import *
+from diagrams.saas.analytics import *
+from diagrams.saas.automation import *
+from diagrams.saas.filesharing import *
+from diagrams.onprem.vcs import *
+from diagrams.onprem.database import *
+from diagrams.onprem.gitops import *
+from diagrams.onprem.workflow import *
+from diagrams.onprem.etl import *
+from diagrams.onprem.inmemory import *
+from diagrams.onprem.identity import *
+from diagrams.onprem.network import *
+from diagrams.onprem.proxmox import *
+from diagrams.onprem.cd import *
+from diagrams.onprem.container import *
+from diagrams.onprem.certificates import *
+from diagrams.onprem.mlops import *
+from diagrams.onprem.dns import *
+from diagrams.onprem.compute import *
+from diagrams.onprem.logging import *
+from diagrams.onprem.registry import *
+from diagrams.onprem.security import *
+from diagrams.onprem.client import *
+from diagrams.onprem.groupware import *
+from diagrams.onprem.iac import *
+from diagrams.onprem.analytics import *
+from diagrams.onprem.messaging import *
+from diagrams.onprem.tracing import *
+from diagrams.onprem.ci import *
+from diagrams.onprem.search import *
+from diagrams.onprem.storage import *
+from diagrams.onprem.auth import *
+from diagrams.onprem.monitoring import *
+from diagrams.onprem.aggregator import *
+from diagrams.onprem.queue import *
+from diagrams.gis.database import *
+from diagrams.gis.cli import *
+from diagrams.gis.server import *
+from diagrams.gis.python import *
+from diagrams.gis.organization import *
+from diagrams.gis.cplusplus import *
+from diagrams.gis.mobile import *
+from diagrams.gis.javascript import *
+from diagrams.gis.desktop import *
+from diagrams.gis.ogc import *
+from diagrams.gis.java import *
+from diagrams.gis.routing import *
+from diagrams.gis.data import *
+from diagrams.gis.geocoding import *
+from diagrams.gis.format import *
+from diagrams.elastic.saas import *
+from diagrams.elastic.observability import *
+from diagrams.elastic.elasticsearch import *
+from diagrams.elastic.orchestration import *
+from diagrams.elastic.security import *
+from diagrams.elastic.beats import *
+from diagrams.elastic.enterprisesearch import *
+from diagrams.elastic.agent import *
+from diagrams.programming.runtime import *
+from diagrams.programming.framework import *
+from diagrams.programming.flowchart import *
+from diagrams.programming.language import *
+from diagrams.gcp.storage import *
+from diagrams.generic.database import *
+from diagrams.generic.blank import *
+from diagrams.generic.network import *
+from diagrams.generic.virtualization import *
+from diagrams.generic.place import *
+from diagrams.generic.device import *
+from diagrams.generic.compute import *
+from diagrams.generic.os import *
+from diagrams.generic.storage import *
+from diagrams.k8s.others import *
+from diagrams.k8s.rbac import *
+from diagrams.k8s.network import *
+from diagrams.k8s.ecosystem import *
+from diagrams.k8s.compute import *
+from diagrams.k8s.chaos import *
+from diagrams.k8s.infra import *
+from diagrams.k8s.podconfig import *
+from diagrams.k8s.controlplane import *
+from diagrams.k8s.clusterconfig import *
+from diagrams.k8s.storage import *
+from diagrams.k8s.group import *
+from diagrams.aws.cost import *
+from diagrams.aws.ar import *
+from diagrams.aws.general import *
+from diagrams.aws.database import *
+from diagrams.aws.management import *
+from diagrams.aws.ml import *
+from diagrams.aws.game import *
+from diagrams.aws.enablement import *
+from diagrams.aws.network import *
+from diagrams.aws.quantum import *
+from diagrams.aws.iot import *
+from diagrams.aws.robotics import *
+from diagrams.aws.migration import *
+from diagrams.aws.mobile import *
+from diagrams.aws.compute import *
+from diagrams.aws.media import *
+from diagrams.aws.engagement import *
+from diagrams.aws.security import *
+from diagrams.aws.devtools import *
+from diagrams.aws.integration import *
+from diagrams.aws.business import *
+from diagrams.aws.analytics import *
+from diagrams.aws.blockchain import *
+from diagrams.aws.storage import *
+from diagrams.aws.satellite import *
+from diagrams.aws.enduser import *
+""",
+        namespace,
+    )
+    # nosec B102 - These exec calls are necessary to import modules in the namespace
+    exec(  # nosem: python.lang.security.audit.exec-detected.exec-detected
+        'from urllib.request import urlretrieve', namespace
+    )  # nosem: python.lang.security.audit.exec-detected.exec-detected
+
+    return namespace
+
+
+def limit_memory(memory_mb: int):
+    """Limit the address space of the current process.
+
+    Args:
+        memory_mb: Limit in megabytes, 0 for no limit
+    """
+    if memory_mb <= 0:
+        return
+    try:
+        import resource
+
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError) as e:
+        # resource is not available on Windows
+        logger.warning(f'Could not limit the memory of the render worker: {e}')
+
+
+def worker_main(connection: Connection, memory_mb: int):
+    """Run a worker process rendering diagrams.
+
+    The worker loads the diagrams namespace once, then executes the code of each diagram
+    received over the connection in a copy of that namespace and replies with the outcome.
+
+    Args:
+        connection: Connection to the parent process
+        memory_mb: Address space limit of the process in megabytes, 0 for no limit
+    """
+    # Keep the output of diagrams off the stdout of the server, which carries the MCP protocol
+    os.dup2(2, 1)
+    limit_memory(memory_mb)
+    namespace = build_namespace()
+    connection.send(('ready', None, None))
+
+    while True:
+        try:
+            code = connection.recv()
+        except EOFError:
+            return
+        try:
+            # nosec B102 - This exec is necessary to run user-provided diagram code in a controlled environment
+            exec(  # nosem: python.lang.security.audit.exec-detected.exec-detected
+                code, dict(namespace)
+            )
+            connection.send(('ok', None, None))
+        except BaseException as e:
+            # Includes SystemExit, so that the code cannot stop the worker
+            connection.send(('error', type(e).__name__, str(e)))
+
+
+class RenderWorker:
+    """A worker process and the connection used to send it diagrams."""
+
+    def __init__(self, context: Any, memory_mb: int):
+        """Start the worker process.
+
+        Args:
+            context: Multiprocessing context used to start the process
+            memory_mb: Address space limit of the process in megabytes, 0 for no limit
+        """
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(
+            target=worker_main,
+            args=(child_connection, memory_mb),
+            name='diagram-render-worker',
+            daemon=True,
+        )
+        self.process.start()
+        child_connection.close()
+        self.ready = False
+        self.healthy = True
+        self.jobs = 0
+
+    def wait_ready(self, timeout: float) -> bool:
+        """Wait for the worker process to load the diagrams namespace.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            True if the worker process is ready to render diagrams
+        """
+        if not self.ready:
+            try:
+                self.ready = self.connection.poll(timeout) and self.connection.recv()[0] == 'ready'
+            except (EOFError, OSError):
+                self.ready = False
+        return self.ready
+
+    def render(self, code: str, timeout: float):
+        """Render a diagram in the worker process.
+
+        Args:
+            code: Code of the diagram
+            timeout: Maximum number of seconds the code may run
+
+        Raises:
+            TimeoutError: If the code did not complete in time
+            RenderError: If the code raised an exception or the worker process died
+        """
+        self.jobs += 1
+        try:
+            self.connection.send(code)
+            completed = self.connection.poll(timeout)
+            if completed:
+                status, error_type, message = self.connection.recv()
+        except (EOFError, OSError):
+            self.healthy = False
+            raise RenderError(
+                'WorkerError',
+                f'Render worker exited with code {self.process.exitcode}, '
+                'the diagram may have exceeded the memory limit',
+            )
+        if not completed:
+            # The worker is still running the code
+            self.healthy = False
+            raise TimeoutError(f'Diagram generation timed out after {timeout} seconds')
+        if status == 'error':
+            if error_type == 'MemoryError':
+                self.healthy = False
+            raise RenderError(error_type, message)
+
+    def stop(self):
+        """Stop the worker process."""
+        self.connection.close()
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+
+
+class RenderPool:
+    """Pool of worker processes with the diagrams namespace preloaded.
+
+    Importing every node of the diagrams package takes much longer than rendering most
+    diagrams, so each worker does it once when it starts. Each diagram is then rendered by an
+    idle worker, so several diagrams render at once without blocking the event loop. A worker
+    running past the timeout of its diagram is killed and replaced.
+    """
+
+    def __init__(self, size: int = RENDER_WORKERS, memory_mb: int = RENDER_WORKER_MEMORY_MB):
+        """Initialize the pool and start its worker processes.
+
+        Args:
+            size: Number of worker processes
+            memory_mb: Address space limit of each worker process in megabytes, 0 for no limit
+        """
+        # Forking a process running an event loop and threads is unsafe
+        self._context = multiprocessing.get_context('spawn')
+        self._memory_mb = memory_mb
+        self._idle: 'queue.Queue[RenderWorker]' = queue.Queue()
+        self._workers: List[RenderWorker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(max(1, size)):
+            self._release(self._start_worker())
+
+    def _start_worker(self) -> RenderWorker:
+        """Start a worker process."""
+        worker = RenderWorker(self._context, self._memory_mb)
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+
+    def _replace(self, worker: RenderWorker):
+        """Stop a worker process and start a fresh one in its place."""
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        worker.stop()
+        if not self._closed:
+            self._release(self._start_worker())
+
+    def _release(self, worker: RenderWorker):
+        """Make a worker available to render diagrams."""
+        self._idle.put(worker)
+
+    def render(self, code: str, timeout: float):
+        """Render a diagram with the next idle worker, blocking until it completes.
+
+        Args:
+            code: Code of the diagram
+            timeout: Maximum number of seconds the code may run
+
+        Raises:
+            TimeoutError: If the code did not complete in time
+            RenderError: If the code raised an exception or no worker could start
+        """
+        if self._closed:
+            raise RenderError('RuntimeError', 'Render pool is closed')
+        worker = self._idle.get()
+        if not worker.wait_ready(WORKER_START_TIMEOUT):
+            exitcode = worker.process.exitcode
+            self._replace(worker)
+            raise RenderError(
+                'WorkerError', f'Render worker failed to start (exit code {exitcode})'
+            )
+
+        try:
+            worker.render(code, timeout)
+        finally:
+            if worker.healthy and worker.jobs < MAX_JOBS_PER_WORKER:
+                self._release(worker)
+            else:
+                self._replace(worker)
+
+    def close(self):
+        """Stop all the worker processes."""
+        self._closed = True
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.stop()
+
+
+_render_pool: Optional[RenderPool] = None
+_render_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> RenderPool:
+    """Get the shared render pool, starting its worker processes on first use.
+
+    Returns:
+        The shared render pool
+    """
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = RenderPool()
+            atexit.register(_render_pool.close)
+        return _render_pool
@@ -13,11 +13,19 @@
 
 import ast
 import os
+from awslabs.aws_diagram_mcp_server import __version__
+from awslabs.aws_diagram_mcp_server.content_cache import content_key, get_content_cache
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
 from pydantic import BaseModel, Field
 from tempfile import NamedTemporaryFile
 from typing import Any, Dict, List, Optional, Tuple
 
 
+# Version of the checks of the server itself, to increase when they change so cached scans are redone
+SCAN_RULES_VERSION = '1'
+
+
 class SecurityIssue(BaseModel):
     """Model for security issues found in code."""
 
@@ -162,8 +170,42 @@ async def count_code_metrics(code: str) -> CodeMetrics:
     )
 
 
+@lru_cache(maxsize=None)
+def get_bandit_version() -> str:
+    """Get the installed version of bandit, which scan results depend on."""
+    try:
+        return version('bandit')
+    except PackageNotFoundError:
+        return 'unknown'
+
+
 async def scan_python_code(code: str) -> CodeScanResult:
-    """Use ast and bandit to scan the python code for security issues."""
+    """Use ast and bandit to scan the python code for security issues.
+
+    Scan results are cached by the hash of the code and the versions of bandit, of the server
+    and of its own checks, so scanning the same code again skips bandit.
+    """
+    cache = get_content_cache()
+    if cache is None:
+        return await scan_python_code_uncached(code)
+
+    cache_key = content_key('scan', get_bandit_version(), __version__, SCAN_RULES_VERSION, code)
+    cached = cache.get_bytes(cache_key, '.json')
+    if cached is not None:
+        try:
+            return CodeScanResult.model_validate_json(cached)
+        except ValueError:
+            pass
+
+    result = await scan_python_code_uncached(code)
+    # Errors running bandit may not happen again
+    if not any(issue.issue_type == 'ScanError' for issue in result.security_issues):
+        cache.put(cache_key, '.json', result.model_dump_json().encode('utf-8'))
+    return result
+
+
+async def scan_python_code_uncached(code: str) -> CodeScanResult:
+    """Use ast and bandit to scan the python code for security issues, without the cache."""
     # Get code metrics
     metrics = await count_code_metrics(code)
 
@@ -8,8 +8,10 @@ from awslabs.aws_diagram_mcp_server.diagrams_tools import (
     generate_diagram,
     get_diagram_examples,
     list_diagram_icons,
+    search_diagram_icons,
 )
 from awslabs.aws_diagram_mcp_server.models import DiagramType
+from awslabs.aws_diagram_mcp_server.render_pool import get_render_pool
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
 from typing import Optional
@@ -41,6 +43,7 @@ WORKFLOW:
    - Discover all available icons in the diagrams package
    - Browse providers, services, and icons organized hierarchically
    - Find the exact import paths for icons you want to use
+   - Use search_icons instead to find icons by name when you know what you are looking for
 
 2. get_diagram_examples:
    - Request example code for the diagram type you need (aws, sequence, flow, class, k8s, onprem, custom, or all)
@@ -260,8 +263,38 @@ async def mcp_list_diagram_icons(
     return result.model_dump()
 
 
+@mcp.tool(name='search_icons')
+async def mcp_search_diagram_icons(
+    query: str = Field(
+        ..., description='Name or part of the name of the icon (e.g., "lambda", "dynamo db")'
+    ),
+    provider_filter: Optional[str] = Field(
+        default=None, description='Filter icons by provider name (e.g., "aws", "gcp", "k8s")'
+    ),
+    limit: int = Field(default=20, description='Maximum number of icons to return'),
+):
+    """Search the icons of the diagrams package by name.
+
+    This tool finds icons whose name is similar to the query, tolerating typos, different
+    casing and separators. Each result includes the import statement of the icon. Names
+    that are aliases of another icon (e.g., "S3" for "SimpleStorageServiceS3") include the
+    name of that icon.
+
+    Example:
+    - search_icons(query="lamda") → Returns the Lambda icon with its import statement
+    - search_icons(query="database", provider_filter="aws") → Returns AWS icons named like "database"
+
+    Returns:
+        Dictionary with the matching icons, best match first
+    """
+    result = search_diagram_icons(query, provider_filter, limit)
+    return result.model_dump()
+
+
 def main():
     """Run the MCP server with CLI argument support."""
+    # Start the render workers so they load the diagrams namespace before the first request
+    get_render_pool()
     mcp.run()
 
 
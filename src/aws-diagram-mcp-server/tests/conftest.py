@@ -17,6 +17,28 @@ from awslabs.aws_diagram_mcp_server.models import DiagramType
 from typing import Dict, Generator
 
 
+@pytest.fixture(autouse=True, scope='session')
+def icon_catalog_cache_dir(tmp_path_factory) -> Generator[str, None, None]:
+    """Keep the icon catalog file out of the cache directory of the user."""
+    cache_dir = str(tmp_path_factory.mktemp('icon-catalog'))
+    with pytest.MonkeyPatch().context() as monkeypatch:
+        monkeypatch.setattr(
+            'awslabs.aws_diagram_mcp_server.icon_catalog.ICON_CATALOG_CACHE_DIR', cache_dir
+        )
+        yield cache_dir
+
+
+@pytest.fixture(autouse=True)
+def diagram_cache_dir(tmp_path) -> Generator[str, None, None]:
+    """Give each test an empty diagram cache outside the cache directory of the user."""
+    cache_dir = str(tmp_path / 'diagram-cache')
+    with pytest.MonkeyPatch().context() as monkeypatch:
+        monkeypatch.setattr(
+            'awslabs.aws_diagram_mcp_server.content_cache.DIAGRAM_CACHE_DIR', cache_dir
+        )
+        yield cache_dir
+
+
 @pytest.fixture
 def temp_workspace_dir() -> Generator[str, None, None]:
     """Create a temporary directory for diagram output."""
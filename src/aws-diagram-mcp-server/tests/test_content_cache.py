@@ -0,0 +1,196 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+
+"""Tests for the content cache module of the diagrams-mcp-server."""
+
+import os
+import pytest
+from awslabs.aws_diagram_mcp_server import content_cache
+from awslabs.aws_diagram_mcp_server.content_cache import (
+    ContentCache,
+    content_key,
+    get_content_cache,
+)
+from awslabs.aws_diagram_mcp_server.diagrams_tools import generate_diagram, get_render_cache_key
+from awslabs.aws_diagram_mcp_server.scanner import SecurityIssue, scan_python_code
+from unittest.mock import MagicMock, patch
+
+
+DIAGRAM_CODE = """with Diagram("Cached Diagram", show=False):
+    EC2("web")
+"""
+
+
+class TestContentCache:
+    """Tests for the ContentCache class."""
+
+    def test_content_key(self):
+        """Test that keys depend on every part and on their boundaries."""
+        assert content_key('scan', 'code') == content_key('scan', 'code')
+        assert content_key('scan', 'code') != content_key('render', 'code')
+        assert content_key('ab', 'c') != content_key('a', 'bc')
+
+    def test_put_and_get(self, tmp_path):
+        """Test caching content."""
+        cache = ContentCache(str(tmp_path), 100)
+        assert cache.get_bytes('key', '.json') is None
+
+        cache.put('key', '.json', b'{}')
+
+        assert cache.get_bytes('key', '.json') == b'{}'
+        assert cache.get('key', '.json') == os.path.join(str(tmp_path), 'key.json')
+        assert cache.get('key', '.png') is None
+
+    def test_least_recently_used_are_evicted(self, tmp_path):
+        """Test that the least recently used files are evicted above the size limit."""
+        cache = ContentCache(str(tmp_path), 25)
+        cache.put('first', '.png', b'1' * 10)
+        cache.put('second', '.png', b'2' * 10)
+        # Using the first file makes the second one the least recently used
+        assert cache.get('first', '.png') is not None
+
+        cache.put('third', '.png', b'3' * 10)
+
+        assert cache.get('second', '.png') is None
+        assert not os.path.exists(os.path.join(str(tmp_path), 'second.png'))
+        assert cache.get('first', '.png') is not None
+        assert cache.get('third', '.png') is not None
+
+    def test_content_larger_than_the_cache_is_not_cached(self, tmp_path):
+        """Test that content larger than the cache does not evict everything."""
+        cache = ContentCache(str(tmp_path), 10)
+        cache.put('small', '.png', b'1' * 5)
+        cache.put('large', '.png', b'2' * 11)
+        assert cache.get('large', '.png') is None
+        assert cache.get('small', '.png') is not None
+
+    def test_files_are_indexed_from_disk(self, tmp_path):
+        """Test that a new cache finds the files of a previous one in least recently used order."""
+        cache = ContentCache(str(tmp_path), 25)
+        cache.put('first', '.png', b'1' * 10)
+        cache.put('second', '.png', b'2' * 10)
+        os.utime(os.path.join(str(tmp_path), 'first.png'), (1, 1))
+
+        cache = ContentCache(str(tmp_path), 25)
+        cache.put('third', '.png', b'3' * 10)
+
+        assert cache.get('first', '.png') is None
+        assert cache.get('second', '.png') is not None
+
+    def test_disabled(self, monkeypatch):
+        """Test that an empty cache directory disables the cache."""
+        monkeypatch.setattr(content_cache, 'DIAGRAM_CACHE_DIR', '')
+        assert get_content_cache() is None
+
+
+class TestScanCache:
+    """Tests for caching code scans."""
+
+    @pytest.mark.asyncio
+    async def test_same_code_is_scanned_once(self):
+        """Test that scanning the same code again does not run bandit."""
+        with patch(
+            'awslabs.aws_diagram_mcp_server.scanner.check_security', return_value=[]
+        ) as mock_check_security:
+            first = await scan_python_code(DIAGRAM_CODE)
+            second = await scan_python_code(DIAGRAM_CODE)
+
+        assert first == second
+        assert first.has_errors is False
+        mock_check_security.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_scans_are_redone_when_the_rules_change(self):
+        """Test that scans cached with older checks of the server are not used."""
+        with patch(
+            'awslabs.aws_diagram_mcp_server.scanner.check_security', return_value=[]
+        ) as mock_check_security:
+            await scan_python_code(DIAGRAM_CODE)
+            with patch('awslabs.aws_diagram_mcp_server.scanner.SCAN_RULES_VERSION', 'next'):
+                await scan_python_code(DIAGRAM_CODE)
+
+        assert mock_check_security.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_scan_errors_are_not_cached(self):
+        """Test that errors running bandit are not cached."""
+        scan_error = SecurityIssue(
+            severity='ERROR',
+            confidence='HIGH',
+            line=0,
+            issue_text='Error during security scan: failure',
+            issue_type='ScanError',
+        )
+        with patch(
+            'awslabs.aws_diagram_mcp_server.scanner.check_security', return_value=[scan_error]
+        ) as mock_check_security:
+            await scan_python_code(DIAGRAM_CODE)
+            await scan_python_code(DIAGRAM_CODE)
+
+        assert mock_check_security.call_count == 2
+
+
+class TestRenderCache:
+    """Tests for caching rendered diagrams."""
+
+    @staticmethod
+    def render_pool():
+        """Create a mock render pool writing the PNG file named in the code."""
+
+        def render(code, timeout):
+            path = code.split("filename='")[1].split("'")[0]
+            with open(f'{path}.png', 'wb') as f:
+                f.write(b'png')
+
+        pool = MagicMock()
+        pool.render.side_effect = render
+        return pool
+
+    @pytest.mark.asyncio
+    async def test_same_code_is_rendered_once(self, temp_workspace_dir):
+        """Test that rendering the same code again copies the cached diagram."""
+        pool = self.render_pool()
+        with patch(
+            'awslabs.aws_diagram_mcp_server.diagrams_tools.get_render_pool', return_value=pool
+        ):
+            first = await generate_diagram(DIAGRAM_CODE, 'first', workspace_dir=temp_workspace_dir)
+            second = await generate_diagram(
+                DIAGRAM_CODE, 'second', workspace_dir=temp_workspace_dir
+            )
+
+        assert first.status == 'success'
+        assert second.status == 'success'
+        assert second.path.endswith('second.png')
+        with open(second.path, 'rb') as f:
+            assert f.read() == b'png'
+        pool.render.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_renders_are_not_cached(self, temp_workspace_dir):
+        """Test that code failing to render is rendered again."""
+        pool = MagicMock()
+        with patch(
+            'awslabs.aws_diagram_mcp_server.diagrams_tools.get_render_pool', return_value=pool
+        ):
+            for filename in ('first', 'second'):
+                result = await generate_diagram(
+                    DIAGRAM_CODE, filename, workspace_dir=temp_workspace_dir
+                )
+                assert result.status == 'error'
+
+        assert pool.render.call_count == 2
+
+    def test_code_reading_files_is_not_cached(self):
+        """Test that diagrams of code reading files or URLs are not cached."""
+        assert get_render_cache_key(DIAGRAM_CODE) is not None
+        assert get_render_cache_key('Custom("icon", "./icon.png")') is None
+        assert get_render_cache_key('urlretrieve(url, "icon.png")') is None
@@ -19,6 +19,7 @@ from awslabs.aws_diagram_mcp_server.diagrams_tools import (
     generate_diagram,
     get_diagram_examples,
     list_diagram_icons,
+    search_diagram_icons,
 )
 from awslabs.aws_diagram_mcp_server.models import DiagramType
 
@@ -185,6 +186,30 @@ class TestListDiagramIcons:
         assert 'error' in response.filter_info
 
 
+class TestSearchDiagramIcons:
+    """Tests for the search_diagram_icons function."""
+
+    def test_search_with_typo(self):
+        """Test that icons are found despite typos."""
+        response = search_diagram_icons('lamda', provider_filter='aws')
+        assert response.query == 'lamda'
+        assert response.results[0].name == 'Lambda'
+        assert response.results[0].import_statement == 'from diagrams.aws.compute import Lambda'
+
+    def test_search_alias(self):
+        """Test that aliases refer to the icon they stand for."""
+        response = search_diagram_icons('s3', provider_filter='aws', limit=1)
+        assert len(response.results) == 1
+        assert response.results[0].name == 'S3'
+        assert response.results[0].alias_of == 'SimpleStorageServiceS3'
+        assert response.results[0].score == 1.0
+
+    def test_search_without_match(self):
+        """Test searching for a name that matches no icon."""
+        response = search_diagram_icons('!!!')
+        assert response.results == []
+
+
 class TestGenerateDiagram:
     """Tests for the generate_diagram function."""
 
@@ -0,0 +1,183 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+
+"""Tests for the icon catalog module of the diagrams-mcp-server."""
+
+import json
+import os
+import pytest
+from awslabs.aws_diagram_mcp_server import icon_catalog
+from awslabs.aws_diagram_mcp_server.icon_catalog import (
+    ICON_CATALOG_VERSION,
+    IconCatalog,
+    build_icon_catalog,
+    get_icon_catalog,
+    load_icon_catalog_file,
+    parse_service_module,
+    save_icon_catalog_file,
+)
+
+
+SERVICE_MODULE = """# This module is automatically generated by autogen.sh. DO NOT EDIT.
+
+from . import _AWS
+
+
+class _Compute(_AWS):
+    _type = "compute"
+    _icon_dir = "resources/aws/compute"
+
+
+class EC2(_Compute):
+    _icon = "ec2.png"
+
+
+class ElasticKubernetesService(_Compute):
+    _icon = "elastic-kubernetes-service.png"
+
+
+class Lambda(_Compute):
+    _icon = "lambda.png"
+
+
+# Aliases
+
+EKS = ElasticKubernetesService
+_Private = EC2
+"""
+
+
+@pytest.fixture
+def diagrams_path(tmp_path):
+    """Create a directory laid out like the diagrams package."""
+    (tmp_path / '__init__.py').write_text('')
+    (tmp_path / '__pycache__').mkdir()
+    aws = tmp_path / 'aws'
+    aws.mkdir()
+    (aws / '__init__.py').write_text('')
+    (aws / 'compute.py').write_text(SERVICE_MODULE)
+    (aws / 'broken.py').write_text('class (')
+    (tmp_path / 'custom').mkdir()
+    return str(tmp_path)
+
+
+@pytest.fixture
+def catalog(diagrams_path):
+    """Create an icon catalog from the fake diagrams package."""
+    return IconCatalog(build_icon_catalog(diagrams_path))
+
+
+class TestBuildIconCatalog:
+    """Tests for building the icon catalog."""
+
+    def test_parse_service_module(self, diagrams_path):
+        """Test finding the icon classes and aliases of a service module."""
+        classes, aliases = parse_service_module(os.path.join(diagrams_path, 'aws', 'compute.py'))
+        assert classes == ['EC2', 'ElasticKubernetesService', 'Lambda']
+        assert aliases == {'EKS': 'ElasticKubernetesService'}
+
+    def test_build_icon_catalog(self, diagrams_path):
+        """Test building the catalog of a package."""
+        catalog = build_icon_catalog(diagrams_path)
+        assert catalog['providers'] == {
+            'aws': {'compute': ['EC2', 'EKS', 'ElasticKubernetesService', 'Lambda']},
+            'custom': {},
+        }
+        assert catalog['aliases'] == {'aws': {'compute': {'EKS': 'ElasticKubernetesService'}}}
+
+
+class TestIconCatalogFile:
+    """Tests for the icon catalog file."""
+
+    def test_save_and_load(self, tmp_path, diagrams_path):
+        """Test that a saved catalog loads back."""
+        path = str(tmp_path / 'cache' / 'catalog.json')
+        catalog = build_icon_catalog(diagrams_path)
+        save_icon_catalog_file(path, catalog)
+        assert load_icon_catalog_file(path) == catalog
+
+    def test_load_other_version(self, tmp_path):
+        """Test that a catalog file of another format version is ignored."""
+        path = tmp_path / 'catalog.json'
+        path.write_text(
+            json.dumps({'version': ICON_CATALOG_VERSION + 1, 'providers': {}, 'aliases': {}})
+        )
+        assert load_icon_catalog_file(str(path)) is None
+
+    def test_load_missing_or_invalid(self, tmp_path):
+        """Test that missing and invalid catalog files are ignored."""
+        path = tmp_path / 'catalog.json'
+        assert load_icon_catalog_file(str(path)) is None
+        path.write_text('not json')
+        assert load_icon_catalog_file(str(path)) is None
+
+    def test_get_icon_catalog_uses_file(self, tmp_path, monkeypatch):
+        """Test that the catalog is loaded from its file instead of being built."""
+        monkeypatch.setattr(icon_catalog, 'ICON_CATALOG_CACHE_DIR', str(tmp_path))
+        monkeypatch.setattr(icon_catalog, '_icon_catalog', None)
+        save_icon_catalog_file(
+            icon_catalog.get_icon_catalog_path(),
+            {'providers': {'aws': {'compute': ['EC2']}}, 'aliases': {}},
+        )
+
+        catalog = get_icon_catalog()
+
+        assert catalog.providers == {'aws': {'compute': ['EC2']}}
+        assert get_icon_catalog() is catalog
+        monkeypatch.setattr(icon_catalog, '_icon_catalog', None)
+
+    def test_get_icon_catalog_saves_file(self, tmp_path, monkeypatch):
+        """Test that a built catalog is saved to its file."""
+        monkeypatch.setattr(icon_catalog, 'ICON_CATALOG_CACHE_DIR', str(tmp_path))
+        monkeypatch.setattr(icon_catalog, '_icon_catalog', None)
+
+        catalog = get_icon_catalog()
+
+        assert 'compute' in catalog.providers['aws']
+        assert os.path.exists(icon_catalog.get_icon_catalog_path())
+        monkeypatch.setattr(icon_catalog, '_icon_catalog', None)
+
+
+class TestIconCatalogSearch:
+    """Tests for searching the icon catalog."""
+
+    def test_exact_match_first(self, catalog):
+        """Test that an exact match ranks first."""
+        results = catalog.search('ec2')
+        assert results[0][0].name == 'EC2'
+        assert results[0][1] == 1.0
+
+    def test_separators_and_case_are_ignored(self, catalog):
+        """Test that queries match regardless of case and separators."""
+        results = catalog.search('elastic kubernetes-SERVICE')
+        assert results[0][0].name == 'ElasticKubernetesService'
+
+    def test_typo(self, catalog):
+        """Test that names with typos are found."""
+        results = catalog.search('lamdba')
+        assert [entry.name for entry, _ in results] == ['Lambda']
+        assert results[0][1] < 1.0
+
+    def test_alias(self, catalog):
+        """Test that aliases are found with the icon they refer to."""
+        entry, _ = catalog.search('eks')[0]
+        assert entry.name == 'EKS'
+        assert entry.icon == 'ElasticKubernetesService'
+
+    def test_provider_filter_and_limit(self, catalog):
+        """Test filtering the results by provider and limiting their number."""
+        assert catalog.search('ec2', provider='gcp') == []
+        assert len(catalog.search('e', limit=1)) == 1
+
+    def test_empty_query(self, catalog):
+        """Test that a query without letters or digits matches nothing."""
+        assert catalog.search(' - ') == []
@@ -0,0 +1,96 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+
+"""Tests for the render pool module of the diagrams-mcp-server."""
+
+import asyncio
+import os
+import pytest
+import time
+from awslabs.aws_diagram_mcp_server.render_pool import RenderError, RenderPool, build_namespace
+
+
+@pytest.fixture(scope='module')
+def render_pool():
+    """Create a render pool with two workers."""
+    pool = RenderPool(size=2, memory_mb=0)
+    yield pool
+    pool.close()
+
+
+class TestBuildNamespace:
+    """Tests for the namespace of diagram code."""
+
+    def test_namespace_has_diagrams_and_nodes(self):
+        """Test that the namespace has the diagrams classes and nodes."""
+        namespace = build_namespace()
+        for name in ('Diagram', 'Cluster', 'Edge', 'EC2', 'Lambda', 'User', 'urlretrieve'):
+            assert name in namespace
+
+
+class TestRenderPool:
+    """Tests for the RenderPool class."""
+
+    def test_render_writes_output(self, render_pool, temp_workspace_dir):
+        """Test that the code runs in a worker with the diagrams namespace."""
+        path = os.path.join(temp_workspace_dir, 'output.txt')
+        render_pool.render(f'open({path!r}, "w").write(Diagram.__name__)', timeout=30)
+        with open(path) as f:
+            assert f.read() == 'Diagram'
+
+    def test_render_error(self, render_pool):
+        """Test that exceptions raised by the code are reported."""
+        with pytest.raises(RenderError) as e:
+            render_pool.render('raise ValueError("boom")', timeout=30)
+        assert e.value.error_type == 'ValueError'
+        assert e.value.message == 'boom'
+
+    def test_exit_does_not_stop_worker(self, render_pool):
+        """Test that code calling exit does not stop the worker."""
+        with pytest.raises(RenderError) as e:
+            render_pool.render('exit(3)', timeout=30)
+        assert e.value.error_type == 'SystemExit'
+        render_pool.render('x = 1', timeout=30)
+
+    def test_namespace_is_not_shared_between_diagrams(self, render_pool):
+        """Test that names defined by a diagram are not visible to the next ones."""
+        for _ in range(2):
+            render_pool.render('assert "leaked" not in globals()\nleaked = True', timeout=30)
+
+    def test_timeout_replaces_worker(self, render_pool):
+        """Test that a worker running past the timeout is replaced."""
+        with pytest.raises(TimeoutError, match='timed out after 0.5 seconds'):
+            render_pool.render('import time\ntime.sleep(30)', timeout=0.5)
+        render_pool.render('x = 1', timeout=30)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_renders(self, render_pool):
+        """Test that diagrams render concurrently in different workers."""
+        # Make sure both workers are ready
+        await asyncio.gather(
+            *(asyncio.to_thread(render_pool.render, 'x = 1', 30) for _ in range(2))
+        )
+        start = time.monotonic()
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(render_pool.render, 'import time\ntime.sleep(1)', 30)
+                for _ in range(2)
+            )
+        )
+        assert time.monotonic() - start < 1.9
+
+    def test_closed_pool(self):
+        """Test that a closed pool no longer renders diagrams."""
+        pool = RenderPool(size=1, memory_mb=0)
+        pool.close()
+        with pytest.raises(RenderError, match='closed'):
+            pool.render('x = 1', timeout=30)
@@ -21,6 +21,7 @@ from awslabs.aws_diagram_mcp_server.server import (
     mcp_generate_diagram,
     mcp_get_diagram_examples,
     mcp_list_diagram_icons,
+    mcp_search_diagram_icons,
 )
 from unittest.mock import MagicMock, patch
 
@@ -312,6 +313,23 @@ class TestMcpListDiagramIcons:
         assert args[1] == 'compute'
 
 
+class TestMcpSearchDiagramIcons:
+    """Tests for the mcp_search_diagram_icons function."""
+
+    @pytest.mark.asyncio
+    @patch('awslabs.aws_diagram_mcp_server.server.search_diagram_icons')
+    async def test_search_diagram_icons(self, mock_search_diagram_icons):
+        """Test the mcp_search_diagram_icons function."""
+        mock_search_diagram_icons.return_value = MagicMock(
+            model_dump=MagicMock(return_value={'query': 'lambda', 'results': []})
+        )
+
+        result = await mcp_search_diagram_icons(query='lambda', provider_filter='aws', limit=5)
+
+        assert result == {'query': 'lambda', 'results': []}
+        mock_search_diagram_icons.assert_called_once_with('lambda', 'aws', 5)
+
+
 class TestServerIntegration:
     """Integration tests for the server module."""
 
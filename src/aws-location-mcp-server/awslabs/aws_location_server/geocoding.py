@@ -0,0 +1,116 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Caching and rate limiting of geocoding and reverse geocoding calls."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+
+# Maximum number of cached geocode and reverse geocode responses
+DEFAULT_GEOCODE_CACHE_SIZE = 1024
+# Seconds during which a cached response is reused, 0 to disable the cache
+DEFAULT_GEOCODE_CACHE_TTL = 3600
+# Decimal places positions are rounded to before reverse geocoding, 5 is about 1 meter
+DEFAULT_COORDINATE_PRECISION = 5
+# Maximum number of concurrent calls of a batch tool
+DEFAULT_BATCH_CONCURRENCY = 8
+# Maximum number of calls per second of a batch tool, 0 for no limit
+DEFAULT_BATCH_RATE_LIMIT = 10.0
+# Maximum number of queries or positions of a batch tool call
+MAX_BATCH_SIZE = 100
+
+
+def normalize_query(query: str) -> str:
+    """Normalize the case and whitespace of a geocode query, so that equivalent queries share a cache entry."""
+    return ' '.join(query.split()).casefold()
+
+
+def quantize_position(
+    longitude: float, latitude: float, precision: int = DEFAULT_COORDINATE_PRECISION
+) -> Tuple[float, float]:
+    """Round a position to a number of decimal places, so that nearby positions share a cache entry."""
+    return round(longitude, precision), round(latitude, precision)
+
+
+class GeocodeCache:
+    """Bounded least recently used cache of geo-places responses, expiring after a TTL."""
+
+    def __init__(
+        self, max_size: int = DEFAULT_GEOCODE_CACHE_SIZE, ttl: float = DEFAULT_GEOCODE_CACHE_TTL
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached responses
+            ttl: Seconds during which a response is reused, 0 to disable the cache
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Tuple[float, Dict]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        """Get a cached response, None if it is not cached or has expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, response: Dict):
+        """Cache a response, evicting the least recently used ones beyond the maximum size."""
+        if self.ttl <= 0 or self.max_size <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Count the cached responses, expired ones included."""
+        return len(self._entries)
+
+    def clear(self):
+        """Forget all the cached responses and statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class RateLimiter:
+    """Spaces calls evenly to stay under a number of calls per second."""
+
+    def __init__(self, rate: float = DEFAULT_BATCH_RATE_LIMIT):
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Maximum number of calls per second, 0 for no limit
+        """
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self._next = 0.0
+
+    async def acquire(self):
+        """Wait until the next call is allowed."""
+        if not self.interval:
+            return
+        # Reserving the time slot does not await, so concurrent callers get distinct slots
+        now = time.monotonic()
+        start = max(now, self._next)
+        self._next = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
@@ -17,10 +17,22 @@ import botocore.config
 import botocore.exceptions
 import os
 import sys
+from awslabs.aws_location_server.geocoding import (
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_BATCH_RATE_LIMIT,
+    DEFAULT_COORDINATE_PRECISION,
+    DEFAULT_GEOCODE_CACHE_SIZE,
+    DEFAULT_GEOCODE_CACHE_TTL,
+    MAX_BATCH_SIZE,
+    GeocodeCache,
+    RateLimiter,
+    normalize_query,
+    quantize_position,
+)
 from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 
 # Set up logging
@@ -41,6 +53,7 @@ mcp = FastMCP(
     - Reverse geocode coordinates
     - Search for places nearby a location
     - Search for places open now (extension)
+    - Geocode or reverse geocode many addresses or positions at once
 
     ## Prerequisites
     1. Have an AWS account with Amazon Location Service enabled
@@ -54,6 +67,7 @@ mcp = FastMCP(
     - Use reverse_geocode for lat/lon to address
     - Use search_nearby for places near a point
     - Use search_places_open_now to find currently open places (if supported by data)
+    - Use batch_geocode and batch_reverse_geocode instead of repeated calls for lists of addresses or positions
     """,
     dependencies=[
         'boto3',
@@ -136,6 +150,80 @@ geo_places_client = GeoPlacesClient()
 # Initialize the geo-routes client
 geo_routes_client = GeoRoutesClient()
 
+# Geocode and reverse geocode responses, reused by the tools within the cache TTL
+geocode_cache = GeocodeCache(
+    max_size=int(os.environ.get('LOCATION_GEOCODE_CACHE_SIZE', DEFAULT_GEOCODE_CACHE_SIZE)),
+    ttl=float(os.environ.get('LOCATION_GEOCODE_CACHE_TTL', DEFAULT_GEOCODE_CACHE_TTL)),
+)
+coordinate_precision = int(
+    os.environ.get('LOCATION_GEOCODE_COORDINATE_PRECISION', DEFAULT_COORDINATE_PRECISION)
+)
+
+# Calls of the batch tools, shared by concurrent batches
+batch_rate_limiter = RateLimiter(
+    float(os.environ.get('LOCATION_BATCH_RATE_LIMIT', DEFAULT_BATCH_RATE_LIMIT))
+)
+batch_concurrency = int(os.environ.get('LOCATION_BATCH_CONCURRENCY', DEFAULT_BATCH_CONCURRENCY))
+
+
+async def geocode_query(query: str, rate_limiter: Optional[RateLimiter] = None) -> Dict:
+    """Geocode a query with the geo-places client, reusing cached responses of equivalent queries."""
+    key = ('geocode', normalize_query(query))
+    response = geocode_cache.get(key)
+    if response is None:
+        if rate_limiter:
+            await rate_limiter.acquire()
+        response = await asyncio.to_thread(
+            geo_places_client.geo_places_client.geocode, QueryText=query
+        )
+        geocode_cache.put(key, response)
+    return response
+
+
+async def reverse_geocode_position(
+    longitude: float, latitude: float, rate_limiter: Optional[RateLimiter] = None
+) -> Dict:
+    """Reverse geocode a position with the geo-places client, reusing cached responses of positions rounded to the same coordinates."""
+    key = ('reverse_geocode', quantize_position(longitude, latitude, coordinate_precision))
+    response = geocode_cache.get(key)
+    if response is None:
+        if rate_limiter:
+            await rate_limiter.acquire()
+        response = await asyncio.to_thread(
+            geo_places_client.geo_places_client.reverse_geocode,
+            QueryPosition=[longitude, latitude],
+        )
+        geocode_cache.put(key, response)
+    return response
+
+
+def summarize_reverse_geocode(response: Dict) -> Optional[Dict]:
+    """Extract the name, coordinates, categories and address of a reverse geocode response, None if it has no place."""
+    place = response.get('Place', {})
+    if place:
+        return {
+            'name': place.get('Label') or place.get('Title', 'Unknown'),
+            'coordinates': {
+                'longitude': place.get('Geometry', {}).get('Point', [0, 0])[0],
+                'latitude': place.get('Geometry', {}).get('Point', [0, 0])[1],
+            },
+            'categories': [cat.get('Name') for cat in place.get('Categories', [])],
+            'address': place.get('Address', {}).get('Label', ''),
+        }
+    items = response.get('ResultItems', [])
+    if items:
+        item = items[0]
+        return {
+            'name': item.get('Title', 'Unknown'),
+            'coordinates': {
+                'longitude': item.get('Position', [0, 0])[0],
+                'latitude': item.get('Position', [0, 0])[1],
+            },
+            'categories': [cat.get('Name') for cat in item.get('Categories', [])],
+            'address': item.get('Address', {}).get('Label', ''),
+        }
+    return None
+
 
 @mcp.tool()
 async def search_places(
@@ -155,7 +243,7 @@ async def search_places(
         await ctx.error(error_msg)
         return {'error': error_msg}
     try:
-        geo_response = geo_places_client.geo_places_client.geocode(QueryText=query)
+        geo_response = await geocode_query(query)
         geo_items = geo_response.get('ResultItems', [])
         if geo_items:
             geo_point = geo_items[0]['Position']
@@ -268,8 +356,10 @@ async def get_place(
         await ctx.error(error_msg)
         return {'error': error_msg}
     try:
-        response = geo_places_client.geo_places_client.get_place(
-            PlaceId=place_id, AdditionalFeatures=['Contact']
+        response = await asyncio.to_thread(
+            geo_places_client.geo_places_client.get_place,
+            PlaceId=place_id,
+            AdditionalFeatures=['Contact'],
         )
         if mode == 'raw':
             return response
@@ -346,22 +436,11 @@ async def reverse_geocode(
         return {'error': error_msg}
     logger.debug(f'Reverse geocoding for longitude: {longitude}, latitude: {latitude}')
     try:
-        response = geo_places_client.geo_places_client.reverse_geocode(
-            QueryPosition=[longitude, latitude]
-        )
+        response = await reverse_geocode_position(longitude, latitude)
         print(f'reverse_geocode raw response: {response}')
-        place = response.get('Place', {})
-        if not place:
+        result = summarize_reverse_geocode(response)
+        if result is None:
             return {'raw_response': response}
-        result = {
-            'name': place.get('Label') or place.get('Title', 'Unknown'),
-            'coordinates': {
-                'longitude': place.get('Geometry', {}).get('Point', [0, 0])[0],
-                'latitude': place.get('Geometry', {}).get('Point', [0, 0])[1],
-            },
-            'categories': [cat.get('Name') for cat in place.get('Categories', [])],
-            'address': place.get('Address', {}).get('Label', ''),
-        }
         logger.debug(f'Reverse geocoded address for coordinates: {longitude}, {latitude}')
         return result
     except botocore.exceptions.ClientError as e:
@@ -376,6 +455,119 @@ async def reverse_geocode(
         return {'error': error_msg}
 
 
+def batch_error_message(e: Exception) -> str:
+    """Describe the error of an item of a batch tool."""
+    if isinstance(e, botocore.exceptions.ClientError):
+        return f'AWS geo-places Service error: {str(e)}'
+    return str(e)
+
+
+@mcp.tool()
+async def batch_geocode(
+    ctx: Context,
+    queries: List[str] = Field(
+        description='Addresses or place names to geocode',
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+    ),
+) -> Dict:
+    """Geocode many addresses or place names at once using Amazon Location Service geo-places geocode API. Queries are geocoded concurrently, with a bounded number of calls per second, and equivalent queries are geocoded once. Results are returned in the order of the queries, each with the best match or an error."""
+    if not geo_places_client.geo_places_client:
+        error_msg = 'AWS geo-places client not initialized'
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        return {'error': error_msg}
+    semaphore = asyncio.Semaphore(batch_concurrency)
+
+    async def geocode(query: str) -> Dict:
+        async with semaphore:
+            try:
+                response = await geocode_query(query, batch_rate_limiter)
+            except Exception as e:
+                return {'query': query, 'error': batch_error_message(e)}
+        items = response.get('ResultItems', [])
+        if not items:
+            return {'query': query, 'error': f'Could not geocode query "{query}".'}
+        item = items[0]
+        return {
+            'query': query,
+            'place_id': item.get('PlaceId', ''),
+            'name': item.get('Title', 'Unknown'),
+            'address': item.get('Address', {}).get('Label', ''),
+            'coordinates': {
+                'longitude': item.get('Position', [None, None])[0],
+                'latitude': item.get('Position', [None, None])[1],
+            },
+        }
+
+    unique_queries = {normalize_query(query): query for query in reversed(queries)}
+    geocoded = dict(
+        zip(
+            unique_queries,
+            await asyncio.gather(*(geocode(query) for query in unique_queries.values())),
+        )
+    )
+    results = [{**geocoded[normalize_query(query)], 'query': query} for query in queries]
+    failed = sum('error' in result for result in results)
+    logger.debug(f'Geocoded {len(results) - failed} of {len(results)} queries')
+    return {'results': results, 'succeeded': len(results) - failed, 'failed': failed}
+
+
+@mcp.tool()
+async def batch_reverse_geocode(
+    ctx: Context,
+    positions: List[List[float]] = Field(
+        description='Positions to reverse geocode, each as [longitude, latitude]',
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+    ),
+) -> Dict:
+    """Reverse geocode many positions at once using Amazon Location Service geo-places reverse_geocode API. Positions are reverse geocoded concurrently, with a bounded number of calls per second, and positions within about a meter of each other are reverse geocoded once. Results are returned in the order of the positions, each with the nearest address or an error."""
+    if not geo_places_client.geo_places_client:
+        error_msg = 'AWS geo-places client not initialized'
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        return {'error': error_msg}
+    semaphore = asyncio.Semaphore(batch_concurrency)
+
+    async def reverse(longitude: float, latitude: float) -> Dict:
+        async with semaphore:
+            try:
+                response = await reverse_geocode_position(longitude, latitude, batch_rate_limiter)
+            except Exception as e:
+                return {'error': batch_error_message(e)}
+        summary = summarize_reverse_geocode(response)
+        if summary is None:
+            return {'error': 'No address found for this position.'}
+        return summary
+
+    unique_positions = {}
+    for position in positions:
+        if len(position) == 2:
+            key = quantize_position(position[0], position[1], coordinate_precision)
+            unique_positions.setdefault(key, position)
+    reversed_positions = dict(
+        zip(
+            unique_positions,
+            await asyncio.gather(
+                *(reverse(position[0], position[1]) for position in unique_positions.values())
+            ),
+        )
+    )
+
+    results = []
+    for position in positions:
+        if len(position) != 2:
+            result = {'error': 'Position must be [longitude, latitude].'}
+        else:
+            key = quantize_position(position[0], position[1], coordinate_precision)
+            result = reversed_positions[key]
+        results.append({'position': position, **result})
+    failed = sum('error' in result for result in results)
+    logger.debug(f'Reverse geocoded {len(results) - failed} of {len(results)} positions')
+    return {'results': results, 'succeeded': len(results) - failed, 'failed': failed}
+
+
 @mcp.tool()
 async def search_nearby(
     ctx: Context,
@@ -513,7 +705,7 @@ async def search_places_open_now(
         return {'error': error_msg}
     logger.debug(f'Searching for places open now with query: {query}, max_results: {max_results}')
     try:
-        geo_response = geo_places_client.geo_places_client.geocode(QueryText=query)
+        geo_response = await geocode_query(query)
         geo_items = geo_response.get('ResultItems', [])
         if not geo_items:
             error_msg = f'Could not geocode query "{query}" for BiasPosition.'
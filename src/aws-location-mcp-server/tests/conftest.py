@@ -11,6 +11,7 @@
 """Pytest configuration for AWS Location Service MCP Server tests."""
 
 import pytest
+from awslabs.aws_location_server.server import geocode_cache
 from unittest.mock import MagicMock, patch
 
 
@@ -49,3 +50,11 @@ def mock_context():
 
     context.error = MagicMock(side_effect=async_error)
     return context
+
+
+@pytest.fixture(autouse=True)
+def clear_geocode_cache():
+    """Call the geo-places client again in each test."""
+    geocode_cache.clear()
+    yield
+    geocode_cache.clear()
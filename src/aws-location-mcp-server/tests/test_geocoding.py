@@ -0,0 +1,94 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+"""Tests for the geocode cache and rate limiter of the AWS Location Service MCP Server."""
+
+import asyncio
+import pytest
+from awslabs.aws_location_server.geocoding import (
+    GeocodeCache,
+    RateLimiter,
+    normalize_query,
+    quantize_position,
+)
+from unittest.mock import patch
+
+
+def test_normalize_query():
+    """Test that queries differing in case and whitespace are normalized alike."""
+    assert normalize_query('  Pike Place,\tSeattle ') == normalize_query('pike place, SEATTLE')
+
+
+def test_quantize_position():
+    """Test that positions are rounded to the precision."""
+    assert quantize_position(-122.3493012, 47.6205049) == (-122.3493, 47.6205)
+    assert quantize_position(-122.3493012, 47.6205049, precision=2) == (-122.35, 47.62)
+
+
+def test_geocode_cache_evicts_least_recently_used():
+    """Test that the least recently used response is evicted when the cache is full."""
+    cache = GeocodeCache(max_size=2)
+    cache.put('a', {'a': 1})
+    cache.put('b', {'b': 1})
+    assert cache.get('a') == {'a': 1}
+    cache.put('c', {'c': 1})
+
+    assert cache.get('b') is None
+    assert cache.get('a') == {'a': 1}
+    assert cache.get('c') == {'c': 1}
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_geocode_cache_expires_entries():
+    """Test that responses are forgotten once the TTL has expired."""
+    cache = GeocodeCache(ttl=60)
+    with patch('awslabs.aws_location_server.geocoding.time.monotonic', return_value=0):
+        cache.put('a', {'a': 1})
+    with patch('awslabs.aws_location_server.geocoding.time.monotonic', return_value=59):
+        assert cache.get('a') == {'a': 1}
+    with patch('awslabs.aws_location_server.geocoding.time.monotonic', return_value=60):
+        assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_geocode_cache_disabled():
+    """Test that a TTL of 0 caches nothing."""
+    cache = GeocodeCache(ttl=0)
+    cache.put('a', {'a': 1})
+    assert cache.get('a') is None
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_calls():
+    """Test that concurrent calls are spaced by the interval of the rate."""
+    limiter = RateLimiter(rate=4)
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+
+    with (
+        patch('awslabs.aws_location_server.geocoding.time.monotonic', return_value=100),
+        patch('awslabs.aws_location_server.geocoding.asyncio.sleep', side_effect=sleep),
+    ):
+        await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+
+    assert sleeps == [0.25, 0.5]
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_unlimited():
+    """Test that a rate of 0 never waits."""
+    limiter = RateLimiter(rate=0)
+    with patch('awslabs.aws_location_server.geocoding.asyncio.sleep') as sleep:
+        await limiter.acquire()
+        await limiter.acquire()
+    sleep.assert_not_called()
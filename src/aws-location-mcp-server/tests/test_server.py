@@ -16,6 +16,8 @@ import pytest
 from awslabs.aws_location_server.server import (
     GeoPlacesClient,
     GeoRoutesClient,
+    batch_geocode,
+    batch_reverse_geocode,
     calculate_route,
     get_place,
     main,
@@ -1217,3 +1219,168 @@ def test_geo_routes_client_initialization_with_session_token(monkeypatch):
             kwargs['aws_session_token']
             == 'AQoEXAMPLEH4aoAH0gNCAPyJxz4BlCFFxWNE1OPTgk5TthT+FvwqnKwRcOIfrRh3c/LTo6UDdyJwOOvEVPvLXCrrrUtdnniCEXAMPLE/IvU1dYUg2RVAJBanLiHb4IgRmpRV3zrkuWJOgQs8IZZaIv2BXIa2R4Olgk'
         )
+
+
+@pytest.mark.asyncio
+async def test_search_places_reuses_cached_geocode(mock_boto3_client, mock_context):
+    """Test that equivalent queries are geocoded once."""
+    mock_boto3_client.geocode.return_value = {'ResultItems': [{'Position': [-122.3321, 47.6062]}]}
+    mock_boto3_client.search_text.return_value = {'ResultItems': [{'Title': 'Pike Place Market'}]}
+
+    with patch('awslabs.aws_location_server.server.geo_places_client') as mock_geo_client:
+        mock_geo_client.geo_places_client = mock_boto3_client
+        await search_places(mock_context, query='Pike Place, Seattle', max_results=5)
+        await search_places(mock_context, query='pike place,  seattle', max_results=5)
+
+    mock_boto3_client.geocode.assert_called_once_with(QueryText='Pike Place, Seattle')
+    assert mock_boto3_client.search_text.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_reverse_geocode_reuses_cached_nearby_position(mock_boto3_client, mock_context):
+    """Test that positions rounded to the same coordinates are reverse geocoded once."""
+    mock_boto3_client.reverse_geocode.return_value = {
+        'ResultItems': [
+            {
+                'Title': '400 Broad St, Seattle, WA 98109',
+                'Position': [-122.3493, 47.6205],
+                'Address': {'Label': '400 Broad St, Seattle, WA 98109'},
+            }
+        ]
+    }
+
+    with patch('awslabs.aws_location_server.server.geo_places_client') as mock_geo_client:
+        mock_geo_client.geo_places_client = mock_boto3_client
+        first = await reverse_geocode(mock_context, longitude=-122.349301, latitude=47.620501)
+        second = await reverse_geocode(mock_context, longitude=-122.349302, latitude=47.620502)
+
+    assert first == second
+    assert first['address'] == '400 Broad St, Seattle, WA 98109'
+    mock_boto3_client.reverse_geocode.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_batch_geocode(mock_boto3_client, mock_context):
+    """Test that batch_geocode geocodes each distinct query once, keeping the order of the queries."""
+    from botocore.exceptions import ClientError
+
+    def geocode(QueryText):
+        if QueryText == 'Nowhere':
+            return {'ResultItems': []}
+        if QueryText == 'Broken':
+            raise ClientError(
+                {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}}, 'geocode'
+            )
+        return {
+            'ResultItems': [
+                {
+                    'PlaceId': f'id-{QueryText}',
+                    'Title': QueryText,
+                    'Address': {'Label': f'{QueryText}, USA'},
+                    'Position': [-122.0, 47.0],
+                }
+            ]
+        }
+
+    mock_boto3_client.geocode.side_effect = geocode
+
+    with patch('awslabs.aws_location_server.server.geo_places_client') as mock_geo_client:
+        mock_geo_client.geo_places_client = mock_boto3_client
+        result = await batch_geocode(
+            mock_context, queries=['Seattle', 'Nowhere', 'seattle', 'Broken', 'Portland']
+        )
+
+    assert [item['query'] for item in result['results']] == [
+        'Seattle',
+        'Nowhere',
+        'seattle',
+        'Broken',
+        'Portland',
+    ]
+    assert result['results'][0] == {
+        'query': 'Seattle',
+        'place_id': 'id-Seattle',
+        'name': 'Seattle',
+        'address': 'Seattle, USA',
+        'coordinates': {'longitude': -122.0, 'latitude': 47.0},
+    }
+    assert result['results'][2]['place_id'] == 'id-Seattle'
+    assert 'Could not geocode query' in result['results'][1]['error']
+    assert 'AWS geo-places Service error' in result['results'][3]['error']
+    assert result['results'][4]['address'] == 'Portland, USA'
+    assert result['succeeded'] == 3
+    assert result['failed'] == 2
+    assert mock_boto3_client.geocode.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_batch_geocode_error_no_client(mock_context):
+    """Test batch_geocode when client is not initialized."""
+    with patch('awslabs.aws_location_server.server.geo_places_client') as mock_geo_client:
+        mock_geo_client.geo_places_client = None
+        result = await batch_geocode(mock_context, queries=['Seattle'])
+
+    assert result == {'error': 'AWS geo-places client not initialized'}
+
+
+@pytest.mark.asyncio
+async def test_batch_reverse_geocode(mock_boto3_client, mock_context):
+    """Test that batch_reverse_geocode reverse geocodes nearby positions once, keeping their order."""
+
+    def reverse_geocode(QueryPosition):
+        if QueryPosition[0] > 0:
+            return {}
+        return {
+            'ResultItems': [
+                {
+                    'Title': f'Place at {QueryPosition[1]}',
+                    'Position': QueryPosition,
+                    'Categories': [{'Name': 'PointAddress'}],
+                    'Address': {'Label': f'Address at {QueryPosition[1]}'},
+                }
+            ]
+        }
+
+    mock_boto3_client.reverse_geocode.side_effect = reverse_geocode
+
+    with patch('awslabs.aws_location_server.server.geo_places_client') as mock_geo_client:
+        mock_geo_client.geo_places_client = mock_boto3_client
+        result = await batch_reverse_geocode(
+            mock_context,
+            positions=[
+                [-122.3493, 47.6205],
+                [10.0, 10.0],
+                [-122.349300001, 47.620500001],
+                [-122.0],
+            ],
+        )
+
+    assert result['results'][0] == {
+        'position': [-122.3493, 47.6205],
+        'name': 'Place at 47.6205',
+        'coordinates': {'longitude': -122.3493, 'latitude': 47.6205},
+        'categories': ['PointAddress'],
+        'address': 'Address at 47.6205',
+    }
+    assert result['results'][1] == {
+        'position': [10.0, 10.0],
+        'error': 'No address found for this position.',
+    }
+    assert result['results'][2]['address'] == 'Address at 47.6205'
+    assert result['results'][3] == {
+        'position': [-122.0],
+        'error': 'Position must be [longitude, latitude].',
+    }
+    assert result['succeeded'] == 2
+    assert result['failed'] == 2
+    assert mock_boto3_client.reverse_geocode.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_reverse_geocode_error_no_client(mock_context):
+    """Test batch_reverse_geocode when client is not initialized."""
+    with patch('awslabs.aws_location_server.server.geo_places_client') as mock_geo_client:
+        mock_geo_client.geo_places_client = None
+        result = await batch_reverse_geocode(mock_context, positions=[[-122.0, 47.0]])
+
+    assert result == {'error': 'AWS geo-places client not initialized'}
@@ -8,9 +8,11 @@
 # or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
 # and limitations under the License.
-from ..models import KnowledgeBaseMapping
+import asyncio
+import time
+from ..models import DataSource, KnowledgeBaseMapping
 from loguru import logger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Tuple
 
 
 if TYPE_CHECKING:
@@ -21,6 +23,12 @@ else:
 
 DEFAULT_KNOWLEDGE_BASE_TAG_INCLUSION_KEY = 'mcp-multirag-kb'
 
+# Maximum number of knowledge bases described at the same time
+MAX_CONCURRENT_DISCOVERY_REQUESTS = 8
+
+# Seconds during which discovered knowledge bases are reused
+DEFAULT_DISCOVERY_CACHE_TTL = 300
+
 
 async def discover_knowledge_bases(
     agent_client: AgentsforBedrockClient,
@@ -28,6 +36,9 @@ async def discover_knowledge_bases(
 ) -> KnowledgeBaseMapping:
     """Discover knowledge bases.
 
+    The knowledge bases are described, and the data sources of the matching ones listed,
+    concurrently.
+
     Args:
         agent_client (AgentsforBedrockClient): The Bedrock agent client
         tag_key (str): The tag key to filter knowledge bases by
@@ -35,45 +46,87 @@ async def discover_knowledge_bases(
     Returns:
         KnowledgeBaseMapping: A mapping of knowledge base IDs to knowledge base details
     """
-    result: KnowledgeBaseMapping = {}
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DISCOVERY_REQUESTS)
 
-    # Collect all knowledge bases with their ARNs in one pass
-    kb_data = []
+    # Collect all knowledge bases in one pass
+    kb_summaries = []
     kb_paginator = agent_client.get_paginator('list_knowledge_bases')
-
-    # First, collect all knowledge bases that match our tag criteria
-    for page in kb_paginator.paginate():
+    for page in await asyncio.to_thread(lambda: list(kb_paginator.paginate())):
         for kb in page.get('knowledgeBaseSummaries', []):
             logger.debug(f'KB: {kb}')
-            kb_id = kb.get('knowledgeBaseId')
-            kb_name = kb.get('name')
-
-            kb_arn = (
-                agent_client.get_knowledge_base(knowledgeBaseId=kb_id)
-                .get('knowledgeBase', {})
-                .get('knowledgeBaseArn')
-            )
-
-            tags = agent_client.list_tags_for_resource(resourceArn=kb_arn).get('tags', {})
-            if tag_key in tags and tags[tag_key] == 'true':
-                logger.debug(f'KB Name: {kb_name}')
-                kb_data.append((kb_id, kb_name))
-
-    # Then, for each matching knowledge base, collect its data sources
-    for kb_id, kb_name in kb_data:
-        result[kb_id] = {'name': kb_name, 'data_sources': []}
-
-        # Collect data sources for this knowledge base
-        data_sources = []
+            kb_summaries.append((kb.get('knowledgeBaseId'), kb.get('name')))
+
+    def is_included(kb_id: str) -> bool:
+        kb_arn = (
+            agent_client.get_knowledge_base(knowledgeBaseId=kb_id)
+            .get('knowledgeBase', {})
+            .get('knowledgeBaseArn')
+        )
+        tags = agent_client.list_tags_for_resource(resourceArn=kb_arn).get('tags', {})
+        return tag_key in tags and tags[tag_key] == 'true'
+
+    def list_data_sources(kb_id: str) -> list[DataSource]:
+        data_sources: list[DataSource] = []
         data_sources_paginator = agent_client.get_paginator('list_data_sources')
-
         for page in data_sources_paginator.paginate(knowledgeBaseId=kb_id):
             for ds in page.get('dataSourceSummaries', []):
-                ds_id = ds.get('dataSourceId')
-                ds_name = ds.get('name')
                 logger.debug(f'DS: {ds}')
-                data_sources.append({'id': ds_id, 'name': ds_name})
-
-        result[kb_id]['data_sources'] = data_sources
+                data_sources.append({'id': ds.get('dataSourceId'), 'name': ds.get('name')})
+        return data_sources
+
+    async def describe(kb_id: str, kb_name: str) -> list[DataSource] | None:
+        async with semaphore:
+            if not await asyncio.to_thread(is_included, kb_id):
+                return None
+            logger.debug(f'KB Name: {kb_name}')
+            return await asyncio.to_thread(list_data_sources, kb_id)
+
+    # Then keep the knowledge bases that match our tag criteria, with their data sources
+    data_sources = await asyncio.gather(*(describe(kb_id, name) for kb_id, name in kb_summaries))
+    result: KnowledgeBaseMapping = {}
+    for (kb_id, kb_name), kb_data_sources in zip(kb_summaries, data_sources):
+        if kb_data_sources is not None:
+            result[kb_id] = {'name': kb_name, 'data_sources': kb_data_sources}
 
     return result
+
+
+class DiscoveryCache:
+    """Cache of the knowledge bases discovered for each tag key, expiring after a TTL."""
+
+    def __init__(self, ttl: float = DEFAULT_DISCOVERY_CACHE_TTL):
+        """Initialize the cache.
+
+        Args:
+            ttl (float): Seconds during which discovered knowledge bases are reused, 0 to disable the cache
+        """
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, KnowledgeBaseMapping]] = {}
+        self._lock = asyncio.Lock()
+
+    async def get(
+        self, tag_key: str, discover: Callable[[], Awaitable[KnowledgeBaseMapping]]
+    ) -> KnowledgeBaseMapping:
+        """Get the knowledge bases of a tag key, discovering them if they are not cached.
+
+        Concurrent calls wait for a single discovery.
+
+        Args:
+            tag_key (str): The tag key the knowledge bases are filtered by
+            discover (Callable[[], Awaitable[KnowledgeBaseMapping]]): Discovers the knowledge bases
+
+        Returns:
+            KnowledgeBaseMapping: A mapping of knowledge base IDs to knowledge base details
+        """
+        async with self._lock:
+            entry = self._entries.get(tag_key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            result = await discover()
+            if self.ttl > 0:
+                self._entries[tag_key] = (time.monotonic() + self.ttl, result)
+            return result
+
+    def clear(self):
+        """Forget all the discovered knowledge bases."""
+        self._entries.clear()
@@ -8,9 +8,10 @@
 # or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
 # and limitations under the License.
+import asyncio
 import json
 from loguru import logger
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Dict, List, Literal
 
 
 if TYPE_CHECKING:
@@ -23,7 +24,14 @@ else:
     KnowledgeBaseRetrievalConfigurationTypeDef = object
 
 
-async def query_knowledge_base(
+# Maximum number of knowledge bases queried at the same time
+MAX_CONCURRENT_RETRIEVALS = 10
+
+# Constant of reciprocal rank fusion, which dampens the weight of the first ranks
+RRF_K = 60
+
+
+async def retrieve_documents(
     query: str,
     knowledge_base_id: str,
     kb_agent_client: AgentsforBedrockRuntimeClient,
@@ -31,22 +39,20 @@ async def query_knowledge_base(
     reranking: bool = False,
     reranking_model_name: Literal['COHERE', 'AMAZON'] = 'AMAZON',
     data_source_ids: list[str] | None = None,
-) -> str:
-    """# Amazon Bedrock Knowledge Base query tool.
+) -> list[dict]:
+    """Retrieve the documents of a knowledge base matching a query, best first.
 
     Args:
         query (str): The query to search the knowledge base with.
         knowledge_base_id (str): The knowledge base ID to query.
         kb_agent_client (AgentsforBedrockRuntimeClient): The Bedrock agent client.
         number_of_results (int): The number of results to return.
-        reranking (bool): Whether to rerank the results. Can be globally configured using the BEDROCK_KB_RERANKING_ENABLED environment variable.
+        reranking (bool): Whether to rerank the results.
         reranking_model_name (Literal['COHERE', 'AMAZON']): The name of the reranking model to use.
         data_source_ids (list[str] | None): The data source IDs to filter the knowledge base by.
 
-    ## Warning: You must use the `resource://knowledgebases` tool to get the knowledge base ID and optionally a data source ID first.
-
-    ## Returns:
-    - A string containing the results of the query.
+    Returns:
+        list[dict]: The content, location and score of each document, images excluded.
     """
     if reranking and kb_agent_client.meta.region_name not in [
         'us-west-2',
@@ -86,7 +92,8 @@ async def query_knowledge_base(
             },
         }
 
-    response = kb_agent_client.retrieve(
+    response = await asyncio.to_thread(
+        kb_agent_client.retrieve,
         knowledgeBaseId=knowledge_base_id,
         retrievalQuery={'text': query},
         retrievalConfiguration=retrieve_request,
@@ -106,4 +113,143 @@ async def query_knowledge_base(
                 }
             )
 
+    return documents
+
+
+async def query_knowledge_base(
+    query: str,
+    knowledge_base_id: str,
+    kb_agent_client: AgentsforBedrockRuntimeClient,
+    number_of_results: int = 20,
+    reranking: bool = False,
+    reranking_model_name: Literal['COHERE', 'AMAZON'] = 'AMAZON',
+    data_source_ids: list[str] | None = None,
+) -> str:
+    """# Amazon Bedrock Knowledge Base query tool.
+
+    Args:
+        query (str): The query to search the knowledge base with.
+        knowledge_base_id (str): The knowledge base ID to query.
+        kb_agent_client (AgentsforBedrockRuntimeClient): The Bedrock agent client.
+        number_of_results (int): The number of results to return.
+        reranking (bool): Whether to rerank the results. Can be globally configured using the BEDROCK_KB_RERANKING_ENABLED environment variable.
+        reranking_model_name (Literal['COHERE', 'AMAZON']): The name of the reranking model to use.
+        data_source_ids (list[str] | None): The data source IDs to filter the knowledge base by.
+
+    ## Warning: You must use the `resource://knowledgebases` tool to get the knowledge base ID and optionally a data source ID first.
+
+    ## Returns:
+    - A string containing the results of the query.
+    """
+    documents = await retrieve_documents(
+        query=query,
+        knowledge_base_id=knowledge_base_id,
+        kb_agent_client=kb_agent_client,
+        number_of_results=number_of_results,
+        reranking=reranking,
+        reranking_model_name=reranking_model_name,
+        data_source_ids=data_source_ids,
+    )
     return '\n\n'.join([json.dumps(document) for document in documents])
+
+
+def fuse_results(results: Dict[str, List[dict]], k: int = RRF_K) -> List[dict]:
+    """Merge the ranked documents of several knowledge bases with reciprocal rank fusion.
+
+    Each document scores the sum of 1 / (k + rank) over the result lists it appears in, so
+    documents ranked well by several knowledge bases come first, and scores of different
+    knowledge bases, which are not comparable, are not mixed. Documents with the same content
+    are merged.
+
+    Args:
+        results (Dict[str, List[dict]]): The documents of each knowledge base ID, best first.
+        k (int): The constant dampening the weight of the first ranks.
+
+    Returns:
+        List[dict]: The merged documents, best first, with their fused score and knowledge base IDs.
+    """
+    fused: Dict[str, dict] = {}
+    for knowledge_base_id, documents in results.items():
+        for rank, document in enumerate(documents, start=1):
+            key = json.dumps(document['content'], sort_keys=True)
+            merged = fused.get(key)
+            if merged is None:
+                merged = fused[key] = {
+                    **document,
+                    'knowledge_base_ids': [],
+                    'fused_score': 0.0,
+                }
+            elif isinstance(document['score'], (int, float)) and (
+                not isinstance(merged['score'], (int, float))
+                or document['score'] > merged['score']
+            ):
+                merged['location'] = document['location']
+                merged['score'] = document['score']
+            if knowledge_base_id not in merged['knowledge_base_ids']:
+                merged['knowledge_base_ids'].append(knowledge_base_id)
+            merged['fused_score'] += 1 / (k + rank)
+
+    return sorted(fused.values(), key=lambda document: -document['fused_score'])
+
+
+async def query_knowledge_bases(
+    query: str,
+    knowledge_base_ids: List[str],
+    kb_agent_client: AgentsforBedrockRuntimeClient,
+    number_of_results: int = 20,
+    reranking: bool = False,
+    reranking_model_name: Literal['COHERE', 'AMAZON'] = 'AMAZON',
+    data_source_ids: Dict[str, List[str]] | None = None,
+) -> str:
+    """Query several knowledge bases concurrently and merge their results.
+
+    Args:
+        query (str): The query to search the knowledge bases with.
+        knowledge_base_ids (List[str]): The knowledge base IDs to query.
+        kb_agent_client (AgentsforBedrockRuntimeClient): The Bedrock agent client.
+        number_of_results (int): The number of results to retrieve from each knowledge base and to return.
+        reranking (bool): Whether to rerank the results of each knowledge base.
+        reranking_model_name (Literal['COHERE', 'AMAZON']): The name of the reranking model to use.
+        data_source_ids (Dict[str, List[str]] | None): The data source IDs to filter each knowledge base by.
+
+    Returns:
+        str: The merged documents, one JSON object per document, followed by the errors of the
+        knowledge bases that could not be queried.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_RETRIEVALS)
+    knowledge_base_ids = list(dict.fromkeys(knowledge_base_ids))
+
+    async def retrieve(knowledge_base_id: str) -> list[dict]:
+        async with semaphore:
+            return await retrieve_documents(
+                query=query,
+                knowledge_base_id=knowledge_base_id,
+                kb_agent_client=kb_agent_client,
+                number_of_results=number_of_results,
+                reranking=reranking,
+                reranking_model_name=reranking_model_name,
+                data_source_ids=(data_source_ids or {}).get(knowledge_base_id),
+            )
+
+    responses = await asyncio.gather(
+        *(retrieve(knowledge_base_id) for knowledge_base_id in knowledge_base_ids),
+        return_exceptions=True,
+    )
+
+    results: Dict[str, List[dict]] = {}
+    errors = []
+    for knowledge_base_id, response in zip(knowledge_base_ids, responses):
+        if isinstance(response, BaseException):
+            logger.warning(f'Error querying knowledge base {knowledge_base_id}: {response}')
+            errors.append({'knowledge_base_id': knowledge_base_id, 'error': str(response)})
+        else:
+            results[knowledge_base_id] = response
+
+    if errors and not results:
+        raise ValueError(
+            'Error querying the knowledge bases: '
+            + '; '.join(f'{error["knowledge_base_id"]}: {error["error"]}' for error in errors)
+        )
+
+    documents = fuse_results(results)[:number_of_results]
+    return '\n\n'.join([json.dumps(document) for document in [*documents, *errors]])
@@ -18,16 +18,19 @@ from awslabs.bedrock_kb_retrieval_mcp_server.knowledgebases.clients import (
     get_bedrock_agent_runtime_client,
 )
 from awslabs.bedrock_kb_retrieval_mcp_server.knowledgebases.discovery import (
+    DEFAULT_DISCOVERY_CACHE_TTL,
     DEFAULT_KNOWLEDGE_BASE_TAG_INCLUSION_KEY,
+    DiscoveryCache,
     discover_knowledge_bases,
 )
 from awslabs.bedrock_kb_retrieval_mcp_server.knowledgebases.retrieval import (
     query_knowledge_base,
+    query_knowledge_bases,
 )
 from loguru import logger
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional
 
 
 # Remove all default handlers then add our own
@@ -53,6 +56,11 @@ except Exception as e:
 
 kb_inclusion_tag_key = os.getenv('KB_INCLUSION_TAG_KEY', DEFAULT_KNOWLEDGE_BASE_TAG_INCLUSION_KEY)
 
+# Seconds during which discovered knowledge bases are reused, 0 to discover them on every read
+kb_discovery_cache = DiscoveryCache(
+    float(os.getenv('BEDROCK_KB_DISCOVERY_CACHE_TTL', DEFAULT_DISCOVERY_CACHE_TTL))
+)
+
 # Parse reranking enabled environment variable
 kb_reranking_enabled_raw = os.getenv('BEDROCK_KB_RERANKING_ENABLED')
 kb_reranking_enabled = False  # Default value is now False (off)
@@ -73,6 +81,7 @@ mcp = FastMCP(
     1. ALWAYS start by accessing the `resource://knowledgebases` resource to discover available knowledge bases and their data sources
     2. Use the QueryKnowledgeBases tool to search specific knowledge bases with your natural language queries
     3. You can make multiple calls to QueryKnowledgeBases with different queries or targeting different knowledge bases
+    4. Use the QueryMultipleKnowledgeBases tool to search several knowledge bases at once and get a single merged ranking
 
     ## Important Notes:
     - Knowledge bases contain structured data from various data sources (documents, websites, databases)
@@ -118,7 +127,11 @@ async def knowledgebases_resource() -> str:
     2. Note the data source IDs if you want to filter queries to specific data sources
     3. Use the names to determine which knowledge base and data source(s) are most relevant to the user's query
     """
-    return json.dumps(await discover_knowledge_bases(kb_agent_mgmt_client, kb_inclusion_tag_key))
+    knowledge_bases = await kb_discovery_cache.get(
+        kb_inclusion_tag_key,
+        lambda: discover_knowledge_bases(kb_agent_mgmt_client, kb_inclusion_tag_key),
+    )
+    return json.dumps(knowledge_bases)
 
 
 @mcp.tool(name='QueryKnowledgeBases')
@@ -184,6 +197,63 @@ async def query_knowledge_bases_tool(
     )
 
 
+@mcp.tool(name='QueryMultipleKnowledgeBases')
+async def query_multiple_knowledge_bases_tool(
+    query: str = Field(
+        ..., description='A natural language query to search the knowledge bases with'
+    ),
+    knowledge_base_ids: List[str] = Field(
+        ...,
+        description='The knowledge base IDs to query. They must be valid IDs from the resource://knowledgebases MCP resource',
+    ),
+    number_of_results: int = Field(
+        10,
+        description='The number of results to retrieve from each knowledge base and to return after merging.',
+    ),
+    reranking: bool = Field(
+        kb_reranking_enabled,
+        description='Whether to rerank the results of each knowledge base. Can be globally configured with BEDROCK_KB_RERANKING_ENABLED environment variable.',
+    ),
+    reranking_model_name: Literal['COHERE', 'AMAZON'] = Field(
+        'AMAZON',
+        description="The name of the reranking model to use. Options: 'COHERE', 'AMAZON'",
+    ),
+    data_source_ids: Optional[Dict[str, List[str]]] = Field(
+        None,
+        description='The data source IDs to filter each knowledge base by, keyed by knowledge base ID. Knowledge bases without an entry are not filtered',
+    ),
+) -> str:
+    """Query several Amazon Bedrock Knowledge Bases at once and merge their results.
+
+    ## Usage Requirements
+    - You MUST first use the `resource://knowledgebases` resource to get valid knowledge base IDs
+    - Prefer this tool over several QueryKnowledgeBases calls when the answer may be in any of several knowledge bases
+
+    ## Tool output format
+    The knowledge bases are queried concurrently. Their results are merged with reciprocal rank
+    fusion, as relevance scores of different knowledge bases are not comparable, and documents
+    found in several knowledge bases are returned once. The response contains multiple JSON
+    objects, best first, each representing a retrieved document with:
+    - content: The text content of the document
+    - location: The source location of the document
+    - score: The best relevance score of the document in the knowledge bases it was found in
+    - knowledge_base_ids: The knowledge bases the document was found in
+    - fused_score: The merged rank score the results are sorted by
+
+    Knowledge bases that could not be queried are reported last, as JSON objects with a
+    knowledge_base_id and an error.
+    """
+    return await query_knowledge_bases(
+        query=query,
+        knowledge_base_ids=knowledge_base_ids,
+        kb_agent_client=kb_runtime_client,
+        number_of_results=number_of_results,
+        reranking=reranking,
+        reranking_model_name=reranking_model_name,
+        data_source_ids=data_source_ids,
+    )
+
+
 def main():
     """Run the MCP server with CLI argument support."""
     mcp.run()
@@ -13,9 +13,10 @@
 
 import pytest
 from awslabs.bedrock_kb_retrieval_mcp_server.knowledgebases.discovery import (
+    DiscoveryCache,
     discover_knowledge_bases,
 )
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 class TestDiscoverKnowledgeBases:
@@ -190,3 +191,48 @@ class TestDiscoverKnowledgeBases:
             resourceArn='arn:aws:bedrock:us-west-2:123456789012:knowledge-base/kb-12345'
         )
         mock_bedrock_agent_client.get_paginator.assert_any_call('list_data_sources')
+
+
+class TestDiscoveryCache:
+    """Tests for the DiscoveryCache class."""
+
+    @pytest.mark.asyncio
+    async def test_discovery_cache_reuses_knowledge_bases_until_expired(self):
+        """Test that discovered knowledge bases are reused until the TTL expires."""
+        cache = DiscoveryCache(ttl=60)
+        discover = AsyncMock(return_value={'kb-1': {'name': 'KB', 'data_sources': []}})
+
+        with patch(
+            'awslabs.bedrock_kb_retrieval_mcp_server.knowledgebases.discovery.time.monotonic',
+            side_effect=[0, 10, 100, 100],
+        ):
+            assert await cache.get('tag', discover) == {'kb-1': {'name': 'KB', 'data_sources': []}}
+            await cache.get('tag', discover)
+            assert discover.await_count == 1
+            await cache.get('tag', discover)
+            assert discover.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_discovery_cache_keys_by_tag(self):
+        """Test that knowledge bases are cached per tag key, and forgotten on clear."""
+        cache = DiscoveryCache(ttl=60)
+        discover = AsyncMock(return_value={})
+
+        await cache.get('tag-1', discover)
+        await cache.get('tag-2', discover)
+        await cache.get('tag-1', discover)
+        assert discover.await_count == 2
+
+        cache.clear()
+        await cache.get('tag-1', discover)
+        assert discover.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_discovery_cache_disabled(self):
+        """Test that a TTL of 0 discovers the knowledge bases on every call."""
+        cache = DiscoveryCache(ttl=0)
+        discover = AsyncMock(return_value={})
+
+        await cache.get('tag', discover)
+        await cache.get('tag', discover)
+        assert discover.await_count == 2
@@ -13,7 +13,36 @@
 
 import json
 import pytest
-from awslabs.bedrock_kb_retrieval_mcp_server.knowledgebases.retrieval import query_knowledge_base
+from awslabs.bedrock_kb_retrieval_mcp_server.knowledgebases.retrieval import (
+    fuse_results,
+    query_knowledge_base,
+    query_knowledge_bases,
+)
+from unittest.mock import MagicMock
+
+
+def make_document(text, score):
+    """Create a retrieved document."""
+    return {
+        'content': {'text': text, 'type': 'TEXT'},
+        'location': {'s3Location': {'uri': f's3://test-bucket/{text}.txt'}},
+        'score': score,
+    }
+
+
+def make_runtime_client(results_by_kb):
+    """Create a runtime client returning the documents, or raising the error, of each knowledge base."""
+    client = MagicMock()
+    client.meta.region_name = 'us-west-2'
+
+    def retrieve(knowledgeBaseId, **kwargs):
+        results = results_by_kb[knowledgeBaseId]
+        if isinstance(results, Exception):
+            raise results
+        return {'retrievalResults': results}
+
+    client.retrieve.side_effect = retrieve
+    return client
 
 
 class TestQueryKnowledgeBase:
@@ -194,3 +223,87 @@ class TestQueryKnowledgeBase:
         assert documents[0]['content']['type'] == 'TEXT'
         assert documents[0]['location']['s3Location']['uri'] == 's3://test-bucket/document.txt'
         assert documents[0]['score'] == 0.85
+
+
+class TestFuseResults:
+    """Tests for the fuse_results function."""
+
+    def test_fuse_results_ranks_documents_found_in_several_knowledge_bases_first(self):
+        """Test that documents ranked by several knowledge bases get the highest fused score."""
+        results = {
+            'kb-1': [make_document('a', 0.9), make_document('shared', 0.5)],
+            'kb-2': [make_document('shared', 0.8), make_document('b', 0.7)],
+        }
+
+        documents = fuse_results(results, k=60)
+
+        assert [document['content']['text'] for document in documents] == ['shared', 'a', 'b']
+        assert documents[0]['knowledge_base_ids'] == ['kb-1', 'kb-2']
+        assert documents[0]['score'] == 0.8
+        assert documents[0]['fused_score'] == pytest.approx(1 / 62 + 1 / 61)
+        assert documents[1]['knowledge_base_ids'] == ['kb-1']
+        assert documents[1]['fused_score'] == pytest.approx(1 / 61)
+
+    def test_fuse_results_empty(self):
+        """Test fusing no results."""
+        assert fuse_results({}) == []
+        assert fuse_results({'kb-1': []}) == []
+
+
+class TestQueryKnowledgeBases:
+    """Tests for the query_knowledge_bases function."""
+
+    @pytest.mark.asyncio
+    async def test_query_knowledge_bases(self):
+        """Test querying several knowledge bases with per knowledge base data source filters."""
+        client = make_runtime_client(
+            {
+                'kb-1': [make_document('a', 0.9), make_document('shared', 0.5)],
+                'kb-2': [make_document('shared', 0.8), make_document('b', 0.7)],
+            }
+        )
+
+        result = await query_knowledge_bases(
+            query='test query',
+            knowledge_base_ids=['kb-1', 'kb-2', 'kb-1'],
+            kb_agent_client=client,
+            number_of_results=2,
+            data_source_ids={'kb-2': ['ds-1']},
+        )
+
+        documents = [json.loads(doc) for doc in result.split('\n\n')]
+        assert [document['content']['text'] for document in documents] == ['shared', 'a']
+        assert client.retrieve.call_count == 2
+        configurations = {
+            call.kwargs['knowledgeBaseId']: call.kwargs['retrievalConfiguration']
+            for call in client.retrieve.call_args_list
+        }
+        assert configurations['kb-1'] == {'vectorSearchConfiguration': {'numberOfResults': 2}}
+        assert configurations['kb-2']['vectorSearchConfiguration']['filter'] == {
+            'in': {'key': 'x-amz-bedrock-kb-data-source-id', 'value': ['ds-1']}
+        }
+
+    @pytest.mark.asyncio
+    async def test_query_knowledge_bases_reports_failed_knowledge_bases(self):
+        """Test that the knowledge bases that could not be queried are reported after the results."""
+        client = make_runtime_client(
+            {'kb-1': [make_document('a', 0.9)], 'kb-2': Exception('Access denied')}
+        )
+
+        result = await query_knowledge_bases(
+            query='test query', knowledge_base_ids=['kb-1', 'kb-2'], kb_agent_client=client
+        )
+
+        documents = [json.loads(doc) for doc in result.split('\n\n')]
+        assert documents[0]['content']['text'] == 'a'
+        assert documents[1] == {'knowledge_base_id': 'kb-2', 'error': 'Access denied'}
+
+    @pytest.mark.asyncio
+    async def test_query_knowledge_bases_all_failed(self):
+        """Test that an error is raised when no knowledge base could be queried."""
+        client = make_runtime_client({'kb-1': Exception('Access denied')})
+
+        with pytest.raises(ValueError, match='kb-1: Access denied'):
+            await query_knowledge_bases(
+                query='test query', knowledge_base_ids=['kb-1'], kb_agent_client=client
+            )
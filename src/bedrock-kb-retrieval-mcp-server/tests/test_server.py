@@ -11,6 +11,7 @@
 
 """Tests for the server module of the bedrock-kb-retrieval-mcp-server."""
 
+import awslabs.bedrock_kb_retrieval_mcp_server.server as server
 import json
 import pytest
 from awslabs.bedrock_kb_retrieval_mcp_server.server import (
@@ -18,11 +19,20 @@ from awslabs.bedrock_kb_retrieval_mcp_server.server import (
     main,
     mcp,
     query_knowledge_bases_tool,
+    query_multiple_knowledge_bases_tool,
 )
 from unittest import mock
 from unittest.mock import patch
 
 
+@pytest.fixture(autouse=True)
+def clear_discovery_cache():
+    """Discover the knowledge bases again in each test."""
+    server.kb_discovery_cache.clear()
+    yield
+    server.kb_discovery_cache.clear()
+
+
 class TestMCPServer:
     """Tests for the MCP server."""
 
@@ -84,6 +94,20 @@ class TestKnowledgebasesResource:
         # Check that discover_knowledge_bases was called with the correct arguments
         mock_discover_knowledge_bases.assert_called_once()
 
+    @pytest.mark.asyncio
+    @patch('awslabs.bedrock_kb_retrieval_mcp_server.server.discover_knowledge_bases')
+    async def test_knowledgebases_resource_is_cached(self, mock_discover_knowledge_bases):
+        """Test that the knowledge bases are discovered once within the cache TTL."""
+        mock_discover_knowledge_bases.return_value = {
+            'kb-12345': {'name': 'KB', 'data_sources': []}
+        }
+
+        first = await knowledgebases_resource()
+        second = await knowledgebases_resource()
+
+        assert first == second
+        mock_discover_knowledge_bases.assert_called_once()
+
 
 class TestQueryKnowledgeBasesTool:
     """Tests for the query_knowledge_bases_tool function."""
@@ -128,6 +152,36 @@ class TestQueryKnowledgeBasesTool:
         )
 
 
+class TestQueryMultipleKnowledgeBasesTool:
+    """Tests for the query_multiple_knowledge_bases_tool function."""
+
+    @pytest.mark.asyncio
+    @patch('awslabs.bedrock_kb_retrieval_mcp_server.server.query_knowledge_bases')
+    async def test_query_multiple_knowledge_bases_tool(self, mock_query_knowledge_bases):
+        """Test the query_multiple_knowledge_bases_tool function."""
+        mock_query_knowledge_bases.return_value = 'merged results'
+
+        result = await query_multiple_knowledge_bases_tool(
+            query='test query',
+            knowledge_base_ids=['kb-12345', 'kb-67890'],
+            number_of_results=5,
+            reranking=False,
+            reranking_model_name='AMAZON',
+            data_source_ids={'kb-12345': ['ds-12345']},
+        )
+
+        assert result == 'merged results'
+        mock_query_knowledge_bases.assert_called_once_with(
+            query='test query',
+            knowledge_base_ids=['kb-12345', 'kb-67890'],
+            kb_agent_client=mock.ANY,
+            number_of_results=5,
+            reranking=False,
+            reranking_model_name='AMAZON',
+            data_source_ids={'kb-12345': ['ds-12345']},
+        )
+
+
 class TestMain:
     """Tests for the main function."""
 
@@ -0,0 +1,220 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+import asyncio
+import json
+import random
+import re
+from awslabs.cfn_mcp_server.errors import ClientError, handle_aws_api_error
+from typing import Any
+
+
+BULK_GET_CONCURRENCY = 10  # Concurrent GetResource calls of a bulk read
+BULK_GET_MAX_ATTEMPTS = 5  # Attempts of a throttled GetResource call
+BULK_GET_BASE_DELAY = 0.5  # Seconds before retrying the first throttled call, doubled each attempt
+THROTTLING_ERROR_CODES = {
+    'ThrottlingException',
+    'Throttling',
+    'TooManyRequestsException',
+    'RequestLimitExceeded',
+}
+
+# A step of a property path: a name, an index, a quoted name or a wildcard
+PATH_STEP = re.compile(r"\.([A-Za-z0-9_\-]+)|\[(\d+)\]|\['([^']*)'\]|(\[\*\]|\.\*)")
+
+# Marks a property path that matched nothing
+MISSING = object()
+
+
+def parse_property_path(path: str) -> list[str | int | None]:
+    """Parse a JSONPath-style property path such as "$.Tags[*].Key" or "VersioningConfiguration.Status".
+
+    Returns:
+        The steps of the path: property names, list indexes, and None for wildcards
+    """
+    expression = path.strip()
+    expression = expression[1:] if expression.startswith('$') else expression
+    if expression and not expression.startswith(('.', '[')):
+        expression = f'.{expression}'
+
+    steps: list[str | int | None] = []
+    position = 0
+    while position < len(expression):
+        match = PATH_STEP.match(expression, position)
+        if not match:
+            raise ClientError(f'Invalid property path: {path}')
+        name, index, quoted, _ = match.groups()
+        if name is not None:
+            steps.append(name)
+        elif index is not None:
+            steps.append(int(index))
+        elif quoted is not None:
+            steps.append(quoted)
+        else:
+            steps.append(None)
+        position = match.end()
+
+    if not steps:
+        raise ClientError(f'Invalid property path: {path}')
+    return steps
+
+
+def select_property(properties: Any, steps: list[str | int | None]) -> Any:
+    """Select the value of a parsed property path.
+
+    A path with a wildcard matches a list of values, possibly empty, only when the part of the
+    path before its first wildcard resolves.
+
+    Returns:
+        The value, the list of matched values if the path has a wildcard, or MISSING
+    """
+    first_wildcard = steps.index(None) if None in steps else len(steps)
+    values = [properties]
+    for position, step in enumerate(steps):
+        if position == first_wildcard and not values:
+            return MISSING
+        selected = []
+        for value in values:
+            if step is None:
+                if isinstance(value, dict):
+                    selected.extend(value.values())
+                elif isinstance(value, list):
+                    selected.extend(value)
+            elif isinstance(step, int):
+                if isinstance(value, list) and step < len(value):
+                    selected.append(value[step])
+            elif isinstance(value, dict) and step in value:
+                selected.append(value[step])
+        values = selected
+
+    if first_wildcard < len(steps):
+        return values
+    return values[0] if values else MISSING
+
+
+def project_properties(properties: dict, paths: dict[str, list[str | int | None]]) -> dict:
+    """Keep the values of some property paths of a resource, keyed by path.
+
+    Paths without a match are left out.
+    """
+    projected = {}
+    for path, steps in paths.items():
+        value = select_property(properties, steps)
+        if value is not MISSING:
+            projected[path] = value
+    return projected
+
+
+def is_throttling_error(e: Exception) -> bool:
+    """Check whether an AWS API error is due to throttling."""
+    if hasattr(e, 'response') and 'Error' in getattr(e, 'response', {}):
+        return e.response['Error'].get('Code') in THROTTLING_ERROR_CODES  # pyright: ignore[reportAttributeAccessIssue]
+    return any(code in str(e) for code in THROTTLING_ERROR_CODES)
+
+
+async def get_resource_properties(
+    cloudcontrol,
+    resource_type: str,
+    identifier: str,
+    max_attempts: int = BULK_GET_MAX_ATTEMPTS,
+    base_delay: float = BULK_GET_BASE_DELAY,
+) -> dict:
+    """Get the properties of a resource, retrying throttled calls with exponential backoff and jitter."""
+    for attempt in range(max_attempts):
+        try:
+            result = await asyncio.to_thread(
+                cloudcontrol.get_resource, TypeName=resource_type, Identifier=identifier
+            )
+            return json.loads(result['ResourceDescription']['Properties'])
+        except Exception as e:
+            if not is_throttling_error(e) or attempt == max_attempts - 1:
+                raise
+            await asyncio.sleep(random.uniform(0, base_delay * 2**attempt))
+    raise ClientError(f'Could not get {identifier}')  # pragma: no cover
+
+
+async def describe_resources(
+    cloudcontrol,
+    resource_type: str,
+    identifiers: list[str] | None = None,
+    properties: list[str] | None = None,
+    max_results: int | None = None,
+    next_token: str | None = None,
+    concurrency: int = BULK_GET_CONCURRENCY,
+) -> dict:
+    """Get the properties of many resources of a type.
+
+    Without identifiers, a page of resources is listed and the properties returned by the list
+    call are used for the resources where they hold every requested property path. Every other
+    resource is read with GetResource, with a bounded number of concurrent calls. Without
+    property paths every resource is read, since the list call only returns some of the
+    properties of many resource types and nothing tells whether they are complete.
+
+    Args:
+        cloudcontrol: Cloud Control API client
+        resource_type: The AWS resource type (e.g., "AWS::S3::Bucket")
+        identifiers: Identifiers of the resources to read, None to list them
+        properties: JSONPath-style paths of the properties to return, None for all of them
+        max_results: Maximum number of resources to list
+        next_token: Token of the page of resources to list
+        concurrency: Maximum number of concurrent GetResource calls
+
+    Returns:
+        The identifier and properties or error of each resource, and the token of the next page
+    """
+    paths = {path: parse_property_path(path) for path in properties} if properties else None
+
+    listed: dict[str, dict | None] = {}
+    token = None
+    if identifiers is None:
+        request: dict[str, Any] = {'TypeName': resource_type}
+        if max_results:
+            request['MaxResults'] = max_results
+        if next_token:
+            request['NextToken'] = next_token
+        try:
+            page = await asyncio.to_thread(cloudcontrol.list_resources, **request)
+        except Exception as e:
+            raise handle_aws_api_error(e)
+        for description in page['ResourceDescriptions']:
+            listed_properties = None
+            # Listed properties are only trusted when they hold every requested path
+            if paths and description.get('Properties'):
+                listed_properties = json.loads(description['Properties'])
+                if any(
+                    select_property(listed_properties, steps) is MISSING
+                    for steps in paths.values()
+                ):
+                    listed_properties = None
+            listed[description['Identifier']] = listed_properties
+        token = page.get('NextToken')
+    else:
+        listed = dict.fromkeys(identifiers)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def describe(identifier: str, resource_properties: dict | None) -> dict:
+        if resource_properties is None:
+            async with semaphore:
+                try:
+                    resource_properties = await get_resource_properties(
+                        cloudcontrol, resource_type, identifier
+                    )
+                except Exception as e:
+                    return {'identifier': identifier, 'error': str(handle_aws_api_error(e))}
+        if paths:
+            resource_properties = project_properties(resource_properties, paths)
+        return {'identifier': identifier, 'properties': resource_properties}
+
+    resources = await asyncio.gather(
+        *(describe(identifier, value) for identifier, value in listed.items())
+    )
+    return {'resources': list(resources), 'next_token': token}
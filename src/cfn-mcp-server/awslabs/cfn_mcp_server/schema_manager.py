@@ -9,30 +9,45 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
 # and limitations under the License.
 
+
+import asyncio
 import json
 import os
+import threading
 from awslabs.cfn_mcp_server.aws_client import get_aws_client
 from awslabs.cfn_mcp_server.errors import ClientError
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict
 
 
-# all schema metadata is stored in .schemas/schema_metadata.json. The schemas themselves are all stored in the directory.
+# all schema metadata is stored in .schemas/schema_metadata.json, which indexes the schema files of the directory.
+# Schema files are only read when their resource type is first requested.
 SCHEMA_CACHE_DIR = '.schemas'
 SCHEMA_METADATA_FILE = 'schema_metadata.json'
 SCHEMA_UPDATE_INTERVAL = timedelta(days=7)  # Check for updates weekly
+SCHEMA_LRU_SIZE = 128  # Number of parsed schemas kept in memory
+SCHEMA_PREFETCH_CONCURRENCY = 8  # Concurrent DescribeType calls when prefetching schemas
 
 
 class SchemaManager:
     """Responsible for keeping track of schemas, cacheing them locally, and updating them if they are outdated."""
 
-    def __init__(self):
-        """Initialize the schema manager with the cache directory."""
-        cache_dir = os.path.join(os.path.dirname(__file__), '.schemas')
+    def __init__(self, cache_dir: str | None = None, lru_size: int = SCHEMA_LRU_SIZE):
+        """Initialize the schema manager with the cache directory.
+
+        Only the metadata index is read here, the schemas are loaded on demand.
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(__file__), SCHEMA_CACHE_DIR)
         self.cache_dir = Path(cache_dir)
         self.metadata_file = self.cache_dir / SCHEMA_METADATA_FILE
-        self.schema_registry: Dict[str, dict] = {}
+        self.lru_size = lru_size
+        # Parsed schemas, least recently used first
+        self.schema_registry: OrderedDict[str, dict] = OrderedDict()
+        # Guards the metadata index, which concurrent downloads update from worker threads
+        self._lock = threading.Lock()
 
         # Ensure cache directory exists
         self.cache_dir.mkdir(exist_ok=True)
@@ -40,9 +55,6 @@ class SchemaManager:
         # Load metadata if it exists
         self.metadata = self._load_metadata()
 
-        # Load cached schemas into registry
-        self._load_cached_schemas()
-
     def _load_metadata(self) -> dict:
         """Load schema metadata from file or create if it doesn't exist."""
         if self.metadata_file.exists():
@@ -56,56 +68,107 @@ class SchemaManager:
         metadata = {'version': '1', 'schemas': {}}
 
         # Save default metadata
-        with open(self.metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        self._save_metadata(metadata)
 
         return metadata
 
-    def _load_cached_schemas(self):
-        """Load all cached schemas into the registry."""
-        for schema_file in self.cache_dir.glob('*.json'):
-            if schema_file.name == SCHEMA_METADATA_FILE:
-                continue
+    def _save_metadata(self, metadata: dict | None = None):
+        """Atomically replace the metadata file.
 
-            try:
-                with open(schema_file, 'r') as f:
-                    schema = json.load(f)
-                    if 'typeName' in schema:
-                        resource_type = schema['typeName']
-                        self.schema_registry[resource_type] = schema
-                        print(f'Loaded schema for {resource_type} from cache')
-            except (json.JSONDecodeError, IOError) as e:
-                print(f'Error loading schema from {schema_file}: {str(e)}')
+        The lock is held until the file is replaced, so concurrent saves neither share the
+        temporary file nor replace a newer index with an older one.
+        """
+        with self._lock:
+            content = json.dumps(self.metadata if metadata is None else metadata, indent=2)
+            temporary_file = self.metadata_file.with_name(
+                f'{SCHEMA_METADATA_FILE}.{os.getpid()}.tmp'
+            )
+            with open(temporary_file, 'w') as f:
+                f.write(content)
+            os.replace(temporary_file, self.metadata_file)
+
+    def _schema_file(self, resource_type: str) -> Path:
+        """Get the cache file of a resource type.
+
+        Older metadata recorded absolute paths, so only the file name is used.
+        """
+        schema_metadata = self.metadata['schemas'].get(resource_type)
+        if schema_metadata and schema_metadata.get('file_path'):
+            return self.cache_dir / Path(schema_metadata['file_path']).name
+        return self.cache_dir / f'{resource_type.replace("::", "_")}.json'
+
+    def _is_stale(self, resource_type: str) -> bool:
+        """Check whether the cached schema of a resource type must be downloaded again."""
+        schema_metadata = self.metadata['schemas'].get(resource_type)
+        if schema_metadata is None:
+            # No metadata for this schema, use cached version
+            return False
+
+        last_updated_str = schema_metadata.get('last_updated')
+        if not last_updated_str:
+            return False
+        try:
+            last_updated = datetime.fromisoformat(last_updated_str)
+        except ValueError:
+            print(f'Invalid timestamp format for {resource_type}: {last_updated_str}')
+            return True
+
+        if datetime.now() - last_updated < SCHEMA_UPDATE_INTERVAL:
+            return False
+        print(
+            f'Schema for {resource_type} is older than {SCHEMA_UPDATE_INTERVAL.days} days, refreshing...'
+        )
+        return True
+
+    def _remember(self, resource_type: str, schema: dict):
+        """Add a parsed schema to the registry, evicting the least recently used ones."""
+        self.schema_registry[resource_type] = schema
+        self.schema_registry.move_to_end(resource_type)
+        while len(self.schema_registry) > self.lru_size:
+            self.schema_registry.popitem(last=False)
+
+    def _load_cached_schema(self, resource_type: str) -> dict | None:
+        """Load the cached schema of a resource type from its file."""
+        schema_file = self._schema_file(resource_type)
+        if not schema_file.exists():
+            return None
+        try:
+            with open(schema_file, 'r') as f:
+                schema = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f'Error loading schema from {schema_file}: {str(e)}')
+            return None
+        self._remember(resource_type, schema)
+        return schema
 
     async def get_schema(self, resource_type: str, region: str | None = None) -> dict:
         """Get schema for a resource type, downloading it if necessary."""
-        # Check if schema is in registry and not forced to refresh
-        if resource_type in self.schema_registry:
-            # Check if schema needs to be updated based on last update time
-            if resource_type in self.metadata['schemas']:
-                schema_metadata = self.metadata['schemas'][resource_type]
-                last_updated_str = schema_metadata.get('last_updated')
-
-                if last_updated_str:
-                    try:
-                        last_updated = datetime.fromisoformat(last_updated_str)
-                        if datetime.now() - last_updated < SCHEMA_UPDATE_INTERVAL:
-                            # Schema is recent enough, use cached version
-                            return self.schema_registry[resource_type]
-                        else:
-                            print(
-                                f'Schema for {resource_type} is older than {SCHEMA_UPDATE_INTERVAL.days} days, refreshing...'
-                            )
-                    except ValueError:
-                        print(f'Invalid timestamp format for {resource_type}: {last_updated_str}')
-            else:
-                # No metadata for this schema, use cached version
+        if not self._is_stale(resource_type):
+            if resource_type in self.schema_registry:
+                self.schema_registry.move_to_end(resource_type)
                 return self.schema_registry[resource_type]
 
+            schema = self._load_cached_schema(resource_type)
+            if schema is not None:
+                return schema
+
         # Download schema
         schema = await self._download_resource_schema(resource_type, region)
         return schema
 
+    def _store_schema(self, resource_type: str, schema_str: str):
+        """Write a downloaded schema to the cache and index it, without saving the index."""
+        schema_file = self.cache_dir / f'{resource_type.replace("::", "_")}.json'
+        with open(schema_file, 'w') as f:
+            f.write(schema_str)
+
+        with self._lock:
+            self.metadata['schemas'][resource_type] = {
+                'last_updated': datetime.now().isoformat(),
+                'file_path': schema_file.name,
+                'source': 'cloudformation_api',
+            }
+
     async def _download_resource_schema(
         self, resource_type: str, region: str | None = None
     ) -> dict:
@@ -129,30 +192,99 @@ class SchemaManager:
         try:
             print(f'Downloading schema for {resource_type} using CloudFormation API')
             cfn_client = get_aws_client('cloudformation', region)
-            resp = cfn_client.describe_type(Type='RESOURCE', TypeName=resource_type)
+            resp = await asyncio.to_thread(
+                cfn_client.describe_type, Type='RESOURCE', TypeName=resource_type
+            )
             schema_str = resp['Schema']
             spec = json.loads(schema_str)
 
             # Save schema to cache
-            schema_file = self.cache_dir / f'{resource_type.replace("::", "_")}.json'
-            with open(schema_file, 'w') as f:
-                f.write(schema_str)
-
-            # Update metadata
-            self.metadata['schemas'][resource_type] = {
-                'last_updated': datetime.now().isoformat(),
-                'file_path': str(schema_file),
-                'source': 'cloudformation_api',
-            }
-
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.metadata, f, indent=2)
+            await asyncio.to_thread(self._store_schema, resource_type, schema_str)
+            await asyncio.to_thread(self._save_metadata)
+            self._remember(resource_type, spec)
 
             print(f'Processed and cached schema for {resource_type}')
             return spec
         except Exception as e:
             raise ClientError(f'Error downloading the schema for {resource_type}: {str(e)}')
 
+    async def prefetch_schemas(
+        self,
+        region: str | None = None,
+        concurrency: int = SCHEMA_PREFETCH_CONCURRENCY,
+        force: bool = False,
+    ) -> dict:
+        """Download the schemas of all the AWS resource types of a region into the cache.
+
+        Schemas are written to the cache without being parsed or kept in memory, and the
+        metadata index is saved once at the end.
+
+        Args:
+            region: AWS region to use for API calls
+            concurrency: Maximum number of schemas downloaded at the same time
+            force: Download the schemas that are already cached and up to date too
+
+        Returns:
+            The number of downloaded and up to date schemas, and the errors by resource type
+        """
+        cfn_client = get_aws_client('cloudformation', region)
+
+        def list_resource_types() -> list[str]:
+            paginator = cfn_client.get_paginator('list_types')
+            resource_types = []
+            for page in paginator.paginate(
+                Visibility='PUBLIC',
+                Type='RESOURCE',
+                DeprecatedStatus='LIVE',
+                Filters={'Category': 'AWS_TYPES'},
+            ):
+                resource_types.extend(summary['TypeName'] for summary in page['TypeSummaries'])
+            return resource_types
+
+        try:
+            resource_types = await asyncio.to_thread(list_resource_types)
+        except Exception as e:
+            raise ClientError(f'Error listing the resource types: {str(e)}')
+
+        listed = len(resource_types)
+        if not force:
+            resource_types = [
+                resource_type
+                for resource_type in resource_types
+                if resource_type not in self.metadata['schemas']
+                or not self._schema_file(resource_type).exists()
+                or self._is_stale(resource_type)
+            ]
+
+        semaphore = asyncio.Semaphore(concurrency)
+        errors: Dict[str, str] = {}
+
+        def download(resource_type: str):
+            resp = cfn_client.describe_type(Type='RESOURCE', TypeName=resource_type)
+            self._store_schema(resource_type, resp['Schema'])
+
+        async def prefetch(resource_type: str):
+            async with semaphore:
+                try:
+                    await asyncio.to_thread(download, resource_type)
+                except Exception as e:
+                    errors[resource_type] = str(e)
+                    return
+            # Drop any outdated parsed copy, it is loaded again from the new file on demand
+            self.schema_registry.pop(resource_type, None)
+
+        print(f'Prefetching {len(resource_types)} schemas using CloudFormation API')
+        await asyncio.gather(*(prefetch(resource_type) for resource_type in resource_types))
+        await asyncio.to_thread(self._save_metadata)
+
+        result = {
+            'downloaded': len(resource_types) - len(errors),
+            'skipped': listed - len(resource_types),
+            'errors': errors,
+        }
+        print(f'Prefetched {result["downloaded"]} schemas, {len(errors)} failed')
+        return result
+
 
 _schema_manager_instance = SchemaManager()
 
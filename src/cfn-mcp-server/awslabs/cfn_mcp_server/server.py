@@ -12,8 +12,10 @@
 """awslabs CFN MCP Server implementation."""
 
 import argparse
+import asyncio
 import json
 from awslabs.cfn_mcp_server.aws_client import get_aws_client
+from awslabs.cfn_mcp_server.bulk_resources import describe_resources
 from awslabs.cfn_mcp_server.cloud_control_utils import progress_event, validate_patch
 from awslabs.cfn_mcp_server.context import Context
 from awslabs.cfn_mcp_server.errors import ClientError, handle_aws_api_error
@@ -30,6 +32,7 @@ mcp = FastMCP(
 
     This MCP allows you to:
     1. Read and List all of your AWS resources by the CloudFormation type name (e.g. AWS::S3::Bucket)
+       - Use get_resources rather than get_resource for each identifier to read many resources of a type, with properties to only return what is needed
     2. Create/Update/Delete your AWS resources
     """,
     dependencies=['pydantic', 'loguru', 'boto3', 'botocore'],
@@ -139,6 +142,63 @@ async def get_resource(
         raise handle_aws_api_error(e)
 
 
+@mcp.tool()
+async def get_resources(
+    resource_type: str = Field(
+        description='The AWS resource type (e.g., "AWS::S3::Bucket", "AWS::RDS::DBInstance")'
+    ),
+    identifiers: list[str] | None = Field(
+        description='The primary identifiers of the resources to get. Leave empty to get a page of all the resources of the type',
+        default=None,
+    ),
+    properties: list[str] | None = Field(
+        description='JSONPath-style paths of the properties to return (e.g., ["BucketName", "Tags[*].Key"]). Leave empty to return all properties',
+        default=None,
+    ),
+    max_results: int | None = Field(
+        description='The maximum number of resources to list when no identifiers are given',
+        default=100,
+    ),
+    next_token: str | None = Field(
+        description='The next_token returned by a previous call, to get the next page of resources',
+        default=None,
+    ),
+    region: str | None = Field(
+        description='The AWS region that the operation should be performed in', default=None
+    ),
+) -> dict:
+    """Get details of many AWS resources of a type at once.
+
+    Parameters:
+        resource_type: The AWS resource type (e.g., "AWS::S3::Bucket")
+        identifiers: The primary identifiers of the resources to get, or None to list them
+        properties: JSONPath-style paths of the properties to return (e.g., "$.Tags[*].Key")
+        max_results: The maximum number of resources to list when no identifiers are given
+        next_token: The token of the page of resources to list
+        region: AWS region to use (e.g., "us-east-1", "us-west-2")
+
+    Returns:
+        The resources and the token of the next page with a consistent structure:
+        {
+            "resources": A list of {"identifier", "properties"}, or {"identifier", "error"} for the resources that could not be read,
+            "next_token": The token to pass to get the next page, or None after the last page
+        }
+        When properties are given, the properties of each resource are keyed by path, leaving out the paths without a match.
+    """
+    if not resource_type:
+        raise ClientError('Please provide a resource type (e.g., AWS::S3::Bucket)')
+
+    cloudcontrol = get_aws_client('cloudcontrol', region)
+    return await describe_resources(
+        cloudcontrol,
+        resource_type,
+        identifiers=identifiers or None,
+        properties=properties or None,
+        max_results=max_results,
+        next_token=next_token,
+    )
+
+
 @mcp.tool()
 async def update_resource(
     resource_type: str = Field(
@@ -427,8 +487,21 @@ def main():
         action=argparse.BooleanOptionalAction,
         help='Prevents the MCP server from performing mutating operations',
     )
+    parser.add_argument(
+        '--prefetch-schemas',
+        nargs='?',
+        const='',
+        metavar='REGION',
+        help='Downloads the schemas of all resource types of a region into the cache and exits',
+    )
 
     args = parser.parse_args()
+    if args.prefetch_schemas is not None:
+        result = asyncio.run(schema_manager().prefetch_schemas(args.prefetch_schemas or None))
+        for resource_type, error in result['errors'].items():
+            print(f'Error downloading the schema for {resource_type}: {error}')
+        return
+
     Context.initialize(args.readonly)
     mcp.run()
 
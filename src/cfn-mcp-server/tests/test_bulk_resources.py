@@ -0,0 +1,215 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+"""Tests for the bulk_resources module."""
+
+import json
+import pytest
+from awslabs.cfn_mcp_server.bulk_resources import (
+    MISSING,
+    describe_resources,
+    parse_property_path,
+    project_properties,
+    select_property,
+)
+from awslabs.cfn_mcp_server.errors import ClientError
+from botocore.exceptions import ClientError as BotoClientError
+from unittest.mock import MagicMock, patch
+
+
+PROPERTIES = {
+    'BucketName': 'bucket',
+    'VersioningConfiguration': {'Status': 'Enabled'},
+    'Tags': [{'Key': 'team', 'Value': 'a'}, {'Key': 'env', 'Value': 'b'}],
+}
+
+
+def throttling_error():
+    """Create a throttling error as raised by botocore."""
+    return BotoClientError(
+        {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}}, 'GetResource'
+    )
+
+
+def get_resource_response(identifier):
+    """Create a GetResource response."""
+    properties = {**PROPERTIES, 'BucketName': identifier}
+    return {
+        'ResourceDescription': {'Identifier': identifier, 'Properties': json.dumps(properties)}
+    }
+
+
+class TestPropertyPaths:
+    """Tests on the property paths."""
+
+    def test_parse_property_path(self):
+        """Testing parsing the supported path syntaxes."""
+        assert parse_property_path('BucketName') == ['BucketName']
+        assert parse_property_path('$.Tags[*].Key') == ['Tags', None, 'Key']
+        assert parse_property_path("$['Tags'][0].Value") == ['Tags', 0, 'Value']
+        assert parse_property_path('VersioningConfiguration.*') == [
+            'VersioningConfiguration',
+            None,
+        ]
+
+    @pytest.mark.parametrize('path', ['', '$', 'Tags[', 'Tags..Key', 'Tags[x]'])
+    def test_parse_invalid_property_path(self, path):
+        """Testing invalid paths."""
+        with pytest.raises(ClientError):
+            parse_property_path(path)
+
+    def test_select_property(self):
+        """Testing selecting values."""
+        assert select_property(PROPERTIES, ['VersioningConfiguration', 'Status']) == 'Enabled'
+        assert select_property(PROPERTIES, ['Tags', 1, 'Key']) == 'env'
+        assert select_property(PROPERTIES, ['Tags', None, 'Key']) == ['team', 'env']
+        assert select_property(PROPERTIES, ['Tags', 5]) is MISSING
+        assert select_property({'Tags': []}, ['Tags', None, 'Key']) == []
+        assert select_property(PROPERTIES, ['Missing', None]) is MISSING
+        assert select_property({'BucketName': 'b1'}, ['Tags', None, 'Key']) is MISSING
+
+    def test_project_properties(self):
+        """Testing that projections are keyed by path and leave out missing paths."""
+        paths = {
+            path: parse_property_path(path)
+            for path in ['BucketName', 'Tags[*].Value', 'LoggingConfiguration']
+        }
+        assert project_properties(PROPERTIES, paths) == {
+            'BucketName': 'bucket',
+            'Tags[*].Value': ['a', 'b'],
+        }
+
+
+@pytest.mark.asyncio
+class TestDescribeResources:
+    """Tests on describe_resources."""
+
+    async def test_reuse_listed_properties(self):
+        """Testing that properties from the list call are used when they hold every path."""
+        client = MagicMock()
+        client.list_resources.return_value = {
+            'ResourceDescriptions': [
+                {'Identifier': 'a', 'Properties': json.dumps({'BucketName': 'a'})},
+                {'Identifier': 'b', 'Properties': json.dumps({'Arn': 'arn'})},
+            ],
+            'NextToken': 'token2',
+        }
+        client.get_resource.side_effect = lambda TypeName, Identifier: get_resource_response(
+            Identifier
+        )
+
+        result = await describe_resources(
+            client,
+            'AWS::S3::Bucket',
+            properties=['BucketName'],
+            max_results=2,
+            next_token='token1',
+        )
+
+        client.list_resources.assert_called_once_with(
+            TypeName='AWS::S3::Bucket', MaxResults=2, NextToken='token1'
+        )
+        client.get_resource.assert_called_once_with(TypeName='AWS::S3::Bucket', Identifier='b')
+        assert result == {
+            'resources': [
+                {'identifier': 'a', 'properties': {'BucketName': 'a'}},
+                {'identifier': 'b', 'properties': {'BucketName': 'b'}},
+            ],
+            'next_token': 'token2',
+        }
+
+    async def test_listed_properties_without_wildcard_prefix(self):
+        """Testing that resources are read when listed properties lack a wildcard path."""
+        client = MagicMock()
+        client.list_resources.return_value = {
+            'ResourceDescriptions': [
+                {'Identifier': 'b1', 'Properties': json.dumps({'BucketName': 'b1'})},
+            ],
+        }
+        client.get_resource.side_effect = lambda TypeName, Identifier: get_resource_response(
+            Identifier
+        )
+
+        result = await describe_resources(client, 'AWS::S3::Bucket', properties=['$.Tags[*].Key'])
+
+        client.get_resource.assert_called_once_with(TypeName='AWS::S3::Bucket', Identifier='b1')
+        assert result['resources'] == [
+            {'identifier': 'b1', 'properties': {'$.Tags[*].Key': ['team', 'env']}}
+        ]
+
+    async def test_all_properties_are_read(self):
+        """Testing that every resource is read when no property path is requested."""
+        client = MagicMock()
+        client.list_resources.return_value = {
+            'ResourceDescriptions': [
+                {'Identifier': 'b1', 'Properties': json.dumps({'BucketName': 'b1'})},
+            ],
+        }
+        client.get_resource.side_effect = lambda TypeName, Identifier: get_resource_response(
+            Identifier
+        )
+
+        result = await describe_resources(client, 'AWS::S3::Bucket')
+
+        client.get_resource.assert_called_once_with(TypeName='AWS::S3::Bucket', Identifier='b1')
+        assert result['resources'][0]['properties']['Tags'] == PROPERTIES['Tags']
+
+    @patch('awslabs.cfn_mcp_server.bulk_resources.asyncio.sleep')
+    async def test_identifiers_with_throttling(self, mock_sleep):
+        """Testing that throttled calls are retried and other errors are reported."""
+        calls = {}
+
+        def get_resource(TypeName, Identifier):
+            calls[Identifier] = calls.get(Identifier, 0) + 1
+            if Identifier == 'throttled' and calls[Identifier] < 3:
+                raise throttling_error()
+            if Identifier == 'missing':
+                raise Exception('ResourceNotFoundException')
+            return get_resource_response(Identifier)
+
+        client = MagicMock()
+        client.get_resource.side_effect = get_resource
+
+        result = await describe_resources(
+            client,
+            'AWS::S3::Bucket',
+            identifiers=['ok', 'throttled', 'missing'],
+            properties=['Tags[*].Key'],
+            concurrency=2,
+        )
+
+        client.list_resources.assert_not_called()
+        assert calls == {'ok': 1, 'throttled': 3, 'missing': 1}
+        assert mock_sleep.await_count == 2
+        assert result['resources'] == [
+            {'identifier': 'ok', 'properties': {'Tags[*].Key': ['team', 'env']}},
+            {'identifier': 'throttled', 'properties': {'Tags[*].Key': ['team', 'env']}},
+            {'identifier': 'missing', 'error': 'Resource was not found'},
+        ]
+        assert result['next_token'] is None
+
+    @patch('awslabs.cfn_mcp_server.bulk_resources.asyncio.sleep')
+    async def test_throttling_gives_up(self, mock_sleep):
+        """Testing that a call throttled on every attempt is reported."""
+        client = MagicMock()
+        client.get_resource.side_effect = throttling_error()
+
+        result = await describe_resources(client, 'AWS::S3::Bucket', identifiers=['a'])
+
+        assert client.get_resource.call_count == 5
+        assert 'error' in result['resources'][0]
+
+    async def test_list_error(self):
+        """Testing an error of the list call."""
+        client = MagicMock()
+        client.list_resources.side_effect = Exception('AccessDenied')
+
+        with pytest.raises(ClientError):
+            await describe_resources(client, 'AWS::S3::Bucket')
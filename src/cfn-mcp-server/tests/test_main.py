@@ -11,7 +11,7 @@
 """Tests for the main function in server.py."""
 
 from awslabs.cfn_mcp_server.server import main
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 class TestMain:
@@ -27,6 +27,22 @@ class TestMain:
         # Check that mcp.run was called with the correct arguments
         mock_run.assert_called_once()
 
+    @patch('awslabs.cfn_mcp_server.server.mcp.run')
+    @patch('awslabs.cfn_mcp_server.server.schema_manager')
+    @patch('sys.argv', ['awslabs.cfn-mcp-server', '--prefetch-schemas', 'eu-west-1'])
+    def test_main_prefetch_schemas(self, mock_schema_manager, mock_run):
+        """Test that main prefetches the schemas of a region and exits."""
+        mock_instance = MagicMock()
+        mock_instance.prefetch_schemas = AsyncMock(
+            return_value={'downloaded': 1, 'skipped': 0, 'errors': {'AWS::Fake::A': 'error'}}
+        )
+        mock_schema_manager.return_value = mock_instance
+
+        main()
+
+        mock_instance.prefetch_schemas.assert_awaited_once_with('eu-west-1')
+        mock_run.assert_not_called()
+
     def test_module_execution(self):
         """Test the module execution when run as __main__."""
         # This test directly executes the code in the if __name__ == '__main__': block
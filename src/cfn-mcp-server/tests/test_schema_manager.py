@@ -10,13 +10,35 @@
 # and limitations under the License.
 """Tests for the cfn MCP Server."""
 
+import json
 import pytest
 import random
 import string
-from awslabs.cfn_mcp_server.schema_manager import schema_manager
+from awslabs.cfn_mcp_server.errors import ClientError
+from awslabs.cfn_mcp_server.schema_manager import SchemaManager, schema_manager
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 
+def write_cached_schema(cache_dir, type_name, last_updated=None, file_path=None):
+    """Write a schema file to a cache directory and index it."""
+    file_name = f'{type_name.replace("::", "_")}.json'
+    (cache_dir / file_name).write_text(json.dumps({'typeName': type_name, 'properties': {}}))
+    metadata_file = cache_dir / 'schema_metadata.json'
+    metadata = (
+        json.loads(metadata_file.read_text())
+        if metadata_file.exists()
+        else {'version': '1', 'schemas': {}}
+    )
+    metadata['schemas'][type_name] = {
+        'last_updated': (last_updated or datetime.now()).isoformat(),
+        'file_path': file_path or file_name,
+        'source': 'cloudformation_api',
+    }
+    metadata_file.write_text(json.dumps(metadata))
+
+
 @pytest.mark.asyncio
 class TestSchemaManager:
     """Tests on the schema_manager module."""
@@ -61,3 +83,121 @@ class TestSchemaManager:
         result1 = await sm.get_schema(type_name)
         result2 = await sm.get_schema(type_name)
         assert result1 == result2
+
+    @patch('awslabs.cfn_mcp_server.schema_manager.get_aws_client')
+    async def test_load_schema_on_demand(self, mock_get_aws_client, tmp_path):
+        """Testing that cached schemas are only read when requested."""
+        write_cached_schema(tmp_path, 'AWS::S3::Bucket')
+        # Metadata written by older versions records absolute paths
+        write_cached_schema(
+            tmp_path, 'AWS::SQS::Queue', file_path='/elsewhere/.schemas/AWS_SQS_Queue.json'
+        )
+
+        sm = SchemaManager(cache_dir=str(tmp_path))
+        assert len(sm.schema_registry) == 0
+
+        result = await sm.get_schema('AWS::SQS::Queue')
+        assert result['typeName'] == 'AWS::SQS::Queue'
+        assert list(sm.schema_registry) == ['AWS::SQS::Queue']
+        mock_get_aws_client.assert_not_called()
+
+    @patch('awslabs.cfn_mcp_server.schema_manager.get_aws_client')
+    async def test_least_recently_used_eviction(self, mock_get_aws_client, tmp_path):
+        """Testing that only the most recently used schemas stay in memory."""
+        for type_name in ['AWS::Fake::A', 'AWS::Fake::B', 'AWS::Fake::C']:
+            write_cached_schema(tmp_path, type_name)
+
+        sm = SchemaManager(cache_dir=str(tmp_path), lru_size=2)
+        await sm.get_schema('AWS::Fake::A')
+        await sm.get_schema('AWS::Fake::B')
+        await sm.get_schema('AWS::Fake::A')
+        await sm.get_schema('AWS::Fake::C')
+
+        assert list(sm.schema_registry) == ['AWS::Fake::A', 'AWS::Fake::C']
+        assert (await sm.get_schema('AWS::Fake::B'))['typeName'] == 'AWS::Fake::B'
+        mock_get_aws_client.assert_not_called()
+
+    @patch('awslabs.cfn_mcp_server.schema_manager.get_aws_client')
+    async def test_refresh_outdated_schema(self, mock_get_aws_client, tmp_path):
+        """Testing that outdated schemas are downloaded again."""
+        write_cached_schema(
+            tmp_path, 'AWS::Fake::Old', last_updated=datetime.now() - timedelta(days=30)
+        )
+        response = {'Schema': '{"typeName": "AWS::Fake::Old", "properties": {"New": {}}}'}
+        mock_get_aws_client.return_value = MagicMock(
+            describe_type=MagicMock(return_value=response)
+        )
+
+        sm = SchemaManager(cache_dir=str(tmp_path))
+        result = await sm.get_schema('AWS::Fake::Old')
+
+        assert result['properties'] == {'New': {}}
+        metadata = json.loads((tmp_path / 'schema_metadata.json').read_text())
+        assert metadata['schemas']['AWS::Fake::Old']['file_path'] == 'AWS_Fake_Old.json'
+        reloaded = SchemaManager(cache_dir=str(tmp_path))
+        assert (await reloaded.get_schema('AWS::Fake::Old'))['properties'] == {'New': {}}
+
+    @patch('awslabs.cfn_mcp_server.schema_manager.get_aws_client')
+    async def test_prefetch_schemas(self, mock_get_aws_client, tmp_path):
+        """Testing downloading the schemas of all resource types of a region."""
+        write_cached_schema(tmp_path, 'AWS::Fake::Cached')
+
+        def describe_type(Type, TypeName):
+            if TypeName == 'AWS::Fake::Broken':
+                raise Exception('Throttling')
+            return {'Schema': json.dumps({'typeName': TypeName})}
+
+        paginator = MagicMock()
+        paginator.paginate.return_value = [
+            {'TypeSummaries': [{'TypeName': 'AWS::Fake::Cached'}, {'TypeName': 'AWS::Fake::A'}]},
+            {'TypeSummaries': [{'TypeName': 'AWS::Fake::B'}, {'TypeName': 'AWS::Fake::Broken'}]},
+        ]
+        mock_cfn_client = MagicMock(
+            describe_type=MagicMock(side_effect=describe_type),
+            get_paginator=MagicMock(return_value=paginator),
+        )
+        mock_get_aws_client.return_value = mock_cfn_client
+
+        sm = SchemaManager(cache_dir=str(tmp_path))
+        result = await sm.prefetch_schemas('us-west-2', concurrency=2)
+
+        mock_get_aws_client.assert_called_once_with('cloudformation', 'us-west-2')
+        assert result['downloaded'] == 2
+        assert result['skipped'] == 1
+        assert list(result['errors']) == ['AWS::Fake::Broken']
+        assert mock_cfn_client.describe_type.call_count == 3
+        assert len(sm.schema_registry) == 0
+
+        metadata = json.loads((tmp_path / 'schema_metadata.json').read_text())
+        assert sorted(metadata['schemas']) == ['AWS::Fake::A', 'AWS::Fake::B', 'AWS::Fake::Cached']
+        assert (await sm.get_schema('AWS::Fake::B'))['typeName'] == 'AWS::Fake::B'
+        assert mock_cfn_client.describe_type.call_count == 3
+
+    async def test_concurrent_metadata_saves(self, tmp_path):
+        """Testing that concurrent saves of the metadata index do not collide."""
+        sm = SchemaManager(cache_dir=str(tmp_path))
+        type_names = [f'AWS::Fake::T{i}' for i in range(50)]
+
+        def store_and_save(type_name):
+            sm._store_schema(type_name, json.dumps({'typeName': type_name}))
+            sm._save_metadata()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(store_and_save, type_names))
+
+        metadata = json.loads((tmp_path / 'schema_metadata.json').read_text())
+        assert sorted(metadata['schemas']) == sorted(type_names)
+        assert [path.name for path in tmp_path.glob('*.tmp')] == []
+
+    @patch('awslabs.cfn_mcp_server.schema_manager.get_aws_client')
+    async def test_prefetch_schemas_list_error(self, mock_get_aws_client, tmp_path):
+        """Testing an error when listing the resource types."""
+        paginator = MagicMock()
+        paginator.paginate.side_effect = Exception('AccessDenied')
+        mock_get_aws_client.return_value = MagicMock(
+            get_paginator=MagicMock(return_value=paginator)
+        )
+
+        sm = SchemaManager(cache_dir=str(tmp_path))
+        with pytest.raises(ClientError):
+            await sm.prefetch_schemas()
@@ -20,6 +20,7 @@ from awslabs.cfn_mcp_server.server import (
     get_resource,
     get_resource_request_status,
     get_resource_schema_information,
+    get_resources,
     list_resources,
     update_resource,
 )
@@ -315,3 +316,33 @@ class TestTools:
 
         # Verify the implementation was called with the correct parameters
         mock_create_template_impl.assert_called_once()
+
+    async def test_get_resources_no_type(self):
+        """Testing no type provided."""
+        with pytest.raises(ClientError):
+            await get_resources(resource_type=None)
+
+    @patch('awslabs.cfn_mcp_server.server.get_aws_client')
+    async def test_get_resources(self, mock_get_aws_client):
+        """Testing getting a page of resources with projected properties."""
+        mock_client = MagicMock()
+        mock_client.list_resources.return_value = {
+            'ResourceDescriptions': [
+                {'Identifier': 'Identifier', 'Properties': '{"Name": "Name", "Other": 1}'}
+            ]
+        }
+        mock_get_aws_client.return_value = mock_client
+
+        result = await get_resources(
+            resource_type='AWS::CodeStarConnections::Connection',
+            identifiers=None,
+            properties=['$.Name'],
+            max_results=10,
+            next_token=None,
+        )
+
+        mock_client.get_resource.assert_not_called()
+        assert result == {
+            'resources': [{'identifier': 'Identifier', 'properties': {'$.Name': 'Name'}}],
+            'next_token': None,
+        }
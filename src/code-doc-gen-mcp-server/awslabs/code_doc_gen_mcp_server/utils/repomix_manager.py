@@ -11,12 +11,118 @@
 
 """Manager for repomix operations with streamlined directory structure extraction."""
 
+import asyncio
+import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 from mcp.server.fastmcp import Context
 from pathlib import Path
 from repomix import RepomixConfig, RepoProcessor
-from typing import Any, Dict, Optional
+from repomix.core.file.file_search import search_files
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Name of the manifest caching the statistics of each file in the output directory
+MANIFEST_FILE = '.repomix_manifest.json'
+MANIFEST_VERSION = 1
+
+# Define standard ignore patterns - using regex patterns as needed
+# Explicitly exclude specific hidden files/directories rather than all with dot prefix
+IGNORE_PATTERNS = [
+    # Standard file formats to ignore
+    '**/*.svg',
+    '**/*.drawio',
+    '**/*.min.js',
+    '**/*.min.css',
+    '**/*.pyc',
+    '**/*.d.ts',
+    '**/*.js.map',
+    '**/*.tsbuildinfo',
+    # Test and build directories
+    '**/test/**',
+    '**/__snapshots__/**',
+    '**/*.test.ts',
+    '**/dist/**',
+    '**/coverage/**',
+    '**/build/**',
+    '**/generated-docs/**',
+    # Node.js specific
+    '**/node_modules/**',
+    '**/.nx/**',
+    # Python specific
+    '**/__pycache__/**',
+    '**/venv/**',
+    '**/.venv/**',
+    '**/__init__.py',
+    '**/.ruff_cache/**',
+    # AWS CDK specific
+    '**/cdk.out/**',
+    '**/**/cdk.out/**',
+    'packages/cdk_infra/cdk.out',
+    'packages/cdk_infra/cdk.out/**',
+    # CI/CD and development tools
+    '**/.projen/**',
+    '**/.husky/**',
+    # Note: Deliberately NOT excluding dot files/directories like .github, .devcontainer, .python-version
+]
+
+# Bytes found in text files, as detected by repomix
+TEXT_CHARACTERS = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7F})
+
+
+def count_characters(path: Path) -> Optional[int]:
+    """Count the characters repomix would pack for a file.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        Number of characters of the stripped file contents, None for binary or unreadable
+        files, which repomix skips
+    """
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    if data[:1024].translate(None, TEXT_CHARACTERS):
+        return None
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        text = data.decode('latin-1')
+    return len(text.strip())
+
+
+def build_directory_structure(file_paths: List[str]) -> str:
+    """Build the text directory structure of files, as extracted from repomix output.
+
+    Args:
+        file_paths: Paths of the files relative to the repository, with / separators
+
+    Returns:
+        Directory structure with one line per file or directory, directory names ending
+        with / and their contents indented by two spaces
+    """
+    tree: Dict[str, Any] = {}
+    for file_path in file_paths:
+        node = tree
+        *directories, name = file_path.split('/')
+        for directory in directories:
+            node = node.setdefault(f'{directory}/', {})
+        node[name] = None
+
+    lines: List[str] = []
+
+    def render(node: Dict[str, Any], indent: int):
+        for name, child in node.items():
+            lines.append(' ' * indent + name)
+            if child is not None:
+                render(child, indent + 2)
+
+    render(tree, 0)
+    return '\n'.join(lines)
 
 
 class RepomixManager:
@@ -29,6 +135,9 @@ class RepomixManager:
     def extract_statistics(self, xml_path: str) -> Dict[str, Any]:
         """Extract statistics from repomix XML output file.
 
+        The file is parsed incrementally and the contents of packed files are discarded as
+        they are read, so memory use does not grow with the size of the repository.
+
         Args:
             xml_path: Path to the XML output file from repomix
 
@@ -36,7 +145,6 @@ class RepomixManager:
             Dictionary containing statistics or empty dict if not found
         """
         import defusedxml.ElementTree as ET
-        import os
 
         self.logger.info(f'Extracting statistics from {xml_path}')
 
@@ -46,21 +154,19 @@ class RepomixManager:
                 self.logger.error(f'XML file does not exist: {xml_path}')
                 return {}
 
-            # Parse XML
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-            if root is None:
-                self.logger.error('Failed to get root element from XML')
-                return {}
+            for _, elem in ET.iterparse(xml_path, events=('end',)):
+                if elem.tag == 'content':
+                    # Discard the packed contents of files
+                    elem.clear()
+                    continue
+                if elem.tag != 'statistics':
+                    continue
 
-            # Find statistics element
-            stats_elem = root.find('.//statistics')
-            if stats_elem is not None:
                 self.logger.info('Found statistics element')
                 stats = {}
 
                 # Extract each statistic
-                for child in stats_elem:
+                for child in elem:
                     try:
                         # Try to convert to appropriate type (int for numeric values)
                         tag = child.tag
@@ -88,6 +194,9 @@ class RepomixManager:
         1. Plain text in <directory_structure> element (for compatibility with tests)
         2. Nested <repository_structure> XML format (new repomix format)
 
+        The file is parsed incrementally up to the directory structure, which repomix writes
+        before the contents of packed files.
+
         Args:
             xml_path: Path to the XML output file from repomix
 
@@ -95,7 +204,6 @@ class RepomixManager:
             String containing the directory structure or None if not found
         """
         import defusedxml.ElementTree as ET
-        import os
 
         self.logger.info(f'Extracting directory structure from {xml_path}')
 
@@ -105,34 +213,23 @@ class RepomixManager:
                 self.logger.error(f'XML file does not exist: {xml_path}')
                 return None
 
-            # Parse XML
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-            if root is None:
-                self.logger.error('Failed to get root element from XML')
-                return None
-
-            # First try the old format with <directory_structure> containing plain text
-            for xpath in [
-                './/directory_structure',
-                'directory_structure',
-                './directory_structure',
-            ]:
-                dir_elem = root.find(xpath)
-                if dir_elem is not None and dir_elem.text:
-                    directory_structure = dir_elem.text.strip()
-                    self.logger.info(f'Extracted directory structure using xpath: {xpath}')
-                    return directory_structure
-
-            # If not found, look for nested <repository_structure> format
-            # Handle case where root could be None
-            repo_structure = root.find('.//repository_structure') if root is not None else None
-            if repo_structure is not None:
-                self.logger.info('Found repository_structure element, converting to text format')
-                lines = []
-                self._convert_repository_structure(repo_structure, lines)
-                if lines:
-                    return '\n'.join(lines)
+            for _, elem in ET.iterparse(xml_path, events=('end',)):
+                if elem.tag == 'content':
+                    # Discard the packed contents of files
+                    elem.clear()
+                elif elem.tag == 'directory_structure' and elem.text and elem.text.strip():
+                    # Old format with <directory_structure> containing plain text
+                    self.logger.info('Extracted directory structure from directory_structure')
+                    return elem.text.strip()
+                elif elem.tag == 'repository_structure':
+                    # Nested <repository_structure> format
+                    self.logger.info(
+                        'Found repository_structure element, converting to text format'
+                    )
+                    lines = []
+                    self._convert_repository_structure(elem, lines)
+                    if lines:
+                        return '\n'.join(lines)
 
             self.logger.warning('Directory structure element not found in XML')
             return None
@@ -160,17 +257,129 @@ class RepomixManager:
                 # Recursively process directory contents with increased indent
                 self._convert_repository_structure(child, lines, indent + 2)
 
+    def create_config(self, output_file: Path) -> RepomixConfig:
+        """Create the repomix configuration.
+
+        Args:
+            output_file: Path of the repomix XML output file
+
+        Returns:
+            Repomix configuration with the standard ignore patterns
+        """
+        config = RepomixConfig()
+        config.output.file_path = str(output_file)
+        config.output.style = 'xml'
+        config.ignore.custom_patterns = IGNORE_PATTERNS
+        config.ignore.use_gitignore = False
+        return config
+
+    def scan_repository(
+        self, project_path: Path, output_dir: Path
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """Find the files repomix would pack and compute their statistics without packing them.
+
+        The number of characters of each file is cached in a manifest in the output directory,
+        keyed by the path, modification time and size of the file, so only new and changed
+        files are read when the repository is scanned again. Since no contents are packed,
+        files that the repomix security check would leave out of a pack are still listed.
+        Tokens are not counted, since that requires tokenizing every file, so the statistics
+        have no total_tokens.
+
+        Args:
+            project_path: Path to the project to scan
+            output_dir: Directory of the manifest
+
+        Returns:
+            Tuple of the paths of the text files relative to the project, in repomix order,
+            and the statistics repomix would report for them
+        """
+        config = self.create_config(output_dir / 'repomix_output.xml')
+        file_paths = [
+            file_path.replace(os.sep, '/')
+            for file_path in search_files(str(project_path), config).file_paths
+        ]
+
+        manifest_path = output_dir / MANIFEST_FILE
+        cached = self._load_manifest(manifest_path)
+
+        entries: Dict[str, List[Any]] = {}
+        changed: List[Tuple[str, os.stat_result]] = []
+        for file_path in file_paths:
+            try:
+                stat = os.stat(project_path / file_path)
+            except OSError:
+                continue
+            entry = cached.get(file_path)
+            if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                entries[file_path] = entry
+            else:
+                changed.append((file_path, stat))
+
+        if changed:
+            self.logger.info(f'Reading {len(changed)} new or changed files')
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                counts = executor.map(
+                    count_characters, (project_path / file_path for file_path, _ in changed)
+                )
+                for (file_path, stat), chars in zip(changed, counts):
+                    entries[file_path] = [stat.st_mtime_ns, stat.st_size, chars]
+        if changed or len(entries) != len(cached):
+            self._save_manifest(manifest_path, entries)
+
+        text_files = [
+            file_path
+            for file_path in file_paths
+            if file_path in entries and entries[file_path][2] is not None
+        ]
+        statistics = {
+            'total_files': len(text_files),
+            'total_chars': sum(entries[file_path][2] for file_path in text_files),
+            'generated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        return text_files, statistics
+
+    def _load_manifest(self, manifest_path: Path) -> Dict[str, List[Any]]:
+        """Load the manifest of a previous scan, empty if there is none or it is invalid."""
+        if not manifest_path.exists():
+            return {}
+        try:
+            with open(manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION:
+                return manifest['files']
+        except Exception as e:
+            self.logger.warning(f'Error loading manifest from {manifest_path}: {e}')
+        return {}
+
+    def _save_manifest(self, manifest_path: Path, entries: Dict[str, List[Any]]):
+        """Write the manifest of a scan."""
+        try:
+            temporary_path = f'{manifest_path}.{os.getpid()}.tmp'
+            with open(temporary_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': MANIFEST_VERSION, 'files': entries}, f)
+            os.replace(temporary_path, manifest_path)
+        except Exception as e:
+            self.logger.warning(f'Error saving manifest to {manifest_path}: {e}')
+
     async def prepare_repository(
-        self, project_root: str | Path, output_path: str | Path, ctx: Optional[Context] = None
+        self,
+        project_root: str | Path,
+        output_path: str | Path,
+        ctx: Optional[Context] = None,
+        structure_only: bool = True,
     ) -> Dict[str, Any]:
         """Prepare repository for documentation by extracting directory structure.
 
-        Streamlined implementation that focuses only on directory structure extraction.
+        By default, the repository is only scanned for its directory structure and statistics,
+        reusing the manifest of previous scans, without packing file contents, so the summary
+        statistics have no token count. A full repomix pack writing repomix_output.xml, whose
+        statistics count tokens, is only run when structure_only is False.
 
         Args:
             project_root: Path to the project to prepare
             output_path: Path where output files should be saved
             ctx: Optional MCP context for progress reporting
+            structure_only: Whether to skip packing file contents into repomix_output.xml
 
         Returns:
             Dict containing directory structure and basic metadata
@@ -204,6 +413,9 @@ class RepomixManager:
             except (OSError, IOError) as e:
                 raise ValueError(f'Output directory is not writable: {output_dir}\nError: {e}')
 
+            if structure_only:
+                return await self._prepare_structure(project_path, output_dir, ctx)
+
             # Run repomix to prepare repository
             self.logger.info(f'Preparing repository: {project_path}')
             if ctx:
@@ -212,53 +424,9 @@ class RepomixManager:
             # Save repomix output to a file in the output directory
             repomix_output_file = output_dir / 'repomix_output.xml'
 
-            # Define standard ignore patterns - using regex patterns as needed
-            # Explicitly exclude specific hidden files/directories rather than all with dot prefix
-            ignore_patterns = [
-                # Standard file formats to ignore
-                '**/*.svg',
-                '**/*.drawio',
-                '**/*.min.js',
-                '**/*.min.css',
-                '**/*.pyc',
-                '**/*.d.ts',
-                '**/*.js.map',
-                '**/*.tsbuildinfo',
-                # Test and build directories
-                '**/test/**',
-                '**/__snapshots__/**',
-                '**/*.test.ts',
-                '**/dist/**',
-                '**/coverage/**',
-                '**/build/**',
-                '**/generated-docs/**',
-                # Node.js specific
-                '**/node_modules/**',
-                '**/.nx/**',
-                # Python specific
-                '**/__pycache__/**',
-                '**/venv/**',
-                '**/.venv/**',
-                '**/__init__.py',
-                '**/.ruff_cache/**',
-                # AWS CDK specific
-                '**/cdk.out/**',
-                '**/**/cdk.out/**',
-                'packages/cdk_infra/cdk.out',
-                'packages/cdk_infra/cdk.out/**',
-                # CI/CD and development tools
-                '**/.projen/**',
-                '**/.husky/**',
-                # Note: Deliberately NOT excluding dot files/directories like .github, .devcontainer, .python-version
-            ]
-
             try:
                 # Configure repomix
-                config = RepomixConfig()
-                config.output.file_path = str(repomix_output_file)
-                config.output.style = 'xml'
-                config.ignore.custom_patterns = ignore_patterns
-                config.ignore.use_gitignore = False
+                config = self.create_config(repomix_output_file)
 
                 if ctx:
                     await ctx.info('Using repomix to generate directory structure...')
@@ -331,3 +499,50 @@ class RepomixManager:
             if ctx:
                 await ctx.error(error_msg)
             raise RuntimeError(error_msg)
+
+    async def _prepare_structure(
+        self, project_path: Path, output_dir: Path, ctx: Optional[Context] = None
+    ) -> Dict[str, Any]:
+        """Extract the directory structure and statistics of a repository without packing it.
+
+        Args:
+            project_path: Path to the project to prepare
+            output_dir: Directory of the manifest of previous scans
+            ctx: Optional MCP context for progress reporting
+
+        Returns:
+            Dict containing directory structure and basic metadata
+
+        Raises:
+            RuntimeError: If the repository cannot be scanned
+        """
+        self.logger.info(f'Scanning repository structure: {project_path}')
+        if ctx:
+            await ctx.info(f'Scanning directory structure of {project_path}')
+
+        try:
+            file_paths, statistics = await asyncio.to_thread(
+                self.scan_repository, project_path, output_dir
+            )
+        except Exception as e:
+            error_msg = f'Error scanning repository: {e}'
+            self.logger.error(error_msg)
+            if ctx:
+                await ctx.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        directory_structure = build_directory_structure(file_paths)
+        if ctx:
+            await ctx.info('Successfully extracted directory structure')
+
+        return {
+            'output_dir': str(output_dir),
+            'project_info': {
+                'path': str(project_path),
+                'name': project_path.name,
+            },
+            'metadata': {
+                'summary': statistics,
+            },
+            'directory_structure': directory_structure,
+        }
@@ -124,7 +124,9 @@ async def test_prepare_repository(mock_unlink, mock_touch, mock_is_dir, mock_exi
                 output_path = '/path/to/output'
                 ctx = AsyncMock()
 
-                result = await manager.prepare_repository(project_root, output_path, ctx)
+                result = await manager.prepare_repository(
+                    project_root, output_path, ctx, structure_only=False
+                )
 
                 # Assert
                 assert MockProcessor.called
@@ -148,7 +150,9 @@ async def test_prepare_repository_module_error(mock_processor):
 
     # Act & Assert
     with pytest.raises(RuntimeError):
-        await manager.prepare_repository('/path/to/project', '/path/to/output')
+        await manager.prepare_repository(
+            '/path/to/project', '/path/to/output', structure_only=False
+        )
 
 
 @pytest.mark.asyncio
@@ -222,7 +222,9 @@ async def test_prepare_repository_with_ctx_info(
         output_path = '/path/to/output'
         ctx = AsyncMock()
 
-        result = await manager.prepare_repository(project_root, output_path, ctx)
+        result = await manager.prepare_repository(
+            project_root, output_path, ctx, structure_only=False
+        )
 
         # Assert
         ctx.info.assert_called()  # Verify context info was called
@@ -0,0 +1,117 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+"""Tests for the structure-only preparation of repositories by RepomixManager."""
+
+import os
+import pytest
+from awslabs.code_doc_gen_mcp_server.utils import repomix_manager
+from awslabs.code_doc_gen_mcp_server.utils.repomix_manager import (
+    MANIFEST_FILE,
+    RepomixManager,
+    build_directory_structure,
+)
+from unittest.mock import patch
+
+
+def create_project(root):
+    """Create a small project with a binary file and an ignored directory."""
+    (root / 'src' / 'pkg').mkdir(parents=True)
+    (root / 'node_modules' / 'lib').mkdir(parents=True)
+    (root / 'src' / 'pkg' / 'app.py').write_text('print("hello")\n')
+    (root / 'src' / 'notes.txt').write_text('  notes  \n')
+    (root / 'README.md').write_text('# Project\n')
+    (root / 'src' / 'logo.dat').write_bytes(b'\x00\x01\x02')
+    (root / 'node_modules' / 'lib' / 'index.js').write_text('module.exports = 1;\n')
+
+
+def test_build_directory_structure():
+    """Test building the text directory structure from file paths."""
+    structure = build_directory_structure(['src/b.txt', 'src/pkg/a.py', 'README.md'])
+    assert structure == 'src/\n  b.txt\n  pkg/\n    a.py\nREADME.md'
+
+
+@pytest.mark.asyncio
+async def test_prepare_repository_structure_only(tmp_path):
+    """Test preparing a repository without packing file contents."""
+    project = tmp_path / 'project'
+    create_project(project)
+    output = project / 'generated-docs'
+    manager = RepomixManager()
+
+    with patch.object(repomix_manager, 'RepoProcessor') as MockProcessor:
+        result = await manager.prepare_repository(project, output)
+
+    assert not MockProcessor.called
+    assert not (output / 'repomix_output.xml').exists()
+    assert (output / MANIFEST_FILE).exists()
+    assert result['project_info']['name'] == 'project'
+
+    lines = result['directory_structure'].splitlines()
+    assert 'README.md' in lines
+    assert '    app.py' in lines
+    assert '  notes.txt' in lines
+    assert '  logo.dat' not in lines
+    assert 'node_modules/' not in lines
+
+    summary = result['metadata']['summary']
+    assert summary['total_files'] == 3
+    assert summary['total_chars'] == len('print("hello")') + len('notes') + len('# Project')
+    assert 'total_tokens' not in summary
+
+
+def test_scan_repository_reads_only_changed_files(tmp_path):
+    """Test rescanning a repository only reads new and changed files."""
+    project = tmp_path / 'project'
+    create_project(project)
+    output = tmp_path / 'output'
+    output.mkdir()
+    manager = RepomixManager()
+
+    manager.scan_repository(project, output)
+
+    (project / 'README.md').write_text('# Project with a longer title\n')
+    (project / 'src' / 'new.py').write_text('x = 1\n')
+    os.remove(project / 'src' / 'notes.txt')
+
+    with patch.object(
+        repomix_manager, 'count_characters', wraps=repomix_manager.count_characters
+    ) as mock_count:
+        file_paths, statistics = manager.scan_repository(project, output)
+
+    read = sorted(call.args[0].name for call in mock_count.call_args_list)
+    assert read == ['README.md', 'new.py']
+    assert sorted(file_paths) == ['README.md', 'src/new.py', 'src/pkg/app.py']
+    assert statistics['total_chars'] == (
+        len('# Project with a longer title') + len('x = 1') + len('print("hello")')
+    )
+
+    # An unchanged repository is not read at all
+    with patch.object(repomix_manager, 'count_characters') as mock_count:
+        assert manager.scan_repository(project, output)[0] == file_paths
+    assert not mock_count.called
+
+
+def test_extract_from_large_output_streams_contents(tmp_path):
+    """Test extracting the structure and statistics of an output with packed contents."""
+    xml_path = tmp_path / 'repomix_output.xml'
+    content = 'x' * 100_000
+    with open(xml_path, 'w') as f:
+        f.write('<repository><repository_structure><file name="a.py"/></repository_structure>')
+        f.write('<repository_files>')
+        for i in range(20):
+            f.write(f'<file><path>a{i}.py</path><content>{content}</content></file>')
+        f.write('</repository_files><statistics><total_files>20</total_files></statistics>')
+        f.write('</repository>')
+
+    manager = RepomixManager()
+
+    assert manager.extract_directory_structure(str(xml_path)) == 'a.py'
+    assert manager.extract_statistics(str(xml_path)) == {'total_files': 20}
@@ -15,10 +15,17 @@ This module provides functionality for analyzing CDK projects to identify AWS se
 and their configurations.
 """
 
+import asyncio
 import logging
 import re
+from awslabs.cost_analysis_mcp_server.project_scanner import (
+    AnalysisCache,
+    analysis_cache,
+    analyze_files,
+    find_source_files,
+)
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 
 # Set up logging
@@ -29,13 +36,32 @@ logger = logging.getLogger(__name__)
 class CDKAnalyzer:
     """Analyzes CDK projects to identify AWS services and configurations."""
 
-    def __init__(self, project_path: str):
+    def __init__(self, project_path: str, cache: Optional[AnalysisCache] = None):
         """Initialize the CDK analyzer.
 
         Args:
             project_path: Path to the CDK project root
+            cache: Cache of per-file results, shared between analyzers by default
         """
         self.project_path = Path(project_path)
+        self.cache = cache if cache is not None else analysis_cache
+
+    def _analyze_file_cached(self, file_path: Path) -> List[Dict[str, Any]]:
+        """Analyze a file, reusing the previous result if the file has not changed.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            List of identified AWS services and their configurations
+        """
+        try:
+            return self.cache.get_or_compute(
+                'cdk', file_path, lambda: self._analyze_file(file_path)
+            )
+        except Exception as e:
+            logger.error(f'Error analyzing {file_path}: {e}')
+            return []
 
     def _analyze_file(self, file_path: Path) -> List[Dict[str, Any]]:
         """Analyze a file for AWS service usage.
@@ -148,22 +174,21 @@ class CDKAnalyzer:
 
         all_services = []
 
-        # Get all Python and TypeScript files in the project
-        source_files = list(self.project_path.rglob('*.py')) + list(
-            self.project_path.rglob('*.ts')
-        )
-        logger.info(f'Found source files: {source_files}')
-
-        for file_path in source_files:
-            if file_path.name != '__init__.py':
-                logger.info(f'Analyzing file: {file_path}')
-                try:
-                    file_services = self._analyze_file(file_path)
-                    if file_services:
-                        logger.info(f'Found services in {file_path}: {file_services}')
-                        all_services.extend(file_services)
-                except Exception as e:
-                    logger.error(f'Error analyzing {file_path}: {e}')
+        # Get all Python and TypeScript files in the project, skipping dependencies and
+        # synthesized output
+        source_files = [
+            file_path
+            for file_path in find_source_files(self.project_path, ['.py', '.ts'])
+            if file_path.name != '__init__.py'
+        ]
+        logger.info(f'Found {len(source_files)} source files')
+
+        # Parse files in parallel off the event loop; unchanged files come from the cache
+        results = await asyncio.to_thread(analyze_files, source_files, self._analyze_file_cached)
+        for file_path, file_services in zip(source_files, results):
+            if file_services:
+                logger.info(f'Found services in {file_path}: {file_services}')
+                all_services.extend(file_services)
 
         # Deduplicate services by name
         seen_services = set()
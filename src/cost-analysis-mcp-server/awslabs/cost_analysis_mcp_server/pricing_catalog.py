@@ -0,0 +1,534 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Local AWS price catalog.
+
+This module ingests AWS Price List bulk offer files (JSON or CSV) into an indexed SQLite
+database so that pricing queries by service, region and product attributes can be answered
+offline, without calling the AWS Price List Query API.
+"""
+
+import csv
+import io
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from contextlib import closing
+from httpx import AsyncClient
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'awslabs', 'cost-analysis-mcp-server', 'pricing_catalog.db'
+)
+DEFAULT_MAX_AGE_HOURS = 24.0
+
+# Public bulk offer files for a single service and region
+OFFER_FILE_URL = 'https://pricing.us-east-1.amazonaws.com/offers/v1.0/aws/{service_code}/current/{region}/index.{file_format}'
+
+# Columns of a CSV offer file that describe the price dimension rather than the product
+CSV_TERM_COLUMNS = {
+    'SKU',
+    'OfferTermCode',
+    'RateCode',
+    'TermType',
+    'PriceDescription',
+    'EffectiveDate',
+    'StartingRange',
+    'EndingRange',
+    'Unit',
+    'PricePerUnit',
+    'Currency',
+    'RelatedTo',
+}
+CSV_TERM_ATTRIBUTE_COLUMNS = ('LeaseContractLength', 'PurchaseOption', 'OfferingClass')
+
+# Product level fields that are not stored in the product attributes
+PRODUCT_FIELDS = {'sku': 'sku', 'productfamily': 'product_family'}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS offers (
+    service_code TEXT NOT NULL,
+    region TEXT NOT NULL,
+    version TEXT,
+    publication_date TEXT,
+    ingested_at REAL NOT NULL,
+    PRIMARY KEY (service_code, region)
+);
+CREATE TABLE IF NOT EXISTS products (
+    service_code TEXT NOT NULL,
+    region TEXT NOT NULL,
+    sku TEXT NOT NULL,
+    product_family TEXT,
+    price_item TEXT NOT NULL,
+    PRIMARY KEY (service_code, region, sku)
+);
+CREATE TABLE IF NOT EXISTS attributes (
+    service_code TEXT NOT NULL,
+    region TEXT NOT NULL,
+    sku TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_attributes_lookup
+    ON attributes (service_code, region, name, value COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_attributes_sku
+    ON attributes (service_code, region, sku);
+"""
+
+
+def _to_camel_case(column: str) -> str:
+    """Convert a CSV offer file column header into a Price List attribute name.
+
+    Args:
+        column: Column header such as 'Instance Type' or 'serviceCode'
+
+    Returns:
+        Attribute name such as 'instanceType'
+    """
+    words = [word for word in re.split(r'[^0-9A-Za-z]+', column) if word]
+    if not words:
+        return column
+    if len(words) == 1:
+        return words[0][0].lower() + words[0][1:]
+    return words[0].lower() + ''.join(word[0].upper() + word[1:] for word in words[1:])
+
+
+def _region_of(product: Dict[str, Any]) -> str:
+    """Get the region code of a product from a non-regional offer file."""
+    return product.get('attributes', {}).get('regionCode') or 'global'
+
+
+def parse_json_offer(data: Dict[str, Any]) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+    """Parse a JSON bulk offer file into Price List API style price items.
+
+    Args:
+        data: Decoded JSON offer file
+
+    Returns:
+        Tuple of the offer metadata and an iterator over price items
+    """
+    metadata = {
+        'service_code': data.get('offerCode'),
+        'version': data.get('version'),
+        'publication_date': data.get('publicationDate'),
+    }
+    terms = data.get('terms', {})
+
+    def items() -> Iterator[Dict[str, Any]]:
+        for sku, product in data.get('products', {}).items():
+            item_terms = {term_type: skus[sku] for term_type, skus in terms.items() if sku in skus}
+            yield {
+                'product': product,
+                'serviceCode': metadata['service_code'],
+                'terms': item_terms,
+                'version': metadata['version'],
+                'publicationDate': metadata['publication_date'],
+            }
+
+    return metadata, items()
+
+
+def parse_csv_offer(
+    lines: Iterable[str],
+) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+    """Parse a CSV bulk offer file into Price List API style price items.
+
+    CSV offer files contain one row per price dimension, preceded by a few metadata rows.
+    Rows are grouped by SKU to rebuild the same structure returned by the API.
+
+    Args:
+        lines: Lines of the CSV offer file
+
+    Returns:
+        Tuple of the offer metadata and an iterator over price items
+    """
+    reader = csv.reader(lines)
+    metadata: Dict[str, Any] = {'service_code': None, 'version': None, 'publication_date': None}
+
+    header: List[str] = []
+    for row in reader:
+        if row and row[0] == 'SKU':
+            header = row
+            break
+        if len(row) >= 2:
+            key = row[0].strip().lower()
+            if key == 'version':
+                metadata['version'] = row[1]
+            elif key == 'publication date':
+                metadata['publication_date'] = row[1]
+            elif key == 'offercode':
+                metadata['service_code'] = row[1]
+
+    attribute_columns = [
+        (index, _to_camel_case(column))
+        for index, column in enumerate(header)
+        if column not in CSV_TERM_COLUMNS
+        and column not in CSV_TERM_ATTRIBUTE_COLUMNS
+        and column != 'Product Family'
+    ]
+    position = {column: index for index, column in enumerate(header)}
+
+    def value(row: List[str], column: str) -> str:
+        index = position.get(column)
+        return row[index] if index is not None and index < len(row) else ''
+
+    products: Dict[str, Dict[str, Any]] = {}
+    for row in reader:
+        if not row:
+            continue
+        sku = value(row, 'SKU')
+        item = products.get(sku)
+        if item is None:
+            attributes = {
+                name: row[index]
+                for index, name in attribute_columns
+                if index < len(row) and row[index]
+            }
+            if not metadata['service_code']:
+                metadata['service_code'] = attributes.get('serviceCode')
+            item = {
+                'product': {
+                    'sku': sku,
+                    'productFamily': value(row, 'Product Family'),
+                    'attributes': attributes,
+                },
+                'serviceCode': attributes.get('serviceCode') or metadata['service_code'],
+                'terms': {},
+                'version': metadata['version'],
+                'publicationDate': metadata['publication_date'],
+            }
+            products[sku] = item
+
+        offer_term_code = value(row, 'OfferTermCode')
+        term_key = f'{sku}.{offer_term_code}'
+        term = (
+            item['terms']
+            .setdefault(value(row, 'TermType'), {})
+            .setdefault(
+                term_key,
+                {
+                    'offerTermCode': offer_term_code,
+                    'sku': sku,
+                    'effectiveDate': value(row, 'EffectiveDate'),
+                    'priceDimensions': {},
+                    'termAttributes': {
+                        column: value(row, column)
+                        for column in CSV_TERM_ATTRIBUTE_COLUMNS
+                        if value(row, column)
+                    },
+                },
+            )
+        )
+        rate_code = value(row, 'RateCode')
+        term['priceDimensions'][rate_code] = {
+            'rateCode': rate_code,
+            'description': value(row, 'PriceDescription'),
+            'beginRange': value(row, 'StartingRange'),
+            'endRange': value(row, 'EndingRange'),
+            'unit': value(row, 'Unit'),
+            'pricePerUnit': {value(row, 'Currency') or 'USD': value(row, 'PricePerUnit')},
+            'appliesTo': [],
+        }
+
+    return metadata, iter(products.values())
+
+
+async def fetch_offer_file(service_code: str, region: str, file_format: str = 'json') -> str:
+    """Download the current bulk offer file of a service for a single region.
+
+    Args:
+        service_code: The service code (e.g., 'AmazonS3')
+        region: AWS region code (e.g., 'us-west-2')
+        file_format: Either 'json' or 'csv'
+
+    Returns:
+        Text content of the offer file
+    """
+    url = OFFER_FILE_URL.format(service_code=service_code, region=region, file_format=file_format)
+    async with AsyncClient() as client:
+        response = await client.get(url, follow_redirects=True, timeout=300.0)
+        response.raise_for_status()
+        return response.text
+
+
+class PricingCatalog:
+    """SQLite backed catalog of AWS price items ingested from bulk offer files."""
+
+    def __init__(self, db_path: Optional[str] = None, max_age_hours: Optional[float] = None):
+        """Initialize the pricing catalog.
+
+        Args:
+            db_path: Path of the SQLite database file
+            max_age_hours: Age after which an ingested offer is considered stale
+        """
+        self.db_path = db_path or os.getenv('PRICING_CATALOG_PATH', DEFAULT_CATALOG_PATH)
+        self.max_age_hours = (
+            max_age_hours
+            if max_age_hours is not None
+            else float(os.getenv('PRICING_CATALOG_MAX_AGE_HOURS', DEFAULT_MAX_AGE_HOURS))
+        )
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the catalog, creating the schema on first use."""
+        if not self._initialized:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.db_path)
+        if not self._initialized:
+            connection.executescript(SCHEMA)
+            self._initialized = True
+        return connection
+
+    def get_offer(self, service_code: str, region: str) -> Optional[Dict[str, Any]]:
+        """Get metadata of the ingested offer for a service and region.
+
+        Args:
+            service_code: The service code (e.g., 'AmazonS3')
+            region: AWS region code (e.g., 'us-west-2')
+
+        Returns:
+            Offer metadata, or None if the offer has not been ingested
+        """
+        if not os.path.exists(self.db_path):
+            return None
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                'SELECT version, publication_date, ingested_at FROM offers '
+                'WHERE service_code = ? AND region = ?',
+                (service_code, region),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            'service_code': service_code,
+            'region': region,
+            'version': row[0],
+            'publication_date': row[1],
+            'ingested_at': row[2],
+        }
+
+    def is_fresh(self, service_code: str, region: str) -> bool:
+        """Check whether the catalog holds a non-stale offer for a service and region.
+
+        Args:
+            service_code: The service code (e.g., 'AmazonS3')
+            region: AWS region code (e.g., 'us-west-2')
+
+        Returns:
+            True if the offer was ingested within the configured maximum age
+        """
+        offer = self.get_offer(service_code, region)
+        if offer is None:
+            return False
+        return time.time() - offer['ingested_at'] <= self.max_age_hours * 3600
+
+    def ingest_price_items(
+        self,
+        items: Iterable[Dict[str, Any]],
+        service_code: str,
+        region: Optional[str] = None,
+        version: Optional[str] = None,
+        publication_date: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """Replace the catalog content for a service with the given price items.
+
+        Args:
+            items: Price items in the Price List API format
+            service_code: The service code the items belong to
+            region: Region of the offer file; product region codes take precedence
+            version: Version of the offer file
+            publication_date: Publication date of the offer file
+
+        Returns:
+            Number of ingested products per region
+        """
+        counts: Dict[str, int] = {}
+        ingested_at = time.time()
+        with closing(self._connect()) as connection, connection:
+            if region:
+                # A regional offer file replaces everything known about that region
+                self._delete_offer(connection, service_code, region)
+            for item in items:
+                product = item.get('product', {})
+                sku = product.get('sku')
+                if not sku:
+                    continue
+                item_region = region or _region_of(product)
+                if item_region not in counts:
+                    if not region:
+                        self._delete_offer(connection, service_code, item_region)
+                    counts[item_region] = 0
+                counts[item_region] += 1
+                connection.execute(
+                    'INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?, ?)',
+                    (
+                        service_code,
+                        item_region,
+                        sku,
+                        product.get('productFamily'),
+                        json.dumps(item),
+                    ),
+                )
+                connection.executemany(
+                    'INSERT INTO attributes VALUES (?, ?, ?, ?, ?)',
+                    [
+                        (service_code, item_region, sku, name, str(value))
+                        for name, value in product.get('attributes', {}).items()
+                    ],
+                )
+            for offer_region in counts or ([region] if region else []):
+                connection.execute(
+                    'INSERT OR REPLACE INTO offers VALUES (?, ?, ?, ?, ?)',
+                    (service_code, offer_region, version, publication_date, ingested_at),
+                )
+        logger.info(f'Ingested {sum(counts.values())} price items for {service_code}')
+        return counts
+
+    @staticmethod
+    def _delete_offer(connection: sqlite3.Connection, service_code: str, region: str) -> None:
+        """Delete every stored row of an offer."""
+        for table in ('offers', 'products', 'attributes'):
+            connection.execute(
+                f'DELETE FROM {table} WHERE service_code = ? AND region = ?',  # nosec B608
+                (service_code, region),
+            )
+
+    def ingest_offer_file(
+        self,
+        content: str,
+        file_format: str,
+        service_code: Optional[str] = None,
+        region: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """Ingest the content of a JSON or CSV bulk offer file.
+
+        Args:
+            content: Text content of the offer file
+            file_format: Either 'json' or 'csv'
+            service_code: Service code, required if the file does not state it
+            region: Region of a regional offer file
+
+        Returns:
+            Number of ingested products per region
+        """
+        file_format = file_format.lower()
+        if file_format == 'json':
+            metadata, items = parse_json_offer(json.loads(content))
+        elif file_format == 'csv':
+            metadata, items = parse_csv_offer(io.StringIO(content))
+        else:
+            raise ValueError(f'Unsupported offer file format: {file_format}')
+
+        service_code = service_code or metadata['service_code']
+        if not service_code:
+            raise ValueError('Service code could not be determined from the offer file')
+
+        return self.ingest_price_items(
+            items,
+            service_code,
+            region=region,
+            version=metadata['version'],
+            publication_date=metadata['publication_date'],
+        )
+
+    def ingest_offer_path(
+        self, path: str, service_code: Optional[str] = None, region: Optional[str] = None
+    ) -> Dict[str, int]:
+        """Ingest a JSON or CSV bulk offer file from the local filesystem.
+
+        Args:
+            path: Path of the offer file; the format is taken from the file extension
+            service_code: Service code, required if the file does not state it
+            region: Region of a regional offer file
+
+        Returns:
+            Number of ingested products per region
+        """
+        file_format = os.path.splitext(path)[1].lstrip('.')
+        with open(path, encoding='utf-8') as offer_file:
+            return self.ingest_offer_file(offer_file.read(), file_format, service_code, region)
+
+    def query(
+        self, service_code: str, region: str, filters: Optional[List[Dict[str, str]]] = None
+    ) -> List[str]:
+        """Query price items of a service and region matching the given filters.
+
+        Filters use the Price List API format ({'Field': str, 'Type': str, 'Value': str}).
+        TERM_MATCH and EQUALS match case-insensitively, CONTAINS matches a substring and
+        ANY_OF/NONE_OF take a comma separated list of values.
+
+        Args:
+            service_code: The service code (e.g., 'AmazonS3')
+            region: AWS region code (e.g., 'us-west-2')
+            filters: Optional list of Price List API filters
+
+        Returns:
+            Matching price items as JSON strings, like the PriceList returned by the API
+        """
+        sql = ['SELECT p.price_item FROM products p WHERE p.service_code = ? AND p.region = ?']
+        params: List[Any] = [service_code, region]
+
+        for api_filter in filters or []:
+            field = api_filter['Field']
+            if field == 'regionCode':
+                continue
+            filter_type = api_filter.get('Type', 'TERM_MATCH').upper()
+            column = PRODUCT_FIELDS.get(field.lower())
+            if column:
+                condition, values = self._filter_condition(
+                    f'p.{column}', filter_type, api_filter['Value']
+                )
+                sql.append(f'AND {condition}')
+                params.extend(values)
+                continue
+
+            # A product without the attribute does not match, except for NONE_OF
+            negate = filter_type == 'NONE_OF'
+            condition, values = self._filter_condition(
+                'a.value', 'ANY_OF' if negate else filter_type, api_filter['Value']
+            )
+            sql.append(
+                f'AND {"NOT " if negate else ""}EXISTS (SELECT 1 FROM attributes a '
+                'WHERE a.service_code = p.service_code AND a.region = p.region '
+                f'AND a.sku = p.sku AND a.name = ? AND {condition})'
+            )
+            params.append(field)
+            params.extend(values)
+
+        sql.append('ORDER BY p.sku')
+        with closing(self._connect()) as connection:
+            rows = connection.execute(' '.join(sql), params).fetchall()  # nosec B608
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def _filter_condition(column: str, filter_type: str, value: str) -> Tuple[str, List[str]]:
+        """Build the SQL condition and parameters of a single filter on a column."""
+        if filter_type in ('TERM_MATCH', 'EQUALS'):
+            return f'{column} = ? COLLATE NOCASE', [value]
+        if filter_type == 'CONTAINS':
+            escaped = re.sub(r'([%_\\])', r'\\\1', value)
+            return f"{column} LIKE ? ESCAPE '\\'", [f'%{escaped}%']
+        if filter_type in ('ANY_OF', 'NONE_OF'):
+            values = [part.strip() for part in value.split(',')]
+            placeholders = ', '.join('?' for _ in values)
+            operator = 'NOT IN' if filter_type == 'NONE_OF' else 'IN'
+            return f'{column} COLLATE NOCASE {operator} ({placeholders})', values
+        raise ValueError(f'Unsupported filter type: {filter_type}')
@@ -0,0 +1,183 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Project scanning utilities shared by the CDK and Terraform analyzers.
+
+This module provides source file discovery with pruning of dependency and build output
+directories, parallel per-file analysis, and a cache of per-file analysis results keyed by
+file modification time and size so that repeated analyses only reparse changed files.
+"""
+
+import copy
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Directories holding dependencies or build output rather than project sources
+PRUNED_DIRECTORIES = frozenset({'node_modules', '.terraform', 'cdk.out', '.git'})
+
+DEFAULT_MAX_CACHE_ENTRIES = 50000
+
+FileStamp = Optional[Tuple[int, int]]
+
+
+def _stamp(path: str) -> FileStamp:
+    """Get the modification time and size of a path, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def find_source_files(root: Path, suffixes: Sequence[str]) -> List[Path]:
+    """Find source files under a directory, skipping dependency and build directories.
+
+    Args:
+        root: Directory to search
+        suffixes: File suffixes to collect (e.g., ['.tf', '.hcl'])
+
+    Returns:
+        Matching files, grouped in the order of the given suffixes
+    """
+    files_by_suffix: Dict[str, List[Path]] = {suffix: [] for suffix in suffixes}
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Pruning in place stops os.walk from descending into these directories
+        dirnames[:] = sorted(name for name in dirnames if name not in PRUNED_DIRECTORIES)
+        for filename in sorted(filenames):
+            suffix = os.path.splitext(filename)[1]
+            if suffix in files_by_suffix:
+                files_by_suffix[suffix].append(Path(dirpath) / filename)
+    return [path for suffix in suffixes for path in files_by_suffix[suffix]]
+
+
+class AnalysisCache:
+    """Cache of per-file analysis results keyed by file modification time and size.
+
+    An entry is reused only while the analyzed file, and every file or directory the
+    analysis read along the way (e.g., local Terraform modules), is unchanged.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_CACHE_ENTRIES):
+        """Initialize the analysis cache.
+
+        Args:
+            max_entries: Maximum number of cached file results
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Tuple[str, str], Tuple[Dict[str, FileStamp], Any]]' = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _dependency_stack(self) -> List[Dict[str, FileStamp]]:
+        """Get the dependencies being recorded by the computations of this thread."""
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def add_dependency(self, path: Path) -> None:
+        """Record that the analysis currently being computed depends on a path.
+
+        Args:
+            path: File or directory read by the analysis
+        """
+        stack = self._dependency_stack()
+        if stack:
+            key = os.path.abspath(path)
+            stack[-1][key] = _stamp(key)
+
+    def get_or_compute(self, namespace: str, path: Path, compute: Callable[[], Any]) -> Any:
+        """Get the cached analysis of a file, computing it if the file changed.
+
+        Args:
+            namespace: Name separating results of different analyzers
+            path: Path of the analyzed file
+            compute: Function producing the analysis result of the file
+
+        Returns:
+            A copy of the analysis result
+        """
+        key = (namespace, os.path.abspath(path))
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None and all(
+            _stamp(dependency) == stamp for dependency, stamp in entry[0].items()
+        ):
+            with self._lock:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            dependencies, result = entry
+        else:
+            with self._lock:
+                self.misses += 1
+            stack = self._dependency_stack()
+            stack.append({key[1]: _stamp(key[1])})
+            try:
+                result = compute()
+            finally:
+                dependencies = stack.pop()
+            with self._lock:
+                self._entries[key] = (dependencies, copy.deepcopy(result))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        # Nested analyses make the enclosing one depend on the same files
+        stack = self._dependency_stack()
+        if stack:
+            stack[-1].update(dependencies)
+        return copy.deepcopy(result)
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Cache shared by analyzer instances, which are created for every tool call
+analysis_cache = AnalysisCache()
+
+
+def analyze_files(
+    files: Sequence[Path],
+    analyze: Callable[[Path], List[Dict[str, Any]]],
+    max_workers: Optional[int] = None,
+) -> List[List[Dict[str, Any]]]:
+    """Analyze files in parallel.
+
+    Args:
+        files: Files to analyze
+        analyze: Function returning the services found in a single file
+        max_workers: Maximum number of worker threads
+
+    Returns:
+        The services found in each file, in the order of the given files
+    """
+    if len(files) <= 1:
+        return [analyze(path) for path in files]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(analyze, files))
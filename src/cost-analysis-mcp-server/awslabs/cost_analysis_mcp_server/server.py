@@ -14,10 +14,12 @@
 This server provides tools for analyzing AWS service costs across different user tiers.
 """
 
+import asyncio
 import boto3
 import logging
 import os
 from awslabs.cost_analysis_mcp_server.cdk_analyzer import analyze_cdk_project
+from awslabs.cost_analysis_mcp_server.pricing_catalog import PricingCatalog, fetch_offer_file
 from awslabs.cost_analysis_mcp_server.static.patterns import BEDROCK
 from awslabs.cost_analysis_mcp_server.terraform_analyzer import analyze_terraform_project
 from bs4 import BeautifulSoup
@@ -62,6 +64,9 @@ mcp = FastMCP(
 
     2. Fallback Mechanism 1:
        - If web scraping fails, MUST use get_pricing_from_api() to fetch data via AWS Pricing API
+       - get_pricing_from_api() answers from the local pricing catalog when it holds fresh data;
+         use update_pricing_catalog() to load the bulk offer file of a service and region
+         before asking many questions about it
 
     3. For Bedrock Services:
        - When analyzing Amazon Bedrock services, MUST also use get_bedrock_patterns()
@@ -103,6 +108,41 @@ mcp = FastMCP(
 profile_name = os.getenv('AWS_PROFILE', 'default')
 logger.info(f'Using AWS profile {profile_name}')
 
+pricing_client = None
+pricing_catalog = PricingCatalog()
+
+
+def get_pricing_client():
+    """Get the AWS Price List API client, creating it on first use."""
+    global pricing_client
+    if pricing_client is None:
+        pricing_client = boto3.Session(profile_name=profile_name).client(
+            'pricing', region_name='us-east-1'
+        )
+    return pricing_client
+
+
+def get_all_products(service_code: str, api_filters: List[Dict[str, str]]) -> List[str]:
+    """Get every price item matching the filters, following all result pages.
+
+    Args:
+        service_code: The service code (e.g., 'AmazonES' for OpenSearch, 'AmazonS3' for S3)
+        api_filters: Filters in the Price List API format
+
+    Returns:
+        List of price items as JSON strings
+    """
+    client = get_pricing_client()
+    request = {'ServiceCode': service_code, 'Filters': api_filters, 'MaxResults': 100}
+    price_list = []
+    while True:
+        response = client.get_products(**request)
+        price_list.extend(response.get('PriceList', []))
+        next_token = response.get('NextToken')
+        if not next_token:
+            return price_list
+        request['NextToken'] = next_token
+
 
 @mcp.tool(
     name='analyze_cdk_project',
@@ -251,6 +291,9 @@ async def get_pricing_from_web(service_code: str, ctx: Context) -> Optional[Dict
         }
     ]
     Details of the filter can be found at https://docs.aws.amazon.com/aws-cost-management/latest/APIReference/API_pricing_Filter.html
+
+    Results are served from the local pricing catalog when it holds a fresh copy of the
+    service offer for the region, otherwise every page of the AWS Price List API is fetched.
     """,
 )
 async def get_pricing_from_api(
@@ -268,25 +311,28 @@ async def get_pricing_from_api(
         Dictionary containing pricing information from AWS Pricing API
     """
     try:
-        pricing_client = boto3.Session(profile_name=profile_name).client(
-            'pricing', region_name='us-east-1'
-        )
-
         # Start with the region filter
         region_filter = PricingFilter(field='regionCode', type='TERM_MATCH', value=region)
-        api_filters = [region_filter.dict()]
+        pricing_filters = [region_filter]
 
         # Add any additional filters if provided
         if filters and filters.filters:
-            api_filters.extend([f.dict() for f in filters.filters])
+            pricing_filters.extend(filters.filters)
 
-        response = pricing_client.get_products(
-            ServiceCode=service_code,
-            Filters=api_filters,
-            MaxResults=100,
-        )
+        api_filters = [
+            {'Field': f.field, 'Type': f.type, 'Value': f.value} for f in pricing_filters
+        ]
 
-        if not response['PriceList']:
+        if pricing_catalog.is_fresh(service_code, region):
+            source = 'local pricing catalog'
+            price_list = await asyncio.to_thread(
+                pricing_catalog.query, service_code, region, api_filters
+            )
+        else:
+            source = 'AWS Pricing API'
+            price_list = await asyncio.to_thread(get_all_products, service_code, api_filters)
+
+        if not price_list:
             await ctx.error(f'Pricing API returned empty results for service code: {service_code}')
             return {
                 'status': 'error',
@@ -303,8 +349,8 @@ async def get_pricing_from_api(
         result = {
             'status': 'success',
             'service_name': service_code,
-            'data': response['PriceList'],
-            'message': f'Retrieved pricing for {service_code} in {region} from AWS Pricing API',
+            'data': price_list,
+            'message': f'Retrieved pricing for {service_code} in {region} from {source}',
         }
 
         # No need to store in context, just return the result
@@ -326,6 +372,63 @@ async def get_pricing_from_api(
         }
 
 
+@mcp.tool(
+    name='update_pricing_catalog',
+    description="""Load the AWS Price List bulk offer file of a service and region into the local pricing catalog.
+    Once loaded, get_pricing_from_api answers queries for that service and region offline until the
+    catalog entry becomes stale (24 hours by default, configurable with PRICING_CATALOG_MAX_AGE_HOURS).
+    Use the same service codes as get_pricing_from_api (e.g., "AmazonS3", "AWSLambda").
+    By default the current offer file is downloaded from the public AWS price list endpoint; a local
+    JSON or CSV offer file can be provided instead with offer_file_path.
+    """,
+)
+async def update_pricing_catalog(
+    service_code: str,
+    region: str,
+    ctx: Context,
+    offer_file_path: Optional[str] = None,
+) -> Dict:
+    """Load a bulk offer file into the local pricing catalog.
+
+    Args:
+        service_code: The service code (e.g., 'AmazonES' for OpenSearch, 'AmazonS3' for S3)
+        region: AWS region (e.g., 'us-west-2')
+        ctx: MCP context for logging and state management
+        offer_file_path: Optional path of a local JSON or CSV offer file to ingest
+
+    Returns:
+        Dictionary describing the ingested offer
+    """
+    try:
+        if offer_file_path:
+            counts = await asyncio.to_thread(
+                pricing_catalog.ingest_offer_path, offer_file_path, service_code, region
+            )
+        else:
+            content = await fetch_offer_file(service_code, region)
+            counts = await asyncio.to_thread(
+                pricing_catalog.ingest_offer_file, content, 'json', service_code, region
+            )
+
+        return {
+            'status': 'success',
+            'service_name': service_code,
+            'region': region,
+            'products': counts.get(region, 0),
+            'offer': pricing_catalog.get_offer(service_code, region),
+            'message': f'Loaded pricing for {service_code} in {region} into the local pricing catalog',
+        }
+    except Exception as e:
+        await ctx.error(f'Failed to update pricing catalog: {e}')
+        return {
+            'status': 'error',
+            'error_type': 'catalog_error',
+            'message': str(e),
+            'service_code': service_code,
+            'region': region,
+        }
+
+
 @mcp.tool(
     name='get_bedrock_patterns',
     description='Get architecture patterns for Amazon Bedrock applications, including component relationships and cost considerations',
@@ -15,8 +15,15 @@ This module provides functionality for analyzing Terraform projects to identify
 and their configurations.
 """
 
+import asyncio
 import logging
 import re
+from awslabs.cost_analysis_mcp_server.project_scanner import (
+    AnalysisCache,
+    analysis_cache,
+    analyze_files,
+    find_source_files,
+)
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -29,13 +36,34 @@ logger = logging.getLogger(__name__)
 class TerraformAnalyzer:
     """Analyzes Terraform projects to identify AWS services and configurations."""
 
-    def __init__(self, project_path: str):
+    def __init__(self, project_path: str, cache: Optional[AnalysisCache] = None):
         """Initialize the Terraform analyzer.
 
         Args:
             project_path: Path to the Terraform project root
+            cache: Cache of per-file results, shared between analyzers by default
         """
         self.project_path = Path(project_path)
+        self.cache = cache if cache is not None else analysis_cache
+
+    def _analyze_file_cached(self, file_path: Path) -> List[Dict[str, Any]]:
+        """Analyze a file, reusing the previous result if the file has not changed.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            List of identified AWS services and their configurations
+        """
+        # Local module sources are resolved against the project root
+        namespace = f'terraform:{self.project_path}'
+        try:
+            return self.cache.get_or_compute(
+                namespace, file_path, lambda: self._analyze_file(file_path)
+            )
+        except Exception as e:
+            logger.error(f'Error analyzing {file_path}: {e}')
+            return []
 
     def _find_aws_services_from_module(
         self, source: str, variables: Dict[str, Any]
@@ -141,14 +169,18 @@ class TerraformAnalyzer:
                     logger.info(f'Found local module directory: {module_path}')
 
                     # Analyze the local module directory
-                    local_analyzer = TerraformAnalyzer(str(module_path))
+                    local_analyzer = TerraformAnalyzer(str(module_path), cache=self.cache)
                     local_services = []
 
-                    # Get all Terraform files in the module directory
-                    local_files = list(module_path.glob('*.tf')) + list(module_path.glob('*.hcl'))
+                    # Get all Terraform files in the module directory; files added to or
+                    # removed from the module invalidate cached results of its callers
+                    self.cache.add_dependency(module_path)
+                    local_files = sorted(module_path.glob('*.tf')) + sorted(
+                        module_path.glob('*.hcl')
+                    )
                     for local_file in local_files:
                         try:
-                            file_services = local_analyzer._analyze_file(local_file)
+                            file_services = local_analyzer._analyze_file_cached(local_file)
                             if file_services:
                                 local_services.extend(file_services)
                         except Exception as e:
@@ -371,21 +403,16 @@ class TerraformAnalyzer:
 
         all_services = []
 
-        # Get all Terraform files in the project
-        source_files = list(self.project_path.rglob('*.tf')) + list(
-            self.project_path.rglob('*.hcl')
-        )
-        logger.info(f'Found source files: {source_files}')
+        # Get all Terraform files in the project, skipping provider caches and dependencies
+        source_files = find_source_files(self.project_path, ['.tf', '.hcl'])
+        logger.info(f'Found {len(source_files)} source files')
 
-        for file_path in source_files:
-            logger.info(f'Analyzing file: {file_path}')
-            try:
-                file_services = self._analyze_file(file_path)
-                if file_services:
-                    logger.info(f'Found services in {file_path}: {file_services}')
-                    all_services.extend(file_services)
-            except Exception as e:
-                logger.error(f'Error analyzing {file_path}: {e}')
+        # Parse files in parallel off the event loop; unchanged files come from the cache
+        results = await asyncio.to_thread(analyze_files, source_files, self._analyze_file_cached)
+        for file_path, file_services in zip(source_files, results):
+            if file_services:
+                logger.info(f'Found services in {file_path}: {file_services}')
+                all_services.extend(file_services)
 
         # Debug logging for all services
         logger.info(f'All services before deduplication: {all_services}')
@@ -18,6 +18,21 @@ from typing import Any, Dict, Generator
 from unittest.mock import AsyncMock, MagicMock
 
 
+@pytest.fixture(autouse=True)
+def isolated_pricing_state(tmp_path, monkeypatch):
+    """Use a temporary pricing catalog, a fresh pricing client and an empty analysis cache."""
+    from awslabs.cost_analysis_mcp_server import server
+    from awslabs.cost_analysis_mcp_server.pricing_catalog import PricingCatalog
+    from awslabs.cost_analysis_mcp_server.project_scanner import analysis_cache
+
+    analysis_cache.clear()
+
+    monkeypatch.setattr(server, 'pricing_client', None)
+    monkeypatch.setattr(
+        server, 'pricing_catalog', PricingCatalog(str(tmp_path / 'pricing_catalog.db'))
+    )
+
+
 @pytest.fixture
 def mock_context():
     """Create a mock MCP context."""
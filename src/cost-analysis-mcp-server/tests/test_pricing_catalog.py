@@ -0,0 +1,229 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for the pricing catalog module of the cost-analysis-mcp-server."""
+
+import json
+import pytest
+import time
+from awslabs.cost_analysis_mcp_server.pricing_catalog import PricingCatalog, parse_csv_offer
+
+
+JSON_OFFER = {
+    'formatVersion': 'v1.0',
+    'offerCode': 'AWSLambda',
+    'version': '20250101000000',
+    'publicationDate': '2025-01-01T00:00:00Z',
+    'products': {
+        'SKU1': {
+            'sku': 'SKU1',
+            'productFamily': 'Serverless',
+            'attributes': {
+                'regionCode': 'us-west-2',
+                'group': 'AWS-Lambda-Requests',
+                'usagetype': 'USW2-Request',
+            },
+        },
+        'SKU2': {
+            'sku': 'SKU2',
+            'productFamily': 'Serverless',
+            'attributes': {
+                'regionCode': 'us-west-2',
+                'group': 'AWS-Lambda-Duration',
+                'usagetype': 'USW2-Lambda-GB-Second',
+            },
+        },
+        'SKU3': {
+            'sku': 'SKU3',
+            'productFamily': 'Data Transfer',
+            'attributes': {'regionCode': 'us-west-2', 'transferType': 'InterRegion Outbound'},
+        },
+    },
+    'terms': {
+        'OnDemand': {
+            'SKU1': {
+                'SKU1.JRTCKXETXF': {
+                    'offerTermCode': 'JRTCKXETXF',
+                    'sku': 'SKU1',
+                    'priceDimensions': {
+                        'SKU1.JRTCKXETXF.6YS6EN2CT7': {
+                            'unit': 'Requests',
+                            'pricePerUnit': {'USD': '0.0000002000'},
+                        }
+                    },
+                }
+            }
+        }
+    },
+}
+
+CSV_OFFER = """"FormatVersion","v1.0"
+"Disclaimer","This pricing list is for informational purposes only."
+"Publication Date","2025-01-01T00:00:00Z"
+"Version","20250101000000"
+"OfferCode","AmazonS3"
+"SKU","OfferTermCode","RateCode","TermType","PriceDescription","EffectiveDate","StartingRange","EndingRange","Unit","PricePerUnit","Currency","Product Family","serviceCode","Location","Region Code","Storage Class","Volume Type"
+"S1","JRTCKXETXF","S1.JRTCKXETXF.1","OnDemand","First 50 TB","2025-01-01","0","51200","GB-Mo","0.023","USD","Storage","AmazonS3","US West (Oregon)","us-west-2","General Purpose","Standard"
+"S1","JRTCKXETXF","S1.JRTCKXETXF.2","OnDemand","Over 50 TB","2025-01-01","51200","Inf","GB-Mo","0.022","USD","Storage","AmazonS3","US West (Oregon)","us-west-2","General Purpose","Standard"
+"S2","JRTCKXETXF","S2.JRTCKXETXF.1","OnDemand","Glacier","2025-01-01","0","Inf","GB-Mo","0.004","USD","Storage","AmazonS3","US West (Oregon)","us-west-2","Archive","Amazon Glacier"
+"""
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    """Create an empty pricing catalog in a temporary directory."""
+    return PricingCatalog(str(tmp_path / 'catalog.db'))
+
+
+class TestPricingCatalogIngestion:
+    """Tests for ingesting offer files into the pricing catalog."""
+
+    def test_ingest_json_offer(self, catalog):
+        """Test ingesting a JSON offer file."""
+        counts = catalog.ingest_offer_file(json.dumps(JSON_OFFER), 'json', region='us-west-2')
+
+        assert counts == {'us-west-2': 3}
+        offer = catalog.get_offer('AWSLambda', 'us-west-2')
+        assert offer['version'] == '20250101000000'
+        assert catalog.is_fresh('AWSLambda', 'us-west-2')
+        assert not catalog.is_fresh('AWSLambda', 'us-east-1')
+
+        items = [json.loads(item) for item in catalog.query('AWSLambda', 'us-west-2')]
+        assert [item['product']['sku'] for item in items] == ['SKU1', 'SKU2', 'SKU3']
+        assert items[0]['serviceCode'] == 'AWSLambda'
+        assert 'SKU1.JRTCKXETXF' in items[0]['terms']['OnDemand']
+        assert items[1]['terms'] == {}
+
+    def test_ingest_csv_offer(self, catalog, tmp_path):
+        """Test ingesting a CSV offer file from disk."""
+        offer_path = tmp_path / 'index.csv'
+        offer_path.write_text(CSV_OFFER)
+
+        counts = catalog.ingest_offer_path(str(offer_path))
+
+        assert counts == {'us-west-2': 2}
+        items = [json.loads(item) for item in catalog.query('AmazonS3', 'us-west-2')]
+        assert len(items) == 2
+        dimensions = items[0]['terms']['OnDemand']['S1.JRTCKXETXF']['priceDimensions']
+        assert dimensions['S1.JRTCKXETXF.2']['pricePerUnit'] == {'USD': '0.022'}
+        assert items[0]['product']['attributes']['storageClass'] == 'General Purpose'
+        assert items[0]['product']['productFamily'] == 'Storage'
+
+    def test_reingest_replaces_offer(self, catalog):
+        """Test that ingesting an offer again replaces previously stored products."""
+        catalog.ingest_offer_file(json.dumps(JSON_OFFER), 'json', region='us-west-2')
+        smaller = dict(JSON_OFFER, products={'SKU1': JSON_OFFER['products']['SKU1']})
+        catalog.ingest_offer_file(json.dumps(smaller), 'json', region='us-west-2')
+
+        assert len(catalog.query('AWSLambda', 'us-west-2')) == 1
+        assert (
+            len(
+                catalog.query(
+                    'AWSLambda',
+                    'us-west-2',
+                    [{'Field': 'group', 'Type': 'TERM_MATCH', 'Value': 'AWS-Lambda-Duration'}],
+                )
+            )
+            == 0
+        )
+
+    def test_ingest_without_region_uses_product_regions(self, catalog):
+        """Test that a non-regional offer file is split by product region code."""
+        offer = json.loads(json.dumps(JSON_OFFER))
+        offer['products']['SKU3']['attributes']['regionCode'] = 'eu-west-1'
+
+        counts = catalog.ingest_offer_file(json.dumps(offer), 'json')
+
+        assert counts == {'us-west-2': 2, 'eu-west-1': 1}
+        assert catalog.is_fresh('AWSLambda', 'eu-west-1')
+
+    def test_ingest_invalid_format(self, catalog):
+        """Test that unsupported formats are rejected."""
+        with pytest.raises(ValueError):
+            catalog.ingest_offer_file('', 'xml', 'AWSLambda', 'us-west-2')
+
+    def test_stale_offer(self, catalog):
+        """Test that offers older than the maximum age are stale."""
+        catalog.max_age_hours = 1
+        catalog.ingest_offer_file(json.dumps(JSON_OFFER), 'json', region='us-west-2')
+        assert catalog.is_fresh('AWSLambda', 'us-west-2')
+
+        catalog.max_age_hours = 0
+        time.sleep(0.01)
+        assert not catalog.is_fresh('AWSLambda', 'us-west-2')
+
+    def test_missing_database(self, catalog):
+        """Test that an absent database holds no offers."""
+        assert catalog.get_offer('AWSLambda', 'us-west-2') is None
+
+
+class TestPricingCatalogQuery:
+    """Tests for querying the pricing catalog with Price List API filters."""
+
+    @pytest.fixture(autouse=True)
+    def ingest(self, catalog):
+        """Load the sample offer into the catalog."""
+        catalog.ingest_offer_file(json.dumps(JSON_OFFER), 'json', region='us-west-2')
+
+    def _skus(self, catalog, filters):
+        return [
+            json.loads(item)['product']['sku']
+            for item in catalog.query('AWSLambda', 'us-west-2', filters)
+        ]
+
+    def test_term_match_is_case_insensitive(self, catalog):
+        """Test TERM_MATCH filters on attributes."""
+        filters = [
+            {'Field': 'regionCode', 'Type': 'TERM_MATCH', 'Value': 'us-west-2'},
+            {'Field': 'group', 'Type': 'TERM_MATCH', 'Value': 'aws-lambda-requests'},
+        ]
+        assert self._skus(catalog, filters) == ['SKU1']
+
+    def test_product_family_filter(self, catalog):
+        """Test filtering on the product family."""
+        filters = [{'Field': 'productFamily', 'Type': 'TERM_MATCH', 'Value': 'Data Transfer'}]
+        assert self._skus(catalog, filters) == ['SKU3']
+
+    def test_contains_filter(self, catalog):
+        """Test CONTAINS filters."""
+        filters = [{'Field': 'usagetype', 'Type': 'CONTAINS', 'Value': 'GB-Second'}]
+        assert self._skus(catalog, filters) == ['SKU2']
+
+    def test_any_of_and_none_of_filters(self, catalog):
+        """Test ANY_OF and NONE_OF filters."""
+        any_of = [
+            {
+                'Field': 'group',
+                'Type': 'ANY_OF',
+                'Value': 'AWS-Lambda-Requests, AWS-Lambda-Duration',
+            }
+        ]
+        assert self._skus(catalog, any_of) == ['SKU1', 'SKU2']
+
+        none_of = [{'Field': 'group', 'Type': 'NONE_OF', 'Value': 'AWS-Lambda-Requests'}]
+        assert self._skus(catalog, none_of) == ['SKU2', 'SKU3']
+
+    def test_unsupported_filter_type(self, catalog):
+        """Test that unknown filter types are rejected."""
+        with pytest.raises(ValueError):
+            self._skus(catalog, [{'Field': 'group', 'Type': 'REGEX', 'Value': '.*'}])
+
+
+def test_parse_csv_offer_metadata():
+    """Test that metadata rows of a CSV offer file are parsed."""
+    metadata, items = parse_csv_offer(CSV_OFFER.splitlines())
+
+    assert metadata == {
+        'service_code': 'AmazonS3',
+        'version': '20250101000000',
+        'publication_date': '2025-01-01T00:00:00Z',
+    }
+    assert [item['product']['sku'] for item in items] == ['S1', 'S2']
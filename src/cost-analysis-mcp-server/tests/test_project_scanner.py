@@ -0,0 +1,181 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for the project scanner shared by the CDK and Terraform analyzers."""
+
+import os
+import pytest
+from awslabs.cost_analysis_mcp_server.cdk_analyzer import CDKAnalyzer
+from awslabs.cost_analysis_mcp_server.project_scanner import (
+    AnalysisCache,
+    analyze_files,
+    find_source_files,
+)
+from awslabs.cost_analysis_mcp_server.terraform_analyzer import TerraformAnalyzer
+from unittest.mock import patch
+
+
+def _touch(path, content):
+    """Write a file and move its modification time forward."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    existed = path.exists()
+    previous = path.stat().st_mtime_ns if existed else 0
+    path.write_text(content)
+    if existed:
+        os.utime(path, ns=(previous + 10**9, previous + 10**9))
+
+
+class TestFindSourceFiles:
+    """Tests for the find_source_files function."""
+
+    def test_prunes_dependency_directories(self, tmp_path):
+        """Test that dependency and build output directories are skipped."""
+        _touch(tmp_path / 'main.tf', '')
+        _touch(tmp_path / 'modules' / 'vpc' / 'main.tf', '')
+        _touch(tmp_path / 'terragrunt.hcl', '')
+        _touch(tmp_path / '.terraform' / 'modules' / 'x' / 'main.tf', '')
+        _touch(tmp_path / 'node_modules' / 'pkg' / 'index.ts', '')
+        _touch(tmp_path / 'cdk.out' / 'asset' / 'main.tf', '')
+
+        files = find_source_files(tmp_path, ['.tf', '.hcl'])
+
+        assert [path.relative_to(tmp_path).as_posix() for path in files] == [
+            'main.tf',
+            'modules/vpc/main.tf',
+            'terragrunt.hcl',
+        ]
+
+
+class TestAnalysisCache:
+    """Tests for the AnalysisCache class."""
+
+    def test_reuses_result_until_file_changes(self, tmp_path):
+        """Test that a result is recomputed only after the file changes."""
+        cache = AnalysisCache()
+        source = tmp_path / 'stack.py'
+        _touch(source, 'a')
+        calls = []
+
+        def compute():
+            calls.append(source.read_text())
+            return [{'name': source.read_text()}]
+
+        assert cache.get_or_compute('cdk', source, compute) == [{'name': 'a'}]
+        result = cache.get_or_compute('cdk', source, compute)
+        assert result == [{'name': 'a'}]
+        assert calls == ['a']
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # Results are copies, so callers can modify them freely
+        result[0]['name'] = 'changed'
+        assert cache.get_or_compute('cdk', source, compute) == [{'name': 'a'}]
+
+        _touch(source, 'bb')
+        assert cache.get_or_compute('cdk', source, compute) == [{'name': 'bb'}]
+        assert calls == ['a', 'bb']
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test that the cache is bounded."""
+        cache = AnalysisCache(max_entries=2)
+        for name in ('a', 'b', 'c'):
+            _touch(tmp_path / name, name)
+            cache.get_or_compute('ns', tmp_path / name, lambda: name)
+
+        assert cache.misses == 3
+        cache.get_or_compute('ns', tmp_path / 'c', lambda: 'c')
+        assert cache.hits == 1
+        cache.get_or_compute('ns', tmp_path / 'a', lambda: 'a')
+        assert cache.misses == 4
+
+    def test_nested_dependencies_invalidate_parent(self, tmp_path):
+        """Test that a change in a nested analysis invalidates the enclosing one."""
+        cache = AnalysisCache()
+        parent = tmp_path / 'parent'
+        child = tmp_path / 'child'
+        _touch(parent, 'parent')
+        _touch(child, 'v1')
+        calls = []
+
+        def compute_parent():
+            calls.append('parent')
+            return cache.get_or_compute('ns', child, lambda: child.read_text())
+
+        assert cache.get_or_compute('ns', parent, compute_parent) == 'v1'
+        assert cache.get_or_compute('ns', parent, compute_parent) == 'v1'
+        assert calls == ['parent']
+
+        _touch(child, 'v2')
+        assert cache.get_or_compute('ns', parent, compute_parent) == 'v2'
+        assert calls == ['parent', 'parent']
+
+
+def test_analyze_files_preserves_order(tmp_path):
+    """Test that parallel analysis returns results in file order."""
+    files = [tmp_path / f'{index}.tf' for index in range(20)]
+    assert analyze_files(files, lambda path: [{'name': path.stem}]) == [
+        [{'name': str(index)}] for index in range(20)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_terraform_reanalysis_only_parses_changed_files(tmp_path):
+    """Test that repeated Terraform analyses reparse only changed files."""
+    _touch(tmp_path / 'main.tf', 'resource "aws_lambda_function" "fn" {}')
+    _touch(tmp_path / 'db.tf', 'resource "aws_dynamodb_table" "table" {}')
+    _touch(tmp_path / '.terraform' / 'main.tf', 'resource "aws_s3_bucket" "cached" {}')
+    analyzer = TerraformAnalyzer(str(tmp_path), cache=AnalysisCache())
+
+    with patch.object(analyzer, '_analyze_file', wraps=analyzer._analyze_file) as mock_analyze:
+        result = await analyzer.analyze_project()
+        assert {service['name'] for service in result['services']} == {'lambda', 'dynamodb'}
+        assert mock_analyze.call_count == 2
+
+        _touch(tmp_path / 'db.tf', 'resource "aws_sqs_queue" "queue" {}')
+        result = await analyzer.analyze_project()
+        assert {service['name'] for service in result['services']} == {'lambda', 'sqs'}
+        assert mock_analyze.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_terraform_local_module_change_invalidates_caller(tmp_path):
+    """Test that changing a local module refreshes the file that uses it."""
+    _touch(tmp_path / 'main.tf', 'module "app" {\n  source = "./modules/app"\n}\n')
+    _touch(tmp_path / 'modules' / 'app' / 'main.tf', 'resource "aws_lambda_function" "fn" {}')
+    analyzer = TerraformAnalyzer(str(tmp_path), cache=AnalysisCache())
+
+    result = await analyzer.analyze_project()
+    assert any(
+        service['name'] == 'lambda' and service['source'] == 'terraform-module'
+        for service in result['services']
+    )
+
+    _touch(tmp_path / 'modules' / 'app' / 'queue.tf', 'resource "aws_sqs_queue" "queue" {}')
+    result = await analyzer.analyze_project()
+    assert any(
+        service['name'] == 'sqs' and service['source'] == 'terraform-module'
+        for service in result['services']
+    )
+
+
+@pytest.mark.asyncio
+async def test_cdk_analysis_skips_node_modules_and_cdk_out(tmp_path):
+    """Test that the CDK analyzer ignores dependencies and synthesized output."""
+    _touch(tmp_path / 'lib' / 'stack.ts', "import * as s3 from 'aws-cdk-lib/aws-s3';")
+    _touch(
+        tmp_path / 'node_modules' / 'aws-cdk-lib' / 'index.ts',
+        "import * as ec2 from 'aws-cdk-lib/aws-ec2';",
+    )
+    _touch(tmp_path / 'cdk.out' / 'asset.py', 'from aws_cdk.aws_sqs import Queue')
+    analyzer = CDKAnalyzer(str(tmp_path), cache=AnalysisCache())
+
+    result = await analyzer.analyze_project()
+
+    assert [service['name'] for service in result['services']] == ['s3']
@@ -11,15 +11,20 @@
 
 """Tests for the server module of the cost-analysis-mcp-server."""
 
+import json
 import pytest
+from awslabs.cost_analysis_mcp_server import server
 from awslabs.cost_analysis_mcp_server.server import (
+    PricingFilter,
+    PricingFilters,
     analyze_cdk_project_wrapper,
     generate_cost_report_wrapper,
     get_bedrock_patterns,
     get_pricing_from_api,
     get_pricing_from_web,
+    update_pricing_catalog,
 )
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 class TestAnalyzeCdkProject:
@@ -159,6 +164,118 @@ class TestGetPricingFromApi:
         assert 'error_type' in result
         assert result['error_type'] == 'api_error'
 
+    @pytest.mark.asyncio
+    async def test_get_pricing_follows_all_pages(self, mock_boto3, mock_context):
+        """Test that every result page of the Pricing API is returned."""
+        pricing_client = mock_boto3.Session().client('pricing')
+        pricing_client.get_products.side_effect = [
+            {'PriceList': ['item1', 'item2'], 'NextToken': 'token1'},
+            {'PriceList': ['item3'], 'NextToken': 'token2'},
+            {'PriceList': ['item4']},
+        ]
+        filters = PricingFilters(filters=[PricingFilter(field='group', value='AWS-Lambda')])
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            result = await get_pricing_from_api('AWSLambda', 'us-west-2', mock_context, filters)
+
+        assert result['status'] == 'success'
+        assert result['data'] == ['item1', 'item2', 'item3', 'item4']
+        calls = pricing_client.get_products.call_args_list
+        assert len(calls) == 3
+        assert 'NextToken' not in calls[0].kwargs
+        assert calls[2].kwargs['NextToken'] == 'token2'
+        assert calls[0].kwargs['Filters'] == [
+            {'Field': 'regionCode', 'Type': 'TERM_MATCH', 'Value': 'us-west-2'},
+            {'Field': 'group', 'Type': 'TERM_MATCH', 'Value': 'AWS-Lambda'},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_pricing_reuses_client(self, mock_boto3, mock_context):
+        """Test that the Pricing API client is created once."""
+        with patch('boto3.Session', return_value=mock_boto3.Session()) as mock_session:
+            await get_pricing_from_api('AWSLambda', 'us-west-2', mock_context)
+            await get_pricing_from_api('AWSLambda', 'us-east-1', mock_context)
+
+        assert mock_session.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_pricing_from_fresh_catalog(self, mock_boto3, mock_context):
+        """Test that a fresh catalog entry is used instead of the Pricing API."""
+        item = {'product': {'sku': 'SKU1', 'attributes': {'group': 'AWS-Lambda-Requests'}}}
+        server.pricing_catalog.ingest_price_items([item], 'AWSLambda', region='us-west-2')
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            result = await get_pricing_from_api('AWSLambda', 'us-west-2', mock_context)
+
+        assert result['status'] == 'success'
+        assert [json.loads(i) for i in result['data']] == [item]
+        assert 'local pricing catalog' in result['message']
+        mock_boto3.Session().client('pricing').get_products.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_pricing_stale_catalog_uses_api(self, mock_boto3, mock_context):
+        """Test that a stale catalog entry falls back to the Pricing API."""
+        item = {'product': {'sku': 'SKU1', 'attributes': {}}}
+        server.pricing_catalog.ingest_price_items([item], 'AWSLambda', region='us-west-2')
+        server.pricing_catalog.max_age_hours = -1
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            result = await get_pricing_from_api('AWSLambda', 'us-west-2', mock_context)
+
+        assert 'AWS Pricing API' in result['message']
+        mock_boto3.Session().client('pricing').get_products.assert_called_once()
+
+
+class TestUpdatePricingCatalog:
+    """Tests for the update_pricing_catalog function."""
+
+    @pytest.mark.asyncio
+    async def test_update_from_download(self, mock_context):
+        """Test loading a downloaded offer file into the catalog."""
+        offer = {
+            'offerCode': 'AWSLambda',
+            'version': 'v1',
+            'products': {'SKU1': {'sku': 'SKU1', 'attributes': {}}},
+            'terms': {},
+        }
+        with patch(
+            'awslabs.cost_analysis_mcp_server.server.fetch_offer_file',
+            AsyncMock(return_value=json.dumps(offer)),
+        ) as mock_fetch:
+            result = await update_pricing_catalog('AWSLambda', 'us-west-2', mock_context)
+
+        mock_fetch.assert_awaited_once_with('AWSLambda', 'us-west-2')
+        assert result['status'] == 'success'
+        assert result['products'] == 1
+        assert result['offer']['version'] == 'v1'
+        assert server.pricing_catalog.is_fresh('AWSLambda', 'us-west-2')
+
+    @pytest.mark.asyncio
+    async def test_update_from_local_file(self, mock_context, tmp_path):
+        """Test loading a local offer file into the catalog."""
+        offer_path = tmp_path / 'index.json'
+        offer_path.write_text(
+            json.dumps({'products': {'SKU1': {'sku': 'SKU1', 'attributes': {}}}})
+        )
+
+        result = await update_pricing_catalog(
+            'AmazonS3', 'us-west-2', mock_context, offer_file_path=str(offer_path)
+        )
+
+        assert result['status'] == 'success'
+        assert result['products'] == 1
+
+    @pytest.mark.asyncio
+    async def test_update_error(self, mock_context, tmp_path):
+        """Test handling of errors while loading an offer file."""
+        result = await update_pricing_catalog(
+            'AmazonS3', 'us-west-2', mock_context, offer_file_path=str(tmp_path / 'missing.json')
+        )
+
+        assert result['status'] == 'error'
+        assert result['error_type'] == 'catalog_error'
+        mock_context.error.assert_called_once()
+
 
 class TestGetBedrockPatterns:
     """Tests for the get_bedrock_patterns function."""
@@ -11,16 +11,35 @@
 
 """CloudWatch handler for the EKS MCP Server."""
 
+import asyncio
 import datetime
+import heapq
+import itertools
 import json
-import time
 from awslabs.eks_mcp_server.aws_helper import AwsHelper
 from awslabs.eks_mcp_server.logging_helper import LogLevel, log_with_request_id
-from awslabs.eks_mcp_server.models import CloudWatchLogsResponse, CloudWatchMetricsResponse
+from awslabs.eks_mcp_server.models import (
+    CloudWatchBulkMetricsResponse,
+    CloudWatchLogsResponse,
+    CloudWatchMetricsResponse,
+    CloudWatchMultiLogsResponse,
+    MetricBucket,
+    MetricSeries,
+)
 from mcp.server.fastmcp import Context
 from mcp.types import TextContent
 from pydantic import Field
-from typing import Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+
+# Maximum number of Logs Insights queries run at the same time by a single tool call
+MAX_CONCURRENT_QUERIES = 10
+
+# Maximum number of metric queries GetMetricData accepts in a single request
+MAX_METRIC_DATA_QUERIES = 500
+
+# Maximum number of GetMetricData request chains run at the same time by a single tool call
+MAX_CONCURRENT_METRIC_REQUESTS = 5
 
 
 class CloudWatchHandler:
@@ -43,6 +62,8 @@ class CloudWatchHandler:
         # Register tools
         self.mcp.tool(name='get_cloudwatch_logs')(self.get_cloudwatch_logs)
         self.mcp.tool(name='get_cloudwatch_metrics')(self.get_cloudwatch_metrics)
+        self.mcp.tool(name='get_cloudwatch_logs_multi')(self.get_cloudwatch_logs_multi)
+        self.mcp.tool(name='get_cloudwatch_metrics_bulk')(self.get_cloudwatch_metrics_bulk)
 
     def resolve_time_range(
         self,
@@ -193,29 +214,10 @@ class CloudWatchHandler:
             logs = AwsHelper.create_boto3_client('logs')
 
             # Determine the log group based on log_type
-            known_types = {'application', 'host', 'performance', 'dataplane'}
-            if log_type in known_types:
-                log_group = f'/aws/containerinsights/{cluster_name}/{log_type}'
-            elif log_type == 'control-plane':
-                log_group = f'/aws/eks/{cluster_name}/cluster'
-            else:
-                log_group = log_type  # Assume user passed full log group name
-
-            # Determine fields to include
-            query_fields = fields if fields else '@timestamp, @message'
-
-            # Construct the base query
-            query = f"""
-            fields {query_fields}
-            | filter @message like '{resource_name}'
-            """
+            log_group = self._resolve_log_group(cluster_name, log_type)
 
-            # Add additional filter pattern if provided
-            if filter_pattern:
-                query += f'\n| {filter_pattern}'
-
-            # Add sorting and limit
-            query += f'\n| sort @timestamp desc\n| limit {limit}'
+            # Construct the query
+            query = self._build_query(resource_name, fields, filter_pattern, limit)
 
             log_with_request_id(
                 ctx,
@@ -226,29 +228,11 @@ class CloudWatchHandler:
                 end_time=end_dt.isoformat(),
             )
 
-            # Start the query
-            start_query_response = logs.start_query(
-                logGroupName=log_group,
-                startTime=int(start_dt.timestamp()),
-                endTime=int(end_dt.timestamp()),
-                queryString=query,
+            # Run the query and process results
+            log_entries = await self._run_logs_query(
+                ctx, logs, log_group, query, start_dt, end_dt, resource_type, resource_name
             )
 
-            query_id = start_query_response['queryId']
-
-            # Poll for results
-            query_response = self._poll_query_results(
-                ctx, logs, query_id, resource_type, resource_name
-            )
-
-            # Process results
-            results = query_response['results']
-            log_entries = []
-
-            for result in results:
-                entry = self._build_log_entry(result)
-                log_entries.append(entry)
-
             log_with_request_id(
                 ctx,
                 LogLevel.INFO,
@@ -291,6 +275,231 @@ class CloudWatchHandler:
                 log_entries=[],
             )
 
+    async def get_cloudwatch_logs_multi(
+        self,
+        ctx: Context,
+        resource_type: str = Field(
+            ...,
+            description='Resource type of the resources to search logs for. Valid values: "pod", "node", "container".',
+        ),
+        resource_names: List[str] = Field(
+            ...,
+            description='Resource names to search for in log messages (e.g., several pod or node names). One query is run per resource name and log type.',
+        ),
+        cluster_name: str = Field(
+            ...,
+            description='Name of the EKS cluster where the resources are located. Used to construct the CloudWatch log group names.',
+        ),
+        log_types: List[str] = Field(
+            ['application'],
+            description="""Log types to query. Options for each entry:
+            - "application": Container/application logs
+            - "host": Node-level system logs
+            - "performance": Performance metrics logs
+            - "control-plane": EKS control plane logs
+            - Or provide a custom CloudWatch log group name directly""",
+        ),
+        minutes: int = Field(
+            15,
+            description='Number of minutes to look back for logs. Default: 15. Ignored if start_time is provided.',
+        ),
+        start_time: Optional[str] = Field(
+            None,
+            description='Start time in ISO format (e.g., "2023-01-01T00:00:00Z"). If provided, overrides the minutes parameter.',
+        ),
+        end_time: Optional[str] = Field(
+            None,
+            description='End time in ISO format (e.g., "2023-01-01T01:00:00Z"). If not provided, defaults to current time.',
+        ),
+        limit: int = Field(
+            50,
+            description='Maximum number of merged log entries to return across all queries. Each query also returns at most this many entries.',
+        ),
+        filter_pattern: Optional[str] = Field(
+            None,
+            description='Additional CloudWatch Logs filter pattern applied to every query. Uses CloudWatch Logs Insights syntax (e.g., "ERROR", "field=value").',
+        ),
+        fields: Optional[str] = Field(
+            None,
+            description='Custom fields to include in the query results (defaults to "@timestamp, @message"). Use CloudWatch Logs Insights field syntax.',
+        ),
+    ) -> CloudWatchMultiLogsResponse:
+        """Get logs from CloudWatch for several resources and log types at once.
+
+        This tool runs one CloudWatch Logs Insights query per resource name and log type
+        concurrently, and merges the results into a single timeline, newest first. It is
+        useful for correlating what several pods or nodes logged around the same time, or
+        for looking at application and host logs of a resource side by side.
+
+        ## Requirements
+        - The server must be run with the `--allow-sensitive-data-access` flag
+        - The EKS cluster must have CloudWatch logging enabled
+
+        ## Response Information
+        The response includes the queried log groups, the time range, and the merged log
+        entries, each tagged with the resource name and log group it came from. Progress
+        notifications report partial results while queries are still running. Queries that
+        fail are listed in failed_queries while the results of the others are returned.
+
+        ## Usage Tips
+        - Use get_cloudwatch_logs for a single resource and log type
+        - Use filter_pattern to narrow down results (e.g., "ERROR", "exception")
+        - Keep the number of resource names and log types small; each pair is one query
+
+        Args:
+            ctx: MCP context
+            resource_type: Resource type (pod, node, container)
+            resource_names: Resource names to search for in log messages
+            cluster_name: Name of the EKS cluster
+            log_types: Log types (application, host, performance, control-plane, or custom)
+            minutes: Number of minutes to look back
+            start_time: Start time in ISO format (overrides minutes)
+            end_time: End time in ISO format (defaults to now)
+            limit: Maximum number of merged log entries to return
+            filter_pattern: Additional CloudWatch Logs filter pattern
+            fields: Custom fields to include in the query results
+
+        Returns:
+            CloudWatchMultiLogsResponse with merged log entries and the queried log groups
+        """
+        log_groups = [self._resolve_log_group(cluster_name, log_type) for log_type in log_types]
+        try:
+            # Check if sensitive data access is allowed
+            if not self.allow_sensitive_data_access:
+                error_message = (
+                    'Access to CloudWatch logs requires --allow-sensitive-data-access flag'
+                )
+                log_with_request_id(ctx, LogLevel.ERROR, error_message)
+                return CloudWatchMultiLogsResponse(
+                    isError=True,
+                    content=[TextContent(type='text', text=error_message)],
+                    resource_type=resource_type,
+                    resource_names=resource_names,
+                    cluster_name=cluster_name,
+                    log_types=log_types,
+                    log_groups=[],
+                    start_time='',
+                    end_time='',
+                    log_entries=[],
+                )
+
+            start_dt, end_dt = self.resolve_time_range(start_time, end_time, minutes)
+
+            # Create CloudWatch Logs client, shared by all queries
+            logs = AwsHelper.create_boto3_client('logs')
+
+            targets = list(itertools.product(resource_names, log_groups))
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+            completed = 0
+
+            log_with_request_id(
+                ctx,
+                LogLevel.INFO,
+                f'Starting {len(targets)} CloudWatch Logs queries for {resource_type} resources in cluster {cluster_name}',
+                start_time=start_dt.isoformat(),
+                end_time=end_dt.isoformat(),
+            )
+
+            async def run_target(resource_name: str, log_group: str) -> List[Dict[str, Any]]:
+                nonlocal completed
+
+                async def report_partial(results: List[Any]) -> None:
+                    await ctx.info(
+                        f'{resource_name} ({log_group}): {len(results)} log entries so far'
+                    )
+
+                async with semaphore:
+                    query = self._build_query(resource_name, fields, filter_pattern, limit)
+                    entries = await self._run_logs_query(
+                        ctx,
+                        logs,
+                        log_group,
+                        query,
+                        start_dt,
+                        end_dt,
+                        resource_type,
+                        resource_name,
+                        on_partial=report_partial,
+                    )
+
+                for entry in entries:
+                    entry['resource_name'] = resource_name
+                    entry['log_group'] = log_group
+
+                completed += 1
+                await ctx.report_progress(completed, len(targets))
+                await ctx.info(
+                    f'{resource_name} ({log_group}): query complete with {len(entries)} log entries'
+                )
+                return entries
+
+            outcomes = await asyncio.gather(
+                *(run_target(resource_name, log_group) for resource_name, log_group in targets),
+                return_exceptions=True,
+            )
+
+            results_by_target = []
+            failed_queries = []
+            for (resource_name, log_group), outcome in zip(targets, outcomes):
+                if isinstance(outcome, BaseException):
+                    failed_queries.append(f'{resource_name} ({log_group}): {str(outcome)}')
+                else:
+                    results_by_target.append(outcome)
+
+            if targets and not results_by_target:
+                raise Exception('; '.join(failed_queries))
+
+            # Each query returns entries newest first, so merging keeps the timeline sorted
+            log_entries = list(
+                itertools.islice(
+                    heapq.merge(
+                        *results_by_target,
+                        key=lambda entry: str(entry.get('timestamp', '')),
+                        reverse=True,
+                    ),
+                    limit,
+                )
+            )
+
+            message = (
+                f'Successfully retrieved {len(log_entries)} log entries from {len(targets)} '
+                f'queries for {resource_type} resources in cluster {cluster_name}'
+            )
+            if failed_queries:
+                message += f'. {len(failed_queries)} queries failed'
+            log_with_request_id(ctx, LogLevel.INFO, message)
+
+            return CloudWatchMultiLogsResponse(
+                isError=False,
+                content=[TextContent(type='text', text=message)],
+                resource_type=resource_type,
+                resource_names=resource_names,
+                cluster_name=cluster_name,
+                log_types=log_types,
+                log_groups=log_groups,
+                start_time=start_dt.isoformat(),
+                end_time=end_dt.isoformat(),
+                log_entries=log_entries,
+                failed_queries=failed_queries,
+            )
+
+        except Exception as e:
+            error_message = f'Failed to get logs for {resource_type} resources: {str(e)}'
+            log_with_request_id(ctx, LogLevel.ERROR, error_message)
+
+            return CloudWatchMultiLogsResponse(
+                isError=True,
+                content=[TextContent(type='text', text=error_message)],
+                resource_type=resource_type,
+                resource_names=resource_names,
+                cluster_name=cluster_name,
+                log_types=log_types,
+                log_groups=[],
+                start_time='',
+                end_time='',
+                log_entries=[],
+            )
+
     async def get_cloudwatch_metrics(
         self,
         ctx: Context,
@@ -421,17 +630,9 @@ class CloudWatchHandler:
                     dimensions = {'ClusterName': cluster_name}
             else:
                 # Set default dimensions based on resource type
-                dimensions['ClusterName'] = cluster_name
-                dimensions['Namespace'] = k8s_namespace
-
-                if resource_type == 'pod':
-                    dimensions['PodName'] = resource_name
-                elif resource_type == 'node':
-                    dimensions['NodeName'] = resource_name
-                elif resource_type == 'container':
-                    dimensions['ContainerName'] = resource_name
-                elif resource_type == 'service':
-                    dimensions['Service'] = resource_name
+                dimensions = self._default_dimensions(
+                    resource_type, resource_name, cluster_name, k8s_namespace
+                )
 
             log_with_request_id(
                 ctx,
@@ -531,7 +732,411 @@ class CloudWatchHandler:
                 data_points=[],
             )
 
-    def _poll_query_results(
+    async def get_cloudwatch_metrics_bulk(
+        self,
+        ctx: Context,
+        resource_type: str = Field(
+            ...,
+            description='Resource type to retrieve metrics for. Valid values: "pod", "node", "container", "cluster", "service". Determines the CloudWatch dimensions.',
+        ),
+        resource_names: List[str] = Field(
+            ...,
+            description='Names of the resources to retrieve metrics for (e.g., all pod names of a deployment). Used as dimension values in CloudWatch.',
+        ),
+        cluster_name: str = Field(
+            ...,
+            description='Name of the EKS cluster where the resources are located. Used as the ClusterName dimension in CloudWatch.',
+        ),
+        metric_names: List[str] = Field(
+            ...,
+            description='Metric names to retrieve for every resource (e.g., ["pod_cpu_utilization", "pod_memory_utilization"]).',
+        ),
+        namespace: str = Field(
+            'ContainerInsights',
+            description='CloudWatch namespace where the metrics are stored. Default: "ContainerInsights"',
+        ),
+        k8s_namespace: str = Field(
+            'default',
+            description='Kubernetes namespace of the resources. Used as the Namespace dimension in CloudWatch. Default: "default"',
+        ),
+        minutes: int = Field(
+            60,
+            description='Number of minutes to look back for metrics. Default: 60. Ignored if start_time is provided.',
+        ),
+        start_time: Optional[str] = Field(
+            None,
+            description='Start time in ISO format (e.g., "2023-01-01T00:00:00Z"). If provided, overrides the minutes parameter.',
+        ),
+        end_time: Optional[str] = Field(
+            None,
+            description='End time in ISO format (e.g., "2023-01-01T01:00:00Z"). If not provided, defaults to current time.',
+        ),
+        period: int = Field(
+            60,
+            description='Period in seconds of the raw metric data points. Default: 60 (1 minute).',
+        ),
+        stat: str = Field(
+            'Average',
+            description='Statistic of the raw metric data points: Average, Sum, Maximum, Minimum, or SampleCount.',
+        ),
+        max_points: int = Field(
+            60,
+            description='Maximum number of data points returned per series. Raw data points are grouped into at most this many time buckets. Default: 60.',
+            ge=1,
+        ),
+    ) -> CloudWatchBulkMetricsResponse:
+        """Get several metrics from CloudWatch for many resources at once.
+
+        This tool retrieves every combination of resource name and metric name in as few
+        GetMetricData requests as possible, which makes it the right tool for dashboards
+        such as CPU and memory of every pod in a deployment. Each series is downsampled to a
+        point budget, reporting the minimum, maximum and average of the raw data points in
+        each time bucket so that spikes remain visible in small payloads.
+
+        ## Requirements
+        - The EKS cluster must have CloudWatch Container Insights enabled
+        - The metrics must be available in the specified namespace
+
+        ## Response Information
+        The response includes one series per resource and metric, each with its status and
+        downsampled data points (bucket start timestamp, min, max, avg, and raw point count).
+
+        ## Usage Tips
+        - Use get_cloudwatch_metrics for a single series at full resolution
+        - Lower max_points for long time ranges or many resources
+        - Use Maximum as the stat to find short spikes in longer periods
+
+        Args:
+            ctx: MCP context
+            resource_type: Resource type (pod, node, container, cluster, service)
+            resource_names: Resource names
+            cluster_name: Name of the EKS cluster
+            metric_names: Metric names (e.g., pod_cpu_utilization)
+            namespace: CloudWatch namespace
+            k8s_namespace: Kubernetes namespace of the resources
+            minutes: Number of minutes to look back
+            start_time: Start time in ISO format (overrides minutes)
+            end_time: End time in ISO format (defaults to now)
+            period: Period in seconds of the raw metric data points
+            stat: Statistic of the raw metric data points
+            max_points: Maximum number of data points per series
+
+        Returns:
+            CloudWatchBulkMetricsResponse with downsampled series for every resource and metric
+        """
+        try:
+            start_dt, end_dt = self.resolve_time_range(start_time, end_time, minutes)
+
+            # Create CloudWatch client, shared by all requests
+            cloudwatch = AwsHelper.create_boto3_client('cloudwatch')
+
+            # One metric query per resource and metric, with ids that are valid identifiers
+            targets = list(itertools.product(resource_names, metric_names))
+            queries = [
+                {
+                    'Id': f'm{index}',
+                    'Label': f'{resource_name}/{metric_name}',
+                    'ReturnData': True,
+                    'MetricStat': {
+                        'Metric': {
+                            'Namespace': namespace,
+                            'MetricName': metric_name,
+                            'Dimensions': [
+                                {'Name': k, 'Value': v}
+                                for k, v in self._default_dimensions(
+                                    resource_type, resource_name, cluster_name, k8s_namespace
+                                ).items()
+                            ],
+                        },
+                        'Period': period,
+                        'Stat': stat,
+                    },
+                }
+                for index, (resource_name, metric_name) in enumerate(targets)
+            ]
+
+            # Pack the queries into as few requests as possible and run them concurrently;
+            # the pages of each request are followed with its NextToken
+            batches = [
+                queries[i : i + MAX_METRIC_DATA_QUERIES]
+                for i in range(0, len(queries), MAX_METRIC_DATA_QUERIES)
+            ]
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_METRIC_REQUESTS)
+
+            async def run_batch(batch: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+                async with semaphore:
+                    return await self._get_metric_data_pages(cloudwatch, batch, start_dt, end_dt)
+
+            log_with_request_id(
+                ctx,
+                LogLevel.INFO,
+                f'Getting {len(queries)} CloudWatch metric series in {len(batches)} requests for {resource_type} resources in cluster {cluster_name}',
+                namespace=namespace,
+                start_time=start_dt.isoformat(),
+                end_time=end_dt.isoformat(),
+            )
+
+            results: Dict[str, Dict[str, Any]] = {}
+            for batch_results in await asyncio.gather(*(run_batch(batch) for batch in batches)):
+                results.update(batch_results)
+
+            bucket_seconds = self._bucket_seconds(start_dt, end_dt, period, max_points)
+            series = []
+            for query, (resource_name, metric_name) in zip(queries, targets):
+                result = results.get(query['Id'], {})
+                series.append(
+                    MetricSeries(
+                        resource_name=resource_name,
+                        metric_name=metric_name,
+                        status_code=result.get('StatusCode', 'Complete'),
+                        data_points=self._downsample(
+                            result.get('Timestamps', []),
+                            result.get('Values', []),
+                            start_dt,
+                            bucket_seconds,
+                        ),
+                    )
+                )
+
+            point_count = sum(len(item.data_points) for item in series)
+            message = (
+                f'Successfully retrieved {len(series)} metric series with {point_count} data '
+                f'points for {resource_type} resources in cluster {cluster_name}'
+            )
+            log_with_request_id(ctx, LogLevel.INFO, message)
+
+            return CloudWatchBulkMetricsResponse(
+                isError=False,
+                content=[TextContent(type='text', text=message)],
+                resource_type=resource_type,
+                cluster_name=cluster_name,
+                namespace=namespace,
+                start_time=start_dt.isoformat(),
+                end_time=end_dt.isoformat(),
+                bucket_seconds=bucket_seconds,
+                series=series,
+            )
+
+        except Exception as e:
+            error_message = f'Failed to get metrics for {resource_type} resources: {str(e)}'
+            log_with_request_id(ctx, LogLevel.ERROR, error_message)
+
+            return CloudWatchBulkMetricsResponse(
+                isError=True,
+                content=[TextContent(type='text', text=error_message)],
+                resource_type=resource_type,
+                cluster_name=cluster_name,
+                namespace=namespace,
+                start_time='',
+                end_time='',
+                bucket_seconds=0,
+                series=[],
+            )
+
+    def _default_dimensions(
+        self, resource_type: str, resource_name: str, cluster_name: str, k8s_namespace: str
+    ) -> Dict[str, str]:
+        """Determine the Container Insights dimensions of a resource.
+
+        Args:
+            resource_type: Resource type (pod, node, container, cluster, service)
+            resource_name: Resource name
+            cluster_name: Name of the EKS cluster
+            k8s_namespace: Kubernetes namespace of the resource
+
+        Returns:
+            Dictionary of dimension name-value pairs
+        """
+        dimensions = {'ClusterName': cluster_name, 'Namespace': k8s_namespace}
+
+        if resource_type == 'pod':
+            dimensions['PodName'] = resource_name
+        elif resource_type == 'node':
+            dimensions['NodeName'] = resource_name
+        elif resource_type == 'container':
+            dimensions['ContainerName'] = resource_name
+        elif resource_type == 'service':
+            dimensions['Service'] = resource_name
+        return dimensions
+
+    async def _get_metric_data_pages(
+        self, cloudwatch_client, queries, start_dt, end_dt
+    ) -> Dict[str, Dict[str, Any]]:
+        """Run a GetMetricData request and follow its NextToken until all pages are read.
+
+        Args:
+            cloudwatch_client: Boto3 CloudWatch client
+            queries: Up to MAX_METRIC_DATA_QUERIES metric data queries
+            start_dt: Start of the time range
+            end_dt: End of the time range
+
+        Returns:
+            Dictionary mapping query ids to their status code, timestamps and values
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        kwargs: Dict[str, Any] = {
+            'MetricDataQueries': queries,
+            'StartTime': start_dt,
+            'EndTime': end_dt,
+            'ScanBy': 'TimestampAscending',
+        }
+        while True:
+            # boto3 calls block, so run them in a worker thread
+            response = await asyncio.to_thread(cloudwatch_client.get_metric_data, **kwargs)
+            for metric_data in response.get('MetricDataResults', []):
+                result = results.setdefault(
+                    metric_data['Id'], {'StatusCode': 'Complete', 'Timestamps': [], 'Values': []}
+                )
+                result['StatusCode'] = metric_data.get('StatusCode', result['StatusCode'])
+                result['Timestamps'].extend(metric_data.get('Timestamps', []))
+                result['Values'].extend(metric_data.get('Values', []))
+
+            next_token = response.get('NextToken')
+            if not next_token:
+                return results
+            kwargs['NextToken'] = next_token
+
+    def _bucket_seconds(self, start_dt, end_dt, period: int, max_points: int) -> int:
+        """Compute the width of the downsampling buckets.
+
+        Args:
+            start_dt: Start of the time range
+            end_dt: End of the time range
+            period: Period in seconds of the raw metric data points
+            max_points: Maximum number of buckets
+
+        Returns:
+            Bucket width in seconds, a multiple of the period
+        """
+        span = max((end_dt - start_dt).total_seconds(), period)
+        periods_per_bucket = max(1, -(-int(span) // (period * max_points)))
+        return period * periods_per_bucket
+
+    def _downsample(self, timestamps, values, start_dt, bucket_seconds: int) -> List[MetricBucket]:
+        """Group raw data points into time buckets with their min, max and average.
+
+        Args:
+            timestamps: Timestamps of the raw data points
+            values: Values of the raw data points
+            start_dt: Start of the time range, where the first bucket starts
+            bucket_seconds: Bucket width in seconds
+
+        Returns:
+            Buckets holding at least one raw data point, oldest first
+        """
+        start = start_dt.timestamp()
+        buckets: Dict[int, List[float]] = {}
+        for timestamp, value in zip(timestamps, values):
+            index = max(0, int((timestamp.timestamp() - start) // bucket_seconds))
+            buckets.setdefault(index, []).append(value)
+
+        return [
+            MetricBucket(
+                timestamp=datetime.datetime.fromtimestamp(
+                    start + index * bucket_seconds, tz=datetime.timezone.utc
+                ).isoformat(),
+                min=min(bucket_values),
+                max=max(bucket_values),
+                avg=sum(bucket_values) / len(bucket_values),
+                count=len(bucket_values),
+            )
+            for index, bucket_values in sorted(buckets.items())
+        ]
+
+    def _resolve_log_group(self, cluster_name: str, log_type: str) -> str:
+        """Determine the CloudWatch log group of a log type.
+
+        Args:
+            cluster_name: Name of the EKS cluster
+            log_type: Log type (application, host, performance, control-plane, or custom)
+
+        Returns:
+            Log group name
+        """
+        known_types = {'application', 'host', 'performance', 'dataplane'}
+        if log_type in known_types:
+            return f'/aws/containerinsights/{cluster_name}/{log_type}'
+        elif log_type == 'control-plane':
+            return f'/aws/eks/{cluster_name}/cluster'
+        return log_type  # Assume user passed full log group name
+
+    def _build_query(self, resource_name, fields, filter_pattern, limit) -> str:
+        """Build a Logs Insights query for the log messages of a resource.
+
+        Args:
+            resource_name: Resource name to search for in log messages
+            fields: Custom fields to include in the query results
+            filter_pattern: Additional CloudWatch Logs filter pattern
+            limit: Maximum number of log entries to return
+
+        Returns:
+            Logs Insights query string
+        """
+        # Determine fields to include
+        query_fields = fields if fields else '@timestamp, @message'
+
+        # Construct the base query
+        query = f"""
+            fields {query_fields}
+            | filter @message like '{resource_name}'
+            """
+
+        # Add additional filter pattern if provided
+        if filter_pattern:
+            query += f'\n| {filter_pattern}'
+
+        # Add sorting and limit
+        query += f'\n| sort @timestamp desc\n| limit {limit}'
+        return query
+
+    async def _run_logs_query(
+        self,
+        ctx,
+        logs_client,
+        log_group,
+        query,
+        start_dt,
+        end_dt,
+        resource_type,
+        resource_name,
+        on_partial: Optional[Callable[[List[Any]], Awaitable[None]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Run a Logs Insights query and build log entries from its results.
+
+        Args:
+            ctx: MCP context
+            logs_client: Boto3 CloudWatch Logs client
+            log_group: Log group to query
+            query: Logs Insights query string
+            start_dt: Start of the time range
+            end_dt: End of the time range
+            resource_type: Resource type for logging
+            resource_name: Resource name for logging
+            on_partial: Coroutine called with the partial results of a running query
+
+        Returns:
+            Log entries
+        """
+        # Start the query; boto3 calls block, so run them in a worker thread
+        start_query_response = await asyncio.to_thread(
+            logs_client.start_query,
+            logGroupName=log_group,
+            startTime=int(start_dt.timestamp()),
+            endTime=int(end_dt.timestamp()),
+            queryString=query,
+        )
+
+        query_id = start_query_response['queryId']
+
+        # Poll for results
+        query_response = await self._poll_query_results(
+            ctx, logs_client, query_id, resource_type, resource_name, on_partial=on_partial
+        )
+
+        # Process results
+        return [self._build_log_entry(result) for result in query_response['results']]
+
+    async def _poll_query_results(
         self,
         ctx,
         logs_client,
@@ -540,9 +1145,13 @@ class CloudWatchHandler:
         resource_name,
         max_attempts=60,
         initial_delay=1,
+        on_partial: Optional[Callable[[List[Any]], Awaitable[None]]] = None,
     ):
         """Poll for CloudWatch Logs query results with exponential backoff.
 
+        Waiting between attempts yields to the event loop, so other tool calls and
+        concurrent queries keep running while a query is in progress.
+
         Args:
             ctx: MCP context
             logs_client: Boto3 CloudWatch Logs client
@@ -551,6 +1160,8 @@ class CloudWatchHandler:
             resource_name: Resource name for logging
             max_attempts: Maximum number of polling attempts before timing out
             initial_delay: Initial delay between polling attempts in seconds
+            on_partial: Coroutine called with the partial results of a running query
+                whenever more results are available
 
         Returns:
             Query response when complete
@@ -567,8 +1178,11 @@ class CloudWatchHandler:
             f'Polling for CloudWatch Logs query results (query_id: {query_id})',
         )
 
+        partial_count = 0
         while attempts < max_attempts:
-            query_response = logs_client.get_query_results(queryId=query_id)
+            query_response = await asyncio.to_thread(
+                logs_client.get_query_results, queryId=query_id
+            )
             status = query_response.get('status')
 
             if status == 'Complete':
@@ -589,6 +1203,12 @@ class CloudWatchHandler:
                 log_with_request_id(ctx, LogLevel.ERROR, error_message)
                 raise Exception(error_message)
 
+            # Report partial results of a running query as they arrive
+            results = query_response.get('results') or []
+            if on_partial is not None and len(results) > partial_count:
+                partial_count = len(results)
+                await on_partial(results)
+
             # Log progress periodically
             if attempts % 5 == 0:
                 log_with_request_id(
@@ -598,7 +1218,7 @@ class CloudWatchHandler:
                 )
 
             # Sleep with exponential backoff (capped at 5 seconds)
-            time.sleep(min(delay, 5))
+            await asyncio.sleep(min(delay, 5))
             delay = min(delay * 1.5, 5)  # Exponential backoff with a cap
             attempts += 1
 
@@ -19,6 +19,37 @@ from loguru import logger
 from typing import Any, Dict, List, Optional
 
 
+# Accept header asking the API server to return only object metadata in list responses,
+# falling back to full objects on servers that do not support it
+PARTIAL_OBJECT_METADATA_LIST_ACCEPT = (
+    'application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json'
+)
+
+
+def event_summary(event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the fields reported for an event.
+
+    Args:
+        event_dict: Event object as a dictionary with camelCase field names
+
+    Returns:
+        Dictionary with the timestamps, count, message, reason, reporting component and type
+    """
+    first_timestamp = event_dict.get('firstTimestamp')
+    last_timestamp = event_dict.get('lastTimestamp')
+    source = event_dict.get('source') or {}
+
+    return {
+        'first_timestamp': str(first_timestamp) if first_timestamp else None,
+        'last_timestamp': str(last_timestamp) if last_timestamp else None,
+        'count': event_dict.get('count'),
+        'message': event_dict.get('message', ''),
+        'reason': event_dict.get('reason'),
+        'reporting_component': source.get('component'),
+        'type': event_dict.get('type'),
+    }
+
+
 class K8sApis:
     """Class for managing Kubernetes API client.
 
@@ -202,6 +233,9 @@ class K8sApis:
         namespace: Optional[str] = None,
         label_selector: Optional[str] = None,
         field_selector: Optional[str] = None,
+        limit: Optional[int] = None,
+        continue_token: Optional[str] = None,
+        metadata_only: bool = False,
         **kwargs,
     ) -> Any:
         """List Kubernetes resources of a specific kind using dynamic client.
@@ -212,10 +246,15 @@ class K8sApis:
             namespace: Namespace to list resources from (optional)
             label_selector: Label selector to filter resources (optional)
             field_selector: Field selector to filter resources (optional)
+            limit: Maximum number of resources to return in one page (optional)
+            continue_token: Continue token from a previous page to resume listing (optional)
+            metadata_only: Whether to fetch only object metadata (PartialObjectMetadataList)
+                instead of full objects (default: False)
             **kwargs: Additional arguments for the API call
 
         Returns:
-            The API response containing the list of resources
+            The API response containing the list of resources. For paged listings, the
+            continue token of the next page is available in metadata['continue'].
         """
         try:
             # Get the API resource
@@ -227,6 +266,12 @@ class K8sApis:
                 list_kwargs['label_selector'] = label_selector
             if field_selector:
                 list_kwargs['field_selector'] = field_selector
+            if limit:
+                list_kwargs['limit'] = limit
+            if continue_token:
+                list_kwargs['_continue'] = continue_token
+            if metadata_only:
+                list_kwargs['header_params'] = {'Accept': PARTIAL_OBJECT_METADATA_LIST_ACCEPT}
 
             # Add any additional kwargs
             list_kwargs.update(kwargs)
@@ -354,30 +399,8 @@ class K8sApis:
             else:
                 events_response = event_resource.get(field_selector=field_selector)
 
-            # Process events
-            result = []
-            for event in events_response.items:
-                # Dynamic client resources always have to_dict()
-                event_dict = event.to_dict()
-
-                # Extract relevant fields and handle camelCase field names
-                first_timestamp = event_dict.get('firstTimestamp')
-                last_timestamp = event_dict.get('lastTimestamp')
-                source = event_dict.get('source', {})
-
-                result.append(
-                    {
-                        'first_timestamp': str(first_timestamp) if first_timestamp else None,
-                        'last_timestamp': str(last_timestamp) if last_timestamp else None,
-                        'count': event_dict.get('count'),
-                        'message': event_dict.get('message', ''),
-                        'reason': event_dict.get('reason'),
-                        'reporting_component': source.get('component'),
-                        'type': event_dict.get('type'),
-                    }
-                )
-
-            return result
+            # Process events; dynamic client resources always have to_dict()
+            return [event_summary(event.to_dict()) for event in events_response.items]
 
         except Exception as e:
             # Re-raise with more context
@@ -13,8 +13,9 @@
 
 import os
 import yaml
-from awslabs.eks_mcp_server.k8s_apis import K8sApis
+from awslabs.eks_mcp_server.k8s_apis import K8sApis, event_summary
 from awslabs.eks_mcp_server.k8s_client_cache import K8sClientCache
+from awslabs.eks_mcp_server.k8s_informer import Informer, InformerManager
 from awslabs.eks_mcp_server.logging_helper import LogLevel, log_with_request_id
 from awslabs.eks_mcp_server.models import (
     ApiVersionsResponse,
@@ -28,6 +29,7 @@ from awslabs.eks_mcp_server.models import (
     PodLogsResponse,
     ResourceSummary,
 )
+from loguru import logger
 from mcp.server.fastmcp import Context
 from mcp.types import TextContent
 from pydantic import Field
@@ -46,6 +48,7 @@ class K8sHandler:
         mcp,
         allow_write: bool = False,
         allow_sensitive_data_access: bool = False,
+        enable_informer_cache: bool = False,
     ):
         """Initialize the Kubernetes handler.
 
@@ -53,11 +56,14 @@ class K8sHandler:
             mcp: The MCP server instance
             allow_write: Whether to enable write access (default: False)
             allow_sensitive_data_access: Whether to allow access to sensitive data (default: False)
+            enable_informer_cache: Whether to serve reads of frequently polled kinds from
+                watch-backed informers (default: False)
         """
         self.mcp = mcp
         self.client_cache = K8sClientCache()
         self.allow_write = allow_write
         self.allow_sensitive_data_access = allow_sensitive_data_access
+        self.informers = InformerManager(self.client_cache) if enable_informer_cache else None
 
         # Register tools
         self.mcp.tool(name='list_k8s_resources')(self.list_k8s_resources)
@@ -83,6 +89,25 @@ class K8sHandler:
         """
         return self.client_cache.get_client(cluster_name)
 
+    def get_informer(self, cluster_name: str, api_version: str, kind: str) -> Optional[Informer]:
+        """Get a synced informer for a kind when the informer cache is enabled.
+
+        Args:
+            cluster_name: Name of the EKS cluster
+            api_version: API version of the kind
+            kind: Kind of the resources
+
+        Returns:
+            The informer, or None if reads of the kind should go to the API server
+        """
+        if self.informers is None:
+            return None
+        try:
+            return self.informers.get_informer(cluster_name, api_version, kind)
+        except Exception as e:
+            logger.warning(f'Informer cache unavailable for {kind}: {str(e)}')
+            return None
+
     async def apply_yaml(
         self,
         ctx: Context,
@@ -285,6 +310,34 @@ class K8sHandler:
         # Then filter out null values
         return self.filter_null_values(resource)
 
+    def _resource_summary(self, item: Any) -> ResourceSummary:
+        """Build a resource summary from the metadata of a listed item.
+
+        Args:
+            item: Item of a list response, either a full object or a PartialObjectMetadata,
+                or an object dictionary from the informer cache
+
+        Returns:
+            ResourceSummary of the item
+        """
+        if isinstance(item, dict):
+            metadata = item.get('metadata') or {}
+        else:
+            metadata = item.metadata.to_dict()
+
+        # Dynamic client uses camelCase field names
+        creation_timestamp = metadata.get('creationTimestamp')
+        if creation_timestamp is not None:
+            creation_timestamp = str(creation_timestamp)
+
+        return ResourceSummary(
+            name=metadata.get('name') or '',
+            namespace=metadata.get('namespace'),
+            creation_timestamp=creation_timestamp,
+            labels=metadata.get('labels') or None,
+            annotations=metadata.get('annotations') or None,
+        )
+
     async def manage_k8s_resource(
         self,
         ctx: Context,
@@ -420,18 +473,45 @@ class K8sHandler:
                     resource=None,
                 )
 
-            # Get Kubernetes client for the cluster
-            k8s_client = self.get_client(cluster_name)
+            # Serve reads from the informer cache when the object is cached
+            cached_resource = None
+            if operation_enum == Operation.READ:
+                informer = self.get_informer(cluster_name, api_version, kind)
+                if informer is not None:
+                    cached_resource = informer.get(namespace, name or '')
+
+            # resourceVersion of the cached object before a write, to detect later watch events
+            write_informer = None
+            previous_resource_version = None
+            if self.informers is not None and operation_enum != Operation.READ:
+                write_informer = self.informers.peek(cluster_name, api_version, kind)
+                if write_informer is not None:
+                    previous_resource_version = write_informer.resource_version_of(
+                        namespace, name or ''
+                    )
 
-            # Call the manage_resource method
-            response = k8s_client.manage_resource(
-                operation_enum,
-                kind,
-                api_version,
-                name=name,
-                namespace=namespace,
-                body=body,
-            )
+            if cached_resource is not None:
+                response = None
+            else:
+                # Get Kubernetes client for the cluster
+                k8s_client = self.get_client(cluster_name)
+
+                # Call the manage_resource method
+                response = k8s_client.manage_resource(
+                    operation_enum,
+                    kind,
+                    api_version,
+                    name=name,
+                    namespace=namespace,
+                    body=body,
+                )
+
+            # Make writes visible to cached reads before their watch events arrive
+            if write_informer is not None:
+                if operation_enum == Operation.DELETE:
+                    write_informer.remove(namespace, name or '')
+                else:
+                    write_informer.apply(response.to_dict(), previous_resource_version)
 
             # Format resource name for logging
             resource_name = f'{namespace + "/" if namespace else ""}{name}'
@@ -452,7 +532,9 @@ class K8sHandler:
             # For read operation, convert response to dict and clean up the response
             resource_data = None
             if operation_enum == Operation.READ:
-                resource_data = self.cleanup_resource_response(response.to_dict())
+                resource_data = self.cleanup_resource_response(
+                    cached_resource if cached_resource is not None else response.to_dict()
+                )
                 log_with_request_id(
                     ctx,
                     LogLevel.INFO,
@@ -525,6 +607,17 @@ class K8sHandler:
             description="""Field selector to filter resources (e.g., 'metadata.name=my-pod,status.phase=Running').
             Uses the same syntax as kubectl's --field-selector flag.""",
         ),
+        limit: Optional[int] = Field(
+            None,
+            description="""Maximum number of resources to return in one page (e.g., 500).
+            If not provided, all matching resources are returned.""",
+            ge=1,
+        ),
+        continue_token: Optional[str] = Field(
+            None,
+            description="""Continue token returned by a previous call to fetch the next page of resources.
+            Must be used with the same kind, namespace, and selectors as the previous call.""",
+        ),
     ) -> KubernetesResourceListResponse:
         """List Kubernetes resources of a specific kind.
 
@@ -536,13 +629,15 @@ class K8sHandler:
 
         ## Response Information
         The response includes a summary of each resource with name, namespace, creation timestamp,
-        labels, and annotations.
+        labels, and annotations. When a limit is set and more resources remain, the response
+        includes a continue_token to fetch the next page.
 
         ## Usage Tips
         - Use the list_api_versions tool first to find available API versions
         - For non-namespaced resources (like Nodes), the namespace parameter is ignored
         - Combine label and field selectors for more precise filtering
         - Results are summarized to avoid overwhelming responses
+        - Use limit and continue_token to page through large result sets (e.g., thousands of pods)
 
         Args:
             ctx: MCP context
@@ -552,46 +647,62 @@ class K8sHandler:
             namespace: Namespace of the Kubernetes resources (optional)
             label_selector: Label selector to filter resources (optional)
             field_selector: Field selector to filter resources (optional)
+            limit: Maximum number of resources to return in one page (optional)
+            continue_token: Continue token from a previous call to fetch the next page (optional)
 
         Returns:
             KubernetesResourceListResponse with operation result
         """
         try:
-            # Get Kubernetes client for the cluster
-            k8s_client = self.get_client(cluster_name)
+            # Unpaged lists of cached kinds are served from the informer cache
+            cached_items = None
+            if not isinstance(limit, int) and not isinstance(continue_token, str):
+                informer = self.get_informer(cluster_name, api_version, kind)
+                if informer is not None:
+                    try:
+                        cached_items = informer.list(
+                            namespace=namespace if isinstance(namespace, str) else None,
+                            label_selector=label_selector
+                            if isinstance(label_selector, str)
+                            else None,
+                            field_selector=field_selector
+                            if isinstance(field_selector, str)
+                            else None,
+                        )
+                    except ValueError:
+                        # Selector syntax the cache does not evaluate, let the API server do it
+                        cached_items = None
+
+            if cached_items is not None:
+                response = None
+                items: Any = cached_items
+            else:
+                # Get Kubernetes client for the cluster
+                k8s_client = self.get_client(cluster_name)
+
+                # List resources; only metadata is needed for the summaries, so ask the API
+                # server to leave out spec and status
+                response = k8s_client.list_resources(
+                    kind,
+                    api_version,
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    field_selector=field_selector,
+                    limit=limit,
+                    continue_token=continue_token,
+                    metadata_only=True,
+                )
+                items = response.items
 
-            # List resources
-            response = k8s_client.list_resources(
-                kind,
-                api_version,
-                namespace=namespace,
-                label_selector=label_selector,
-                field_selector=field_selector,
-            )
+            # Extract summaries directly from item metadata
+            summaries = [self._resource_summary(item) for item in items]
 
-            # Extract summaries from items and clean up the responses
-            summaries = []
-            for item in response.items:
-                item_dict = self.cleanup_resource_response(item.to_dict())
-                metadata = item_dict.get('metadata', {})
-
-                # Dynamic client uses camelCase field names
-                creation_timestamp = metadata.get('creationTimestamp')
-                if creation_timestamp is not None:
-                    creation_timestamp = str(creation_timestamp)
-
-                summary = ResourceSummary(
-                    name=metadata.get('name', ''),
-                    namespace=metadata.get('namespace'),
-                    creation_timestamp=creation_timestamp,
-                    labels=metadata.get('labels'),
-                    annotations=metadata.get('annotations'),
-                )
-                summaries.append(summary)
+            log_with_request_id(ctx, LogLevel.INFO, f'Summarized {kind} resources')
 
-            log_with_request_id(
-                ctx, LogLevel.INFO, f'Cleaned up resource responses for {kind} resources'
-            )
+            # Continue token and remaining count are only set when more pages remain
+            list_metadata = getattr(response, 'metadata', None) or {}
+            next_token = list_metadata.get('continue')
+            remaining_item_count = list_metadata.get('remainingItemCount')
 
             # Log success
             resource_location = f'in {namespace + "/" if namespace else ""}all namespaces'
@@ -599,20 +710,25 @@ class K8sHandler:
                 ctx, LogLevel.INFO, f'Listed {len(summaries)} {kind} resources {resource_location}'
             )
 
+            message = f'Successfully listed {len(summaries)} {kind} resources {resource_location}'
+            if isinstance(next_token, str) and next_token:
+                message += '. More resources are available, use continue_token to list them'
+            else:
+                next_token = None
+
             # Return success response
             return KubernetesResourceListResponse(
                 isError=False,
-                content=[
-                    TextContent(
-                        type='text',
-                        text=f'Successfully listed {len(summaries)} {kind} resources {resource_location}',
-                    )
-                ],
+                content=[TextContent(type='text', text=message)],
                 kind=kind,
                 api_version=api_version,
                 namespace=namespace,
                 count=len(summaries),
                 items=summaries,
+                continue_token=next_token,
+                remaining_item_count=remaining_item_count
+                if isinstance(remaining_item_count, int)
+                else None,
             )
 
         except Exception as e:
@@ -1039,15 +1155,25 @@ class K8sHandler:
             )
 
         try:
-            # Get Kubernetes client for the cluster
-            k8s_client = self.get_client(cluster_name)
+            # Serve events from the informer cache, which indexes them by involved object
+            informer = self.get_informer(cluster_name, 'v1', 'Event')
+            if informer is not None:
+                events = [
+                    event_summary(event)
+                    for event in informer.list(
+                        namespace=namespace, index=('involvedObject', f'{kind}/{name}')
+                    )
+                ]
+            else:
+                # Get Kubernetes client for the cluster
+                k8s_client = self.get_client(cluster_name)
 
-            # Get events
-            events = k8s_client.get_events(
-                kind=kind,
-                name=name,
-                namespace=namespace,
-            )
+                # Get events
+                events = k8s_client.get_events(
+                    kind=kind,
+                    name=name,
+                    namespace=namespace,
+                )
 
             # Format resource name for logging
             resource_name = f'{namespace + "/" if namespace else ""}{name}'
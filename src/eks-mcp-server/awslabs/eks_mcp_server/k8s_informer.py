@@ -0,0 +1,683 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Watch-backed informer cache for Kubernetes resources.
+
+An informer lists all objects of one kind in a cluster once, then keeps an in-memory copy
+up to date by watching for changes from the list's resourceVersion. Reads of frequently
+polled kinds are then served from memory instead of hitting the API server on every call.
+"""
+
+import copy
+import json
+import re
+import threading
+import time
+from awslabs.eks_mcp_server.k8s_apis import K8sApis
+from awslabs.eks_mcp_server.k8s_client_cache import K8sClientCache
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+from loguru import logger
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+
+# Kinds that are polled often and are cheap enough to mirror in memory. Secrets are left out
+# so that sensitive data is never held by the cache.
+DEFAULT_INFORMER_KINDS: FrozenSet[Tuple[str, str]] = frozenset(
+    {
+        ('v1', 'Pod'),
+        ('v1', 'Service'),
+        ('v1', 'Node'),
+        ('v1', 'Namespace'),
+        ('v1', 'Event'),
+        ('apps/v1', 'Deployment'),
+        ('apps/v1', 'ReplicaSet'),
+        ('apps/v1', 'StatefulSet'),
+        ('apps/v1', 'DaemonSet'),
+        ('batch/v1', 'Job'),
+    }
+)
+
+# Total size of the cached objects, measured as serialized JSON, across all informers
+DEFAULT_MEMORY_BUDGET_BYTES = 256 * 1024 * 1024
+
+# Informers that have not been read for this many seconds are stopped
+DEFAULT_IDLE_TIMEOUT = 10 * 60
+
+# Seconds before an informer whose watch failed is started again
+FAILED_RETRY_INTERVAL = 60
+
+# Page size of the initial list and server-side timeout of each watch request
+LIST_PAGE_SIZE = 500
+WATCH_TIMEOUT_SECONDS = 5 * 60
+
+# Consecutive watch connection errors tolerated before an informer gives up
+MAX_WATCH_ERRORS = 3
+
+HTTP_GONE = 410
+
+ObjectKey = Tuple[str, str]
+Indexer = Callable[[Dict[str, Any]], Optional[str]]
+
+_SET_REQUIREMENT = re.compile(r'^(\S+)\s+(in|notin)\s+\((.*)\)$')
+
+
+class MemoryBudgetExceeded(Exception):
+    """Raised when an informer grows beyond its memory budget."""
+
+
+def _split_selector(selector: str) -> List[str]:
+    """Split a selector into requirements on commas outside of parentheses."""
+    requirements = []
+    depth = 0
+    current = ''
+    for char in selector:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        if char == ',' and depth == 0:
+            requirements.append(current.strip())
+            current = ''
+        else:
+            current += char
+    requirements.append(current.strip())
+    return [requirement for requirement in requirements if requirement]
+
+
+def _split_equality(requirement: str) -> Tuple[str, str, str]:
+    """Split an equality requirement into key, operator and value.
+
+    Raises:
+        ValueError: If the requirement is not an equality requirement
+    """
+    for operator in ('!=', '==', '='):
+        if operator in requirement:
+            key, value = requirement.split(operator, 1)
+            return key.strip(), operator, value.strip()
+    raise ValueError(f'Unsupported selector requirement: {requirement}')
+
+
+def compile_label_selector(selector: Optional[str]) -> Callable[[Dict[str, str]], bool]:
+    """Compile a label selector into a predicate over object labels.
+
+    Supports the equality-based (=, ==, !=) and set-based (in, notin, exists, !exists)
+    requirements understood by the Kubernetes API server.
+
+    Args:
+        selector: Label selector (e.g., 'app=nginx,tier in (frontend,web)')
+
+    Returns:
+        Function returning whether a set of labels matches the selector
+
+    Raises:
+        ValueError: If the selector uses syntax that is not supported
+    """
+    checks: List[Callable[[Dict[str, str]], bool]] = []
+    for requirement in _split_selector(selector or ''):
+        set_match = _SET_REQUIREMENT.match(requirement)
+        if set_match:
+            key, operator, values = set_match.groups()
+            allowed = {value.strip() for value in values.split(',') if value.strip()}
+            if operator == 'in':
+                checks.append(lambda labels, k=key, a=allowed: labels.get(k) in a)
+            else:
+                checks.append(lambda labels, k=key, a=allowed: labels.get(k) not in a)
+        elif requirement.startswith('!'):
+            key = requirement[1:].strip()
+            checks.append(lambda labels, k=key: k not in labels)
+        elif any(operator in requirement for operator in ('=', '<', '>')):
+            key, operator, value = _split_equality(requirement)
+            if operator == '!=':
+                checks.append(lambda labels, k=key, v=value: labels.get(k) != v)
+            else:
+                checks.append(lambda labels, k=key, v=value: labels.get(k) == v)
+        else:
+            checks.append(lambda labels, k=requirement: k in labels)
+    return lambda labels: all(check(labels) for check in checks)
+
+
+def _field_value(obj: Dict[str, Any], path: str) -> str:
+    """Get the value of a dotted field path as the string the API server compares."""
+    value: Any = obj
+    for part in path.split('.'):
+        if not isinstance(value, dict):
+            return ''
+        value = value.get(part)
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+def compile_field_selector(selector: Optional[str]) -> Callable[[Dict[str, Any]], bool]:
+    """Compile a field selector into a predicate over objects.
+
+    Args:
+        selector: Field selector (e.g., 'status.phase=Running,spec.nodeName!=node-1')
+
+    Returns:
+        Function returning whether an object matches the selector
+
+    Raises:
+        ValueError: If the selector uses syntax that is not supported
+    """
+    checks: List[Callable[[Dict[str, Any]], bool]] = []
+    for requirement in _split_selector(selector or ''):
+        path, operator, value = _split_equality(requirement)
+        if operator == '!=':
+            checks.append(lambda obj, p=path, v=value: _field_value(obj, p) != v)
+        else:
+            checks.append(lambda obj, p=path, v=value: _field_value(obj, p) == v)
+    return lambda obj: all(check(obj) for check in checks)
+
+
+def involved_object_index(event: Dict[str, Any]) -> Optional[str]:
+    """Index events by the kind and name of the object they are about."""
+    involved_object = event.get('involvedObject') or {}
+    return f'{involved_object.get("kind")}/{involved_object.get("name")}'
+
+
+# Secondary indexes maintained for specific kinds, in addition to the namespace index
+KIND_INDEXERS: Dict[Tuple[str, str], Dict[str, Indexer]] = {
+    ('v1', 'Event'): {'involvedObject': involved_object_index},
+}
+
+
+def _is_newer(resource_version: Optional[str], other: Optional[str]) -> bool:
+    """Check whether a resourceVersion is newer than another one.
+
+    resourceVersions are opaque, but the API server backed by etcd uses increasing integers,
+    so versions that are not integers are never considered newer.
+    """
+    try:
+        return int(resource_version) > int(other)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return False
+
+
+class Informer:
+    """In-memory mirror of all objects of one kind in a cluster, kept current by a watch.
+
+    The informer runs a background thread that lists the objects, then watches for
+    changes from the resourceVersion of the list, reconnecting from the last seen
+    resourceVersion whenever a watch request ends and listing again when that
+    resourceVersion has expired (HTTP 410 Gone).
+    """
+
+    def __init__(
+        self,
+        client: K8sApis,
+        api_version: str,
+        kind: str,
+        indexers: Optional[Dict[str, Indexer]] = None,
+        max_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES,
+    ):
+        """Initialize the informer.
+
+        Args:
+            client: Kubernetes client of the cluster
+            api_version: API version of the watched kind (e.g., 'v1', 'apps/v1')
+            kind: Watched kind (e.g., 'Pod')
+            indexers: Secondary indexes, mapping index names to functions computing the
+                index value of an object
+            max_bytes: Maximum size of the cached objects before the informer gives up
+        """
+        self.client = client
+        self.api_version = api_version
+        self.kind = kind
+        self.indexers = indexers or {}
+        self.max_bytes = max_bytes
+
+        self.resource_version: Optional[str] = None
+        self.size_bytes = 0
+        self.last_access = time.monotonic()
+        self.error: Optional[str] = None
+        self.failed_at: Optional[float] = None
+
+        self._objects: Dict[ObjectKey, Dict[str, Any]] = {}
+        self._sizes: Dict[ObjectKey, int] = {}
+        self._indices: Dict[str, Dict[str, Set[ObjectKey]]] = {}
+        self._namespaced = True
+        self._lock = threading.RLock()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._watcher: Optional[watch.Watch] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def synced(self) -> bool:
+        """Whether the initial list has completed and the informer is healthy."""
+        return self._synced.is_set() and self.failed_at is None
+
+    @property
+    def failed(self) -> bool:
+        """Whether the informer stopped because of an error."""
+        return self.failed_at is not None
+
+    def start(self) -> None:
+        """Start listing and watching in a background thread."""
+        self._thread = threading.Thread(
+            target=self._run, name=f'informer-{self.api_version}-{self.kind}', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching and drop the cached objects."""
+        self._stopped.set()
+        watcher = self._watcher
+        if watcher is not None:
+            watcher.stop()
+        with self._lock:
+            self._replace({}, {})
+        self._synced.clear()
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the initial list has completed.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            Whether the informer is synced
+        """
+        if timeout:
+            self._synced.wait(timeout)
+        return self.synced
+
+    def touch(self) -> None:
+        """Record that the informer was read."""
+        self.last_access = time.monotonic()
+
+    def _key(self, namespace: Optional[str], name: Optional[str]) -> ObjectKey:
+        """Build the store key of an object."""
+        return (namespace or '') if self._namespaced else '', name or ''
+
+    def _object_key(self, obj: Dict[str, Any]) -> ObjectKey:
+        """Build the store key of an object from its metadata."""
+        metadata = obj.get('metadata') or {}
+        return self._key(metadata.get('namespace'), metadata.get('name'))
+
+    def _index_values(self, obj: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        """Compute the secondary index values of an object."""
+        values = {'namespace': (obj.get('metadata') or {}).get('namespace') or ''}
+        for index_name, indexer in self.indexers.items():
+            values[index_name] = indexer(obj)
+        return values
+
+    def _add_to_indices(self, key: ObjectKey, obj: Dict[str, Any]) -> None:
+        """Add an object to the secondary indexes."""
+        for index_name, value in self._index_values(obj).items():
+            if value is not None:
+                self._indices.setdefault(index_name, {}).setdefault(value, set()).add(key)
+
+    def _remove_from_indices(self, key: ObjectKey, obj: Dict[str, Any]) -> None:
+        """Remove an object from the secondary indexes."""
+        for index_name, value in self._index_values(obj).items():
+            keys = self._indices.get(index_name, {}).get(value) if value is not None else None
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._indices[index_name][value]
+
+    def _normalize(self, obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in the kind and apiVersion, which list and watch responses may omit."""
+        obj.setdefault('apiVersion', self.api_version)
+        obj.setdefault('kind', self.kind)
+        return obj
+
+    def _replace(
+        self, objects: Dict[ObjectKey, Dict[str, Any]], sizes: Dict[ObjectKey, int]
+    ) -> None:
+        """Replace the whole store, e.g., with the result of a list."""
+        self._objects = objects
+        self._sizes = sizes
+        self._indices = {}
+        self.size_bytes = sum(sizes.values())
+        for key, obj in objects.items():
+            self._add_to_indices(key, obj)
+
+    def _upsert(self, key: ObjectKey, obj: Dict[str, Any]) -> None:
+        """Add or update an object in the store."""
+        self._delete(key)
+        size = len(json.dumps(obj, default=str))
+        if self.size_bytes + size > self.max_bytes:
+            raise MemoryBudgetExceeded(
+                f'{self.kind} objects exceed the informer memory budget of {self.max_bytes} bytes'
+            )
+        self._objects[key] = obj
+        self._sizes[key] = size
+        self.size_bytes += size
+        self._add_to_indices(key, obj)
+
+    def _delete(self, key: ObjectKey) -> None:
+        """Remove an object from the store if present."""
+        obj = self._objects.pop(key, None)
+        if obj is not None:
+            self.size_bytes -= self._sizes.pop(key, 0)
+            self._remove_from_indices(key, obj)
+
+    def resource_version_of(self, namespace: Optional[str], name: str) -> Optional[str]:
+        """Get the resourceVersion of a cached object.
+
+        Args:
+            namespace: Namespace of the object, ignored for cluster-scoped kinds
+            name: Name of the object
+
+        Returns:
+            The resourceVersion, or None if the object is not cached
+        """
+        with self._lock:
+            obj = self._objects.get(self._key(namespace, name))
+            return (obj.get('metadata') or {}).get('resourceVersion') if obj is not None else None
+
+    def apply(self, obj: Dict[str, Any], previous_resource_version: Optional[str] = None) -> None:
+        """Record the result of a write so that it is visible before its watch event arrives.
+
+        The result is ignored when a watch event changed the cached object since the write
+        started, as that event is at least as recent as the write, or when the cached object
+        is newer than the result.
+
+        Args:
+            obj: Object returned by the API server for a create, replace or patch
+            previous_resource_version: resourceVersion of the cached object when the write
+                started, None if it was not cached
+        """
+        if not self.synced:
+            return
+        with self._lock:
+            key = self._object_key(obj)
+            cached = self._objects.get(key)
+            cached_version = (
+                (cached.get('metadata') or {}).get('resourceVersion')
+                if cached is not None
+                else None
+            )
+            written_version = (obj.get('metadata') or {}).get('resourceVersion')
+            if cached_version != previous_resource_version or _is_newer(
+                cached_version, written_version
+            ):
+                return
+            try:
+                self._upsert(key, self._normalize(copy.deepcopy(obj)))
+            except MemoryBudgetExceeded as e:
+                self._fail(str(e))
+
+    def remove(self, namespace: Optional[str], name: str) -> None:
+        """Forget a deleted object so that it is not read before its watch event arrives.
+
+        Args:
+            namespace: Namespace of the object, ignored for cluster-scoped kinds
+            name: Name of the object
+        """
+        with self._lock:
+            self._delete(self._key(namespace, name))
+
+    def get(self, namespace: Optional[str], name: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of a cached object.
+
+        Args:
+            namespace: Namespace of the object, ignored for cluster-scoped kinds
+            name: Name of the object
+
+        Returns:
+            The object, or None if it is not cached
+        """
+        self.touch()
+        with self._lock:
+            obj = self._objects.get(self._key(namespace, name))
+            return copy.deepcopy(obj) if obj is not None else None
+
+    def list(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        index: Optional[Tuple[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """List copies of cached objects, sorted by namespace and name like the API server.
+
+        Args:
+            namespace: Only list objects in this namespace
+            label_selector: Only list objects matching this label selector
+            field_selector: Only list objects matching this field selector
+            index: Only list objects with this (index name, index value)
+
+        Returns:
+            Matching objects
+
+        Raises:
+            ValueError: If a selector uses syntax that is not supported
+        """
+        label_matches = compile_label_selector(label_selector)
+        field_matches = compile_field_selector(field_selector)
+        self.touch()
+        with self._lock:
+            if index is not None:
+                keys: Any = self._indices.get(index[0], {}).get(index[1], set())
+            else:
+                keys = self._objects.keys()
+            if namespace and self._namespaced:
+                keys = [key for key in keys if key[0] == namespace]
+            matches = [
+                self._objects[key]
+                for key in sorted(keys)
+                if label_matches((self._objects[key].get('metadata') or {}).get('labels') or {})
+                and field_matches(self._objects[key])
+            ]
+            return copy.deepcopy(matches)
+
+    def _fail(self, error: str) -> None:
+        """Stop the informer after an error it cannot recover from."""
+        logger.warning(f'Stopping {self.kind} informer: {error}')
+        self.error = error
+        self.failed_at = time.monotonic()
+        self.stop()
+
+    def _run(self) -> None:
+        """List and watch until stopped."""
+        try:
+            resource = self.client.dynamic_client.resources.get(
+                api_version=self.api_version, kind=self.kind
+            )
+            watch_errors = 0
+            while not self._stopped.is_set():
+                try:
+                    if self.resource_version is None:
+                        self._list(resource)
+                    self._watch(resource)
+                    watch_errors = 0
+                except ApiException as e:
+                    if e.status != HTTP_GONE:
+                        raise
+                    # The resourceVersion is too old to resume from, so list again
+                    logger.info(f'{self.kind} watch expired, listing again')
+                    self.resource_version = None
+                except (MemoryBudgetExceeded, ValueError):
+                    raise
+                except Exception as e:
+                    watch_errors += 1
+                    if watch_errors >= MAX_WATCH_ERRORS:
+                        raise
+                    logger.info(f'{self.kind} watch interrupted, reconnecting: {str(e)}')
+                    self._stopped.wait(watch_errors)
+        except Exception as e:
+            if not self._stopped.is_set():
+                self._fail(str(e))
+
+    def _list(self, resource: Any) -> None:
+        """List all objects page by page and replace the store with them."""
+        self._namespaced = bool(resource.namespaced)
+        objects: Dict[ObjectKey, Dict[str, Any]] = {}
+        sizes: Dict[ObjectKey, int] = {}
+        size = 0
+        continue_token = None
+        while True:
+            response = resource.get(
+                limit=LIST_PAGE_SIZE, _continue=continue_token, serialize=False
+            )
+            data = json.loads(response.data)
+            for item in data.get('items') or []:
+                obj = self._normalize(item)
+                key = self._object_key(obj)
+                sizes[key] = len(json.dumps(obj, default=str))
+                size += sizes[key]
+                if size > self.max_bytes:
+                    raise MemoryBudgetExceeded(
+                        f'{self.kind} objects exceed the informer memory budget of '
+                        f'{self.max_bytes} bytes'
+                    )
+                objects[key] = obj
+            metadata = data.get('metadata') or {}
+            continue_token = metadata.get('continue')
+            if not continue_token:
+                break
+
+        with self._lock:
+            self._replace(objects, sizes)
+            self.resource_version = metadata.get('resourceVersion')
+        self._synced.set()
+        logger.info(f'Synced {len(objects)} {self.kind} objects into the informer cache')
+
+    def _watch(self, resource: Any) -> None:
+        """Apply watch events to the store until the watch request ends."""
+        self._watcher = watch.Watch()
+        for event in self.client.dynamic_client.watch(
+            resource,
+            resource_version=self.resource_version,
+            timeout=WATCH_TIMEOUT_SECONDS,
+            watcher=self._watcher,
+            allow_watch_bookmarks=True,
+        ):
+            if self._stopped.is_set():
+                break
+            obj = event['raw_object']
+            with self._lock:
+                if event['type'] in ('ADDED', 'MODIFIED'):
+                    obj = self._normalize(obj)
+                    self._upsert(self._object_key(obj), obj)
+                elif event['type'] == 'DELETED':
+                    self._delete(self._object_key(obj))
+                resource_version = (obj.get('metadata') or {}).get('resourceVersion')
+                if resource_version:
+                    self.resource_version = resource_version
+
+
+class InformerManager:
+    """Registry of informers per cluster and kind, bounded by a memory budget.
+
+    Informers are tied to the clients of the K8sClientCache: when the cache hands out a new
+    client for a cluster (e.g., after the authentication token expired), the informers
+    using the old client are replaced. Informers that have not been read for a while are
+    stopped, and the least recently read informers are stopped while the cached objects
+    exceed the memory budget.
+    """
+
+    def __init__(
+        self,
+        client_cache: K8sClientCache,
+        kinds: FrozenSet[Tuple[str, str]] = DEFAULT_INFORMER_KINDS,
+        memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        sync_timeout: float = 0,
+    ):
+        """Initialize the informer manager.
+
+        Args:
+            client_cache: Cache providing the Kubernetes clients
+            kinds: (API version, kind) pairs served from informers
+            memory_budget_bytes: Maximum total size of the cached objects
+            idle_timeout: Seconds after which an unread informer is stopped
+            sync_timeout: Seconds a read waits for a new informer to sync before falling
+                back to the API server
+        """
+        self.client_cache = client_cache
+        self.kinds = kinds
+        self.memory_budget_bytes = memory_budget_bytes
+        self.idle_timeout = idle_timeout
+        self.sync_timeout = sync_timeout
+        self._informers: Dict[Tuple[str, str, str], Informer] = {}
+        self._lock = threading.Lock()
+
+    def _evict(self) -> None:
+        """Stop idle informers, then the least recently read ones while over budget."""
+        now = time.monotonic()
+        with self._lock:
+            for key, informer in list(self._informers.items()):
+                if now - informer.last_access > self.idle_timeout:
+                    logger.info(f'Stopping idle {informer.kind} informer for cluster {key[0]}')
+                    informer.stop()
+                    del self._informers[key]
+
+            by_last_access = sorted(self._informers.items(), key=lambda item: item[1].last_access)
+            total = sum(informer.size_bytes for informer in self._informers.values())
+            for key, informer in by_last_access:
+                if total <= self.memory_budget_bytes:
+                    break
+                logger.info(f'Stopping {informer.kind} informer for cluster {key[0]} over budget')
+                total -= informer.size_bytes
+                informer.stop()
+                del self._informers[key]
+
+    def peek(self, cluster_name: str, api_version: str, kind: str) -> Optional[Informer]:
+        """Get the informer of a kind if it is running and synced, without starting one."""
+        informer = self._informers.get((cluster_name, api_version, kind))
+        return informer if informer is not None and informer.synced else None
+
+    def get_informer(self, cluster_name: str, api_version: str, kind: str) -> Optional[Informer]:
+        """Get a synced informer for a kind, starting one if needed.
+
+        Args:
+            cluster_name: Name of the EKS cluster
+            api_version: API version of the kind (e.g., 'v1')
+            kind: Kind of the resources (e.g., 'Pod')
+
+        Returns:
+            The informer, or None if the kind is not cached or its informer is not synced
+            yet, in which case the caller should read from the API server
+        """
+        if (api_version, kind) not in self.kinds:
+            return None
+
+        self._evict()
+        client = self.client_cache.get_client(cluster_name)
+        key = (cluster_name, api_version, kind)
+        with self._lock:
+            informer = self._informers.get(key)
+            if informer is not None and informer.client is not client:
+                # The client was refreshed, so the watch is using an expired token
+                informer.stop()
+                informer = None
+            elif informer is not None and informer.failed:
+                if time.monotonic() - (informer.failed_at or 0) < FAILED_RETRY_INTERVAL:
+                    return None
+                informer = None
+            if informer is None:
+                informer = Informer(
+                    client,
+                    api_version,
+                    kind,
+                    indexers=KIND_INDEXERS.get((api_version, kind)),
+                    max_bytes=self.memory_budget_bytes,
+                )
+                self._informers[key] = informer
+                informer.start()
+
+        informer.touch()
+        return informer if informer.wait_for_sync(self.sync_timeout) else None
+
+    def stop_all(self) -> None:
+        """Stop every informer."""
+        with self._lock:
+            for informer in self._informers.values():
+                informer.stop()
+            self._informers.clear()
@@ -94,6 +94,13 @@ class KubernetesResourceListResponse(CallToolResult):
     namespace: Optional[str] = Field(None, description='Namespace of the Kubernetes resources')
     count: int = Field(..., description='Number of resources found')
     items: List[ResourceSummary] = Field(..., description='List of resources')
+    continue_token: Optional[str] = Field(
+        None,
+        description='Token to pass as continue_token to list the next page, if more resources remain',
+    )
+    remaining_item_count: Optional[int] = Field(
+        None, description='Approximate number of resources remaining after this page'
+    )
 
 
 class ApiVersionsResponse(CallToolResult):
@@ -163,6 +170,31 @@ class CloudWatchLogsResponse(CallToolResult):
     )
 
 
+class CloudWatchMultiLogsResponse(CallToolResult):
+    """Response model for get_cloudwatch_logs_multi tool.
+
+    This model contains the merged results of CloudWatch logs queries for several
+    resources and log types, newest first.
+    """
+
+    resource_type: str = Field(..., description='Resource type (pod, node, container)')
+    resource_names: List[str] = Field(..., description='Resource names')
+    cluster_name: str = Field(..., description='Name of the EKS cluster')
+    log_types: List[str] = Field(
+        ..., description='Log types (application, host, performance, control-plane, or custom)'
+    )
+    log_groups: List[str] = Field(..., description='CloudWatch log group names')
+    start_time: str = Field(..., description='Start time in ISO format')
+    end_time: str = Field(..., description='End time in ISO format')
+    log_entries: List[Dict[str, Any]] = Field(
+        ...,
+        description='Log entries with timestamps, messages, and the resource name and log group they came from',
+    )
+    failed_queries: List[str] = Field(
+        default_factory=list, description='Queries that failed, with their errors'
+    )
+
+
 class CloudWatchDataPoint(BaseModel):
     """Model for a CloudWatch metric data point.
 
@@ -193,6 +225,46 @@ class CloudWatchMetricsResponse(CallToolResult):
     )
 
 
+class MetricBucket(BaseModel):
+    """Model for a downsampled CloudWatch metric data point.
+
+    This model summarizes the raw data points of a metric series that fall into one time
+    bucket.
+    """
+
+    timestamp: str = Field(..., description='Start of the bucket in ISO format')
+    min: float = Field(..., description='Lowest raw value in the bucket')
+    max: float = Field(..., description='Highest raw value in the bucket')
+    avg: float = Field(..., description='Mean of the raw values in the bucket')
+    count: int = Field(..., description='Number of raw data points in the bucket')
+
+
+class MetricSeries(BaseModel):
+    """Model for a downsampled CloudWatch metric series of one resource."""
+
+    resource_name: str = Field(..., description='Resource name')
+    metric_name: str = Field(..., description='Metric name')
+    status_code: str = Field(
+        ..., description='GetMetricData status of the series (Complete, PartialData, ...)'
+    )
+    data_points: List[MetricBucket] = Field(..., description='Downsampled data points')
+
+
+class CloudWatchBulkMetricsResponse(CallToolResult):
+    """Response model for get_cloudwatch_metrics_bulk tool.
+
+    This model contains downsampled metric series for several resources and metrics.
+    """
+
+    resource_type: str = Field(..., description='Resource type (pod, node, container, cluster)')
+    cluster_name: str = Field(..., description='Name of the EKS cluster')
+    namespace: str = Field(..., description='CloudWatch namespace (e.g., ContainerInsights)')
+    start_time: str = Field(..., description='Start time in ISO format')
+    end_time: str = Field(..., description='End time in ISO format')
+    bucket_seconds: int = Field(..., description='Width of the downsampling buckets in seconds')
+    series: List[MetricSeries] = Field(..., description='Metric series per resource and metric')
+
+
 class StackSummary(BaseModel):
     """Summary of a CloudFormation stack."""
 
@@ -115,11 +115,18 @@ def main():
         default=False,
         help='Enable sensitive data access (required for reading logs, events, and Kubernetes Secrets)',
     )
+    parser.add_argument(
+        '--enable-informer-cache',
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help='Serve reads of frequently polled Kubernetes kinds from watch-backed in-memory caches',
+    )
 
     args = parser.parse_args()
 
     allow_write = args.allow_write
     allow_sensitive_data_access = args.allow_sensitive_data_access
+    enable_informer_cache = args.enable_informer_cache
 
     # Log startup mode
     mode_info = []
@@ -138,7 +145,7 @@ def main():
     CloudWatchHandler(mcp, allow_sensitive_data_access)
     EKSKnowledgeBaseHandler(mcp)
     EksStackHandler(mcp, allow_write)
-    K8sHandler(mcp, allow_write, allow_sensitive_data_access)
+    K8sHandler(mcp, allow_write, allow_sensitive_data_access, enable_informer_cache)
     IAMHandler(mcp, allow_write)
 
     # Run server
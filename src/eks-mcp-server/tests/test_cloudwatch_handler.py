@@ -16,7 +16,7 @@ import pytest
 from awslabs.eks_mcp_server.cloudwatch_handler import CloudWatchHandler
 from mcp.server.fastmcp import Context
 from mcp.types import TextContent
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 @pytest.fixture
@@ -46,7 +46,7 @@ class TestCloudWatchHandler:
         assert handler.allow_sensitive_data_access is False
 
         # Verify that both tools are registered
-        assert mock_mcp.tool.call_count == 2
+        assert mock_mcp.tool.call_count == 4
 
         # Get all call args
         call_args_list = mock_mcp.tool.call_args_list
@@ -57,6 +57,12 @@ class TestCloudWatchHandler:
         # Verify that get_cloudwatch_metrics was registered
         assert call_args_list[1][1]['name'] == 'get_cloudwatch_metrics'
 
+        # Verify that get_cloudwatch_logs_multi was registered
+        assert call_args_list[2][1]['name'] == 'get_cloudwatch_logs_multi'
+
+        # Verify that get_cloudwatch_metrics_bulk was registered
+        assert call_args_list[3][1]['name'] == 'get_cloudwatch_metrics_bulk'
+
     def test_resolve_time_range_defaults(self):
         """Test resolve_time_range with default values."""
         # Initialize the CloudWatch handler
@@ -913,3 +919,307 @@ class TestCloudWatchHandler:
                 assert result.cluster_name == 'test-cluster'
                 assert result.metric_name == 'cpu_usage_total'
                 assert len(result.data_points) == 0
+
+    @pytest.mark.asyncio
+    async def test_poll_query_results_does_not_block_event_loop(self, mock_context, mock_mcp):
+        """Test that polling waits with asyncio.sleep and reports partial results."""
+        handler = CloudWatchHandler(mock_mcp, allow_sensitive_data_access=True)
+
+        partial_row = [{'field': '@message', 'value': 'partial'}]
+        mock_logs_client = MagicMock()
+        mock_logs_client.get_query_results.side_effect = [
+            {'status': 'Running', 'results': []},
+            {'status': 'Running', 'results': [partial_row]},
+            {'status': 'Complete', 'results': [partial_row, partial_row]},
+        ]
+        on_partial = AsyncMock()
+
+        with patch(
+            'awslabs.eks_mcp_server.cloudwatch_handler.asyncio.sleep', new_callable=AsyncMock
+        ) as mock_sleep:
+            response = await handler._poll_query_results(
+                mock_context,
+                mock_logs_client,
+                'test-query-id',
+                'pod',
+                'test-pod',
+                on_partial=on_partial,
+            )
+
+        assert response['status'] == 'Complete'
+        assert mock_sleep.await_count == 2
+        on_partial.assert_awaited_once_with([partial_row])
+
+    @pytest.mark.asyncio
+    async def test_poll_query_results_timeout(self, mock_context, mock_mcp):
+        """Test that polling gives up after the maximum number of attempts."""
+        handler = CloudWatchHandler(mock_mcp, allow_sensitive_data_access=True)
+
+        mock_logs_client = MagicMock()
+        mock_logs_client.get_query_results.return_value = {'status': 'Running', 'results': []}
+
+        with patch(
+            'awslabs.eks_mcp_server.cloudwatch_handler.asyncio.sleep', new_callable=AsyncMock
+        ):
+            with pytest.raises(TimeoutError):
+                await handler._poll_query_results(
+                    mock_context, mock_logs_client, 'test-query-id', 'pod', 'test-pod', 3
+                )
+
+    @pytest.mark.asyncio
+    async def test_get_cloudwatch_logs_multi_merges_by_timestamp(self, mock_context, mock_mcp):
+        """Test get_cloudwatch_logs_multi merges the results of concurrent queries."""
+        handler = CloudWatchHandler(mock_mcp, allow_sensitive_data_access=True)
+
+        def row(timestamp, message):
+            return [
+                {'field': '@timestamp', 'value': timestamp},
+                {'field': '@message', 'value': message},
+            ]
+
+        results_by_query = {
+            'query-pod-a': [
+                row('2025-01-01 12:03:00.000', 'a3'),
+                row('2025-01-01 12:01:00.000', 'a1'),
+            ],
+            'query-pod-b': [
+                row('2025-01-01 12:02:00.000', 'b2'),
+                row('2025-01-01 12:00:00.000', 'b0'),
+            ],
+        }
+        mock_logs_client = MagicMock()
+        mock_logs_client.start_query.side_effect = lambda **kwargs: {
+            'queryId': 'query-pod-a' if "'pod-a'" in kwargs['queryString'] else 'query-pod-b'
+        }
+        mock_logs_client.get_query_results.side_effect = lambda queryId: {
+            'status': 'Complete',
+            'results': results_by_query[queryId],
+        }
+
+        start_dt = datetime.datetime(2025, 1, 1, 11, 45, 0)
+        end_dt = datetime.datetime(2025, 1, 1, 12, 0, 0)
+        with patch.object(handler, 'resolve_time_range', return_value=(start_dt, end_dt)):
+            with patch(
+                'awslabs.eks_mcp_server.cloudwatch_handler.AwsHelper.create_boto3_client',
+                return_value=mock_logs_client,
+            ) as mock_create_client:
+                result = await handler.get_cloudwatch_logs_multi(
+                    mock_context,
+                    resource_type='pod',
+                    resource_names=['pod-a', 'pod-b'],
+                    cluster_name='test-cluster',
+                    log_types=['application'],
+                    limit=3,
+                    filter_pattern=None,
+                    fields=None,
+                )
+
+        assert not result.isError
+        mock_create_client.assert_called_once_with('logs')
+        assert mock_logs_client.start_query.call_count == 2
+        assert result.log_groups == ['/aws/containerinsights/test-cluster/application']
+        assert [entry['message'] for entry in result.log_entries] == ['a3', 'b2', 'a1']
+        assert [entry['resource_name'] for entry in result.log_entries] == [
+            'pod-a',
+            'pod-b',
+            'pod-a',
+        ]
+        assert result.failed_queries == []
+        assert mock_context.report_progress.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_cloudwatch_logs_multi_partial_failure(self, mock_context, mock_mcp):
+        """Test get_cloudwatch_logs_multi returns the results of the queries that succeeded."""
+        handler = CloudWatchHandler(mock_mcp, allow_sensitive_data_access=True)
+
+        mock_logs_client = MagicMock()
+
+        def start_query(**kwargs):
+            if kwargs['logGroupName'] == '/aws/eks/test-cluster/cluster':
+                raise Exception('Log group does not exist')
+            return {'queryId': 'test-query-id'}
+
+        mock_logs_client.start_query.side_effect = start_query
+        mock_logs_client.get_query_results.return_value = {
+            'status': 'Complete',
+            'results': [[{'field': '@message', 'value': 'ok'}]],
+        }
+
+        with patch(
+            'awslabs.eks_mcp_server.cloudwatch_handler.AwsHelper.create_boto3_client',
+            return_value=mock_logs_client,
+        ):
+            result = await handler.get_cloudwatch_logs_multi(
+                mock_context,
+                resource_type='node',
+                resource_names=['node-1'],
+                cluster_name='test-cluster',
+                log_types=['host', 'control-plane'],
+                minutes=15,
+                start_time=None,
+                end_time=None,
+                limit=50,
+                filter_pattern=None,
+                fields=None,
+            )
+
+        assert not result.isError
+        assert len(result.log_entries) == 1
+        assert result.log_entries[0]['log_group'] == '/aws/containerinsights/test-cluster/host'
+        assert len(result.failed_queries) == 1
+        assert 'Log group does not exist' in result.failed_queries[0]
+        assert '1 queries failed' in result.content[0].text
+
+        # When every query fails, the tool reports an error
+        mock_logs_client.start_query.side_effect = Exception('Access denied')
+        with patch(
+            'awslabs.eks_mcp_server.cloudwatch_handler.AwsHelper.create_boto3_client',
+            return_value=mock_logs_client,
+        ):
+            result = await handler.get_cloudwatch_logs_multi(
+                mock_context,
+                resource_type='node',
+                resource_names=['node-1'],
+                cluster_name='test-cluster',
+                log_types=['host'],
+                minutes=15,
+                start_time=None,
+                end_time=None,
+                limit=50,
+                filter_pattern=None,
+                fields=None,
+            )
+
+        assert result.isError
+        assert 'Access denied' in result.content[0].text
+
+    @pytest.mark.asyncio
+    async def test_get_cloudwatch_logs_multi_sensitive_data_access_disabled(
+        self, mock_context, mock_mcp
+    ):
+        """Test get_cloudwatch_logs_multi requires sensitive data access."""
+        handler = CloudWatchHandler(mock_mcp, allow_sensitive_data_access=False)
+
+        result = await handler.get_cloudwatch_logs_multi(
+            mock_context,
+            resource_type='pod',
+            resource_names=['pod-a'],
+            cluster_name='test-cluster',
+            log_types=['application'],
+        )
+
+        assert result.isError
+        assert '--allow-sensitive-data-access' in result.content[0].text
+        assert result.log_entries == []
+
+    @pytest.mark.asyncio
+    async def test_get_cloudwatch_metrics_bulk_packs_queries(self, mock_context, mock_mcp):
+        """Test get_cloudwatch_metrics_bulk packs queries and follows NextToken."""
+        handler = CloudWatchHandler(mock_mcp)
+
+        start_dt = datetime.datetime(2025, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+        end_dt = start_dt + datetime.timedelta(minutes=10)
+        timestamps = [start_dt + datetime.timedelta(minutes=i) for i in range(10)]
+
+        def get_metric_data(**kwargs):
+            queries = kwargs['MetricDataQueries']
+            first_page = 'NextToken' not in kwargs
+            page_timestamps = timestamps[:5] if first_page else timestamps[5:]
+            response = {
+                'MetricDataResults': [
+                    {
+                        'Id': query['Id'],
+                        'StatusCode': 'PartialData' if first_page else 'Complete',
+                        'Timestamps': page_timestamps,
+                        'Values': [float(ts.minute) for ts in page_timestamps],
+                    }
+                    for query in queries
+                ]
+            }
+            if first_page:
+                response['NextToken'] = 'page-2'
+            return response
+
+        mock_cloudwatch_client = MagicMock()
+        mock_cloudwatch_client.get_metric_data.side_effect = get_metric_data
+
+        resource_names = [f'pod-{i}' for i in range(300)]
+        with patch.object(handler, 'resolve_time_range', return_value=(start_dt, end_dt)):
+            with patch(
+                'awslabs.eks_mcp_server.cloudwatch_handler.AwsHelper.create_boto3_client',
+                return_value=mock_cloudwatch_client,
+            ):
+                result = await handler.get_cloudwatch_metrics_bulk(
+                    mock_context,
+                    resource_type='pod',
+                    resource_names=resource_names,
+                    cluster_name='test-cluster',
+                    metric_names=['pod_cpu_utilization', 'pod_memory_utilization'],
+                    namespace='ContainerInsights',
+                    k8s_namespace='default',
+                    period=60,
+                    stat='Average',
+                    max_points=5,
+                )
+
+        assert not result.isError
+        # 600 queries are packed into two requests, each followed by a second page
+        calls = mock_cloudwatch_client.get_metric_data.call_args_list
+        assert len(calls) == 4
+        assert sorted(len(call.kwargs['MetricDataQueries']) for call in calls) == [
+            100,
+            100,
+            500,
+            500,
+        ]
+        first_query = calls[0].kwargs['MetricDataQueries'][0]
+        assert first_query['MetricStat']['Metric']['Dimensions'] == [
+            {'Name': 'ClusterName', 'Value': 'test-cluster'},
+            {'Name': 'Namespace', 'Value': 'default'},
+            {'Name': 'PodName', 'Value': 'pod-0'},
+        ]
+
+        assert len(result.series) == 600
+        assert result.bucket_seconds == 120
+        series = result.series[1]
+        assert series.resource_name == 'pod-0'
+        assert series.metric_name == 'pod_memory_utilization'
+        assert series.status_code == 'Complete'
+        assert len(series.data_points) == 5
+        assert series.data_points[0].timestamp == '2025-01-01T12:00:00+00:00'
+        assert series.data_points[0].min == 0.0
+        assert series.data_points[0].max == 1.0
+        assert series.data_points[0].avg == 0.5
+        assert series.data_points[0].count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_cloudwatch_metrics_bulk_error(self, mock_context, mock_mcp):
+        """Test get_cloudwatch_metrics_bulk with an error."""
+        handler = CloudWatchHandler(mock_mcp)
+
+        mock_cloudwatch_client = MagicMock()
+        mock_cloudwatch_client.get_metric_data.side_effect = Exception('Throttled')
+
+        with patch(
+            'awslabs.eks_mcp_server.cloudwatch_handler.AwsHelper.create_boto3_client',
+            return_value=mock_cloudwatch_client,
+        ):
+            result = await handler.get_cloudwatch_metrics_bulk(
+                mock_context,
+                resource_type='node',
+                resource_names=['node-1'],
+                cluster_name='test-cluster',
+                metric_names=['node_cpu_utilization'],
+                namespace='ContainerInsights',
+                k8s_namespace='default',
+                minutes=60,
+                start_time=None,
+                end_time=None,
+                period=60,
+                stat='Average',
+                max_points=60,
+            )
+
+        assert result.isError
+        assert 'Throttled' in result.content[0].text
+        assert result.series == []
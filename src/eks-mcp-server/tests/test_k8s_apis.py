@@ -161,9 +161,11 @@ class TestK8sApisInitialization:
         # Mock import error by patching the import mechanism
         with patch(
             'builtins.__import__',
-            side_effect=lambda name, *args, **kwargs: __import__(name, *args, **kwargs)
-            if name != 'kubernetes'
-            else exec('raise ImportError("kubernetes package not installed")'),
+            side_effect=lambda name, *args, **kwargs: (
+                __import__(name, *args, **kwargs)
+                if name != 'kubernetes'
+                else exec('raise ImportError("kubernetes package not installed")')
+            ),
         ):
             # Initialize K8sApis - should raise ImportError
             with pytest.raises(ImportError, match='kubernetes package not installed'):
@@ -400,6 +402,38 @@ class TestK8sApisOperations:
         assert kwargs['label_selector'] == 'app=test'
         assert kwargs['field_selector'] == 'status.phase=Running'
 
+    def test_list_resources_paginated_metadata_only(self, k8s_apis):
+        """Test list_resources method with paging and metadata-only listing."""
+        mock_resource = MagicMock()
+        mock_resources = MagicMock()
+        mock_resources.get.return_value = mock_resource
+        k8s_apis.dynamic_client.resources = mock_resources
+
+        k8s_apis.list_resources(
+            'Pod', 'v1', limit=500, continue_token='page-token', metadata_only=True
+        )
+
+        args, kwargs = mock_resource.get.call_args
+        assert kwargs['limit'] == 500
+        assert kwargs['_continue'] == 'page-token'
+        assert kwargs['header_params'] == {
+            'Accept': 'application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json'
+        }
+
+    def test_list_resources_full_objects_by_default(self, k8s_apis):
+        """Test that list_resources fetches full objects without paging by default."""
+        mock_resource = MagicMock()
+        mock_resources = MagicMock()
+        mock_resources.get.return_value = mock_resource
+        k8s_apis.dynamic_client.resources = mock_resources
+
+        k8s_apis.list_resources('Pod', 'v1', namespace='default')
+
+        args, kwargs = mock_resource.get.call_args
+        assert 'limit' not in kwargs
+        assert '_continue' not in kwargs
+        assert 'header_params' not in kwargs
+
     def test_list_resources_all_namespaces(self, k8s_apis):
         """Test list_resources method without namespace (all namespaces)."""
         # Mock the dynamic client and resources
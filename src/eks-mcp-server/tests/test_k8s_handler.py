@@ -15,6 +15,7 @@ import os
 import pytest
 from awslabs.eks_mcp_server.k8s_apis import K8sApis
 from awslabs.eks_mcp_server.k8s_handler import K8sHandler
+from kubernetes.dynamic.resource import ResourceInstance
 from mcp.server.fastmcp import Context
 from mcp.types import TextContent
 from unittest.mock import MagicMock, mock_open, patch
@@ -749,30 +750,35 @@ metadata:
         # Mock get_client
         mock_k8s_apis = MagicMock()
 
-        # Mock response with items
-        mock_item1 = MagicMock()
-        mock_item1.to_dict.return_value = {
-            'metadata': {
-                'name': 'test-pod-1',
-                'namespace': 'test-namespace',
-                'creation_timestamp': '2023-01-01T00:00:00Z',
-                'labels': {'app': 'test'},
-                'annotations': {'description': 'Test pod 1'},
-            }
-        }
-        mock_item2 = MagicMock()
-        mock_item2.to_dict.return_value = {
-            'metadata': {
-                'name': 'test-pod-2',
-                'namespace': 'test-namespace',
-                'creation_timestamp': '2023-01-02T00:00:00Z',
-                'labels': {'app': 'test'},
-                'annotations': {'description': 'Test pod 2'},
-            }
-        }
-
-        mock_response = MagicMock()
-        mock_response.items = [mock_item1, mock_item2]
+        # Mock response with items, shaped like a dynamic client list response
+        mock_response = ResourceInstance(
+            None,
+            {
+                'apiVersion': 'meta.k8s.io/v1',
+                'kind': 'PartialObjectMetadataList',
+                'metadata': {},
+                'items': [
+                    {
+                        'metadata': {
+                            'name': 'test-pod-1',
+                            'namespace': 'test-namespace',
+                            'creationTimestamp': '2023-01-01T00:00:00Z',
+                            'labels': {'app': 'test'},
+                            'annotations': {'description': 'Test pod 1'},
+                        }
+                    },
+                    {
+                        'metadata': {
+                            'name': 'test-pod-2',
+                            'namespace': 'test-namespace',
+                            'creationTimestamp': '2023-01-02T00:00:00Z',
+                            'labels': {'app': 'test'},
+                            'annotations': {'description': 'Test pod 2'},
+                        }
+                    },
+                ],
+            },
+        )
         mock_k8s_apis.list_resources.return_value = mock_response
 
         with patch.object(handler, 'get_client', return_value=mock_k8s_apis) as mock_client:
@@ -820,6 +826,89 @@ metadata:
                 'Successfully listed 2 Pod resources in test-namespace/' in result.content[0].text
             )
 
+    @pytest.mark.asyncio
+    async def test_list_k8s_resources_paginated(self, mock_context, mock_mcp, mock_client_cache):
+        """Test list_k8s_resources method with limit and continue token."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp)
+
+        mock_k8s_apis = MagicMock()
+        mock_k8s_apis.list_resources.return_value = ResourceInstance(
+            None,
+            {
+                'apiVersion': 'meta.k8s.io/v1',
+                'kind': 'PartialObjectMetadataList',
+                'metadata': {'continue': 'next-page-token', 'remainingItemCount': 41},
+                'items': [{'metadata': {'name': 'test-pod-3', 'namespace': 'test-namespace'}}],
+            },
+        )
+
+        with patch.object(handler, 'get_client', return_value=mock_k8s_apis):
+            result = await handler.list_k8s_resources(
+                mock_context,
+                cluster_name='test-cluster',
+                kind='Pod',
+                api_version='v1',
+                namespace='test-namespace',
+                label_selector=None,
+                field_selector=None,
+                limit=1,
+                continue_token='page-token',
+            )
+
+        _, kwargs = mock_k8s_apis.list_resources.call_args
+        assert kwargs['limit'] == 1
+        assert kwargs['continue_token'] == 'page-token'
+        assert kwargs['metadata_only'] is True
+
+        assert not result.isError
+        assert result.count == 1
+        assert result.items[0].name == 'test-pod-3'
+        assert result.items[0].labels is None
+        assert result.items[0].creation_timestamp is None
+        assert result.continue_token == 'next-page-token'
+        assert result.remaining_item_count == 41
+        assert 'use continue_token' in result.content[0].text
+
+    @pytest.mark.asyncio
+    async def test_list_k8s_resources_last_page(self, mock_context, mock_mcp, mock_client_cache):
+        """Test that the last page of list_k8s_resources has no continue token."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp)
+
+        mock_k8s_apis = MagicMock()
+        mock_k8s_apis.list_resources.return_value = ResourceInstance(
+            None,
+            {
+                'apiVersion': 'meta.k8s.io/v1',
+                'kind': 'PartialObjectMetadataList',
+                'metadata': {'continue': '', 'resourceVersion': '123'},
+                'items': [{'metadata': {'name': 'test-pod-4', 'namespace': 'test-namespace'}}],
+            },
+        )
+
+        with patch.object(handler, 'get_client', return_value=mock_k8s_apis):
+            result = await handler.list_k8s_resources(
+                mock_context,
+                cluster_name='test-cluster',
+                kind='Pod',
+                api_version='v1',
+                namespace='test-namespace',
+                label_selector=None,
+                field_selector=None,
+                limit=10,
+                continue_token='page-token',
+            )
+
+        assert not result.isError
+        assert result.continue_token is None
+        assert result.remaining_item_count is None
+        assert 'use continue_token' not in result.content[0].text
+
     @pytest.mark.asyncio
     async def test_list_k8s_resources_empty(self, mock_context, mock_mcp, mock_client_cache):
         """Test list_k8s_resources method with empty result."""
@@ -0,0 +1,559 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+# ruff: noqa: D101, D102, D103
+"""Tests for the Kubernetes informer cache."""
+
+import json
+import pytest
+from awslabs.eks_mcp_server.k8s_handler import K8sHandler
+from awslabs.eks_mcp_server.k8s_informer import (
+    Informer,
+    InformerManager,
+    compile_field_selector,
+    compile_label_selector,
+    involved_object_index,
+)
+from kubernetes.client.rest import ApiException
+from mcp.server.fastmcp import Context
+from unittest.mock import MagicMock, patch
+
+
+def make_pod(name, namespace='default', labels=None, phase='Running', resource_version='1'):
+    return {
+        'metadata': {
+            'name': name,
+            'namespace': namespace,
+            'labels': labels or {},
+            'resourceVersion': resource_version,
+            'creationTimestamp': '2023-01-01T00:00:00Z',
+        },
+        'status': {'phase': phase},
+    }
+
+
+def make_list_page(items, resource_version='10', continue_token=None):
+    page = MagicMock()
+    metadata = {'resourceVersion': resource_version}
+    if continue_token:
+        metadata['continue'] = continue_token
+    page.data = json.dumps({'items': items, 'metadata': metadata}).encode('utf-8')
+    return page
+
+
+def make_client(pages, namespaced=True):
+    client = MagicMock()
+    resource = MagicMock()
+    resource.namespaced = namespaced
+    resource.get.side_effect = pages
+    client.dynamic_client.resources.get.return_value = resource
+    return client, resource
+
+
+def make_synced_informer(objects, kind='Pod', api_version='v1', indexers=None):
+    client, resource = make_client([make_list_page(objects)])
+    informer = Informer(client, api_version, kind, indexers=indexers)
+    informer._list(resource)
+    return informer
+
+
+class TestSelectors:
+    def test_label_selector(self):
+        matches = compile_label_selector('app=nginx,tier in (frontend, web),!canary,env')
+        assert matches({'app': 'nginx', 'tier': 'web', 'env': 'prod'})
+        assert not matches({'app': 'nginx', 'tier': 'backend', 'env': 'prod'})
+        assert not matches({'app': 'nginx', 'tier': 'web', 'env': 'prod', 'canary': 'true'})
+        assert not matches({'app': 'nginx', 'tier': 'web'})
+
+        assert compile_label_selector('app!=nginx,tier notin (db)')({'tier': 'web'})
+        assert compile_label_selector(None)({})
+
+    def test_unsupported_label_selector(self):
+        with pytest.raises(ValueError):
+            compile_label_selector('replicas>1')
+
+    def test_field_selector(self):
+        matches = compile_field_selector('metadata.name=pod-1,status.phase!=Failed')
+        assert matches(make_pod('pod-1'))
+        assert not matches(make_pod('pod-2'))
+        assert not matches(make_pod('pod-1', phase='Failed'))
+        assert compile_field_selector('spec.unschedulable=true')({'spec': {'unschedulable': True}})
+
+
+class TestInformer:
+    def test_list_pages_and_reads(self):
+        client, resource = make_client(
+            [
+                make_list_page(
+                    [make_pod('b', labels={'app': 'web'})],
+                    resource_version='5',
+                    continue_token='c',
+                ),
+                make_list_page([make_pod('a', namespace='kube-system')], resource_version='7'),
+            ]
+        )
+        informer = Informer(client, 'v1', 'Pod')
+
+        informer._list(resource)
+
+        assert informer.synced
+        assert informer.resource_version == '7'
+        assert resource.get.call_args_list[1].kwargs['_continue'] == 'c'
+        assert informer.get('default', 'b')['kind'] == 'Pod'
+        assert informer.get('default', 'a') is None
+        assert [pod['metadata']['name'] for pod in informer.list()] == ['b', 'a']
+        assert [pod['metadata']['name'] for pod in informer.list(namespace='kube-system')] == ['a']
+        assert [pod['metadata']['name'] for pod in informer.list(label_selector='app=web')] == [
+            'b'
+        ]
+        assert informer.size_bytes > 0
+
+    def test_reads_return_copies(self):
+        informer = make_synced_informer([make_pod('a')])
+
+        informer.get('default', 'a')['status']['phase'] = 'Failed'
+
+        assert informer.get('default', 'a')['status']['phase'] == 'Running'
+
+    def test_watch_applies_events(self):
+        informer = make_synced_informer([make_pod('a'), make_pod('b')])
+        informer.client.dynamic_client.watch.return_value = iter(
+            [
+                {
+                    'type': 'MODIFIED',
+                    'raw_object': make_pod('a', phase='Failed', resource_version='11'),
+                },
+                {'type': 'DELETED', 'raw_object': make_pod('b', resource_version='12')},
+                {'type': 'ADDED', 'raw_object': make_pod('c', resource_version='13')},
+                {'type': 'BOOKMARK', 'raw_object': {'metadata': {'resourceVersion': '20'}}},
+            ]
+        )
+
+        informer._watch(MagicMock())
+
+        watch_kwargs = informer.client.dynamic_client.watch.call_args.kwargs
+        assert watch_kwargs['resource_version'] == '10'
+        assert watch_kwargs['allow_watch_bookmarks'] is True
+        assert informer.get('default', 'a')['status']['phase'] == 'Failed'
+        assert informer.get('default', 'b') is None
+        assert informer.get('default', 'c') is not None
+        assert informer.resource_version == '20'
+
+    def test_apply_records_write_result(self):
+        informer = make_synced_informer([make_pod('a', resource_version='5')])
+
+        informer.apply(make_pod('a', phase='Failed', resource_version='6'), '5')
+        informer.apply(make_pod('b', resource_version='7'), None)
+
+        assert informer.get('default', 'a')['status']['phase'] == 'Failed'
+        assert informer.get('default', 'b')['kind'] == 'Pod'
+
+    def test_late_apply_does_not_overwrite_newer_watch_event(self):
+        informer = make_synced_informer([make_pod('a', resource_version='5')])
+        previous_resource_version = informer.resource_version_of('default', 'a')
+        # A watch event newer than the write arrives before the write result is applied
+        informer.client.dynamic_client.watch.return_value = iter(
+            [
+                {
+                    'type': 'MODIFIED',
+                    'raw_object': make_pod('a', phase='Failed', resource_version='8'),
+                }
+            ]
+        )
+        informer._watch(MagicMock())
+
+        informer.apply(
+            make_pod('a', phase='Pending', resource_version='6'), previous_resource_version
+        )
+
+        assert informer.get('default', 'a')['status']['phase'] == 'Failed'
+        assert informer.resource_version_of('default', 'a') == '8'
+
+    def test_apply_does_not_overwrite_newer_cached_object(self):
+        informer = make_synced_informer([make_pod('a', resource_version='9')])
+
+        informer.apply(make_pod('a', phase='Pending', resource_version='6'), '9')
+
+        assert informer.get('default', 'a')['status']['phase'] == 'Running'
+
+    def test_remove(self):
+        informer = make_synced_informer([make_pod('a'), make_pod('b')])
+        size_bytes = informer.size_bytes
+
+        informer.remove('default', 'a')
+        informer.remove('default', 'missing')
+
+        assert informer.get('default', 'a') is None
+        assert [pod['metadata']['name'] for pod in informer.list()] == ['b']
+        assert informer.size_bytes < size_bytes
+
+    def test_run_lists_again_when_watch_expires(self):
+        client, resource = make_client(
+            [
+                make_list_page([make_pod('a')]),
+                make_list_page([make_pod('b')], resource_version='30'),
+            ]
+        )
+        informer = Informer(client, 'v1', 'Pod')
+
+        def stop_watching(*args, **kwargs):
+            informer._stopped.set()
+            return iter([])
+
+        watch_calls = [ApiException(status=410, reason='Gone')]
+
+        def watch(*args, **kwargs):
+            if watch_calls:
+                raise watch_calls.pop()
+            return stop_watching()
+
+        client.dynamic_client.watch.side_effect = watch
+
+        informer._run()
+
+        assert resource.get.call_count == 2
+        assert informer.resource_version == '30'
+        assert informer.get('default', 'a') is None
+        assert informer.get('default', 'b') is not None
+        assert not informer.failed
+
+    def test_run_fails_over_memory_budget(self):
+        client, resource = make_client([make_list_page([make_pod('a'), make_pod('b')])])
+        informer = Informer(client, 'v1', 'Pod', max_bytes=100)
+
+        informer._run()
+
+        assert informer.failed
+        assert not informer.synced
+        assert 'memory budget' in informer.error
+
+    def test_run_fails_on_api_error(self):
+        client, resource = make_client([make_list_page([make_pod('a')])])
+        client.dynamic_client.watch.side_effect = ApiException(status=401, reason='Unauthorized')
+        informer = Informer(client, 'v1', 'Pod')
+
+        informer._run()
+
+        assert informer.failed
+        assert informer.size_bytes == 0
+
+    def test_index_and_cluster_scoped_keys(self):
+        events = make_synced_informer(
+            [
+                {
+                    'metadata': {'name': 'e1', 'namespace': 'default'},
+                    'involvedObject': {'kind': 'Pod', 'name': 'web'},
+                },
+                {
+                    'metadata': {'name': 'e2', 'namespace': 'default'},
+                    'involvedObject': {'kind': 'Pod', 'name': 'db'},
+                },
+            ],
+            kind='Event',
+            indexers={'involvedObject': involved_object_index},
+        )
+        assert len(events.list(index=('involvedObject', 'Pod/web'))) == 1
+        assert events.list(index=('involvedObject', 'Service/web')) == []
+
+        client, resource = make_client(
+            [make_list_page([{'metadata': {'name': 'node-1'}}])], namespaced=False
+        )
+        nodes = Informer(client, 'v1', 'Node')
+        nodes._list(resource)
+        assert nodes.get('ignored', 'node-1') is not None
+
+
+class TestInformerManager:
+    @pytest.fixture
+    def client_cache(self):
+        cache = MagicMock()
+        cache.get_client.return_value = MagicMock()
+        return cache
+
+    @pytest.fixture(autouse=True)
+    def synced_on_start(self):
+        def start(informer):
+            informer._synced.set()
+
+        with patch.object(Informer, 'start', start):
+            yield
+
+    def test_uncached_kind(self, client_cache):
+        manager = InformerManager(client_cache)
+
+        assert manager.get_informer('cluster', 'v1', 'Secret') is None
+        client_cache.get_client.assert_not_called()
+
+    def test_reuses_informer(self, client_cache):
+        manager = InformerManager(client_cache)
+
+        informer = manager.get_informer('cluster', 'v1', 'Pod')
+
+        assert informer is not None
+        assert manager.get_informer('cluster', 'v1', 'Pod') is informer
+        assert manager.peek('cluster', 'v1', 'Pod') is informer
+        assert manager.peek('cluster', 'v1', 'Service') is None
+
+    def test_replaces_informer_when_client_refreshed(self, client_cache):
+        manager = InformerManager(client_cache)
+        informer = manager.get_informer('cluster', 'v1', 'Pod')
+
+        client_cache.get_client.return_value = MagicMock()
+        replacement = manager.get_informer('cluster', 'v1', 'Pod')
+
+        assert replacement is not informer
+        assert replacement.client is client_cache.get_client.return_value
+        assert informer._stopped.is_set()
+
+    def test_failed_informer_is_not_restarted_immediately(self, client_cache):
+        manager = InformerManager(client_cache)
+        informer = manager.get_informer('cluster', 'v1', 'Pod')
+        informer._fail('watch failed')
+
+        assert manager.get_informer('cluster', 'v1', 'Pod') is None
+
+        informer.failed_at -= 3600
+        assert manager.get_informer('cluster', 'v1', 'Pod') is not None
+
+    def test_evicts_idle_informers(self, client_cache):
+        manager = InformerManager(client_cache, idle_timeout=60)
+        pods = manager.get_informer('cluster', 'v1', 'Pod')
+        pods.last_access -= 120
+
+        manager.get_informer('cluster', 'v1', 'Service')
+
+        assert pods._stopped.is_set()
+        assert manager.peek('cluster', 'v1', 'Pod') is None
+
+    def test_evicts_least_recently_read_over_budget(self, client_cache):
+        manager = InformerManager(client_cache, memory_budget_bytes=1000)
+        pods = manager.get_informer('cluster', 'v1', 'Pod')
+        pods.size_bytes = 800
+        pods.last_access -= 10
+
+        services = manager.get_informer('cluster', 'v1', 'Service')
+        services.size_bytes = 800
+        manager.get_informer('cluster', 'v1', 'Service')
+
+        assert pods._stopped.is_set()
+        assert manager.peek('cluster', 'v1', 'Service') is services
+
+
+class TestK8sHandlerInformerReads:
+    @pytest.fixture
+    def handler(self):
+        with patch('awslabs.eks_mcp_server.k8s_handler.K8sClientCache'):
+            handler = K8sHandler(
+                MagicMock(), allow_sensitive_data_access=True, enable_informer_cache=True
+            )
+        return handler
+
+    @pytest.fixture
+    def ctx(self):
+        ctx = MagicMock(spec=Context)
+        ctx.request_id = 'test-request-id'
+        return ctx
+
+    def test_disabled_by_default(self):
+        with patch('awslabs.eks_mcp_server.k8s_handler.K8sClientCache'):
+            handler = K8sHandler(MagicMock())
+
+        assert handler.informers is None
+        assert handler.get_informer('cluster', 'v1', 'Pod') is None
+
+    @pytest.mark.asyncio
+    async def test_read_from_cache(self, handler, ctx):
+        informer = make_synced_informer([make_pod('web')])
+        with (
+            patch.object(handler.informers, 'get_informer', return_value=informer),
+            patch.object(handler, 'get_client') as mock_get_client,
+        ):
+            result = await handler.manage_k8s_resource(
+                ctx,
+                operation='read',
+                cluster_name='cluster',
+                kind='Pod',
+                api_version='v1',
+                name='web',
+                namespace='default',
+            )
+
+        assert not result.isError
+        assert result.resource['metadata']['name'] == 'web'
+        mock_get_client.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_read_falls_back_on_cache_miss(self, handler, ctx):
+        informer = make_synced_informer([])
+        mock_client = MagicMock()
+        mock_client.manage_resource.return_value.to_dict.return_value = make_pod('web')
+        with (
+            patch.object(handler.informers, 'get_informer', return_value=informer),
+            patch.object(handler, 'get_client', return_value=mock_client),
+        ):
+            result = await handler.manage_k8s_resource(
+                ctx,
+                operation='read',
+                cluster_name='cluster',
+                kind='Pod',
+                api_version='v1',
+                name='web',
+                namespace='default',
+            )
+
+        assert not result.isError
+        mock_client.manage_resource.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_read_after_delete_misses_cache(self, handler, ctx):
+        handler.allow_write = True
+        informer = make_synced_informer([make_pod('web')])
+        mock_client = MagicMock()
+        mock_client.manage_resource.side_effect = [
+            MagicMock(),
+            ApiException(status=404, reason='Not Found'),
+        ]
+        with (
+            patch.object(handler.informers, 'peek', return_value=informer),
+            patch.object(handler.informers, 'get_informer', return_value=informer),
+            patch.object(handler, 'get_client', return_value=mock_client),
+        ):
+            deleted = await handler.manage_k8s_resource(
+                ctx,
+                operation='delete',
+                cluster_name='cluster',
+                kind='Pod',
+                api_version='v1',
+                name='web',
+                namespace='default',
+            )
+            read = await handler.manage_k8s_resource(
+                ctx,
+                operation='read',
+                cluster_name='cluster',
+                kind='Pod',
+                api_version='v1',
+                name='web',
+                namespace='default',
+            )
+
+        assert not deleted.isError
+        assert informer.get('default', 'web') is None
+        assert read.isError
+        assert mock_client.manage_resource.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_write_applies_result_to_cache(self, handler, ctx):
+        handler.allow_write = True
+        informer = make_synced_informer([make_pod('web', resource_version='5')])
+        mock_client = MagicMock()
+        mock_client.manage_resource.return_value.to_dict.return_value = make_pod(
+            'web', phase='Succeeded', resource_version='6'
+        )
+        with (
+            patch.object(handler.informers, 'peek', return_value=informer),
+            patch.object(handler, 'get_client', return_value=mock_client),
+        ):
+            result = await handler.manage_k8s_resource(
+                ctx,
+                operation='patch',
+                cluster_name='cluster',
+                kind='Pod',
+                api_version='v1',
+                name='web',
+                namespace='default',
+                body={'status': {'phase': 'Succeeded'}},
+            )
+
+        assert not result.isError
+        assert informer.get('default', 'web')['status']['phase'] == 'Succeeded'
+
+    @pytest.mark.asyncio
+    async def test_list_from_cache(self, handler, ctx):
+        informer = make_synced_informer(
+            [make_pod('web', labels={'app': 'web'}), make_pod('db', labels={'app': 'db'})]
+        )
+        with (
+            patch.object(handler.informers, 'get_informer', return_value=informer),
+            patch.object(handler, 'get_client') as mock_get_client,
+        ):
+            result = await handler.list_k8s_resources(
+                ctx,
+                cluster_name='cluster',
+                kind='Pod',
+                api_version='v1',
+                namespace='default',
+                label_selector='app=web',
+                field_selector=None,
+                limit=None,
+                continue_token=None,
+            )
+
+        assert not result.isError
+        assert [item.name for item in result.items] == ['web']
+        assert result.items[0].labels == {'app': 'web'}
+        mock_get_client.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_paged_list_bypasses_cache(self, handler, ctx):
+        mock_client = MagicMock()
+        mock_client.list_resources.return_value.items = []
+        mock_client.list_resources.return_value.metadata = {}
+        with (
+            patch.object(handler.informers, 'get_informer') as mock_get_informer,
+            patch.object(handler, 'get_client', return_value=mock_client),
+        ):
+            result = await handler.list_k8s_resources(
+                ctx,
+                cluster_name='cluster',
+                kind='Pod',
+                api_version='v1',
+                namespace=None,
+                label_selector=None,
+                field_selector=None,
+                limit=10,
+                continue_token=None,
+            )
+
+        assert not result.isError
+        mock_get_informer.assert_not_called()
+        mock_client.list_resources.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_events_from_cache(self, handler, ctx):
+        event = {
+            'metadata': {'name': 'web.1', 'namespace': 'default'},
+            'involvedObject': {'kind': 'Pod', 'name': 'web'},
+            'firstTimestamp': '2023-01-01T00:00:00Z',
+            'lastTimestamp': '2023-01-01T00:05:00Z',
+            'count': 2,
+            'message': 'Back-off restarting failed container',
+            'reason': 'BackOff',
+            'source': {'component': 'kubelet'},
+            'type': 'Warning',
+        }
+        informer = make_synced_informer(
+            [event],
+            kind='Event',
+            indexers={'involvedObject': involved_object_index},
+        )
+        with (
+            patch.object(handler.informers, 'get_informer', return_value=informer),
+            patch.object(handler, 'get_client') as mock_get_client,
+        ):
+            result = await handler.get_k8s_events(
+                ctx, cluster_name='cluster', kind='Pod', name='web', namespace='default'
+            )
+
+        assert not result.isError
+        assert result.count == 1
+        assert result.events[0].reason == 'BackOff'
+        assert result.events[0].reporting_component == 'kubelet'
+        mock_get_client.assert_not_called()
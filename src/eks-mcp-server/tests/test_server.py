@@ -52,7 +52,9 @@ async def test_command_line_args():
     with patch.object(argparse.ArgumentParser, 'parse_args') as mock_parse_args:
         # Test with default args (read-only mode by default)
         mock_parse_args.return_value = argparse.Namespace(
-            allow_write=False, allow_sensitive_data_access=False
+            allow_write=False,
+            allow_sensitive_data_access=False,
+            enable_informer_cache=False,
         )
 
         # Mock AWS client creation
@@ -76,7 +78,9 @@ async def test_command_line_args():
     # Test with write access enabled
     with patch.object(argparse.ArgumentParser, 'parse_args') as mock_parse_args:
         mock_parse_args.return_value = argparse.Namespace(
-            allow_write=True, allow_sensitive_data_access=False
+            allow_write=True,
+            allow_sensitive_data_access=False,
+            enable_informer_cache=False,
         )
 
         # Mock AWS client creation
@@ -108,7 +112,9 @@ async def test_command_line_args():
                                 # Verify that the handlers were initialized with correct parameters
                                 mock_cloudwatch_handler.assert_called_once_with(mock_server, False)
                                 mock_eks_stack_handler.assert_called_once_with(mock_server, True)
-                                mock_k8s_handler.assert_called_once_with(mock_server, True, False)
+                                mock_k8s_handler.assert_called_once_with(
+                                    mock_server, True, False, False
+                                )
                                 mock_iam_handler.assert_called_once_with(mock_server, True)
 
                                 # Verify that run was called
@@ -117,7 +123,9 @@ async def test_command_line_args():
     # Test with sensitive data access enabled
     with patch.object(argparse.ArgumentParser, 'parse_args') as mock_parse_args:
         mock_parse_args.return_value = argparse.Namespace(
-            allow_write=False, allow_sensitive_data_access=True
+            allow_write=False,
+            allow_sensitive_data_access=True,
+            enable_informer_cache=False,
         )
 
         # Mock AWS client creation
@@ -149,7 +157,9 @@ async def test_command_line_args():
                                 # Verify that the handlers were initialized with correct parameters
                                 mock_cloudwatch_handler.assert_called_once_with(mock_server, True)
                                 mock_eks_stack_handler.assert_called_once_with(mock_server, False)
-                                mock_k8s_handler.assert_called_once_with(mock_server, False, True)
+                                mock_k8s_handler.assert_called_once_with(
+                                    mock_server, False, True, False
+                                )
                                 mock_iam_handler.assert_called_once_with(mock_server, False)
 
                                 # Verify that run was called
@@ -158,7 +168,9 @@ async def test_command_line_args():
     # Test with both write access and sensitive data access enabled
     with patch.object(argparse.ArgumentParser, 'parse_args') as mock_parse_args:
         mock_parse_args.return_value = argparse.Namespace(
-            allow_write=True, allow_sensitive_data_access=True
+            allow_write=True,
+            allow_sensitive_data_access=True,
+            enable_informer_cache=False,
         )
 
         # Mock AWS client creation
@@ -190,7 +202,9 @@ async def test_command_line_args():
                                 # Verify that the handlers were initialized with both flags
                                 mock_cloudwatch_handler.assert_called_once_with(mock_server, True)
                                 mock_eks_stack_handler.assert_called_once_with(mock_server, True)
-                                mock_k8s_handler.assert_called_once_with(mock_server, True, True)
+                                mock_k8s_handler.assert_called_once_with(
+                                    mock_server, True, True, False
+                                )
                                 mock_iam_handler.assert_called_once_with(mock_server, True)
 
                                 # Verify that run was called
@@ -351,7 +365,7 @@ async def test_cloudwatch_handler_initialization():
     CloudWatchHandler(mock_mcp)
 
     # Verify that all tools are registered
-    assert mock_mcp.tool.call_count == 2
+    assert mock_mcp.tool.call_count == 4
 
     # Get all call args
     call_args_list = mock_mcp.tool.call_args_list
@@ -362,6 +376,8 @@ async def test_cloudwatch_handler_initialization():
     # Verify that all tools are registered
     assert 'get_cloudwatch_metrics' in tool_names
     assert 'get_cloudwatch_logs' in tool_names
+    assert 'get_cloudwatch_logs_multi' in tool_names
+    assert 'get_cloudwatch_metrics_bulk' in tool_names
 
 
 @pytest.mark.asyncio
@@ -373,7 +389,7 @@ async def test_cloudwatch_handler_initialization_with_sensitive_data_access():
     CloudWatchHandler(mock_mcp, allow_sensitive_data_access=True)
 
     # Verify that all tools were registered
-    assert mock_mcp.tool.call_count == 2
+    assert mock_mcp.tool.call_count == 4
 
     # Get all call args
     call_args_list = mock_mcp.tool.call_args_list
@@ -384,6 +400,12 @@ async def test_cloudwatch_handler_initialization_with_sensitive_data_access():
     # Verify that get_cloudwatch_metrics was registered
     assert call_args_list[1][1]['name'] == 'get_cloudwatch_metrics'
 
+    # Verify that get_cloudwatch_logs_multi was registered
+    assert call_args_list[2][1]['name'] == 'get_cloudwatch_logs_multi'
+
+    # Verify that get_cloudwatch_metrics_bulk was registered
+    assert call_args_list[3][1]['name'] == 'get_cloudwatch_metrics_bulk'
+
 
 @pytest.mark.asyncio
 async def test_apply_yaml():
@@ -1,12 +1,19 @@
 """awslabs lambda MCP Server implementation."""
 
+import asyncio
 import boto3
+import hashlib
 import json
 import logging
 import os
 import re
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from mcp.server.fastmcp import Context, FastMCP
-from typing import Optional
+from mcp.server.lowlevel import NotificationOptions
+from mcp.server.stdio import stdio_server
+from typing import Any, Dict, List, Optional
 
 
 # Set up logging
@@ -38,16 +45,104 @@ logger.info(f'FUNCTION_TAG_VALUE: {FUNCTION_TAG_VALUE}')
 FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY = os.environ.get('FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY')
 logger.info(f'FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY: {FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY}')
 
+# Directory where the discovered tools are persisted, an empty value disables persistence
+TOOL_REGISTRY_CACHE_DIR = os.environ.get(
+    'TOOL_REGISTRY_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'awslabs-lambda-tool-mcp-server'),
+)
+logger.info(f'TOOL_REGISTRY_CACHE_DIR: {TOOL_REGISTRY_CACHE_DIR}')
+
+TOOL_REGISTRY_VERSION = 1
+
+# Maximum number of concurrent AWS API calls made while discovering tools
+MAX_DISCOVERY_WORKERS = 16
+
 # Initialize AWS clients
 session = boto3.Session(profile_name=AWS_PROFILE, region_name=AWS_REGION)
 lambda_client = session.client('lambda')
 schemas_client = session.client('schemas')
+tagging_client = session.client('resourcegroupstaggingapi')
+
+# Tools currently registered, keyed by tool name
+registered_tools: Dict[str, Dict[str, Any]] = {}
+
+# Set by main when tools were loaded from the persisted registry and must be refreshed
+refresh_tools_on_start = False
+
+
+class LambdaToolMCP(FastMCP):
+    """FastMCP server that notifies its clients when the Lambda tools change."""
 
-mcp = FastMCP(
+    def __init__(self, *args, **kwargs):
+        """Initialize the server."""
+        super().__init__(*args, **kwargs)
+        self.sessions: 'weakref.WeakSet[Any]' = weakref.WeakSet()
+
+    async def list_tools(self):
+        """List the tools, remembering the session of the client asking for them."""
+        try:
+            self.sessions.add(self.get_context().session)
+        except (LookupError, ValueError):
+            pass
+        return await super().list_tools()
+
+    async def notify_tools_changed(self):
+        """Send a tools/list_changed notification to the clients that listed the tools."""
+        for client_session in list(self.sessions):
+            try:
+                await client_session.send_tool_list_changed()
+            except Exception as e:
+                logger.warning(f'Error notifying client of tool changes: {e}')
+
+    async def run_stdio_async(self) -> None:
+        """Run the server using stdio transport, advertising tool list changes."""
+        async with stdio_server() as (read_stream, write_stream):
+            await self._mcp_server.run(
+                read_stream,
+                write_stream,
+                self._mcp_server.create_initialization_options(
+                    NotificationOptions(tools_changed=True)
+                ),
+            )
+
+
+async def refresh_lambda_tools():
+    """Rediscover the Lambda tools and notify the clients if they changed."""
+    try:
+        logger.info('Refreshing Lambda tools in the background...')
+        tools = await asyncio.to_thread(discover_lambda_tools)
+    except Exception as e:
+        logger.error(f'Error refreshing Lambda tools: {e}')
+        return
+
+    if update_lambda_tools(tools):
+        logger.info('Lambda tools changed, notifying clients.')
+        await mcp.notify_tools_changed()
+    save_tool_registry(tools)
+
+
+@asynccontextmanager
+async def tool_registry_lifespan(server: FastMCP):
+    """Refresh tools loaded from the persisted registry while the server is running."""
+    global refresh_tools_on_start
+
+    task = None
+    if refresh_tools_on_start:
+        refresh_tools_on_start = False
+        task = asyncio.create_task(refresh_lambda_tools())
+    try:
+        yield {}
+    finally:
+        if task is not None:
+            task.cancel()
+
+
+mcp = LambdaToolMCP(
     'awslabs.lambda-tool-mcp-server',
     instructions="""Use AWS Lambda functions to improve your answers.
     These Lambda functions give you additional capabilities and access to AWS services and resources in an AWS account.""",
     dependencies=['pydantic', 'boto3'],
+    lifespan=tool_registry_lifespan,
 )
 
 
@@ -153,13 +248,35 @@ def get_schema_from_registry(schema_arn: str) -> Optional[dict]:
         return None
 
 
-def create_lambda_tool(function_name: str, description: str, schema_arn: Optional[str] = None):
+def fetch_schemas(schema_arns) -> Dict[str, Optional[dict]]:
+    """Fetch schemas from EventBridge Schema Registry concurrently.
+
+    Args:
+        schema_arns: ARNs of the schemas to fetch
+
+    Returns:
+        Schema content by ARN, None for the schemas that could not be fetched
+    """
+    schema_arns = sorted(set(schema_arns))
+    if len(schema_arns) <= 1:
+        return {schema_arn: get_schema_from_registry(schema_arn) for schema_arn in schema_arns}
+    with ThreadPoolExecutor(max_workers=MAX_DISCOVERY_WORKERS) as executor:
+        return dict(zip(schema_arns, executor.map(get_schema_from_registry, schema_arns)))
+
+
+def create_lambda_tool(
+    function_name: str,
+    description: str,
+    schema_arn: Optional[str] = None,
+    schema: Optional[Any] = None,
+):
     """Create a tool function for a Lambda function.
 
     Args:
         function_name: Name of the Lambda function
         description: Base description for the tool
         schema_arn: Optional ARN of the input schema in the Schema Registry
+        schema: Optional input schema already fetched from the Schema Registry
     """
     # Create a meaningful tool name
     tool_name = sanitize_tool_name(function_name)
@@ -171,15 +288,13 @@ def create_lambda_tool(function_name: str, description: str, schema_arn: Optiona
         return await invoke_lambda_function_impl(function_name, parameters, ctx)
 
     # Set the function's documentation
-    if schema_arn:
+    if schema is None and schema_arn:
         schema = get_schema_from_registry(schema_arn)
-        if schema:
-            #  We add the schema to the description because mcp.tool does not expose overriding the tool schema.
-            description_with_schema = f'{description}\n\nInput Schema:\n{schema}'
-            lambda_function.__doc__ = description_with_schema
-            logger.info(f'Added schema from registry to description for function {function_name}')
-        else:
-            lambda_function.__doc__ = description
+    if schema:
+        #  We add the schema to the description because mcp.tool does not expose overriding the tool schema.
+        description_with_schema = f'{description}\n\nInput Schema:\n{schema}'
+        lambda_function.__doc__ = description_with_schema
+        logger.info(f'Added schema from registry to description for function {function_name}')
     else:
         lambda_function.__doc__ = description
 
@@ -190,34 +305,115 @@ def create_lambda_tool(function_name: str, description: str, schema_arn: Optiona
     return decorated_function
 
 
-def get_schema_arn_from_function_arn(function_arn: str) -> Optional[str]:
-    """Get schema ARN from function tags if configured.
+def remove_lambda_tool(tool_name: str):
+    """Remove a previously registered Lambda tool.
 
     Args:
-        function_arn: ARN of the Lambda function
+        tool_name: Name of the tool to remove
+    """
+    logger.info(f'Removing tool {tool_name}')
+    remove_tool = getattr(mcp, 'remove_tool', None)
+    if remove_tool is not None:
+        remove_tool(tool_name)
+    else:
+        # Older FastMCP versions do not expose tool removal
+        mcp._tool_manager._tools.pop(tool_name, None)
+
+
+def update_lambda_tools(tools: List[Dict[str, Any]]) -> bool:
+    """Register the given Lambda tools, replacing the ones registered before.
+
+    Only the tools that were added, removed or changed are registered again.
+
+    Args:
+        tools: Tools as returned by discover_lambda_tools
 
     Returns:
-        Schema ARN if found and configured, None otherwise
+        True if the registered tools changed, False otherwise
     """
-    if not FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY:
-        logger.info(
-            'No schema tag environment variable provided (FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY ).'
+    tools_by_name = {sanitize_tool_name(tool['function_name']): tool for tool in tools}
+    changed = False
+
+    for tool_name in list(registered_tools):
+        if tools_by_name.get(tool_name) != registered_tools[tool_name]:
+            remove_lambda_tool(tool_name)
+            del registered_tools[tool_name]
+            changed = True
+
+    for tool_name, tool in tools_by_name.items():
+        if tool_name in registered_tools:
+            continue
+        create_lambda_tool(
+            tool['function_name'], tool['description'], tool['schema_arn'], tool['schema']
         )
-        return None
+        registered_tools[tool_name] = tool
+        changed = True
+
+    return changed
+
+
+def list_all_functions() -> List[Dict[str, Any]]:
+    """List all the Lambda functions in the account and region, following pagination.
+
+    Returns:
+        List of Lambda function objects
+    """
+    functions = []
+    params = {}
+    while True:
+        response = lambda_client.list_functions(**params)
+        functions.extend(response['Functions'])
+        marker = response.get('NextMarker')
+        if not marker:
+            return functions
+        params['Marker'] = marker
+
+
+def get_function_tags(functions, tag_key: str) -> Dict[str, Dict[str, str]]:
+    """Get the tags of Lambda functions that may have a specific tag key.
+
+    Tags are resolved in bulk through the Resource Groups Tagging API. If that fails (e.g.,
+    the tag:GetResources permission is missing), tags are listed for each function concurrently.
+
+    Args:
+        functions: List of Lambda function objects
+        tag_key: Tag key of interest, functions without it may have their tags omitted
 
+    Returns:
+        Tags by function ARN, without the functions whose tags could not be retrieved
+    """
+    function_arns = {function['FunctionArn'] for function in functions}
     try:
-        tags_response = lambda_client.list_tags(Resource=function_arn)
-        tags = tags_response.get('Tags', {})
-        if FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY in tags:
-            return tags[FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY]
-        else:
-            logger.info(
-                f'No schema arn provided for function {function_arn} via tag {FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY}'
-            )
+        tags_by_arn = {function_arn: {} for function_arn in function_arns}
+        params = {'ResourceTypeFilters': ['lambda:function'], 'TagFilters': [{'Key': tag_key}]}
+        while True:
+            response = tagging_client.get_resources(**params)
+            for mapping in response.get('ResourceTagMappingList', []):
+                if mapping['ResourceARN'] in function_arns:
+                    tags_by_arn[mapping['ResourceARN']] = {
+                        tag['Key']: tag['Value'] for tag in mapping.get('Tags', [])
+                    }
+            token = response.get('PaginationToken')
+            if not token:
+                return tags_by_arn
+            params['PaginationToken'] = token
     except Exception as e:
-        logger.warning(f'Error checking tags for function {function_arn}: {e}')
+        logger.warning(f'Error getting tags in bulk, listing tags for each function: {e}')
+
+    def list_function_tags(function):
+        try:
+            return lambda_client.list_tags(Resource=function['FunctionArn']).get('Tags', {})
+        except Exception as e:
+            logger.warning(f'Error getting tags for function {function["FunctionName"]}: {e}')
+            return None
 
-    return None
+    with ThreadPoolExecutor(max_workers=MAX_DISCOVERY_WORKERS) as executor:
+        all_tags = list(executor.map(list_function_tags, functions))
+    return {
+        function['FunctionArn']: tags
+        for function, tags in zip(functions, all_tags)
+        if tags is not None
+    }
 
 
 def filter_functions_by_tag(functions, tag_key, tag_value):
@@ -232,64 +428,153 @@ def filter_functions_by_tag(functions, tag_key, tag_value):
         List of Lambda functions that have the specified tag key-value pair
     """
     logger.info(f'Filtering functions by tag key-value pair: {tag_key}={tag_value}')
-    tagged_functions = []
-
-    for function in functions:
-        try:
-            # Get tags for the function
-            tags_response = lambda_client.list_tags(Resource=function['FunctionArn'])
-            tags = tags_response.get('Tags', {})
-
-            # Check if the function has the specified tag key-value pair
-            if tag_key in tags and tags[tag_key] == tag_value:
-                tagged_functions.append(function)
-        except Exception as e:
-            logger.warning(f'Error getting tags for function {function["FunctionName"]}: {e}')
+    tags_by_arn = get_function_tags(functions, tag_key)
+    tagged_functions = [
+        function
+        for function in functions
+        if tags_by_arn.get(function['FunctionArn'], {}).get(tag_key) == tag_value
+    ]
 
     logger.info(f'{len(tagged_functions)} Lambda functions found with tag {tag_key}={tag_value}.')
     return tagged_functions
 
 
-def register_lambda_functions():
-    """Register Lambda functions as individual tools."""
-    try:
-        logger.info('Registering Lambda functions as individual tools...')
-        functions = lambda_client.list_functions()
-
-        # Get all functions
-        all_functions = functions['Functions']
-        logger.info(f'Total Lambda functions found: {len(all_functions)}')
-
-        # First filter by function name if prefix or list is set
-        if FUNCTION_PREFIX or FUNCTION_LIST:
-            valid_functions = [
-                f for f in all_functions if validate_function_name(f['FunctionName'])
-            ]
-            logger.info(f'{len(valid_functions)} Lambda functions found after name filtering.')
-        else:
-            valid_functions = all_functions
-            logger.info(
-                'No name filtering applied (both FUNCTION_PREFIX and FUNCTION_LIST are empty).'
-            )
+def discover_lambda_tools() -> List[Dict[str, Any]]:
+    """Discover the Lambda functions to expose as tools.
 
-        # Then filter by tag if both FUNCTION_TAG_KEY and FUNCTION_TAG_VALUE are set and non-empty
-        if FUNCTION_TAG_KEY and FUNCTION_TAG_VALUE:
-            tagged_functions = filter_functions_by_tag(
-                valid_functions, FUNCTION_TAG_KEY, FUNCTION_TAG_VALUE
-            )
-            valid_functions = tagged_functions
-        elif FUNCTION_TAG_KEY or FUNCTION_TAG_VALUE:
-            logger.warning(
-                'Both FUNCTION_TAG_KEY and FUNCTION_TAG_VALUE must be set to filter by tag.'
-            )
-            valid_functions = []
+    Returns:
+        Tools with the function name, description, schema ARN and schema of each function
+    """
+    # Get all functions
+    all_functions = list_all_functions()
+    logger.info(f'Total Lambda functions found: {len(all_functions)}')
+
+    # First filter by function name if prefix or list is set
+    if FUNCTION_PREFIX or FUNCTION_LIST:
+        valid_functions = [f for f in all_functions if validate_function_name(f['FunctionName'])]
+        logger.info(f'{len(valid_functions)} Lambda functions found after name filtering.')
+    else:
+        valid_functions = all_functions
+        logger.info(
+            'No name filtering applied (both FUNCTION_PREFIX and FUNCTION_LIST are empty).'
+        )
 
+    # Then filter by tag if both FUNCTION_TAG_KEY and FUNCTION_TAG_VALUE are set and non-empty
+    if FUNCTION_TAG_KEY and FUNCTION_TAG_VALUE:
+        valid_functions = filter_functions_by_tag(
+            valid_functions, FUNCTION_TAG_KEY, FUNCTION_TAG_VALUE
+        )
+    elif FUNCTION_TAG_KEY or FUNCTION_TAG_VALUE:
+        logger.warning(
+            'Both FUNCTION_TAG_KEY and FUNCTION_TAG_VALUE must be set to filter by tag.'
+        )
+        valid_functions = []
+
+    schema_arns = {}
+    if not FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY:
+        logger.info(
+            'No schema tag environment variable provided (FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY ).'
+        )
+    elif valid_functions:
+        tags_by_arn = get_function_tags(valid_functions, FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY)
         for function in valid_functions:
-            function_name = function['FunctionName']
-            description = function.get('Description', f'AWS Lambda function: {function_name}')
-            schema_arn = get_schema_arn_from_function_arn(function['FunctionArn'])
+            tags = tags_by_arn.get(function['FunctionArn'], {})
+            if FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY in tags:
+                schema_arns[function['FunctionArn']] = tags[FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY]
+            else:
+                logger.info(
+                    f'No schema arn provided for function {function["FunctionArn"]} via tag {FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY}'
+                )
+    schemas = fetch_schemas(schema_arns.values())
+
+    tools = []
+    for function in valid_functions:
+        function_name = function['FunctionName']
+        schema_arn = schema_arns.get(function['FunctionArn'])
+        tools.append(
+            {
+                'function_name': function_name,
+                'description': function.get(
+                    'Description', f'AWS Lambda function: {function_name}'
+                ),
+                'schema_arn': schema_arn,
+                'schema': schemas.get(schema_arn) if schema_arn else None,
+            }
+        )
+    return tools
 
-            create_lambda_tool(function_name, description, schema_arn)
+
+def get_tool_registry_path() -> Optional[str]:
+    """Get the path of the persisted tool registry for the current configuration.
+
+    Returns:
+        Path of the registry file, None if persistence is disabled
+    """
+    if not TOOL_REGISTRY_CACHE_DIR:
+        return None
+    configuration = json.dumps(
+        [
+            AWS_PROFILE,
+            AWS_REGION,
+            FUNCTION_PREFIX,
+            FUNCTION_LIST,
+            FUNCTION_TAG_KEY,
+            FUNCTION_TAG_VALUE,
+            FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY,
+        ]
+    )
+    digest = hashlib.sha256(configuration.encode()).hexdigest()[:16]
+    return os.path.join(TOOL_REGISTRY_CACHE_DIR, f'tools-{digest}.json')
+
+
+def load_tool_registry() -> Optional[List[Dict[str, Any]]]:
+    """Load the tools persisted by a previous run with the same configuration.
+
+    Returns:
+        The persisted tools, None if there are none or they cannot be read
+    """
+    path = get_tool_registry_path()
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding='utf-8') as f:
+            registry = json.load(f)
+        if registry.get('version') != TOOL_REGISTRY_VERSION:
+            return None
+        tools = registry['tools']
+        logger.info(f'Loaded {len(tools)} Lambda tools from {path}')
+        return tools
+    except Exception as e:
+        logger.warning(f'Error loading tool registry from {path}: {e}')
+        return None
+
+
+def save_tool_registry(tools: List[Dict[str, Any]]):
+    """Persist the discovered tools so that the next run can serve them immediately.
+
+    Args:
+        tools: Tools as returned by discover_lambda_tools
+    """
+    path = get_tool_registry_path()
+    if not path:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = f'{path}.{os.getpid()}.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': TOOL_REGISTRY_VERSION, 'tools': tools}, f)
+        os.replace(temporary_path, path)
+    except Exception as e:
+        logger.warning(f'Error saving tool registry to {path}: {e}')
+
+
+def register_lambda_functions():
+    """Register Lambda functions as individual tools."""
+    try:
+        logger.info('Registering Lambda functions as individual tools...')
+        tools = discover_lambda_tools()
+        update_lambda_tools(tools)
+        save_tool_registry(tools)
 
         logger.info('Lambda functions registered successfully as individual tools.')
 
@@ -299,7 +584,15 @@ def register_lambda_functions():
 
 def main():
     """Run the MCP server with CLI argument support."""
-    register_lambda_functions()
+    global refresh_tools_on_start
+
+    tools = load_tool_registry()
+    if tools is None:
+        register_lambda_functions()
+    else:
+        # Serve the persisted tools right away and refresh them once the server is running
+        update_lambda_tools(tools)
+        refresh_tools_on_start = True
 
     mcp.run()
 
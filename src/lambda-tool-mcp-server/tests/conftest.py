@@ -5,6 +5,28 @@ import pytest
 from unittest.mock import MagicMock
 
 
+@pytest.fixture(autouse=True)
+def isolated_server(monkeypatch, tmp_path):
+    """Isolate the server module state and AWS clients between tests."""
+    monkeypatch.setattr('boto3.Session', MagicMock)
+    from awslabs.lambda_tool_mcp_server import server
+
+    # Default to an account without functions
+    default_lambda_client = MagicMock()
+    default_lambda_client.list_functions.return_value = {'Functions': []}
+    monkeypatch.setattr(server, 'lambda_client', default_lambda_client)
+
+    # Make bulk tag resolution unavailable unless a test sets it up
+    tagging_client = MagicMock()
+    tagging_client.get_resources.side_effect = Exception('Tagging API unavailable')
+    monkeypatch.setattr(server, 'tagging_client', tagging_client)
+
+    monkeypatch.setattr(server, 'TOOL_REGISTRY_CACHE_DIR', str(tmp_path / 'registry'))
+    monkeypatch.setattr(server, 'registered_tools', {})
+    monkeypatch.setattr(server, 'refresh_tools_on_start', False)
+    return server
+
+
 @pytest.fixture
 def mock_lambda_client():
     """Create a mock boto3 Lambda client."""
@@ -9,7 +9,6 @@ with pytest.MonkeyPatch().context() as CTX:
     CTX.setattr('boto3.Session', MagicMock)
     from awslabs.lambda_tool_mcp_server.server import (
         create_lambda_tool,
-        get_schema_arn_from_function_arn,
         get_schema_from_registry,
     )
 
@@ -93,85 +92,6 @@ class TestSchemaRegistry:
                 assert 'Schema client error' in caplog.text
 
 
-class TestSchemaArnRetrieval:
-    """Tests for schema ARN retrieval from function tags."""
-
-    @patch('os.environ', {'FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY': 'schema-arn-tag'})
-    @patch(
-        'awslabs.lambda_tool_mcp_server.server.FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY', 'schema-arn-tag'
-    )
-    def test_get_schema_arn_from_tags(self):
-        """Test getting schema ARN from function tags."""
-        schema_arn = 'arn:aws:schemas:us-east-1:123456789012:schema/registry/schema'
-
-        with patch('awslabs.lambda_tool_mcp_server.server.lambda_client') as mock_client:
-            # Set up the mock
-            mock_client.list_tags.return_value = {'Tags': {'schema-arn-tag': schema_arn}}
-
-            # Call the function
-            result = get_schema_arn_from_function_arn('test-function-arn')
-
-            # Verify the result
-            assert result == schema_arn
-
-            # Verify the client was called correctly
-            mock_client.list_tags.assert_called_once_with(Resource='test-function-arn')
-
-    def test_get_schema_arn_no_tag_key_configured(self):
-        """Test when tag key is not configured."""
-        with patch(
-            'awslabs.lambda_tool_mcp_server.server.FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY', None
-        ):
-            with patch('awslabs.lambda_tool_mcp_server.server.lambda_client') as mock_client:
-                # Call the function
-                result = get_schema_arn_from_function_arn('test-function-arn')
-
-                # Verify the result is None
-                assert result is None
-
-                # Verify client was not called
-                mock_client.list_tags.assert_not_called()
-
-    def test_get_schema_arn_tag_not_found(self):
-        """Test when schema ARN tag is not found."""
-        with patch('os.environ', {'FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY': 'schema-arn-tag'}):
-            with patch(
-                'awslabs.lambda_tool_mcp_server.server.FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY',
-                'schema-arn-tag',
-            ):
-                with patch('awslabs.lambda_tool_mcp_server.server.lambda_client') as mock_client:
-                    # Set up the mock with different tag
-                    mock_client.list_tags.return_value = {'Tags': {'different-tag': 'value'}}
-
-                    # Call the function
-                    result = get_schema_arn_from_function_arn('test-function-arn')
-
-                    # Verify the result is None
-                    assert result is None
-
-    def test_get_schema_arn_client_error(self, caplog):
-        """Test handling of tag retrieval errors."""
-        with patch('os.environ', {'FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY': 'schema-arn-tag'}):
-            with patch(
-                'awslabs.lambda_tool_mcp_server.server.FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY',
-                'schema-arn-tag',
-            ):
-                with patch('awslabs.lambda_tool_mcp_server.server.lambda_client') as mock_client:
-                    # Set up the mock to raise an exception
-                    mock_client.list_tags.side_effect = Exception('Tag retrieval error')
-
-                    with caplog.at_level(logging.WARNING):
-                        # Call the function
-                        result = get_schema_arn_from_function_arn('test-function-arn')
-
-                        # Verify the result is None
-                        assert result is None
-
-                        # Verify error was logged
-                        assert 'Error checking tags for function' in caplog.text
-                        assert 'Tag retrieval error' in caplog.text
-
-
 class TestToolCreationWithSchema:
     """Tests for Lambda tool creation with schemas."""
 
@@ -272,7 +272,7 @@ with pytest.MonkeyPatch().context() as CTX:
                 # Should only register functions with the prefix
                 assert mock_create_lambda_tool.call_count == 1
                 mock_create_lambda_tool.assert_called_with(
-                    'prefix-test-function-3', 'Test function 3 with prefix', None
+                    'prefix-test-function-3', 'Test function 3 with prefix', None, None
                 )
 
         @patch(
@@ -313,10 +313,10 @@ with pytest.MonkeyPatch().context() as CTX:
                 # Should only register functions in the list
                 assert mock_create_lambda_tool.call_count == 2
                 mock_create_lambda_tool.assert_any_call(
-                    'test-function-1', 'Test function 1 description', None
+                    'test-function-1', 'Test function 1 description', None, None
                 )
                 mock_create_lambda_tool.assert_any_call(
-                    'test-function-2', 'Test function 2 description', None
+                    'test-function-2', 'Test function 2 description', None, None
                 )
                 # finally:
                 #     # Clean up environment variables
@@ -369,10 +369,10 @@ with pytest.MonkeyPatch().context() as CTX:
                 # Should only register functions with the matching tag
                 assert mock_create_lambda_tool.call_count == 2
                 mock_create_lambda_tool.assert_any_call(
-                    'test-function-1', 'Test function 1 description', None
+                    'test-function-1', 'Test function 1 description', None, None
                 )
                 mock_create_lambda_tool.assert_any_call(
-                    'prefix-test-function-3', 'Test function 3 with prefix', None
+                    'prefix-test-function-3', 'Test function 3 with prefix', None, None
                 )
                 # finally:
                 #     # Clean up environment variables
@@ -403,15 +403,15 @@ with pytest.MonkeyPatch().context() as CTX:
                 # Should register all functions
                 assert mock_create_lambda_tool.call_count == 4
                 mock_create_lambda_tool.assert_any_call(
-                    'test-function-1', 'Test function 1 description', None
+                    'test-function-1', 'Test function 1 description', None, None
                 )
                 mock_create_lambda_tool.assert_any_call(
-                    'test-function-2', 'Test function 2 description', None
+                    'test-function-2', 'Test function 2 description', None, None
                 )
                 mock_create_lambda_tool.assert_any_call(
-                    'prefix-test-function-3', 'Test function 3 with prefix', None
+                    'prefix-test-function-3', 'Test function 3 with prefix', None, None
                 )
-                mock_create_lambda_tool.assert_any_call('other-function', '', None)
+                mock_create_lambda_tool.assert_any_call('other-function', '', None, None)
 
         @patch('awslabs.lambda_tool_mcp_server.server.lambda_client')
         def test_register_error_handling(self, mock_lambda_client):
@@ -0,0 +1,335 @@
+"""Tests for tool discovery and the persisted tool registry of the lambda-tool-mcp-server."""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+with pytest.MonkeyPatch().context() as CTX:
+    CTX.setattr('boto3.Session', MagicMock)
+    from awslabs.lambda_tool_mcp_server import server
+    from awslabs.lambda_tool_mcp_server.server import (
+        discover_lambda_tools,
+        fetch_schemas,
+        filter_functions_by_tag,
+        list_all_functions,
+        load_tool_registry,
+        main,
+        refresh_lambda_tools,
+        register_lambda_functions,
+        save_tool_registry,
+        update_lambda_tools,
+    )
+
+
+def make_function(name, description='Description'):
+    """Create a Lambda function object as returned by list_functions."""
+    return {
+        'FunctionName': name,
+        'FunctionArn': f'arn:aws:lambda:us-east-1:123456789012:function:{name}',
+        'Description': description,
+    }
+
+
+def make_tool(name, description='Description', schema_arn=None, schema=None):
+    """Create a tool as returned by discover_lambda_tools."""
+    return {
+        'function_name': name,
+        'description': description,
+        'schema_arn': schema_arn,
+        'schema': schema,
+    }
+
+
+class TestListAllFunctions:
+    """Tests for the list_all_functions function."""
+
+    def test_follows_next_marker(self):
+        """Test that every page of functions is listed."""
+        with patch('awslabs.lambda_tool_mcp_server.server.lambda_client') as mock_client:
+            mock_client.list_functions.side_effect = [
+                {'Functions': [make_function('function-1')], 'NextMarker': 'marker-1'},
+                {'Functions': [make_function('function-2')], 'NextMarker': 'marker-2'},
+                {'Functions': [make_function('function-3')]},
+            ]
+
+            functions = list_all_functions()
+
+            assert [f['FunctionName'] for f in functions] == [
+                'function-1',
+                'function-2',
+                'function-3',
+            ]
+            assert mock_client.list_functions.call_args_list[0].kwargs == {}
+            assert mock_client.list_functions.call_args_list[1].kwargs == {'Marker': 'marker-1'}
+            assert mock_client.list_functions.call_args_list[2].kwargs == {'Marker': 'marker-2'}
+
+
+class TestBulkTags:
+    """Tests for resolving tags through the Resource Groups Tagging API."""
+
+    def test_filter_functions_by_tag_in_bulk(self):
+        """Test that tags are resolved in bulk instead of per function."""
+        functions = [make_function('function-1'), make_function('function-2')]
+        server.tagging_client.get_resources.side_effect = [
+            {
+                'ResourceTagMappingList': [
+                    {
+                        'ResourceARN': functions[0]['FunctionArn'],
+                        'Tags': [{'Key': 'test-key', 'Value': 'test-value'}],
+                    },
+                ],
+                'PaginationToken': 'token-1',
+            },
+            {
+                'ResourceTagMappingList': [
+                    {
+                        'ResourceARN': functions[1]['FunctionArn'],
+                        'Tags': [{'Key': 'test-key', 'Value': 'other-value'}],
+                    },
+                    {
+                        'ResourceARN': 'arn:aws:lambda:us-east-1:123456789012:function:other',
+                        'Tags': [{'Key': 'test-key', 'Value': 'test-value'}],
+                    },
+                ],
+                'PaginationToken': '',
+            },
+        ]
+
+        with patch('awslabs.lambda_tool_mcp_server.server.lambda_client') as mock_client:
+            result = filter_functions_by_tag(functions, 'test-key', 'test-value')
+
+            assert result == [functions[0]]
+            mock_client.list_tags.assert_not_called()
+
+        calls = server.tagging_client.get_resources.call_args_list
+        assert calls[0].kwargs == {
+            'ResourceTypeFilters': ['lambda:function'],
+            'TagFilters': [{'Key': 'test-key'}],
+        }
+        assert calls[1].kwargs['PaginationToken'] == 'token-1'
+
+    @patch(
+        'awslabs.lambda_tool_mcp_server.server.FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY', 'schema-arn-tag'
+    )
+    def test_discover_resolves_schemas_from_bulk_tags(self):
+        """Test that schema ARNs come from the bulk tags and schemas are fetched once each."""
+        schema_arn = 'arn:aws:schemas:us-east-1:123456789012:schema/registry/schema'
+        functions = [make_function('function-1'), make_function('function-2')]
+        server.tagging_client.get_resources.side_effect = None
+        server.tagging_client.get_resources.return_value = {
+            'ResourceTagMappingList': [
+                {
+                    'ResourceARN': function['FunctionArn'],
+                    'Tags': [{'Key': 'schema-arn-tag', 'Value': schema_arn}],
+                }
+                for function in functions
+            ],
+        }
+
+        with patch('awslabs.lambda_tool_mcp_server.server.lambda_client') as mock_client:
+            mock_client.list_functions.return_value = {'Functions': functions}
+            with patch(
+                'awslabs.lambda_tool_mcp_server.server.get_schema_from_registry',
+                return_value='{"type": "object"}',
+            ) as mock_get_schema:
+                tools = discover_lambda_tools()
+
+                mock_get_schema.assert_called_once_with(schema_arn)
+            mock_client.list_tags.assert_not_called()
+
+        assert tools == [
+            make_tool('function-1', schema_arn=schema_arn, schema='{"type": "object"}'),
+            make_tool('function-2', schema_arn=schema_arn, schema='{"type": "object"}'),
+        ]
+
+
+class TestFetchSchemas:
+    """Tests for the fetch_schemas function."""
+
+    def test_fetches_every_schema(self):
+        """Test that every distinct schema is fetched."""
+        schema_arns = [f'arn:aws:schemas:us-east-1:123456789012:schema/r/s{i}' for i in range(5)]
+
+        with patch(
+            'awslabs.lambda_tool_mcp_server.server.get_schema_from_registry',
+            side_effect=lambda schema_arn: f'schema of {schema_arn}',
+        ) as mock_get_schema:
+            schemas = fetch_schemas(schema_arns + schema_arns[:2])
+
+            assert mock_get_schema.call_count == 5
+            assert schemas == {schema_arn: f'schema of {schema_arn}' for schema_arn in schema_arns}
+
+
+class TestUpdateLambdaTools:
+    """Tests for the update_lambda_tools function."""
+
+    @patch('awslabs.lambda_tool_mcp_server.server.create_lambda_tool')
+    @patch('awslabs.lambda_tool_mcp_server.server.remove_lambda_tool')
+    def test_only_changed_tools_are_registered(self, mock_remove, mock_create):
+        """Test that unchanged tools are left alone."""
+        assert update_lambda_tools([make_tool('function-1'), make_tool('function-2')]) is True
+        assert mock_create.call_count == 2
+        mock_create.reset_mock()
+
+        assert update_lambda_tools([make_tool('function-1'), make_tool('function-2')]) is False
+        mock_create.assert_not_called()
+        mock_remove.assert_not_called()
+
+        changed = update_lambda_tools([make_tool('function-1', 'New description')])
+
+        assert changed is True
+        mock_remove.assert_any_call('function_1')
+        mock_remove.assert_any_call('function_2')
+        mock_create.assert_called_once_with('function-1', 'New description', None, None)
+
+    def test_tools_are_replaced_on_the_server(self):
+        """Test that the server exposes the updated tools."""
+        try:
+            update_lambda_tools([make_tool('function-1'), make_tool('function-2')])
+            update_lambda_tools([make_tool('function-1', 'New description')])
+
+            tools = {tool.name: tool for tool in server.mcp._tool_manager.list_tools()}
+            assert 'function_2' not in tools
+            assert tools['function_1'].description == 'New description'
+        finally:
+            update_lambda_tools([])
+
+
+class TestToolRegistry:
+    """Tests for persisting the discovered tools."""
+
+    def test_save_and_load(self):
+        """Test that saved tools are loaded back."""
+        tools = [make_tool('function-1', schema_arn='arn', schema='{"type": "object"}')]
+
+        assert load_tool_registry() is None
+        save_tool_registry(tools)
+
+        assert load_tool_registry() == tools
+
+    def test_registry_depends_on_configuration(self):
+        """Test that tools saved with another configuration are not loaded."""
+        save_tool_registry([make_tool('function-1')])
+
+        with patch('awslabs.lambda_tool_mcp_server.server.FUNCTION_PREFIX', 'prefix-'):
+            assert load_tool_registry() is None
+
+    def test_persistence_disabled(self):
+        """Test that an empty cache directory disables persistence."""
+        with patch('awslabs.lambda_tool_mcp_server.server.TOOL_REGISTRY_CACHE_DIR', ''):
+            save_tool_registry([make_tool('function-1')])
+
+            assert load_tool_registry() is None
+
+    def test_invalid_registry(self):
+        """Test that an unreadable registry is ignored."""
+        save_tool_registry([])
+        with open(server.get_tool_registry_path(), 'w') as f:
+            f.write('not json')
+
+        assert load_tool_registry() is None
+
+    def test_outdated_registry(self):
+        """Test that a registry with another version is ignored."""
+        save_tool_registry([])
+        with open(server.get_tool_registry_path(), 'w') as f:
+            json.dump({'version': 0, 'tools': []}, f)
+
+        assert load_tool_registry() is None
+
+    @patch('awslabs.lambda_tool_mcp_server.server.create_lambda_tool')
+    def test_register_saves_tools(self, mock_create_lambda_tool):
+        """Test that registering the Lambda functions persists the tools."""
+        server.lambda_client.list_functions.return_value = {
+            'Functions': [make_function('function-1')]
+        }
+
+        register_lambda_functions()
+
+        assert load_tool_registry() == [make_tool('function-1')]
+
+
+class TestStartupFromRegistry:
+    """Tests for serving persisted tools and refreshing them in the background."""
+
+    @patch('awslabs.lambda_tool_mcp_server.server.register_lambda_functions')
+    @patch('awslabs.lambda_tool_mcp_server.server.update_lambda_tools')
+    @patch('awslabs.lambda_tool_mcp_server.server.mcp')
+    def test_main_serves_persisted_tools(self, mock_mcp, mock_update, mock_register):
+        """Test that main registers the persisted tools without discovering them."""
+        save_tool_registry([make_tool('function-1')])
+
+        main()
+
+        mock_register.assert_not_called()
+        mock_update.assert_called_once_with([make_tool('function-1')])
+        assert server.refresh_tools_on_start is True
+        mock_mcp.run.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    @patch('awslabs.lambda_tool_mcp_server.server.create_lambda_tool')
+    @patch('awslabs.lambda_tool_mcp_server.server.remove_lambda_tool')
+    async def test_refresh_notifies_clients(self, mock_remove, mock_create):
+        """Test that a refresh updates the tools and notifies the clients."""
+        update_lambda_tools([make_tool('function-1')])
+        mock_create.reset_mock()
+        server.lambda_client.list_functions.return_value = {
+            'Functions': [make_function('function-2')]
+        }
+        client_session = MagicMock()
+        client_session.send_tool_list_changed = AsyncMock()
+        server.mcp.sessions.add(client_session)
+
+        try:
+            await refresh_lambda_tools()
+        finally:
+            server.mcp.sessions.discard(client_session)
+
+        mock_remove.assert_called_once_with('function_1')
+        mock_create.assert_called_once_with('function-2', 'Description', None, None)
+        client_session.send_tool_list_changed.assert_awaited_once()
+        assert load_tool_registry() == [make_tool('function-2')]
+
+    @pytest.mark.asyncio
+    @patch('awslabs.lambda_tool_mcp_server.server.create_lambda_tool')
+    async def test_refresh_without_changes(self, mock_create):
+        """Test that clients are not notified when the tools did not change."""
+        update_lambda_tools([make_tool('function-1')])
+        server.lambda_client.list_functions.return_value = {
+            'Functions': [make_function('function-1')]
+        }
+        client_session = MagicMock()
+        client_session.send_tool_list_changed = AsyncMock()
+        server.mcp.sessions.add(client_session)
+
+        try:
+            await refresh_lambda_tools()
+        finally:
+            server.mcp.sessions.discard(client_session)
+
+        client_session.send_tool_list_changed.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_refresh_keeps_tools_on_error(self):
+        """Test that a failed refresh keeps the persisted tools."""
+        save_tool_registry([make_tool('function-1')])
+        server.lambda_client.list_functions.side_effect = Exception('Error listing functions')
+
+        await refresh_lambda_tools()
+
+        assert load_tool_registry() == [make_tool('function-1')]
+
+    @pytest.mark.asyncio
+    async def test_lifespan_starts_refresh(self):
+        """Test that the lifespan refreshes the tools loaded from the registry."""
+        server.refresh_tools_on_start = True
+
+        with patch(
+            'awslabs.lambda_tool_mcp_server.server.refresh_lambda_tools', new_callable=AsyncMock
+        ) as mock_refresh:
+            async with server.tool_registry_lifespan(server.mcp):
+                pass
+
+            mock_refresh.assert_called_once()
+        assert server.refresh_tools_on_start is False
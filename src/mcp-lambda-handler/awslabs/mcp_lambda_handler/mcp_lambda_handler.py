@@ -1,3 +1,6 @@
+import asyncio
+import concurrent.futures
+import contextvars
 import functools
 import inspect
 import json
@@ -80,6 +83,10 @@ class MCPLambdaHandler:
         self.version = version
         self.tools: Dict[str, Dict] = {}
         self.tool_implementations: Dict[str, Callable] = {}
+        # Enum-typed parameters per tool, resolved once when the tool is registered
+        self._tool_enum_params: Dict[str, Dict[str, type]] = {}
+        # Cached tools/list result, rebuilt only when a tool is registered
+        self._tools_list_result: Optional[Dict[str, List[Dict]]] = None
 
         # Configure session storage
         if session_store is None:
@@ -142,6 +149,8 @@ class MCPLambdaHandler:
         """Create a decorator for a function as an MCP tool.
 
         Uses function name, docstring, and type hints to generate the MCP tool schema.
+        Both regular and ``async`` functions are supported; coroutine tools called in
+        the same batch request run concurrently on a single event loop.
         """
 
         def decorator(func: Callable):
@@ -182,6 +191,7 @@ class MCPLambdaHandler:
                             arg_descriptions[arg_name.strip()] = arg_desc.strip()
 
             # Build properties from type hints
+            enum_params: Dict[str, type] = {}
             for param_name, param_type in hints.items():
                 param_schema: Dict[str, Union[str, List[str]]] = {
                     'type': 'string'
@@ -195,6 +205,7 @@ class MCPLambdaHandler:
                 elif isinstance(param_type, type) and issubclass(param_type, Enum):
                     param_schema['type'] = 'string'
                     param_schema['enum'] = [e.value for e in param_type]
+                    enum_params[param_name] = param_type
 
                 if param_name in arg_descriptions:
                     param_schema['description'] = arg_descriptions[param_name]
@@ -212,6 +223,16 @@ class MCPLambdaHandler:
             # Register the tool
             self.tools[tool_name] = tool_schema
             self.tool_implementations[tool_name] = func
+            self._tool_enum_params[tool_name] = enum_params
+            self._tools_list_result = None
+
+            if inspect.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    return await func(*args, **kwargs)
+
+                return async_wrapper
 
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
@@ -269,6 +290,48 @@ class MCPLambdaHandler:
 
         return {'statusCode': 200, 'body': response.model_dump_json(), 'headers': headers}
 
+    def _create_batch_response(
+        self, responses: List[Dict], session_id: Optional[str] = None
+    ) -> Dict:
+        """Combine individual responses into a single JSON-RPC batch response.
+
+        Notifications produce no entry in the batch. If every message in the batch was a
+        notification, an empty 204 response is returned as for a single notification.
+        """
+        headers = {'Content-Type': 'application/json', 'MCP-Version': '0.6'}
+        bodies = [response['body'] for response in responses if response.get('body')]
+        if not bodies:
+            return {'statusCode': 204, 'body': '', 'headers': headers}
+
+        if session_id:
+            headers['MCP-Session-Id'] = session_id
+
+        # Each body is already a serialized JSON-RPC response object
+        return {'statusCode': 200, 'body': '[' + ','.join(bodies) + ']', 'headers': headers}
+
+    def _get_tools_list_result(self) -> Dict[str, List[Dict]]:
+        """Get the tools/list result, built once from the registered tool schemas."""
+        if self._tools_list_result is None:
+            self._tools_list_result = {'tools': list(self.tools.values())}
+        return self._tools_list_result
+
+    @staticmethod
+    def _run_coroutine(coro: Any) -> Any:
+        """Run a coroutine to completion from synchronous code.
+
+        Lambda invokes the handler without a running event loop, so a fresh loop is used.
+        If the handler is called from a thread that is already running a loop, the
+        coroutine is run on a separate thread with a copy of the current context.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        ctx = contextvars.copy_context()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(ctx.run, asyncio.run, coro).result()
+
     def handle_request(self, event: Dict, context: Any) -> Dict:
         """Handle an incoming Lambda request."""
         request_id = None
@@ -304,28 +367,50 @@ class MCPLambdaHandler:
             try:
                 body = json.loads(event['body'])
                 logger.debug(f'Parsed request body: {body}')
-                request_id = body.get('id') if isinstance(body, dict) else None
-
-                # Check if this is a notification (no id field)
-                if isinstance(body, dict) and 'id' not in body:
-                    logger.debug('Request is a notification')
-                    return {
-                        'statusCode': 204,
-                        'body': '',
-                        'headers': {'Content-Type': 'application/json', 'MCP-Version': '0.6'},
-                    }
-
-                # Validate basic JSON-RPC structure
-                if (
-                    not isinstance(body, dict)
-                    or body.get('jsonrpc') != '2.0'
-                    or 'method' not in body
-                ):
-                    return self._create_error_response(-32700, 'Parse error', request_id)
-
             except json.JSONDecodeError:
                 return self._create_error_response(-32700, 'Parse error')
 
+            # Handle JSON-RPC batch requests
+            if isinstance(body, list):
+                if not body:
+                    return self._create_error_response(-32600, 'Invalid Request')
+                logger.info(f'Handling batch request with {len(body)} messages')
+
+                async def dispatch_batch() -> List[Dict]:
+                    return await asyncio.gather(
+                        *(self._dispatch_message(message, session_id) for message in body)
+                    )
+
+                responses = self._run_coroutine(dispatch_batch())
+                return self._create_batch_response(responses, session_id)
+
+            return self._run_coroutine(self._dispatch_message(body, session_id))
+
+        except Exception as e:
+            logger.error(f'Error processing request: {str(e)}', exc_info=True)
+            return self._create_error_response(-32000, str(e), request_id, session_id=session_id)
+        finally:
+            # Clear session context
+            current_session_id.set(None)
+
+    async def _dispatch_message(self, body: Any, session_id: Optional[str]) -> Dict:
+        """Handle a single JSON-RPC message, either on its own or as part of a batch."""
+        request_id = body.get('id') if isinstance(body, dict) else None
+
+        try:
+            # Check if this is a notification (no id field)
+            if isinstance(body, dict) and 'id' not in body:
+                logger.debug('Request is a notification')
+                return {
+                    'statusCode': 204,
+                    'body': '',
+                    'headers': {'Content-Type': 'application/json', 'MCP-Version': '0.6'},
+                }
+
+            # Validate basic JSON-RPC structure
+            if not isinstance(body, dict) or body.get('jsonrpc') != '2.0' or 'method' not in body:
+                return self._create_error_response(-32700, 'Parse error', request_id)
+
             # Parse and validate the request
             request = JSONRPCRequest.model_validate(body)
             logger.debug(f'Validated request: {request}')
@@ -361,7 +446,7 @@ class MCPLambdaHandler:
             if request.method == 'tools/list':
                 logger.info('Handling tools/list request')
                 return self._create_success_response(
-                    {'tools': list(self.tools.values())}, request.id, session_id
+                    self._get_tools_list_result(), request.id, session_id
                 )
 
             # Handle tool calls
@@ -378,16 +463,18 @@ class MCPLambdaHandler:
                     # Convert enum string values to enum objects
                     converted_args = {}
                     tool_func = self.tool_implementations[tool_name]
-                    hints = get_type_hints(tool_func)
+                    enum_params = self._tool_enum_params.get(tool_name, {})
 
                     for arg_name, arg_value in tool_args.items():
-                        arg_type = hints.get(arg_name)
-                        if isinstance(arg_type, type) and issubclass(arg_type, Enum):
-                            converted_args[arg_name] = arg_type(arg_value)
+                        enum_type = enum_params.get(arg_name)
+                        if enum_type is not None:
+                            converted_args[arg_name] = enum_type(arg_value)
                         else:
                             converted_args[arg_name] = arg_value
 
                     result = tool_func(**converted_args)
+                    if inspect.isawaitable(result):
+                        result = await result
                     content = [TextContent(text=str(result)).model_dump()]
                     return self._create_success_response(
                         {'content': content}, request.id, session_id
@@ -411,10 +498,6 @@ class MCPLambdaHandler:
             return self._create_error_response(
                 -32601, f'Method not found: {request.method}', request.id, session_id=session_id
             )
-
         except Exception as e:
             logger.error(f'Error processing request: {str(e)}', exc_info=True)
             return self._create_error_response(-32000, str(e), request_id, session_id=session_id)
-        finally:
-            # Clear session context
-            current_session_id.set(None)
@@ -1,3 +1,5 @@
+import asyncio
+import inspect
 import json
 import pytest
 import time
@@ -692,3 +694,149 @@ def test_dynamodb_delete_session_exception():
         store = DynamoDBSessionStore('tbl')
         mock_table.delete_item.side_effect = Exception('fail')
         assert store.delete_session('sid') is False
+
+
+def test_handle_request_async_tool():
+    """Test handle_request with a coroutine tool."""
+    handler = MCPLambdaHandler('test-server')
+
+    @handler.tool()
+    async def async_echo(text: str) -> str:
+        """Echo text asynchronously.
+
+        Args:
+            text: text to echo
+        """
+        await asyncio.sleep(0)
+        return text
+
+    assert inspect.iscoroutinefunction(async_echo)
+    req = {
+        'jsonrpc': '2.0',
+        'id': 1,
+        'method': 'tools/call',
+        'params': {'name': 'asyncEcho', 'arguments': {'text': 'hi'}},
+    }
+    resp = handler.handle_request(make_lambda_event(req), None)
+    body = json.loads(resp['body'])
+    assert resp['statusCode'] == 200
+    assert body['result']['content'][0]['text'] == 'hi'
+
+
+def test_handle_request_batch_runs_async_tools_concurrently():
+    """Test that async tools in a batch request overlap on one event loop."""
+    handler = MCPLambdaHandler('test-server')
+
+    @handler.tool()
+    async def slow_tool(value: int) -> int:
+        """Sleep and return the value.
+
+        Args:
+            value: value to return
+        """
+        await asyncio.sleep(0.2)
+        return value
+
+    batch = [
+        {
+            'jsonrpc': '2.0',
+            'id': i,
+            'method': 'tools/call',
+            'params': {'name': 'slowTool', 'arguments': {'value': i}},
+        }
+        for i in range(5)
+    ]
+    batch.append({'jsonrpc': '2.0', 'method': 'notifications/initialized'})
+    batch.append({'jsonrpc': '2.0', 'id': 'p', 'method': 'ping'})
+
+    start = time.monotonic()
+    resp = handler.handle_request(make_lambda_event(json.dumps(batch)), None)
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.8
+    assert resp['statusCode'] == 200
+    body = json.loads(resp['body'])
+    # The notification does not produce a response entry
+    assert len(body) == 6
+    assert [r['id'] for r in body] == [0, 1, 2, 3, 4, 'p']
+    assert [r['result']['content'][0]['text'] for r in body[:5]] == ['0', '1', '2', '3', '4']
+    assert body[5]['result'] == {}
+
+
+def test_handle_request_batch_mixed_errors():
+    """Test that errors in a batch are reported per message."""
+    handler = MCPLambdaHandler('test-server')
+
+    @handler.tool()
+    def fail_tool():
+        raise ValueError('fail!')
+
+    batch = [
+        {'jsonrpc': '2.0', 'id': 1, 'method': 'tools/call', 'params': {'name': 'failTool'}},
+        {'jsonrpc': '2.0', 'id': 2, 'method': 'unknown'},
+        'not an object',
+        {'jsonrpc': '2.0', 'id': 3, 'method': 'ping'},
+    ]
+    resp = handler.handle_request(make_lambda_event(json.dumps(batch)), None)
+    assert resp['statusCode'] == 200
+    body = json.loads(resp['body'])
+    assert body[0]['error']['code'] == -32603
+    assert body[1]['error']['code'] == -32601
+    assert body[2]['error']['code'] == -32700
+    assert body[2]['id'] is None
+    assert body[3]['result'] == {}
+
+
+def test_handle_request_batch_empty_and_notifications_only():
+    """Test empty batches and batches containing only notifications."""
+    handler = MCPLambdaHandler('test-server')
+    resp = handler.handle_request(make_lambda_event('[]'), None)
+    assert resp['statusCode'] == 400
+    assert json.loads(resp['body'])['error']['code'] == -32600
+
+    batch = [{'jsonrpc': '2.0', 'method': 'notifications/initialized'}]
+    resp = handler.handle_request(make_lambda_event(json.dumps(batch)), None)
+    assert resp['statusCode'] == 204
+    assert resp['body'] == ''
+
+
+async def test_handle_request_inside_running_loop():
+    """Test handle_request when called from code that already runs an event loop."""
+    handler = MCPLambdaHandler('test-server')
+
+    @handler.tool()
+    async def async_tool() -> str:
+        """Return a value asynchronously."""
+        return 'done'
+
+    req = {
+        'jsonrpc': '2.0',
+        'id': 1,
+        'method': 'tools/call',
+        'params': {'name': 'asyncTool', 'arguments': {}},
+    }
+    resp = handler.handle_request(make_lambda_event(req), None)
+    assert json.loads(resp['body'])['result']['content'][0]['text'] == 'done'
+
+
+def test_tools_list_result_is_cached_until_new_tool():
+    """Test that the tools/list result is built once and refreshed on registration."""
+    handler = MCPLambdaHandler('test-server')
+
+    @handler.tool()
+    def first_tool() -> str:
+        """First tool."""
+        return 'first'
+
+    result = handler._get_tools_list_result()
+    assert handler._get_tools_list_result() is result
+    assert [t['name'] for t in result['tools']] == ['firstTool']
+
+    @handler.tool()
+    def second_tool() -> str:
+        """Second tool."""
+        return 'second'
+
+    refreshed = handler._get_tools_list_result()
+    assert refreshed is not result
+    assert [t['name'] for t in refreshed['tools']] == ['firstTool', 'secondTool']
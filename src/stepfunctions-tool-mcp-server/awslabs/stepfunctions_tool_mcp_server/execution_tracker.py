@@ -0,0 +1,269 @@
+"""Shared tracker of in-flight Step Functions Standard executions."""
+
+import asyncio
+import logging
+import math
+from collections import defaultdict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+
+
+logger = logging.getLogger(__name__)
+
+# Statuses after which an execution no longer changes
+TERMINAL_STATUSES = frozenset({'SUCCEEDED', 'FAILED', 'TIMED_OUT', 'ABORTED'})
+
+MIN_POLL_INTERVAL = 0.2
+MAX_POLL_INTERVAL = 10.0
+
+# Number of past execution durations kept per state machine
+HISTORY_SIZE = 50
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """Get a percentile of a list of values using the nearest-rank method.
+
+    Args:
+        values: Values, which must not be empty
+        percent: Percentile between 0 and 100
+
+    Returns:
+        The value below which the given percent of the values fall
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def next_poll_delay(elapsed: float, durations: List[float]) -> float:
+    """Get the delay before checking an execution again.
+
+    Without history, checks back off exponentially. With the durations of past executions of
+    the state machine, the first check happens when half of them have completed, checks then
+    close in on the 90th percentile and back off once the execution runs longer than that.
+
+    Args:
+        elapsed: Seconds since the execution started
+        durations: Durations in seconds of past executions of the same state machine
+
+    Returns:
+        Delay in seconds
+    """
+    if durations:
+        p50 = percentile(durations, 50)
+        p90 = percentile(durations, 90)
+        if elapsed < p50:
+            delay = p50 - elapsed
+        elif elapsed < p90:
+            delay = (p90 - elapsed) / 2
+        else:
+            delay = (elapsed - p90) / 2
+    else:
+        delay = elapsed / 2
+    return min(MAX_POLL_INTERVAL, max(MIN_POLL_INTERVAL, delay))
+
+
+class TrackedExecution:
+    """An execution being tracked and the future resolved with its final description."""
+
+    def __init__(self, execution_arn: str, state_machine_arn: str, started: float):
+        """Initialize the tracked execution.
+
+        Args:
+            execution_arn: ARN of the execution
+            state_machine_arn: ARN of the state machine of the execution
+            started: Event loop time at which tracking started
+        """
+        self.execution_arn = execution_arn
+        self.state_machine_arn = state_machine_arn
+        self.started = started
+        self.next_check = started
+        self.waiters = 0
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class ExecutionTracker:
+    """Tracker waiting for Standard executions to complete.
+
+    A single background task checks every in-flight execution. When several executions of the
+    same state machine are due, one ListExecutions call finds the ones still running so that
+    only finished executions are described. Checks are scheduled from the durations of past
+    executions of each state machine.
+    """
+
+    def __init__(self, client_provider: Callable[[], Any]):
+        """Initialize the tracker.
+
+        Args:
+            client_provider: Function returning the Step Functions client to use
+        """
+        self._client_provider = client_provider
+        self._executions: Dict[str, TrackedExecution] = {}
+        self._durations: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=HISTORY_SIZE))
+        self._history_loaded: Set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def durations(self, state_machine_arn: str) -> List[float]:
+        """Get the known durations of past executions of a state machine.
+
+        Args:
+            state_machine_arn: ARN of the state machine
+
+        Returns:
+            Durations in seconds
+        """
+        return list(self._durations[state_machine_arn])
+
+    async def wait(
+        self, execution_arn: str, state_machine_arn: str, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Wait for an execution to complete.
+
+        Args:
+            execution_arn: ARN of the execution
+            state_machine_arn: ARN of the state machine of the execution
+            timeout: Maximum number of seconds to wait, None to wait until completion
+
+        Returns:
+            The DescribeExecution response of the completed execution, None on timeout
+        """
+        await self._load_history(state_machine_arn)
+        tracked = self._track(execution_arn, state_machine_arn)
+        tracked.waiters += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(tracked.future), timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            tracked.waiters -= 1
+            if tracked.waiters == 0 and not tracked.future.done():
+                # Nobody is waiting for the execution anymore
+                self._executions.pop(execution_arn, None)
+                tracked.future.cancel()
+
+    def _track(self, execution_arn: str, state_machine_arn: str) -> TrackedExecution:
+        """Start tracking an execution, or get it if it is already tracked."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            # Executions tracked on another event loop can no longer be checked
+            self._executions = {}
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+
+        tracked = self._executions.get(execution_arn)
+        if tracked is None:
+            tracked = TrackedExecution(execution_arn, state_machine_arn, loop.time())
+            tracked.next_check = tracked.started + next_poll_delay(
+                0, self.durations(state_machine_arn)
+            )
+            self._executions[execution_arn] = tracked
+            self._wakeup.set()
+        return tracked
+
+    async def _load_history(self, state_machine_arn: str):
+        """Load the durations of the recent successful executions of a state machine."""
+        if state_machine_arn in self._history_loaded:
+            return
+        self._history_loaded.add(state_machine_arn)
+        try:
+            response = await asyncio.to_thread(
+                self._client_provider().list_executions,
+                stateMachineArn=state_machine_arn,
+                statusFilter='SUCCEEDED',
+                maxResults=HISTORY_SIZE,
+            )
+            for execution in response.get('executions', []):
+                self._record_duration(state_machine_arn, execution)
+        except Exception as e:
+            logger.warning(f'Error loading execution history of {state_machine_arn}: {e}')
+
+    def _record_duration(self, state_machine_arn: str, execution: Dict[str, Any]):
+        """Record the duration of a completed execution."""
+        try:
+            duration = (execution['stopDate'] - execution['startDate']).total_seconds()
+        except (KeyError, TypeError, AttributeError):
+            return
+        self._durations[state_machine_arn].append(duration)
+
+    async def _run(self):
+        """Check the tracked executions until none are left."""
+        loop = asyncio.get_running_loop()
+        while self._executions:
+            now = loop.time()
+            next_check = min(tracked.next_check for tracked in self._executions.values())
+            if next_check > now:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), next_check - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            due: Dict[str, List[TrackedExecution]] = defaultdict(list)
+            for tracked in self._executions.values():
+                if tracked.next_check <= now:
+                    due[tracked.state_machine_arn].append(tracked)
+            await asyncio.gather(
+                *(
+                    self._check(state_machine_arn, group)
+                    for state_machine_arn, group in due.items()
+                )
+            )
+
+    async def _check(self, state_machine_arn: str, group: List[TrackedExecution]):
+        """Check the due executions of a state machine."""
+        client = self._client_provider()
+        candidates = group
+        if len(group) > 1:
+            try:
+                running = await asyncio.to_thread(
+                    self._list_running_executions, client, state_machine_arn
+                )
+                candidates = [t for t in group if t.execution_arn not in running]
+                for tracked in group:
+                    if tracked.execution_arn in running:
+                        self._reschedule(tracked)
+            except Exception as e:
+                logger.warning(f'Error listing running executions of {state_machine_arn}: {e}')
+        await asyncio.gather(*(self._describe(client, tracked) for tracked in candidates))
+
+    @staticmethod
+    def _list_running_executions(client: Any, state_machine_arn: str) -> Set[str]:
+        """List the ARNs of the running executions of a state machine."""
+        running = set()
+        params = {'stateMachineArn': state_machine_arn, 'statusFilter': 'RUNNING'}
+        while True:
+            response = client.list_executions(**params)
+            running.update(execution['executionArn'] for execution in response['executions'])
+            next_token = response.get('nextToken')
+            if not next_token:
+                return running
+            params['nextToken'] = next_token
+
+    async def _describe(self, client: Any, tracked: TrackedExecution):
+        """Describe an execution and resolve it if it completed."""
+        try:
+            execution = await asyncio.to_thread(
+                client.describe_execution, executionArn=tracked.execution_arn
+            )
+        except Exception as e:
+            self._executions.pop(tracked.execution_arn, None)
+            if not tracked.future.done():
+                tracked.future.set_exception(e)
+            return
+
+        if execution['status'] in TERMINAL_STATUSES:
+            self._executions.pop(tracked.execution_arn, None)
+            if execution['status'] == 'SUCCEEDED':
+                self._record_duration(tracked.state_machine_arn, execution)
+            if not tracked.future.done():
+                tracked.future.set_result(execution)
+        else:
+            self._reschedule(tracked)
+
+    def _reschedule(self, tracked: TrackedExecution):
+        """Schedule the next check of an execution that is still running."""
+        now = asyncio.get_running_loop().time()
+        tracked.next_check = now + next_poll_delay(
+            now - tracked.started, self.durations(tracked.state_machine_arn)
+        )
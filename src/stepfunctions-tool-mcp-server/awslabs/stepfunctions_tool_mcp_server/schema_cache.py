@@ -0,0 +1,111 @@
+"""On-disk cache of EventBridge Schema Registry schemas."""
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_CACHE_VERSION = 1
+
+
+class SchemaCache:
+    """Cache of schema contents keyed by schema ARN and version.
+
+    Schema versions are immutable, so a cached version stays valid. For each schema ARN, the
+    cache also remembers the latest known version along with the last modification time
+    reported by the registry, which tells whether that version is still the latest.
+    """
+
+    def __init__(self, path: Optional[str]):
+        """Initialize the schema cache.
+
+        Args:
+            path: Path of the cache file, None to keep the cache in memory only
+        """
+        self.path = path
+        self._schemas: Dict[str, Any] = {}
+        self._latest: Dict[str, Dict[str, Optional[str]]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def _key(schema_arn: str, schema_version: str) -> str:
+        """Get the cache key of a schema version."""
+        return f'{schema_arn}@{schema_version}'
+
+    def _load(self):
+        """Load the cache file if it exists."""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('version') == SCHEMA_CACHE_VERSION:
+                self._schemas = cache['schemas']
+                self._latest = cache['latest']
+        except Exception as e:
+            logger.warning(f'Error loading schema cache from {self.path}: {e}')
+
+    def get(self, schema_arn: str, last_modified: Optional[str]) -> Optional[Any]:
+        """Get the latest version of a schema if it did not change.
+
+        Args:
+            schema_arn: ARN of the schema
+            last_modified: Last modification time of the schema reported by the registry
+
+        Returns:
+            The schema content, None if it is not cached or may have changed
+        """
+        with self._lock:
+            latest = self._latest.get(schema_arn)
+            if not latest or not last_modified or latest['last_modified'] != last_modified:
+                return None
+            return self._schemas.get(self._key(schema_arn, latest['schema_version']))
+
+    def put(
+        self,
+        schema_arn: str,
+        schema_version: str,
+        content: Any,
+        last_modified: Optional[str] = None,
+    ):
+        """Store the latest version of a schema.
+
+        Args:
+            schema_arn: ARN of the schema
+            schema_version: Version of the schema
+            content: Content of the schema version
+            last_modified: Last modification time of the schema reported by the registry
+        """
+        with self._lock:
+            previous = self._latest.get(schema_arn)
+            if previous and previous['schema_version'] != schema_version:
+                self._schemas.pop(self._key(schema_arn, previous['schema_version']), None)
+            self._schemas[self._key(schema_arn, schema_version)] = content
+            self._latest[schema_arn] = {
+                'schema_version': schema_version,
+                'last_modified': last_modified,
+            }
+
+    def save(self):
+        """Write the cache file."""
+        if not self.path:
+            return
+        with self._lock:
+            cache = {
+                'version': SCHEMA_CACHE_VERSION,
+                'schemas': dict(self._schemas),
+                'latest': dict(self._latest),
+            }
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temporary_path = f'{self.path}.{os.getpid()}.tmp'
+            with open(temporary_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(temporary_path, self.path)
+        except Exception as e:
+            logger.warning(f'Error saving schema cache to {self.path}: {e}')
@@ -9,8 +9,16 @@ import logging
 import os
 import re
 from awslabs.stepfunctions_tool_mcp_server.aws_helper import AwsHelper
+from awslabs.stepfunctions_tool_mcp_server.execution_tracker import (
+    TERMINAL_STATUSES,
+    ExecutionTracker,
+)
+from awslabs.stepfunctions_tool_mcp_server.schema_cache import SchemaCache
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from mcp.server.fastmcp import Context, FastMCP
-from typing import Optional
+from pydantic import Field
+from typing import Annotated, Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 
 # Set up logging
@@ -39,6 +47,16 @@ logger.info(f'STATE_MACHINE_TAG_VALUE: {STATE_MACHINE_TAG_VALUE}')
 STATE_MACHINE_INPUT_SCHEMA_ARN_TAG_KEY = os.environ.get('STATE_MACHINE_INPUT_SCHEMA_ARN_TAG_KEY')
 logger.info(f'STATE_MACHINE_INPUT_SCHEMA_ARN_TAG_KEY: {STATE_MACHINE_INPUT_SCHEMA_ARN_TAG_KEY}')
 
+# Directory of the on-disk schema cache, an empty value disables it
+SCHEMA_CACHE_DIR = os.environ.get(
+    'SCHEMA_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'awslabs-stepfunctions-tool-mcp-server'),
+)
+logger.info(f'SCHEMA_CACHE_DIR: {SCHEMA_CACHE_DIR}')
+
+# Maximum number of concurrent AWS API calls made while registering state machines
+MAX_DISCOVERY_WORKERS = 8
+
 # Initialize AWS clients
 sfn_client = AwsHelper.create_boto3_client('stepfunctions')
 schemas_client = AwsHelper.create_boto3_client('schemas')
@@ -50,6 +68,19 @@ mcp = FastMCP(
     dependencies=['pydantic', 'boto3'],
 )
 
+# Maximum number of seconds get_state_machine_execution waits for an execution
+MAX_EXECUTION_WAIT_SECONDS = 300
+
+# Shared tracker of the Standard executions being waited for
+execution_tracker = ExecutionTracker(lambda: sfn_client)
+
+# Maximum number of executions started without waiting that can be retrieved
+MAX_EXECUTION_HANDLES = 1000
+
+# Executions started without waiting for completion and not seen completed, by execution ARN,
+# oldest first
+execution_handles: 'OrderedDict[str, Tuple[str, str]]' = OrderedDict()
+
 
 def validate_state_machine_name(state_machine_name: str) -> bool:
     """Validate that the state machine name is valid and can be called."""
@@ -90,10 +121,28 @@ def format_state_machine_response(state_machine_name: str, payload: bytes) -> st
         return f'State machine {state_machine_name} returned payload: {payload}'
 
 
+async def format_execution_result(
+    state_machine_name: str, execution: Dict[str, Any], ctx: Context
+) -> str:
+    """Format the result of a completed Standard state machine execution."""
+    status = execution['status']
+    if status == 'SUCCEEDED':
+        output = execution['output']
+        return format_state_machine_response(state_machine_name, output.encode())
+
+    error_message = f'State machine {state_machine_name} execution failed with status: {status}'
+    if 'error' in execution:
+        error_message += f', error: {execution["error"]}'
+    if 'cause' in execution:
+        error_message += f', cause: {execution["cause"]}'
+    await ctx.error(error_message)
+    return error_message
+
+
 async def invoke_standard_state_machine_impl(
     state_machine_name: str, state_machine_arn: str, parameters: dict, ctx: Context
 ) -> str:
-    """Execute a Standard state machine using StartExecution and poll for completion."""
+    """Execute a Standard state machine using StartExecution and wait for completion."""
     await ctx.info(
         f'Starting asynchronous execution of Standard state machine {state_machine_name}'
     )
@@ -107,27 +156,80 @@ async def invoke_standard_state_machine_impl(
     await ctx.info(f'Started execution {response["executionArn"]}')
 
     # Wait for execution to complete
-    while True:
-        execution = sfn_client.describe_execution(executionArn=response['executionArn'])
-        status = execution['status']
-        await ctx.info(f'Execution status: {status}')
-
-        if status == 'SUCCEEDED':
-            output = execution['output']
-            return format_state_machine_response(state_machine_name, output.encode())
-        elif status in ['FAILED', 'TIMED_OUT', 'ABORTED']:
-            error_message = (
-                f'State machine {state_machine_name} execution failed with status: {status}'
+    execution = await execution_tracker.wait(response['executionArn'], state_machine_arn)
+    await ctx.info(f'Execution status: {execution["status"]}')
+    return await format_execution_result(state_machine_name, execution, ctx)
+
+
+async def start_standard_state_machine_impl(
+    state_machine_name: str, state_machine_arn: str, parameters: dict, ctx: Context
+) -> str:
+    """Start a Standard state machine using StartExecution without waiting for completion."""
+    await ctx.info(
+        f'Starting asynchronous execution of Standard state machine {state_machine_name}'
+    )
+
+    response = sfn_client.start_execution(
+        stateMachineArn=state_machine_arn,
+        input=json.dumps(parameters),
+    )
+    execution_arn = response['executionArn']
+    execution_handles[execution_arn] = (state_machine_name, state_machine_arn)
+    while len(execution_handles) > MAX_EXECUTION_HANDLES:
+        execution_handles.popitem(last=False)
+
+    await ctx.info(f'Started execution {execution_arn}')
+    return (
+        f'State machine {state_machine_name} started execution {execution_arn}. '
+        'Use the get_state_machine_execution tool with this execution ARN to get its result.'
+    )
+
+
+@mcp.tool(name='get_state_machine_execution')
+async def get_state_machine_execution(
+    execution_arn: Annotated[
+        str, Field(description='ARN of an execution started without waiting for completion')
+    ],
+    ctx: Context,
+    wait_seconds: Annotated[
+        int,
+        Field(
+            description=(
+                'Seconds to wait for the execution to complete before returning its status '
+                f'(at most {MAX_EXECUTION_WAIT_SECONDS})'
             )
-            if 'error' in execution:
-                error_message += f', error: {execution["error"]}'
-            if 'cause' in execution:
-                error_message += f', cause: {execution["cause"]}'
-            await ctx.error(error_message)
-            return error_message
+        ),
+    ] = 0,
+) -> str:
+    """Get the status or result of a Standard state machine execution.
+
+    Only executions started by a state machine tool with wait_for_completion set to false can
+    be retrieved, and the result of a completed execution is only returned once.
+    """
+    if execution_arn not in execution_handles:
+        error_message = f'Execution {execution_arn} was not started by this server'
+        await ctx.error(error_message)
+        return error_message
+    state_machine_name, state_machine_arn = execution_handles[execution_arn]
+
+    execution = None
+    if wait_seconds > 0:
+        execution = await execution_tracker.wait(
+            execution_arn,
+            state_machine_arn,
+            timeout=min(wait_seconds, MAX_EXECUTION_WAIT_SECONDS),
+        )
+    if execution is None:
+        execution = await asyncio.to_thread(
+            sfn_client.describe_execution, executionArn=execution_arn
+        )
 
-        # Wait before checking again
-        await asyncio.sleep(1)
+    status = execution['status']
+    await ctx.info(f'Execution status: {status}')
+    if status not in TERMINAL_STATUSES:
+        return f'State machine {state_machine_name} execution {execution_arn} is {status}'
+    execution_handles.pop(execution_arn, None)
+    return await format_execution_result(state_machine_name, execution, ctx)
 
 
 async def invoke_express_state_machine_impl(
@@ -161,51 +263,177 @@ async def invoke_express_state_machine_impl(
         return error_message
 
 
-def get_schema_from_registry(schema_arn: str) -> Optional[dict]:
-    """Fetch schema from EventBridge Schema Registry.
+def parse_schema_arn(schema_arn: str) -> Optional[Tuple[str, str]]:
+    """Get the registry name and schema name from a schema ARN.
 
     Args:
-        schema_arn: ARN of the schema to fetch
+        schema_arn: ARN of the schema
 
     Returns:
-        Schema content if successful, None if failed
+        Registry name and schema name, None if the ARN is invalid
     """
-    try:
-        # Parse registry name and schema name from ARN
-        # ARN format: arn:aws:schemas:region:account:schema/registry-name/schema-name
-        arn_parts = schema_arn.split(':')
-        if len(arn_parts) < 6:
-            logger.error(f'Invalid schema ARN format: {schema_arn}')
-            return None
+    # ARN format: arn:aws:schemas:region:account:schema/registry-name/schema-name
+    arn_parts = schema_arn.split(':')
+    if len(arn_parts) < 6:
+        logger.error(f'Invalid schema ARN format: {schema_arn}')
+        return None
 
-        registry_schema = arn_parts[5].split('/')
-        if len(registry_schema) != 3:
-            logger.error(f'Invalid schema path in ARN: {arn_parts[5]}')
-            return None
+    registry_schema = arn_parts[5].split('/')
+    if len(registry_schema) != 3:
+        logger.error(f'Invalid schema path in ARN: {arn_parts[5]}')
+        return None
+
+    return registry_schema[1], registry_schema[2]
 
-        registry_name = registry_schema[1]
-        schema_name = registry_schema[2]
+
+def describe_schema_from_registry(schema_arn: str) -> Optional[Dict[str, Any]]:
+    """Describe the latest version of a schema in EventBridge Schema Registry.
+
+    Args:
+        schema_arn: ARN of the schema to describe
+
+    Returns:
+        The DescribeSchema response if successful, None if failed
+    """
+    try:
+        names = parse_schema_arn(schema_arn)
+        if names is None:
+            return None
+        registry_name, schema_name = names
 
         # Get the latest schema version
-        response = schemas_client.describe_schema(
+        return schemas_client.describe_schema(
             RegistryName=registry_name,
             SchemaName=schema_name,
         )
 
-        # Return the raw schema content
-        return response['Content']
-
     except Exception as e:
         logger.error(f'Error fetching schema from registry: {e}')
         return None
 
 
+def get_schema_from_registry(schema_arn: str) -> Optional[dict]:
+    """Fetch schema from EventBridge Schema Registry.
+
+    Args:
+        schema_arn: ARN of the schema to fetch
+
+    Returns:
+        Schema content if successful, None if failed
+    """
+    response = describe_schema_from_registry(schema_arn)
+    if response is None:
+        return None
+
+    # Return the raw schema content
+    return response['Content']
+
+
+def map_concurrently(function: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+    """Apply a function to items using a bounded thread pool.
+
+    Args:
+        function: Function to apply, usually making an AWS API call
+        items: Items to apply the function to
+
+    Returns:
+        The results, in the order of the items
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=MAX_DISCOVERY_WORKERS) as executor:
+        return list(executor.map(function, items))
+
+
+def get_schema_cache() -> SchemaCache:
+    """Get the schema cache, stored on disk unless SCHEMA_CACHE_DIR is empty."""
+    path = os.path.join(SCHEMA_CACHE_DIR, 'schemas.json') if SCHEMA_CACHE_DIR else None
+    return SchemaCache(path)
+
+
+def list_registry_schemas(registry_name: str) -> Dict[str, str]:
+    """List the last modification time of each schema of a registry.
+
+    Args:
+        registry_name: Name of the schema registry
+
+    Returns:
+        Last modification time by schema ARN, empty if the schemas cannot be listed
+    """
+    last_modified = {}
+    params = {'RegistryName': registry_name}
+    try:
+        while True:
+            response = schemas_client.list_schemas(**params)
+            for schema in response.get('Schemas', []):
+                last_modified[schema['SchemaArn']] = str(schema.get('LastModified'))
+            next_token = response.get('NextToken')
+            if not next_token:
+                return last_modified
+            params['NextToken'] = next_token
+    except Exception as e:
+        logger.warning(f'Error listing schemas of registry {registry_name}: {e}')
+        return {}
+
+
+def resolve_schemas(schema_arns: Iterable[str]) -> Dict[str, Optional[Any]]:
+    """Get the content of schemas, using the schema cache for those that did not change.
+
+    The schemas of each registry are listed once to find the ones that changed, which are
+    then described concurrently.
+
+    Args:
+        schema_arns: ARNs of the schemas
+
+    Returns:
+        Schema content by ARN, None for the schemas that could not be fetched
+    """
+    schema_arns = sorted(set(schema_arns))
+    if not schema_arns:
+        return {}
+
+    registries = defaultdict(list)
+    for schema_arn in schema_arns:
+        names = parse_schema_arn(schema_arn)
+        if names is not None:
+            registries[names[0]].append(schema_arn)
+    last_modified: Dict[str, str] = {}
+    for listed in map_concurrently(list_registry_schemas, registries):
+        last_modified.update(listed)
+
+    cache = get_schema_cache()
+    schemas = {
+        schema_arn: cache.get(schema_arn, last_modified.get(schema_arn))
+        for schema_arn in schema_arns
+    }
+    missing = [schema_arn for schema_arn, content in schemas.items() if content is None]
+    logger.info(f'{len(schema_arns) - len(missing)} schemas found in the schema cache.')
+
+    for schema_arn, response in zip(
+        missing, map_concurrently(describe_schema_from_registry, missing)
+    ):
+        if response is None:
+            continue
+        schemas[schema_arn] = response['Content']
+        cache.put(
+            schema_arn,
+            str(response.get('SchemaVersion')),
+            response['Content'],
+            last_modified.get(schema_arn),
+        )
+    if missing:
+        cache.save()
+    return schemas
+
+
 def create_state_machine_tool(
     state_machine_name: str,
     state_machine_arn: str,
     state_machine_type: str,
     description: str,
     schema_arn: Optional[str] = None,
+    schema: Optional[Any] = None,
 ):
     """Create a tool function for a Step Functions state machine.
 
@@ -215,35 +443,54 @@ def create_state_machine_tool(
         state_machine_type: Type of the state machine (STANDARD or EXPRESS)
         description: Base description for the tool
         schema_arn: Optional ARN of the input schema in the Schema Registry
+        schema: Optional input schema already fetched from the Schema Registry
     """
     # Create a meaningful tool name
     tool_name = sanitize_tool_name(state_machine_name)
 
-    # Define the inner function
-    async def state_machine_function(parameters: dict, ctx: Context) -> str:
-        """Tool for invoking a specific AWS Step Functions state machine with parameters."""
-        # Use the appropriate implementation based on state machine type
-        if state_machine_type == 'EXPRESS':
+    # Define the inner function using the appropriate implementation for the state machine type
+    if state_machine_type == 'EXPRESS':
+
+        async def state_machine_function(parameters: dict, ctx: Context) -> str:
+            """Tool for invoking a specific AWS Step Functions state machine with parameters."""
             return await invoke_express_state_machine_impl(
                 state_machine_name, state_machine_arn, parameters, ctx
             )
-        else:  # STANDARD
+
+    else:  # STANDARD
+
+        async def state_machine_function(
+            parameters: dict,
+            ctx: Context,
+            wait_for_completion: Annotated[
+                bool,
+                Field(
+                    description=(
+                        'Wait for the execution to complete, or return its execution ARN '
+                        'right away to get the result later with get_state_machine_execution'
+                    )
+                ),
+            ] = True,
+        ) -> str:
+            """Tool for invoking a specific AWS Step Functions state machine with parameters."""
+            if not wait_for_completion:
+                return await start_standard_state_machine_impl(
+                    state_machine_name, state_machine_arn, parameters, ctx
+                )
             return await invoke_standard_state_machine_impl(
                 state_machine_name, state_machine_arn, parameters, ctx
             )
 
     # Set the function's documentation
-    if schema_arn:
+    if schema is None and schema_arn:
         schema = get_schema_from_registry(schema_arn)
-        if schema:
-            #  We add the schema to the description because mcp.tool does not expose overriding the tool schema.
-            description_with_schema = f'{description}\n\nInput Schema:\n{schema}'
-            state_machine_function.__doc__ = description_with_schema
-            logger.info(
-                f'Added schema from registry to description for state machine {state_machine_name}'
-            )
-        else:
-            state_machine_function.__doc__ = description
+    if schema:
+        #  We add the schema to the description because mcp.tool does not expose overriding the tool schema.
+        description_with_schema = f'{description}\n\nInput Schema:\n{schema}'
+        state_machine_function.__doc__ = description_with_schema
+        logger.info(
+            f'Added schema from registry to description for state machine {state_machine_name}'
+        )
     else:
         state_machine_function.__doc__ = description
 
@@ -284,6 +531,25 @@ def get_schema_arn_from_state_machine_arn(state_machine_arn: str) -> Optional[st
     return None
 
 
+def get_state_machine_tags(state_machine) -> Optional[Dict[str, str]]:
+    """Get the tags of a Step Functions state machine.
+
+    Args:
+        state_machine: Step Functions state machine object
+
+    Returns:
+        Tags of the state machine, None if they cannot be retrieved
+    """
+    try:
+        tags_response = sfn_client.list_tags_for_resource(
+            resourceArn=state_machine['stateMachineArn']
+        )
+        return {tag['key']: tag['value'] for tag in tags_response.get('tags', [])}
+    except Exception as e:
+        logger.warning(f'Error getting tags for state machine {state_machine["name"]}: {e}')
+        return None
+
+
 def filter_state_machines_by_tag(state_machines, tag_key, tag_value):
     """Filter Step Functions state machines by a specific tag key-value pair.
 
@@ -296,21 +562,12 @@ def filter_state_machines_by_tag(state_machines, tag_key, tag_value):
         List of Step Functions state machines that have the specified tag key-value pair
     """
     logger.info(f'Filtering state machines by tag key-value pair: {tag_key}={tag_value}')
-    tagged_state_machines = []
-
-    for state_machine in state_machines:
-        try:
-            # Get tags for the state machine
-            tags_response = sfn_client.list_tags_for_resource(
-                resourceArn=state_machine['stateMachineArn']
-            )
-            tags = {tag['key']: tag['value'] for tag in tags_response.get('tags', [])}
-
-            # Check if the state machine has the specified tag key-value pair
-            if tag_key in tags and tags[tag_key] == tag_value:
-                tagged_state_machines.append(state_machine)
-        except Exception as e:
-            logger.warning(f'Error getting tags for state machine {state_machine["name"]}: {e}')
+    all_tags = map_concurrently(get_state_machine_tags, state_machines)
+    tagged_state_machines = [
+        state_machine
+        for state_machine, tags in zip(state_machines, all_tags)
+        if tags is not None and tags.get(tag_key) == tag_value
+    ]
 
     logger.info(
         f'{len(tagged_state_machines)} Step Functions state machines found with tag {tag_key}={tag_value}.'
@@ -318,14 +575,57 @@ def filter_state_machines_by_tag(state_machines, tag_key, tag_value):
     return tagged_state_machines
 
 
+def list_all_state_machines() -> List[Dict[str, Any]]:
+    """List all the Step Functions state machines in the account and region.
+
+    Returns:
+        List of Step Functions state machine objects
+    """
+    state_machines = []
+    params = {}
+    while True:
+        response = sfn_client.list_state_machines(**params)
+        state_machines.extend(response['stateMachines'])
+        next_token = response.get('nextToken')
+        if not next_token:
+            return state_machines
+        params['nextToken'] = next_token
+
+
+def get_state_machine_description(state_machine) -> str:
+    """Build the tool description of a Step Functions state machine.
+
+    Args:
+        state_machine: Step Functions state machine object
+
+    Returns:
+        The state machine description, followed by the Comment of its definition if present
+    """
+    state_machine_name = state_machine['name']
+    try:
+        state_machine_details = sfn_client.describe_state_machine(
+            stateMachineArn=state_machine['stateMachineArn']
+        )
+        description = state_machine_details.get(
+            'description', f'AWS Step Functions state machine: {state_machine_name}'
+        )
+        # Parse definition and get Comment if present
+        definition = json.loads(state_machine_details.get('definition', '{}'))
+        if 'Comment' in definition:
+            description = f'{description}\n\nWorkflow Description: {definition["Comment"]}'
+        return description
+    except Exception as e:
+        logger.warning(f'Error getting details for state machine {state_machine_name}: {e}')
+        return f'AWS Step Functions state machine: {state_machine_name}'
+
+
 def register_state_machines():
     """Register Step Functions state machines as individual tools."""
     try:
         logger.info('Registering Step Functions state machines as individual tools...')
-        state_machines = sfn_client.list_state_machines()
 
         # Get all state machines
-        all_state_machines = state_machines['stateMachines']
+        all_state_machines = list_all_state_machines()
         logger.info(f'Total Step Functions state machines found: {len(all_state_machines)}')
 
         # First filter by state machine name if prefix or list is set
@@ -354,35 +654,24 @@ def register_state_machines():
             )
             valid_state_machines = []
 
-        for state_machine in valid_state_machines:
-            state_machine_name = state_machine['name']
-            state_machine_arn = state_machine['stateMachineArn']
-
-            # Get state machine description from describe_state_machine
-            try:
-                state_machine_details = sfn_client.describe_state_machine(
-                    stateMachineArn=state_machine_arn
-                )
-                description = state_machine_details.get(
-                    'description', f'AWS Step Functions state machine: {state_machine_name}'
-                )
-                # Parse definition and get Comment if present
-                definition = json.loads(state_machine_details.get('definition', '{}'))
-                if 'Comment' in definition:
-                    description = f'{description}\n\nWorkflow Description: {definition["Comment"]}'
-            except Exception as e:
-                logger.warning(
-                    f'Error getting details for state machine {state_machine_name}: {e}'
-                )
-                description = f'AWS Step Functions state machine: {state_machine_name}'
+        # Get the descriptions and schema ARNs of the state machines concurrently
+        descriptions = map_concurrently(get_state_machine_description, valid_state_machines)
+        schema_arns = map_concurrently(
+            get_schema_arn_from_state_machine_arn,
+            [state_machine['stateMachineArn'] for state_machine in valid_state_machines],
+        )
+        schemas = resolve_schemas(schema_arn for schema_arn in schema_arns if schema_arn)
 
-            schema_arn = get_schema_arn_from_state_machine_arn(state_machine_arn)
+        for state_machine, description, schema_arn in zip(
+            valid_state_machines, descriptions, schema_arns
+        ):
             create_state_machine_tool(
-                state_machine_name,
-                state_machine_arn,
+                state_machine['name'],
+                state_machine['stateMachineArn'],
                 state_machine['type'],
                 description,
                 schema_arn,
+                schemas.get(schema_arn) if schema_arn else None,
             )
 
         logger.info('Step Functions state machines registered successfully as individual tools.')
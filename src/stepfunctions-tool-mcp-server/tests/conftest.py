@@ -0,0 +1,12 @@
+"""Test fixtures for the stepfunctions-tool-mcp-server tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def schema_cache_dir(monkeypatch, tmp_path):
+    """Keep the schema cache of each test in a temporary directory."""
+    from awslabs.stepfunctions_tool_mcp_server import server
+
+    monkeypatch.setattr(server, 'SCHEMA_CACHE_DIR', str(tmp_path / 'cache'))
+    return tmp_path / 'cache'
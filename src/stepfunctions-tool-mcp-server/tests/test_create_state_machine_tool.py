@@ -182,3 +182,33 @@ class TestCreateTool:
             state_machine_name, state_machine_arn, {'test': 'value'}, ctx
         )
         mock_standard_impl.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch('awslabs.stepfunctions_tool_mcp_server.server.start_standard_state_machine_impl')
+    @patch('awslabs.stepfunctions_tool_mcp_server.server.invoke_standard_state_machine_impl')
+    @patch('awslabs.stepfunctions_tool_mcp_server.server.mcp')
+    async def test_create_tool_standard_without_waiting(
+        self, mock_mcp, mock_standard_impl, mock_start_impl
+    ):
+        """Test that a STANDARD state machine can be started without waiting for completion."""
+        # Set up test data
+        state_machine_name = 'test-standard-machine'
+        state_machine_arn = (
+            f'arn:aws:states:us-east-1:123456789012:stateMachine:{state_machine_name}'
+        )
+        mock_decorator = MagicMock()
+        mock_mcp.tool.return_value = mock_decorator
+
+        # Call the function
+        create_state_machine_tool(state_machine_name, state_machine_arn, 'STANDARD', 'Test')
+
+        # Call the decorated function without waiting for completion
+        decorated_function = mock_decorator.call_args[0][0]
+        ctx = MagicMock()
+        await decorated_function({'test': 'value'}, ctx, wait_for_completion=False)
+
+        # Verify results
+        mock_start_impl.assert_called_once_with(
+            state_machine_name, state_machine_arn, {'test': 'value'}, ctx
+        )
+        mock_standard_impl.assert_not_called()
@@ -0,0 +1,172 @@
+"""Tests for the execution tracker."""
+
+import asyncio
+import pytest
+from awslabs.stepfunctions_tool_mcp_server.execution_tracker import (
+    MAX_POLL_INTERVAL,
+    MIN_POLL_INTERVAL,
+    ExecutionTracker,
+    next_poll_delay,
+    percentile,
+)
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+
+STATE_MACHINE_ARN = 'arn:aws:states:us-east-1:123456789012:stateMachine:test-state-machine'
+
+
+def execution_arn(name):
+    """Get the ARN of an execution of the test state machine."""
+    return f'arn:aws:states:us-east-1:123456789012:execution:test-state-machine:{name}'
+
+
+def make_client(statuses):
+    """Create a mock client returning a sequence of statuses for each execution."""
+    client = MagicMock()
+    client.list_executions.return_value = {'executions': []}
+    remaining = {arn: list(sequence) for arn, sequence in statuses.items()}
+
+    def describe_execution(executionArn):
+        sequence = remaining[executionArn]
+        status = sequence.pop(0) if len(sequence) > 1 else sequence[0]
+        return {'executionArn': executionArn, 'status': status, 'output': '{}'}
+
+    client.describe_execution.side_effect = describe_execution
+    return client
+
+
+class TestPollSchedule:
+    """Tests for the poll schedule."""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        values = [5.0, 1.0, 3.0, 2.0, 4.0]
+        assert percentile(values, 50) == 3.0
+        assert percentile(values, 90) == 5.0
+        assert percentile(values, 0) == 1.0
+
+    def test_backoff_without_history(self):
+        """Test that checks back off exponentially without history."""
+        assert next_poll_delay(0, []) == MIN_POLL_INTERVAL
+        assert next_poll_delay(4, []) == 2
+        assert next_poll_delay(1000, []) == MAX_POLL_INTERVAL
+
+    def test_schedule_from_history(self):
+        """Test that checks follow the durations of past executions."""
+        durations = [float(seconds) for seconds in range(1, 11)]
+
+        # First check when half of the past executions completed
+        assert next_poll_delay(0, durations) == 5
+        # Then close in on the 90th percentile
+        assert next_poll_delay(5, durations) == 2
+        # Then back off
+        assert next_poll_delay(9.1, durations) == MIN_POLL_INTERVAL
+        assert next_poll_delay(15, durations) == 3
+
+
+class TestExecutionTracker:
+    """Tests for the ExecutionTracker class."""
+
+    @pytest.mark.asyncio
+    async def test_wait_for_completion(self):
+        """Test waiting for an execution to complete."""
+        client = make_client({execution_arn('1'): ['RUNNING', 'SUCCEEDED']})
+        tracker = ExecutionTracker(lambda: client)
+
+        execution = await tracker.wait(execution_arn('1'), STATE_MACHINE_ARN)
+
+        assert execution['status'] == 'SUCCEEDED'
+        assert client.describe_execution.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_running_executions_are_listed_in_batch(self):
+        """Test that executions still running are found without describing them."""
+        client = make_client(
+            {
+                execution_arn('1'): ['SUCCEEDED'],
+                execution_arn('2'): ['SUCCEEDED'],
+            }
+        )
+        client.list_executions.side_effect = [
+            # History of the state machine
+            {'executions': []},
+            # Execution 2 is still running at the first check
+            {'executions': [{'executionArn': execution_arn('2')}], 'nextToken': 'token'},
+            {'executions': []},
+        ]
+        tracker = ExecutionTracker(lambda: client)
+
+        executions = await asyncio.gather(
+            tracker.wait(execution_arn('1'), STATE_MACHINE_ARN),
+            tracker.wait(execution_arn('2'), STATE_MACHINE_ARN),
+        )
+
+        assert [execution['status'] for execution in executions] == ['SUCCEEDED', 'SUCCEEDED']
+        # Execution 2 was only described once it was no longer listed as running
+        described = [call.kwargs['executionArn'] for call in client.describe_execution.mock_calls]
+        assert described == [execution_arn('1'), execution_arn('2')]
+        assert client.list_executions.call_args_list[2].kwargs['nextToken'] == 'token'
+
+    @pytest.mark.asyncio
+    async def test_waiters_share_checks(self):
+        """Test that waiting twice for the same execution does not duplicate checks."""
+        client = make_client({execution_arn('1'): ['RUNNING', 'SUCCEEDED']})
+        tracker = ExecutionTracker(lambda: client)
+
+        first, second = await asyncio.gather(
+            tracker.wait(execution_arn('1'), STATE_MACHINE_ARN),
+            tracker.wait(execution_arn('1'), STATE_MACHINE_ARN),
+        )
+
+        assert first is second
+        assert client.describe_execution.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """Test that waiting returns None when the execution does not complete in time."""
+        client = make_client({execution_arn('1'): ['RUNNING']})
+        tracker = ExecutionTracker(lambda: client)
+
+        execution = await tracker.wait(execution_arn('1'), STATE_MACHINE_ARN, timeout=0.3)
+
+        assert execution is None
+        # The execution is no longer tracked once nobody waits for it
+        await asyncio.sleep(MIN_POLL_INTERVAL * 2)
+        assert tracker._task.done()
+
+    @pytest.mark.asyncio
+    async def test_describe_error(self):
+        """Test that errors describing the execution are raised to the waiters."""
+        client = make_client({})
+        client.describe_execution.side_effect = Exception('Access denied')
+        tracker = ExecutionTracker(lambda: client)
+
+        with pytest.raises(Exception, match='Access denied'):
+            await tracker.wait(execution_arn('1'), STATE_MACHINE_ARN)
+
+    @pytest.mark.asyncio
+    async def test_history_is_loaded_and_recorded(self):
+        """Test that past and completed execution durations are recorded."""
+        start = datetime(2024, 1, 1)
+        client = MagicMock()
+        client.list_executions.return_value = {
+            'executions': [
+                {'startDate': start, 'stopDate': start + timedelta(seconds=seconds)}
+                for seconds in (0.1, 0.2)
+            ]
+        }
+        client.describe_execution.return_value = {
+            'status': 'SUCCEEDED',
+            'startDate': start,
+            'stopDate': start + timedelta(seconds=0.3),
+        }
+        tracker = ExecutionTracker(lambda: client)
+
+        await tracker.wait(execution_arn('1'), STATE_MACHINE_ARN)
+        await tracker.wait(execution_arn('2'), STATE_MACHINE_ARN)
+
+        assert sorted(tracker.durations(STATE_MACHINE_ARN)) == [0.1, 0.2, 0.3, 0.3]
+        client.list_executions.assert_called_once_with(
+            stateMachineArn=STATE_MACHINE_ARN, statusFilter='SUCCEEDED', maxResults=50
+        )
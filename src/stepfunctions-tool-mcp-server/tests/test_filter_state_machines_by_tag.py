@@ -33,11 +33,14 @@ class TestFilterStateMachines:
         ]
 
         # Set up mock responses
-        mock_sfn_client.list_tags_for_resource.side_effect = [
-            {'tags': [{'key': 'test-key', 'value': 'test-value'}]},  # First state machine
-            {'tags': []},  # Second state machine
-            {'tags': [{'key': 'test-key', 'value': 'test-value'}]},  # Third state machine
-        ]
+        tags = {
+            state_machines[0]['stateMachineArn']: [{'key': 'test-key', 'value': 'test-value'}],
+            state_machines[1]['stateMachineArn']: [],
+            state_machines[2]['stateMachineArn']: [{'key': 'test-key', 'value': 'test-value'}],
+        }
+        mock_sfn_client.list_tags_for_resource.side_effect = lambda resourceArn: {
+            'tags': tags[resourceArn]
+        }
 
         # Call the function
         result = filter_state_machines_by_tag(state_machines, 'test-key', 'test-value')
@@ -127,11 +130,14 @@ class TestFilterStateMachines:
         ]
 
         # Set up mixed mock responses
-        mock_sfn_client.list_tags_for_resource.side_effect = [
-            {'tags': [{'key': 'test-key', 'value': 'test-value'}]},  # Success case
-            Exception('Access denied'),  # Error case
-            {'tags': []},  # Empty tags case
-        ]
+        def list_tags_for_resource(resourceArn):
+            if resourceArn == state_machines[0]['stateMachineArn']:
+                return {'tags': [{'key': 'test-key', 'value': 'test-value'}]}  # Success case
+            if resourceArn == state_machines[1]['stateMachineArn']:
+                raise Exception('Access denied')  # Error case
+            return {'tags': []}  # Empty tags case
+
+        mock_sfn_client.list_tags_for_resource.side_effect = list_tags_for_resource
 
         # Call the function
         result = filter_state_machines_by_tag(state_machines, 'test-key', 'test-value')
@@ -8,7 +8,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 with pytest.MonkeyPatch().context() as CTX:
     CTX.setattr('boto3.Session', MagicMock)
-    from awslabs.stepfunctions_tool_mcp_server.server import invoke_standard_state_machine_impl
+    from awslabs.stepfunctions_tool_mcp_server import server
+    from awslabs.stepfunctions_tool_mcp_server.server import (
+        get_state_machine_execution,
+        invoke_standard_state_machine_impl,
+        start_standard_state_machine_impl,
+    )
 
 
 class TestStandardStateMachines:
@@ -292,3 +297,118 @@ class TestStandardStateMachines:
             # Reset mocks for next iteration
             mock_sfn_client.reset_mock()
             ctx.reset_mock()
+
+
+class TestStandardExecutionHandles:
+    """Tests for starting Standard state machines without waiting for completion."""
+
+    state_machine_name = 'test-state-machine'
+    state_machine_arn = 'arn:aws:states:us-east-1:123456789012:stateMachine:test-state-machine'
+    execution_arn = 'arn:aws:states:us-east-1:123456789012:execution:test-state-machine:12345'
+
+    @pytest.fixture(autouse=True)
+    def execution_handles(self):
+        """Isolate the execution handles of each test."""
+        with patch.dict(
+            'awslabs.stepfunctions_tool_mcp_server.server.execution_handles', clear=True
+        ):
+            yield
+
+    @pytest.fixture
+    def ctx(self):
+        """Create a mock context."""
+        ctx = MagicMock(spec=Context)
+        ctx.info = AsyncMock()
+        ctx.error = AsyncMock()
+        return ctx
+
+    @pytest.mark.asyncio
+    @patch('awslabs.stepfunctions_tool_mcp_server.server.sfn_client')
+    async def test_start_and_get_result(self, mock_sfn_client, ctx):
+        """Test starting an execution and getting its result later."""
+        mock_sfn_client.start_execution.return_value = {'executionArn': self.execution_arn}
+
+        result = await start_standard_state_machine_impl(
+            self.state_machine_name, self.state_machine_arn, {'param': 'value'}, ctx
+        )
+
+        assert self.execution_arn in result
+        mock_sfn_client.describe_execution.assert_not_called()
+
+        # Still running
+        mock_sfn_client.describe_execution.return_value = {'status': 'RUNNING'}
+        result = await get_state_machine_execution(self.execution_arn, ctx)
+        assert result == (
+            f'State machine test-state-machine execution {self.execution_arn} is RUNNING'
+        )
+
+        # Completed while waiting
+        mock_sfn_client.describe_execution.side_effect = [
+            {'status': 'RUNNING'},
+            {'status': 'SUCCEEDED', 'output': '{"result": "success"}'},
+        ]
+        result = await get_state_machine_execution(self.execution_arn, ctx, wait_seconds=10)
+        assert 'State machine test-state-machine returned:' in result
+        assert '"result": "success"' in result
+
+    @pytest.mark.asyncio
+    @patch('awslabs.stepfunctions_tool_mcp_server.server.sfn_client')
+    async def test_get_failed_execution(self, mock_sfn_client, ctx):
+        """Test getting the result of a failed execution."""
+        mock_sfn_client.start_execution.return_value = {'executionArn': self.execution_arn}
+        mock_sfn_client.describe_execution.return_value = {
+            'status': 'FAILED',
+            'error': 'States.TaskFailed',
+        }
+        await start_standard_state_machine_impl(
+            self.state_machine_name, self.state_machine_arn, {}, ctx
+        )
+
+        result = await get_state_machine_execution(self.execution_arn, ctx)
+
+        assert 'execution failed with status: FAILED, error: States.TaskFailed' in result
+        ctx.error.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch('awslabs.stepfunctions_tool_mcp_server.server.sfn_client')
+    async def test_get_unknown_execution(self, mock_sfn_client, ctx):
+        """Test that only executions started by the server can be retrieved."""
+        result = await get_state_machine_execution(self.execution_arn, ctx)
+
+        assert result == f'Execution {self.execution_arn} was not started by this server'
+        mock_sfn_client.describe_execution.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch('awslabs.stepfunctions_tool_mcp_server.server.sfn_client')
+    async def test_completed_execution_is_forgotten(self, mock_sfn_client, ctx):
+        """Test that the handle of an execution is removed once it has completed."""
+        mock_sfn_client.start_execution.return_value = {'executionArn': self.execution_arn}
+        mock_sfn_client.describe_execution.return_value = {'status': 'SUCCEEDED', 'output': '{}'}
+        await start_standard_state_machine_impl(
+            self.state_machine_name, self.state_machine_arn, {}, ctx
+        )
+
+        await get_state_machine_execution(self.execution_arn, ctx)
+
+        assert self.execution_arn not in server.execution_handles
+        result = await get_state_machine_execution(self.execution_arn, ctx)
+        assert result == f'Execution {self.execution_arn} was not started by this server'
+
+    @pytest.mark.asyncio
+    @patch('awslabs.stepfunctions_tool_mcp_server.server.MAX_EXECUTION_HANDLES', 2)
+    @patch('awslabs.stepfunctions_tool_mcp_server.server.sfn_client')
+    async def test_execution_handles_are_bounded(self, mock_sfn_client, ctx):
+        """Test that the oldest handles are dropped beyond the maximum number of handles."""
+        mock_sfn_client.start_execution.side_effect = [
+            {'executionArn': f'{self.execution_arn}-{i}'} for i in range(3)
+        ]
+
+        for _ in range(3):
+            await start_standard_state_machine_impl(
+                self.state_machine_name, self.state_machine_arn, {}, ctx
+            )
+
+        assert list(server.execution_handles) == [
+            f'{self.execution_arn}-1',
+            f'{self.execution_arn}-2',
+        ]
@@ -45,6 +45,7 @@ class TestRegisterStateMachines:
             'STANDARD',
             'AWS Step Functions state machine: prefix-test-machine',
             None,
+            None,
         )
 
     @patch('awslabs.stepfunctions_tool_mcp_server.server.sfn_client')
@@ -86,6 +87,7 @@ class TestRegisterStateMachines:
             'STANDARD',
             'AWS Step Functions state machine: machine1',
             None,
+            None,
         )
         mock_create_tool.assert_any_call(
             'machine2',
@@ -93,6 +95,7 @@ class TestRegisterStateMachines:
             'STANDARD',
             'AWS Step Functions state machine: machine2',
             None,
+            None,
         )
 
     @patch('awslabs.stepfunctions_tool_mcp_server.server.sfn_client')
@@ -125,6 +128,7 @@ class TestRegisterStateMachines:
             'STANDARD',
             'AWS Step Functions state machine: tagged-machine',
             None,
+            None,
         )
 
     @patch('awslabs.stepfunctions_tool_mcp_server.server.sfn_client')
@@ -156,6 +160,7 @@ class TestRegisterStateMachines:
             'STANDARD',
             'Test Description\n\nWorkflow Description: Workflow Comment',
             None,
+            None,
         )
 
     @patch('awslabs.stepfunctions_tool_mcp_server.server.sfn_client')
@@ -0,0 +1,155 @@
+"""Tests for the schema cache and schema resolution."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+
+with pytest.MonkeyPatch().context() as CTX:
+    CTX.setattr('boto3.Session', MagicMock)
+    from awslabs.stepfunctions_tool_mcp_server.schema_cache import SchemaCache
+    from awslabs.stepfunctions_tool_mcp_server.server import (
+        list_all_state_machines,
+        resolve_schemas,
+    )
+
+
+SCHEMA_ARN_1 = 'arn:aws:schemas:us-east-1:123456789012:schema/registry/schema-1'
+SCHEMA_ARN_2 = 'arn:aws:schemas:us-east-1:123456789012:schema/registry/schema-2'
+
+
+class TestSchemaCache:
+    """Tests for the SchemaCache class."""
+
+    def test_put_and_get(self, tmp_path):
+        """Test that cached schemas are returned while they did not change."""
+        path = str(tmp_path / 'schemas.json')
+        cache = SchemaCache(path)
+        cache.put(SCHEMA_ARN_1, '1', '{"type": "object"}', '2024-01-01')
+        cache.save()
+
+        cache = SchemaCache(path)
+        assert cache.get(SCHEMA_ARN_1, '2024-01-01') == '{"type": "object"}'
+        assert cache.get(SCHEMA_ARN_1, '2024-02-01') is None
+        assert cache.get(SCHEMA_ARN_1, None) is None
+        assert cache.get(SCHEMA_ARN_2, '2024-01-01') is None
+
+    def test_new_version_replaces_previous(self, tmp_path):
+        """Test that only the latest version of a schema is kept."""
+        cache = SchemaCache(str(tmp_path / 'schemas.json'))
+        cache.put(SCHEMA_ARN_1, '1', 'version 1', '2024-01-01')
+        cache.put(SCHEMA_ARN_1, '2', 'version 2', '2024-02-01')
+
+        assert cache.get(SCHEMA_ARN_1, '2024-02-01') == 'version 2'
+        assert list(cache._schemas) == [f'{SCHEMA_ARN_1}@2']
+
+    def test_invalid_cache_file(self, tmp_path):
+        """Test that an unreadable cache file is ignored."""
+        path = tmp_path / 'schemas.json'
+        path.write_text('not json')
+
+        assert SchemaCache(str(path)).get(SCHEMA_ARN_1, '2024-01-01') is None
+
+    def test_memory_only(self):
+        """Test that a cache without path is not written."""
+        cache = SchemaCache(None)
+        cache.put(SCHEMA_ARN_1, '1', 'content', '2024-01-01')
+        cache.save()
+
+        assert cache.get(SCHEMA_ARN_1, '2024-01-01') == 'content'
+
+
+class TestResolveSchemas:
+    """Tests for the resolve_schemas function."""
+
+    @patch('awslabs.stepfunctions_tool_mcp_server.server.schemas_client')
+    def test_cold_and_warm_start(self, mock_schemas_client):
+        """Test that unchanged schemas are read from the cache on the next start."""
+        mock_schemas_client.list_schemas.side_effect = lambda **kwargs: {
+            'Schemas': [
+                {'SchemaArn': SCHEMA_ARN_1, 'LastModified': '2024-01-01'},
+                {'SchemaArn': SCHEMA_ARN_2, 'LastModified': '2024-01-01'},
+            ]
+        }
+        mock_schemas_client.describe_schema.side_effect = lambda RegistryName, SchemaName: {
+            'Content': f'content of {SchemaName}',
+            'SchemaVersion': '1',
+        }
+
+        schemas = resolve_schemas([SCHEMA_ARN_1, SCHEMA_ARN_2, SCHEMA_ARN_1])
+
+        assert schemas == {
+            SCHEMA_ARN_1: 'content of schema-1',
+            SCHEMA_ARN_2: 'content of schema-2',
+        }
+        assert mock_schemas_client.describe_schema.call_count == 2
+        mock_schemas_client.list_schemas.assert_called_once_with(RegistryName='registry')
+
+        # Second start: nothing changed
+        mock_schemas_client.describe_schema.reset_mock()
+        assert resolve_schemas([SCHEMA_ARN_1, SCHEMA_ARN_2]) == schemas
+        mock_schemas_client.describe_schema.assert_not_called()
+
+    @patch('awslabs.stepfunctions_tool_mcp_server.server.schemas_client')
+    def test_changed_schema_is_fetched(self, mock_schemas_client):
+        """Test that a schema modified since it was cached is fetched again."""
+        mock_schemas_client.list_schemas.return_value = {
+            'Schemas': [{'SchemaArn': SCHEMA_ARN_1, 'LastModified': '2024-01-01'}],
+        }
+        mock_schemas_client.describe_schema.return_value = {
+            'Content': 'version 1',
+            'SchemaVersion': '1',
+        }
+        resolve_schemas([SCHEMA_ARN_1])
+
+        mock_schemas_client.list_schemas.return_value = {
+            'Schemas': [{'SchemaArn': SCHEMA_ARN_1, 'LastModified': '2024-02-01'}],
+        }
+        mock_schemas_client.describe_schema.return_value = {
+            'Content': 'version 2',
+            'SchemaVersion': '2',
+        }
+
+        assert resolve_schemas([SCHEMA_ARN_1]) == {SCHEMA_ARN_1: 'version 2'}
+
+    @patch('awslabs.stepfunctions_tool_mcp_server.server.schemas_client')
+    def test_list_schemas_error(self, mock_schemas_client):
+        """Test that schemas are described when the registry cannot be listed."""
+        mock_schemas_client.list_schemas.side_effect = Exception('Access denied')
+        mock_schemas_client.describe_schema.return_value = {
+            'Content': 'content',
+            'SchemaVersion': '1',
+        }
+
+        assert resolve_schemas([SCHEMA_ARN_1]) == {SCHEMA_ARN_1: 'content'}
+        assert resolve_schemas([SCHEMA_ARN_1]) == {SCHEMA_ARN_1: 'content'}
+        assert mock_schemas_client.describe_schema.call_count == 2
+
+    @patch('awslabs.stepfunctions_tool_mcp_server.server.schemas_client')
+    def test_describe_schema_error(self, mock_schemas_client):
+        """Test that schemas that cannot be fetched are None."""
+        mock_schemas_client.list_schemas.return_value = {'Schemas': []}
+        mock_schemas_client.describe_schema.side_effect = Exception('Not found')
+
+        assert resolve_schemas([SCHEMA_ARN_1, 'invalid-arn']) == {
+            SCHEMA_ARN_1: None,
+            'invalid-arn': None,
+        }
+
+
+class TestListAllStateMachines:
+    """Tests for the list_all_state_machines function."""
+
+    @patch('awslabs.stepfunctions_tool_mcp_server.server.sfn_client')
+    def test_follows_next_token(self, mock_sfn_client):
+        """Test that every page of state machines is listed."""
+        mock_sfn_client.list_state_machines.side_effect = [
+            {'stateMachines': [{'name': 'machine1'}], 'nextToken': 'token-1'},
+            {'stateMachines': [{'name': 'machine2'}]},
+        ]
+
+        state_machines = list_all_state_machines()
+
+        assert [sm['name'] for sm in state_machines] == ['machine1', 'machine2']
+        assert mock_sfn_client.list_state_machines.call_args_list[1].kwargs == {
+            'nextToken': 'token-1'
+        }
@@ -0,0 +1,540 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Expansion of small seed tables into large synthetic datasets."""
+
+import numpy as np
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import re
+from abc import ABC, abstractmethod
+from awslabs.syntheticdata_mcp_server.integrity import factorize_table
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
+# Number of rows generated and written at once, which bounds memory use
+CHUNK_ROWS = 500_000
+
+# Numeric columns with repeated values and at most this many distinct values are categorical
+MAX_CATEGORICAL_VALUES = 10
+
+# Strings made of a common prefix and a number, such as 'C001'
+KEY_PATTERN = re.compile(r'^(\D*)(\d+)$')
+
+
+class ColumnModel(ABC):
+    """Model generating the values of a column."""
+
+    arrow_type: pa.DataType = pa.string()
+    # Fraction of null values in the seed column
+    null_fraction: float = 0.0
+
+    @abstractmethod
+    def generate(self, rng: np.random.Generator, start: int, count: int) -> np.ndarray:
+        """Generate the values of consecutive rows.
+
+        Args:
+            rng: Random generator
+            start: Index of the first row
+            count: Number of rows
+
+        Returns:
+            Values of the rows
+        """
+        pass
+
+
+class KeyModel(ColumnModel):
+    """Model of a key column, whose value is computed from the index of the row."""
+
+    def __init__(self, start: int, prefix: Optional[str] = None, width: int = 0):
+        """Initialize the key model.
+
+        Args:
+            start: Key of the first row
+            prefix: Prefix of string keys, None for integer keys
+            width: Minimum number of digits of string keys
+        """
+        self.start = start
+        self.prefix = prefix
+        self.width = width
+        self.arrow_type = pa.int64() if prefix is None else pa.string()
+
+    def values_at(self, indices: np.ndarray) -> np.ndarray:
+        """Get the keys of rows.
+
+        Args:
+            indices: Indices of the rows
+
+        Returns:
+            Keys of the rows
+        """
+        numbers = indices.astype(np.int64) + self.start
+        if self.prefix is None:
+            return numbers
+        digits = np.char.zfill(numbers.astype(str), self.width)
+        return np.char.add(self.prefix, digits).astype(object)
+
+    def generate(self, rng: np.random.Generator, start: int, count: int) -> np.ndarray:
+        """Generate the keys of consecutive rows."""
+        return self.values_at(np.arange(start, start + count))
+
+
+class ForeignKeyModel(ColumnModel):
+    """Model of a column referencing the key of a parent table.
+
+    Each parent row gets a number of references drawn from the numbers of rows referencing
+    each parent row in the seed tables, so the expanded tables keep the fan-out of the seed
+    tables. When the child table has as many rows as references drawn, each parent row is
+    referenced exactly that number of times by consecutive rows, otherwise rows reference
+    parent rows at random in proportion to their number of references.
+    """
+
+    # Whether the child table has as many rows as references drawn
+    exact: bool = False
+
+    def __init__(
+        self,
+        parent_key: KeyModel,
+        parent_rows: int,
+        fan_out: np.ndarray,
+        rng: np.random.Generator,
+        one_to_one: bool = False,
+    ):
+        """Initialize the foreign key model.
+
+        Args:
+            parent_key: Model of the referenced key
+            parent_rows: Number of rows of the expanded parent table
+            fan_out: Number of rows referencing each parent row in the seed tables
+            rng: Random generator drawing the references of the parent rows
+            one_to_one: Whether each parent row is referenced by a single row
+        """
+        self.parent_key = parent_key
+        self.parent_rows = parent_rows
+        self.one_to_one = one_to_one
+        self.arrow_type = parent_key.arrow_type
+        references = rng.choice(fan_out, size=parent_rows) if len(fan_out) else None
+        if references is None or references.sum() == 0:
+            references = np.ones(parent_rows, dtype=np.int64)
+        self._cumulative = np.cumsum(references)
+
+    @property
+    def references(self) -> int:
+        """Get the number of references drawn for all the parent rows."""
+        return int(self._cumulative[-1])
+
+    def generate(self, rng: np.random.Generator, start: int, count: int) -> np.ndarray:
+        """Generate references to parent rows."""
+        if self.exact:
+            positions = np.arange(start, start + count)
+        elif self.one_to_one:
+            return self.parent_key.values_at(np.arange(start, start + count) % self.parent_rows)
+        else:
+            positions = rng.integers(0, self.references, count)
+        return self.parent_key.values_at(
+            np.searchsorted(self._cumulative, positions, side='right')
+        )
+
+
+class CategoricalModel(ColumnModel):
+    """Model sampling the values of the seed column with their frequencies."""
+
+    def __init__(self, values: np.ndarray, frequencies: np.ndarray, arrow_type: pa.DataType):
+        """Initialize the categorical model.
+
+        Args:
+            values: Distinct values of the seed column
+            frequencies: Frequency of each value
+            arrow_type: Type of the values
+        """
+        self.values = values
+        self.probabilities = frequencies / frequencies.sum()
+        self.arrow_type = arrow_type
+
+    def generate(self, rng: np.random.Generator, start: int, count: int) -> np.ndarray:
+        """Sample values with their seed frequencies."""
+        return self.values[rng.choice(len(self.values), size=count, p=self.probabilities)]
+
+
+class NumericModel(ColumnModel):
+    """Model drawing numbers from a normal or log-normal distribution fitted to the seed."""
+
+    def __init__(self, values: np.ndarray, integer: bool, decimals: int):
+        """Fit the distribution of a numeric seed column.
+
+        Args:
+            values: Non-null values of the seed column
+            integer: Whether to generate integers
+            decimals: Number of decimals of the generated numbers
+        """
+        self.integer = integer
+        self.decimals = decimals
+        self.arrow_type = pa.int64() if integer else pa.float64()
+        self.log = bool(values.min() > 0 and pd.Series(values).skew() > 1)
+        fitted = np.log(values) if self.log else values
+        self.mean = float(fitted.mean())
+        self.std = float(fitted.std()) if len(values) > 1 else 0.0
+        # Allow values slightly outside of the seed range, without changing their sign
+        margin = 0.1 * float(values.max() - values.min())
+        self.low = float(values.min()) - margin
+        self.high = float(values.max()) + margin
+        if values.min() >= 0:
+            self.low = max(self.low, 0.0)
+
+    def generate(self, rng: np.random.Generator, start: int, count: int) -> np.ndarray:
+        """Draw numbers from the fitted distribution."""
+        numbers = rng.normal(self.mean, self.std, count)
+        if self.log:
+            numbers = np.exp(numbers)
+        numbers = np.clip(numbers, self.low, self.high)
+        if self.integer:
+            return np.rint(numbers).astype(np.int64)
+        return np.round(numbers, self.decimals)
+
+
+class DatetimeModel(ColumnModel):
+    """Model drawing timestamps uniformly between the earliest and latest seed values."""
+
+    def __init__(self, values: pd.Series):
+        """Fit the range of a datetime seed column.
+
+        Args:
+            values: Non-null values of the seed column, as datetimes
+        """
+        self.low = values.min().value
+        self.high = values.max().value
+        self.date_only = bool((values == values.dt.normalize()).all())
+        self.arrow_type = pa.date32() if self.date_only else pa.timestamp('ns')
+
+    def generate(self, rng: np.random.Generator, start: int, count: int) -> np.ndarray:
+        """Draw timestamps between the earliest and latest seed values."""
+        nanoseconds = rng.integers(self.low, self.high, count, endpoint=True)
+        timestamps = nanoseconds.astype('datetime64[ns]')
+        if self.date_only:
+            return timestamps.astype('datetime64[D]')
+        return timestamps
+
+
+class Relationship(NamedTuple):
+    """A column of a table referencing the key of another table."""
+
+    child: str
+    column: str
+    parent: str
+
+
+def is_key_name(column: str) -> bool:
+    """Check whether a column is named like a key."""
+    name = str(column).lower()
+    return name == 'id' or name.endswith('_id')
+
+
+def find_relationships(seeds: Dict[str, pd.DataFrame]) -> List[Relationship]:
+    """Find the columns referencing the key of another table.
+
+    A column named like a key references another table when that table has a column of the
+    same name with a distinct value in every row. A column with a distinct value in every row
+    of its own table is the key of that table, and only references another table when its
+    table has another key, such as the profile_id of a profiles table referencing users by
+    user_id. When the column then is unique in both tables, the table listed first is the
+    parent.
+
+    Args:
+        seeds: Seed tables, by name
+
+    Returns:
+        The relationships between the tables
+    """
+    unique = {
+        name: {
+            column
+            for column, factorized in factorize_table(df).items()
+            if len(df) and factorized.cardinality == len(df) and is_key_name(column)
+        }
+        for name, df in seeds.items()
+    }
+    order = list(seeds)
+    relationships = []
+    for child, child_df in seeds.items():
+        for column in child_df.columns:
+            if not is_key_name(column):
+                continue
+            if unique[child] == {column}:
+                # The column is the only key of its table
+                continue
+            for parent in order:
+                if parent == child or column not in unique[parent]:
+                    continue
+                if column in unique[child] and order.index(parent) > order.index(child):
+                    continue
+                relationships.append(Relationship(child, column, parent))
+                break
+    return relationships
+
+
+def sort_tables(tables: List[str], relationships: List[Relationship]) -> List[Relationship]:
+    """Order the tables so that parents come before their children, breaking cycles.
+
+    Args:
+        tables: Names of the tables, in the order to keep when possible
+        relationships: Relationships between the tables, sorted in place
+
+    Returns:
+        The relationships kept, without the ones closing a cycle
+    """
+    ordered: List[str] = []
+    remaining = list(tables)
+    kept = []
+    while remaining:
+        for table in remaining:
+            parents = {r.parent for r in relationships if r.child == table}
+            if parents <= set(ordered):
+                break
+        else:
+            # Every remaining table is in a cycle, so its references to them are dropped
+            table = remaining[0]
+        kept.extend(r for r in relationships if r.child == table and r.parent in ordered)
+        ordered.append(table)
+        remaining.remove(table)
+    tables[:] = ordered
+    return kept
+
+
+def parse_datetimes(values: pd.Series) -> Optional[pd.Series]:
+    """Parse a string column made only of dates or timestamps.
+
+    Args:
+        values: Non-null values of the column
+
+    Returns:
+        The parsed values, None if the column does not only hold dates or timestamps
+    """
+    strings = values.astype(str)
+    if not strings.str.contains(r'\d[-/:]\d', regex=True).all():
+        return None
+    parsed = pd.to_datetime(strings, errors='coerce', format='ISO8601')
+    if parsed.isna().any():
+        return None
+    return parsed
+
+
+def count_decimals(values: np.ndarray, maximum: int = 6) -> int:
+    """Get the number of decimals needed to write numbers."""
+    for decimals in range(maximum + 1):
+        if np.allclose(np.round(values, decimals), values):
+            return decimals
+    return maximum
+
+
+def fit_column(column: pd.Series, is_key: bool) -> ColumnModel:
+    """Fit the model generating the values of a seed column.
+
+    Args:
+        column: Seed column
+        is_key: Whether the column is the key of its table
+
+    Returns:
+        The model of the column
+    """
+    values = column.dropna()
+    if len(values) == 0:
+        model: ColumnModel = CategoricalModel(np.array([None]), np.array([1.0]), pa.string())
+        model.null_fraction = 1.0
+        return model
+
+    numeric = pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column)
+    integer = numeric and bool(np.all(np.mod(values.to_numpy(np.float64), 1) == 0))
+
+    if is_key:
+        if integer:
+            return KeyModel(int(values.min()))
+        matches = values.astype(str).str.extract(KEY_PATTERN)
+        if not matches.isna().any().any() and matches[0].nunique() == 1:
+            return KeyModel(
+                int(matches[1].astype(int).min()), matches[0].iloc[0], len(matches[1].iloc[0])
+            )
+        return KeyModel(1, f'{column.name}_', 0)
+
+    if pd.api.types.is_datetime64_any_dtype(column):
+        model = DatetimeModel(values)
+    elif numeric and not (
+        values.nunique() <= MAX_CATEGORICAL_VALUES and values.nunique() < len(values)
+    ):
+        numbers = values.to_numpy(np.float64)
+        model = NumericModel(numbers, integer, 0 if integer else count_decimals(numbers))
+    else:
+        is_text = pd.api.types.is_string_dtype(values) or values.dtype == object
+        datetimes = parse_datetimes(values) if is_text else None
+        if datetimes is not None:
+            model = DatetimeModel(datetimes)
+        else:
+            frequencies = values.value_counts(sort=False)
+            distinct = frequencies.index.to_numpy()
+            if integer:
+                arrow_type = pa.int64()
+                distinct = distinct.astype(np.int64)
+            elif numeric:
+                arrow_type = pa.float64()
+            elif pd.api.types.is_bool_dtype(column):
+                arrow_type = pa.bool_()
+            else:
+                arrow_type = pa.string()
+                distinct = distinct.astype(str).astype(object)
+            model = CategoricalModel(distinct, frequencies.to_numpy(np.float64), arrow_type)
+
+    model.null_fraction = float(column.isna().mean())
+    return model
+
+
+def fan_out(child: pd.Series, parent: pd.Series) -> np.ndarray:
+    """Count the rows of a child seed table referencing each row of its parent seed table.
+
+    Args:
+        child: Referencing column of the child table
+        parent: Key column of the parent table
+
+    Returns:
+        Number of references to each parent row
+    """
+    counts = child.dropna().value_counts()
+    return counts.reindex(parent.to_numpy(), fill_value=0).to_numpy(np.int64)
+
+
+def write_table(
+    path: str,
+    models: Dict[str, ColumnModel],
+    rows: int,
+    rng: np.random.Generator,
+    chunk_rows: int,
+) -> int:
+    """Generate a table chunk by chunk and write each chunk as a Parquet row group.
+
+    Args:
+        path: Path of the Parquet file
+        models: Models of the columns of the table
+        rows: Number of rows to generate
+        rng: Random generator
+        chunk_rows: Number of rows generated and written at once
+
+    Returns:
+        Number of row groups written
+    """
+    schema = pa.schema([(str(name), model.arrow_type) for name, model in models.items()])
+    row_groups = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for start in range(0, rows, chunk_rows):
+            count = min(chunk_rows, rows - start)
+            arrays = []
+            for model in models.values():
+                values = model.generate(rng, start, count)
+                mask = rng.random(count) < model.null_fraction if model.null_fraction else None
+                arrays.append(pa.array(values, type=model.arrow_type, mask=mask))
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            row_groups += 1
+    return row_groups
+
+
+def expand_tables(
+    seeds: Dict[str, pd.DataFrame],
+    output_dir: str,
+    row_counts: Optional[Dict[str, int]] = None,
+    scale_factor: float = 1000,
+    chunk_rows: int = CHUNK_ROWS,
+    random_seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Expand seed tables into large tables with the same distributions and relationships.
+
+    Each column is fitted from its seed: keys become sequences, categorical columns keep the
+    frequencies of their values, numeric columns follow a normal or log-normal distribution
+    and dates are spread over the seed range. Columns referencing another table pick parent
+    rows with the fan-out of the seed tables. Tables are written to Parquet files one row
+    group at a time, so memory use does not grow with the number of rows.
+
+    Args:
+        seeds: Seed tables, by name
+        output_dir: Directory of the Parquet files
+        row_counts: Number of rows of some tables
+        scale_factor: Ratio of expanded to seed rows of the other tables without a parent
+        chunk_rows: Number of rows generated and written at once
+        random_seed: Seed of the random generator, for reproducible datasets
+
+    Returns:
+        Dictionary with the Parquet file, rows and row groups of each table, and the
+        relationships kept between tables
+    """
+    row_counts = row_counts or {}
+    rng = np.random.default_rng(random_seed)
+
+    tables = list(seeds)
+    relationships = sort_tables(tables, find_relationships(seeds))
+
+    os.makedirs(output_dir, exist_ok=True)
+    keys: Dict[str, Dict[str, KeyModel]] = {}
+    rows_by_table: Dict[str, int] = {}
+    results: Dict[str, Any] = {}
+    relationship_results = []
+
+    for table in tables:
+        seed = seeds[table]
+        parents = [r for r in relationships if r.child == table]
+        unique_columns = {
+            column
+            for column, factorized in factorize_table(seed).items()
+            if len(seed) and factorized.cardinality == len(seed)
+        }
+
+        models: Dict[str, ColumnModel] = {}
+        foreign_keys: List[ForeignKeyModel] = []
+        keys[table] = {}
+        for column in seed.columns:
+            relationship = next((r for r in parents if r.column == column), None)
+            if relationship is not None and column in keys[relationship.parent]:
+                references = fan_out(seed[column], seeds[relationship.parent][column])
+                model: ColumnModel = ForeignKeyModel(
+                    keys[relationship.parent][column],
+                    rows_by_table[relationship.parent],
+                    references,
+                    rng,
+                    one_to_one=column in unique_columns,
+                )
+                model.null_fraction = float(seed[column].isna().mean())
+                foreign_keys.append(model)
+                relationship_results.append(
+                    {
+                        'child_table': table,
+                        'column': column,
+                        'parent_table': relationship.parent,
+                        'mean_fan_out': round(float(references.mean()), 3),
+                    }
+                )
+            else:
+                model = fit_column(seed[column], column in unique_columns and is_key_name(column))
+                if isinstance(model, KeyModel):
+                    keys[table][column] = model
+            models[column] = model
+
+        # Rows of the table, from the references drawn for its first parent if not given
+        rows = row_counts.get(table)
+        if rows is None and foreign_keys:
+            rows = foreign_keys[0].references
+            foreign_keys[0].exact = True
+        if rows is None:
+            rows = round(len(seed) * scale_factor)
+        rows_by_table[table] = rows
+
+        path = os.path.join(output_dir, f'{table}.parquet')
+        row_groups = write_table(path, models, rows, rng, chunk_rows)
+        results[table] = {'path': path, 'rows': rows, 'row_groups': row_groups}
+
+    return {'tables': results, 'relationships': relationship_results}
@@ -0,0 +1,157 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Vectorized analysis of keys and dependencies between tables."""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+# Tables with more rows are first checked on a sample of this size
+SAMPLE_ROWS = 100_000
+
+
+class FactorizedColumn(NamedTuple):
+    """A column encoded as integer codes of its distinct values."""
+
+    # Code of the value of each row, -1 for null values
+    codes: np.ndarray
+    # Number of distinct non-null values
+    cardinality: int
+    has_nulls: bool
+
+
+def factorize_column(column: pd.Series) -> FactorizedColumn:
+    """Encode a column as integer codes of its distinct values.
+
+    Args:
+        column: Column to encode
+
+    Returns:
+        The factorized column
+    """
+    codes, uniques = pd.factorize(column, use_na_sentinel=True)
+    codes = codes.astype(np.int64, copy=False)
+    return FactorizedColumn(codes, len(uniques), bool((codes < 0).any()))
+
+
+def factorize_table(df: pd.DataFrame) -> Dict[str, FactorizedColumn]:
+    """Encode every column of a table as integer codes.
+
+    Args:
+        df: Table to encode
+
+    Returns:
+        Dictionary of column name to factorized column
+    """
+    return {column: factorize_column(df[column]) for column in df.columns}
+
+
+def count_distinct(values: np.ndarray) -> int:
+    """Count the distinct values of an integer array using a hash table."""
+    return len(pd.unique(values))
+
+
+def determines(
+    determinant: FactorizedColumn, dependent: FactorizedColumn, exact: bool = True
+) -> bool:
+    """Check whether a column functionally determines another one.
+
+    The determinant determines the dependent if every non-null value of the determinant is
+    found with exactly one distinct non-null value of the dependent. Both columns partition the
+    rows by value, and the dependency holds when refining the partition of the determinant by
+    the dependent leaves it unchanged, so the check only counts distinct pairs of codes.
+
+    Args:
+        determinant: Column that may determine the other one
+        dependent: Column that may be determined
+        exact: False to only check that no value of the determinant is found with several
+            values of the dependent, which also holds on any sample of rows of the table
+
+    Returns:
+        True if the dependency holds
+    """
+    if not determinant.has_nulls and not dependent.has_nulls:
+        if determinant.cardinality == len(determinant.codes):
+            # Each value of a key is found in a single row
+            return True
+        if dependent.cardinality > determinant.cardinality:
+            return False
+        pairs = determinant.codes * dependent.cardinality + dependent.codes
+        return count_distinct(pairs) == determinant.cardinality
+
+    both = (determinant.codes >= 0) & (dependent.codes >= 0)
+    codes = determinant.codes[both]
+    pairs = codes * dependent.cardinality + dependent.codes[both]
+    distinct = count_distinct(codes)
+    if count_distinct(pairs) != distinct:
+        return False
+    # Values of the determinant only found with null values of the dependent
+    return not exact or distinct == determinant.cardinality
+
+
+def find_functional_dependencies(
+    df: pd.DataFrame,
+    sample_rows: int = SAMPLE_ROWS,
+    columns: Optional[Dict[str, FactorizedColumn]] = None,
+) -> List[Tuple[str, str]]:
+    """Find the functional dependencies between the columns of a table.
+
+    Large tables are first checked on a sample of rows, which rules out most column pairs, and
+    only the dependencies found on the sample are checked on the whole table.
+
+    Args:
+        df: Table to analyze
+        sample_rows: Tables with more rows are first checked on a sample of this size
+        columns: Factorized columns of the table, if already computed
+
+    Returns:
+        List of (determinant, dependent) column pairs, in column order
+    """
+    pairs = [(a, b) for a in df.columns for b in df.columns if a != b]
+    if len(df) > sample_rows:
+        sample = factorize_table(df.sample(n=sample_rows, random_state=0))
+        pairs = [(a, b) for a, b in pairs if determines(sample[a], sample[b], exact=False)]
+        if not pairs:
+            return []
+
+    if columns is None:
+        columns = factorize_table(df)
+    return [(a, b) for a, b in pairs if determines(columns[a], columns[b])]
+
+
+def find_missing_values(source: pd.Series, target: pd.Series) -> np.ndarray:
+    """Find the non-null values of a column that are not in another column.
+
+    Numeric columns are checked with a binary search of the sorted distinct target values,
+    other columns with a hash table.
+
+    Args:
+        source: Column whose values must exist in the target column
+        target: Column holding the allowed values
+
+    Returns:
+        The distinct values of the source column missing from the target column
+    """
+    values = pd.unique(source.dropna())
+    if len(values) == 0:
+        return np.asarray(values)
+
+    if source.dtype.kind in 'iufb' and target.dtype.kind in 'iufb':
+        allowed = np.sort(pd.unique(target.dropna()))
+        if len(allowed) == 0:
+            return np.asarray(values)
+        positions = np.minimum(np.searchsorted(allowed, values), len(allowed) - 1)
+        found = allowed[positions] == values
+    else:
+        found = pd.Series(values).isin(pd.unique(target)).to_numpy()
+    return np.asarray(values)[~found]
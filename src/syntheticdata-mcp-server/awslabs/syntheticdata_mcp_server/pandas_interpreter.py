@@ -13,6 +13,11 @@
 import ast
 import os
 import pandas as pd
+from awslabs.syntheticdata_mcp_server.integrity import (
+    factorize_table,
+    find_functional_dependencies,
+    find_missing_values,
+)
 from typing import Any, Dict, List
 
 
@@ -173,6 +178,8 @@ def check_referential_integrity(dataframes: Dict[str, pd.DataFrame]) -> List[Dic
     2. Checks if values in potential foreign key columns exist in the target table
     3. Checks for functional dependencies within each table
 
+    Columns are factorized into integer codes once, so that every check is vectorized.
+
     Args:
         dataframes: Dictionary of dataframe name to dataframe object
 
@@ -180,6 +187,7 @@ def check_referential_integrity(dataframes: Dict[str, pd.DataFrame]) -> List[Dic
         List of integrity issues found
     """
     issues = []
+    columns = {name: factorize_table(df) for name, df in dataframes.items()}
 
     # Check for potential foreign keys and their integrity
     for source_name, source_df in dataframes.items():
@@ -188,51 +196,39 @@ def check_referential_integrity(dataframes: Dict[str, pd.DataFrame]) -> List[Dic
                 continue
 
             # Find columns with same name in both dataframes (potential foreign keys)
-            common_cols = set(source_df.columns).intersection(set(target_df.columns))
+            common_cols = [col for col in source_df.columns if col in target_df.columns]
 
             for col in common_cols:
                 # Check if column in target_df has unique values (could be a primary key)
-                if target_df[col].nunique() == len(target_df):
+                if columns[target_name][col].cardinality == len(target_df):
                     # Check if all values in source_df[col] exist in target_df[col]
-                    source_values = set(source_df[col].dropna())
-                    target_values = set(target_df[col])
-
-                    missing_values = source_values - target_values
-                    if missing_values:
+                    missing_values = find_missing_values(source_df[col], target_df[col])
+                    if len(missing_values):
                         issues.append(
                             {
                                 'type': 'referential_integrity',
                                 'source_table': source_name,
                                 'target_table': target_name,
                                 'column': col,
-                                'missing_values': list(missing_values)[
+                                'missing_values': missing_values[
                                     :10
-                                ],  # Limit to first 10 values
+                                ].tolist(),  # Limit to first 10 values
                                 'missing_count': len(missing_values),
                             }
                         )
 
     # Check for functional dependencies
     for df_name, df in dataframes.items():
-        for col1 in df.columns:
-            for col2 in df.columns:
-                if col1 == col2:
-                    continue
-
-                # Group by potential determinant and check if it determines the dependent
-                grouped = df.groupby(col1)[col2].nunique()
-
-                # Check if each value in col1 maps to exactly one value in col2
-                if (grouped == 1).all():
-                    issues.append(
-                        {
-                            'type': 'functional_dependency',
-                            'table': df_name,
-                            'determinant': col1,
-                            'dependent': col2,
-                            'message': f"Column '{col1}' functionally determines '{col2}' (possible violation of 3NF)",
-                        }
-                    )
+        for col1, col2 in find_functional_dependencies(df, columns=columns[df_name]):
+            issues.append(
+                {
+                    'type': 'functional_dependency',
+                    'table': df_name,
+                    'determinant': col1,
+                    'dependent': col2,
+                    'message': f"Column '{col1}' functionally determines '{col2}' (possible violation of 3NF)",
+                }
+            )
 
     return issues
 
@@ -11,9 +11,11 @@
 
 """AWS syntheticdata MCP Server implementation."""
 
+import asyncio
 import os
 import pandas as pd
 import re
+from awslabs.syntheticdata_mcp_server.expansion import expand_tables
 from awslabs.syntheticdata_mcp_server.pandas_interpreter import (
     execute_pandas_code as _execute_pandas_code,
 )
@@ -104,6 +106,56 @@ class LoadToStorageInput(BaseModel):
     )
 
 
+class ExpandSeedDataInput(BaseModel):
+    """Input model for expanding seed tables into large synthetic datasets.
+
+    This model defines the required parameters for expanding the small tables saved as CSV
+    files into large Parquet files keeping their distributions and relationships.
+
+    Attributes:
+        workspace_dir: The current workspace directory. Critical for finding the seed
+            tables in the user's current project.
+        seed_dir: Optional subdirectory within workspace_dir holding the seed CSV files.
+            If not provided, the CSV files of workspace_dir are used.
+        output_dir: Subdirectory within workspace_dir to save Parquet files to.
+        tables: Optional names of the seed tables to expand. If not provided, all the
+            CSV files of the seed directory are expanded.
+        row_counts: Optional number of rows of some tables.
+        scale_factor: Ratio of expanded to seed rows of the other tables without a parent.
+        random_seed: Optional seed of the random generator, for reproducible datasets.
+    """
+
+    workspace_dir: str = Field(
+        ...,
+        description="CRITICAL: The current workspace directory. Assistant must always provide this parameter to find the seed tables in the user's current project.",
+    )
+    seed_dir: Optional[str] = Field(
+        None,
+        description='Optional subdirectory within workspace_dir holding the seed CSV files. If not provided, the CSV files of workspace_dir are used.',
+    )
+    output_dir: str = Field(
+        'expanded',
+        description='Subdirectory within workspace_dir to save Parquet files to.',
+    )
+    tables: Optional[List[str]] = Field(
+        None,
+        description='Optional names of the seed tables to expand, which are the names of their CSV files without extension. If not provided, all the seed tables are expanded.',
+    )
+    row_counts: Optional[Dict[str, int]] = Field(
+        None,
+        description='Optional number of rows of some tables. Tables referencing another table default to the number of rows keeping the fan-out of the seed tables.',
+    )
+    scale_factor: float = Field(
+        1000,
+        gt=0,
+        description='Ratio of expanded to seed rows of the tables without a row count that do not reference another table.',
+    )
+    random_seed: Optional[int] = Field(
+        None,
+        description='Optional seed of the random generator, for reproducible datasets.',
+    )
+
+
 mcp = FastMCP(
     'awslabs.syntheticdata-mcp-server',
     instructions="""
@@ -115,7 +167,8 @@ mcp = FastMCP(
 
     - Provides detailed instructions for generating synthetic data based on business descriptions
     - Validates and saves JSON Lines data as CSV files
-    - Loads data to various storage targets (S3, with more coming soon)
+    - Expands saved seed tables into millions of rows written as Parquet files
+    - Loads data to various storage targets (S3, or the local filesystem for offline testing)
     - Supports multiple data formats (CSV, JSON, Parquet)
     - Handles data partitioning and storage optimization
 
@@ -125,7 +178,8 @@ mcp = FastMCP(
     2. Get detailed instructions for generating synthetic data
     3. Generate the data in JSON Lines format following the instructions
     4. Validate and save the data as CSV files
-    5. (Optional) Load the data to storage targets like S3 with optimized formats and partitioning
+    5. (Optional) Expand the saved tables into large Parquet datasets
+    6. (Optional) Load the data to storage targets like S3 with optimized formats and partitioning
 
     ## Use Cases
 
@@ -295,7 +349,9 @@ async def load_to_storage(input_data: LoadToStorageInput) -> Dict:
 
     This tool uses the UnifiedDataLoader to load data to configured storage targets.
     Currently supports:
-    - S3: Load data as CSV, JSON, or Parquet files with optional partitioning
+    - S3: Load data as CSV, JSON, or Parquet files with optional partitioning,
+      streamed with parallel multipart uploads
+    - local: Write the same files to a local directory, for offline testing
 
     Example targets configuration:
     ```python
@@ -407,6 +463,72 @@ async def execute_pandas_code(input_data: ExecutePandasCodeInput) -> Dict:
         }
 
 
+@mcp.tool(name='expand_seed_data')
+async def expand_seed_data(input_data: ExpandSeedDataInput) -> Dict:
+    """Expand saved seed tables into large synthetic datasets written as Parquet files.
+
+    This tool fits each column of the seed CSV files and generates as many rows as needed:
+
+    - Key columns become sequences following the format of the seed keys
+    - Categorical columns keep the frequencies of their values
+    - Numeric columns follow a normal or log-normal distribution fitted to the seed
+    - Date columns are spread over the range of the seed dates
+    - Columns referencing the key of another table keep the number of rows referencing each
+      parent row in the seed tables, so child tables grow with their parents
+
+    Rows are generated and written in chunks, one Parquet row group each, so tables of
+    millions of rows do not need to fit in memory.
+
+    Parameters:
+        workspace_dir: CRITICAL - The current workspace directory
+        seed_dir: Optional subdirectory within workspace_dir holding the seed CSV files
+        output_dir: Subdirectory within workspace_dir to save Parquet files to
+        tables: Optional names of the seed tables to expand
+        row_counts: Optional number of rows of some tables
+        scale_factor: Ratio of expanded to seed rows of the other tables without a parent
+        random_seed: Optional seed of the random generator
+
+    Returns:
+        A dictionary containing the Parquet file and number of rows of each table and the
+        relationships kept between tables
+    """
+    try:
+        seed_dir = input_data.workspace_dir
+        if input_data.seed_dir:
+            seed_dir = os.path.join(input_data.workspace_dir, input_data.seed_dir)
+
+        names = input_data.tables
+        if names is None:
+            names = sorted(name[:-4] for name in os.listdir(seed_dir) if name.endswith('.csv'))
+        missing = [
+            name for name in names if not os.path.isfile(os.path.join(seed_dir, f'{name}.csv'))
+        ]
+        if missing:
+            return {
+                'success': False,
+                'error': f'Seed tables not found in {seed_dir}: {", ".join(missing)}',
+            }
+        if not names:
+            return {'success': False, 'error': f'No seed CSV files found in {seed_dir}'}
+
+        seeds = {name: pd.read_csv(os.path.join(seed_dir, f'{name}.csv')) for name in names}
+        save_dir = os.path.join(input_data.workspace_dir, input_data.output_dir)
+        result = await asyncio.to_thread(
+            expand_tables,
+            seeds,
+            save_dir,
+            row_counts=input_data.row_counts,
+            scale_factor=input_data.scale_factor,
+            random_seed=input_data.random_seed,
+        )
+        return {'success': True, 'output_dir': save_dir, **result}
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e),
+        }
+
+
 def _extract_key_entities(description: str) -> List[str]:
     """Extract key entities from a business description.
 
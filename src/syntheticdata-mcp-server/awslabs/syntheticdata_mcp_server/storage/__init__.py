@@ -1,7 +1,8 @@
 """Storage module for synthetic data loading."""
 
 from .base import DataTarget
+from .local import LocalTarget
 from .s3 import S3Target
 from .loader import UnifiedDataLoader
 
-__all__ = ['DataTarget', 'S3Target', 'UnifiedDataLoader']
+__all__ = ['DataTarget', 'LocalTarget', 'S3Target', 'UnifiedDataLoader']
@@ -12,6 +12,7 @@
 
 """Unified data loader implementation."""
 
+from .local import LocalTarget
 from .s3 import S3Target
 from typing import Any, Dict, List
 
@@ -21,7 +22,7 @@ class UnifiedDataLoader:
 
     def __init__(self):
         """Initialize with supported storage targets."""
-        self.targets = {'s3': S3Target()}
+        self.targets = {'s3': S3Target(), 'local': LocalTarget()}
 
     async def load_data(
         self, data: Dict[str, List[Dict]], targets: List[Dict[str, Any]]
@@ -31,7 +32,7 @@ class UnifiedDataLoader:
         Args:
             data: Dictionary mapping table names to lists of records
             targets: List of target configurations, each containing:
-                - type: Target type (e.g., 's3')
+                - type: Target type (e.g., 's3' or 'local')
                 - config: Target-specific configuration
 
         Returns:
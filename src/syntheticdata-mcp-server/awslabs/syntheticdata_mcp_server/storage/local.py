@@ -0,0 +1,92 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+
+"""Local filesystem storage target implementation."""
+
+import asyncio
+import os
+from .base import DataTarget
+from .streaming import LocalFileSink, stream_table
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+
+class LocalTarget(DataTarget):
+    """Local filesystem storage target, laid out like the S3 target for offline testing."""
+
+    def __init__(self):
+        """Initialize local target."""
+        self.supported_formats = ['csv', 'json', 'parquet']
+        self.executor = ThreadPoolExecutor(max_workers=4)
+
+    async def validate(self, data: Dict[str, List[Dict]], config: Dict[str, Any]) -> bool:
+        """Validate data and local configuration.
+
+        Args:
+            data: Dictionary mapping table names to lists of records
+            config: Local configuration including path, format, etc.
+
+        Returns:
+            True if validation passes, False otherwise
+        """
+        if not all(field in config for field in ['path', 'format']):
+            return False
+
+        if config['format'] not in self.supported_formats:
+            return False
+
+        if not data or not all(isinstance(records, list) for records in data.values()):
+            return False
+
+        return True
+
+    async def load(self, data: Dict[str, List[Dict]], config: Dict[str, Any]) -> Dict:
+        """Write data to local files with the layout of S3 objects.
+
+        Files are written to {path}/{table}/{partition}/{table}.{format}, chunk by chunk.
+
+        Args:
+            data: Dictionary mapping table names to lists of records
+            config: Local configuration including:
+                - path: Directory of the files
+                - format: Output format (csv, json, parquet)
+                - partitioning: Optional partitioning configuration
+                - compression: Optional Parquet compression type
+                - chunk_rows: Optional number of records encoded at once, which is also the
+                  size of Parquet row groups
+
+        Returns:
+            Dictionary containing load results
+        """
+        try:
+
+            def open_sink(path: str) -> LocalFileSink:
+                return LocalFileSink(os.path.join(config['path'], path))
+
+            loop = asyncio.get_event_loop()
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        self.executor, stream_table, table_name, records, config, open_sink
+                    )
+                    for table_name, records in data.items()
+                )
+            )
+
+            return {
+                'success': True,
+                'written_files': [written for table in results for written in table],
+                'total_records': sum(len(records) for records in data.values()),
+            }
+
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
@@ -3,10 +3,14 @@
 import asyncio
 import boto3
 import os
-import pandas as pd
 from .base import DataTarget
+from .streaming import PART_SIZE, S3MultipartSink, stream_table
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
+
+
+# Number of parts uploaded at the same time across all tables
+UPLOAD_WORKERS = 16
 
 
 class S3Target(DataTarget):
@@ -18,6 +22,7 @@ class S3Target(DataTarget):
         self.s3_client = session.client('s3')
         self.supported_formats = ['csv', 'json', 'parquet']
         self.executor = ThreadPoolExecutor(max_workers=4)
+        self.upload_executor = ThreadPoolExecutor(max_workers=UPLOAD_WORKERS)
 
     async def validate(self, data: Dict[str, List[Dict]], config: Dict[str, Any]) -> bool:
         """Validate data and S3 configuration.
@@ -57,6 +62,10 @@ class S3Target(DataTarget):
     async def load(self, data: Dict[str, List[Dict]], config: Dict[str, Any]) -> Dict:
         """Load data to S3 with specified configuration.
 
+        Tables are encoded chunk by chunk and streamed to S3 with multipart uploads, several
+        tables and several parts of each object at a time, so memory use stays bounded by a
+        few parts per object rather than growing with the size of the tables.
+
         Args:
             data: Dictionary mapping table names to lists of records
             config: S3 configuration including:
@@ -66,153 +75,50 @@ class S3Target(DataTarget):
                 - partitioning: Optional partitioning configuration
                 - storage: Optional storage class and encryption settings
                 - metadata: Optional object metadata
+                - compression: Optional Parquet compression type
+                - chunk_rows: Optional number of records encoded at once, which is also the
+                  size of Parquet row groups
+                - part_size_mb: Optional size of the parts of multipart uploads, at least 5
 
         Returns:
             Dictionary containing load results
         """
         try:
-            # Convert to DataFrames
-            dataframes = {name: pd.DataFrame(records) for name, records in data.items()}
-
-            # Apply partitioning if enabled
-            if config.get('partitioning', {}).get('enabled'):
-                partitioned_data = self._apply_partitioning(dataframes, config['partitioning'])
-            else:
-                partitioned_data = {name: {'': df} for name, df in dataframes.items()}
-
-            # Process each table and partition
-            upload_tasks = []
-            for table_name, partitions in partitioned_data.items():
-                for partition_key, df in partitions.items():
-                    # Construct S3 key
-                    partition_path = f'{partition_key}/' if partition_key else ''
-                    key = f'{config["prefix"]}{table_name}/{partition_path}{table_name}.{config["format"]}'
-
-                    # Convert to specified format
-                    content = self._convert_format(df, config['format'], config.get('compression'))
-
-                    # Create upload task
-                    task = self._upload_to_s3(
-                        content,
-                        config['bucket'],
-                        key,
-                        config.get('storage', {}),
-                        config.get('metadata', {}),
+            storage_config = config.get('storage', {})
+            extra_args: Dict[str, Any] = {
+                'StorageClass': storage_config.get('class', 'STANDARD'),
+                'Metadata': config.get('metadata', {}),
+            }
+            if storage_config.get('encryption'):
+                extra_args['ServerSideEncryption'] = storage_config['encryption']
+            part_size = int(float(config.get('part_size_mb') or 0) * 1024 * 1024) or PART_SIZE
+
+            def open_sink(path: str) -> S3MultipartSink:
+                return S3MultipartSink(
+                    self.s3_client,
+                    config['bucket'],
+                    f'{config["prefix"]}{path}',
+                    extra_args,
+                    self.upload_executor,
+                    part_size,
+                )
+
+            # Stream the tables in parallel
+            loop = asyncio.get_event_loop()
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        self.executor, stream_table, table_name, records, config, open_sink
                     )
-                    upload_tasks.append(task)
-
-            # Execute uploads in parallel
-            results = await asyncio.gather(*upload_tasks)
+                    for table_name, records in data.items()
+                )
+            )
 
             return {
                 'success': True,
-                'uploaded_files': results,
-                'total_records': sum(len(df) for df in dataframes.values()),
+                'uploaded_files': [uploaded for table in results for uploaded in table],
+                'total_records': sum(len(records) for records in data.values()),
             }
 
         except Exception as e:
             return {'success': False, 'error': str(e)}
-
-    def _convert_format(
-        self, df: pd.DataFrame, format: str, compression: Optional[str] = None
-    ) -> bytes:
-        """Convert DataFrame to specified format.
-
-        Args:
-            df: pandas DataFrame to convert
-            format: Target format (csv, json, parquet)
-            compression: Optional compression type
-
-        Returns:
-            Bytes containing the converted data
-        """
-        if format == 'parquet':
-            return df.to_parquet(compression=compression)
-        elif format == 'csv':
-            csv_data = df.to_csv(index=False)
-            return csv_data.encode() if csv_data is not None else b''
-        elif format == 'json':
-            json_data = df.to_json(orient='records')
-            return json_data.encode() if json_data is not None else b''
-        else:
-            raise ValueError(f'Unsupported format: {format}')
-
-    def _apply_partitioning(
-        self, dataframes: Dict[str, pd.DataFrame], partition_config: Dict[str, Any]
-    ) -> Dict[str, Dict[str, pd.DataFrame]]:
-        """Apply partitioning to DataFrames.
-
-        Args:
-            dataframes: Dictionary of table name to DataFrame
-            partition_config: Partitioning configuration
-
-        Returns:
-            Dictionary mapping table names to dictionaries of partition key to DataFrame
-        """
-        partitioned_data = {}
-        partition_cols = partition_config['columns']
-
-        for table_name, df in dataframes.items():
-            # Skip if partition columns don't exist
-            if not all(col in df.columns for col in partition_cols):
-                partitioned_data[table_name] = {'': df}
-                continue
-
-            # Group by partition columns
-            grouped = df.groupby(partition_cols)
-            partitions = {}
-
-            for group_key, group_df in grouped:
-                # Create partition key
-                if isinstance(group_key, tuple):
-                    partition_key = '/'.join(str(k) for k in group_key)
-                else:
-                    partition_key = str(group_key)
-
-                # Remove partition columns if specified
-                if partition_config.get('drop_columns', False):
-                    group_df = group_df.drop(columns=partition_cols)
-
-                partitions[partition_key] = group_df
-
-            partitioned_data[table_name] = partitions
-
-        return partitioned_data
-
-    async def _upload_to_s3(
-        self, content: bytes, bucket: str, key: str, storage_config: Dict, metadata: Dict
-    ) -> Dict:
-        """Upload content to S3 with specified configuration.
-
-        Args:
-            content: Bytes to upload
-            bucket: S3 bucket name
-            key: S3 object key
-            storage_config: Storage class and encryption settings
-            metadata: Object metadata
-
-        Returns:
-            Dictionary containing upload details
-        """
-        try:
-            # Run S3 upload in thread pool
-            await asyncio.get_event_loop().run_in_executor(
-                self.executor,
-                lambda: self.s3_client.put_object(
-                    Bucket=bucket,
-                    Key=key,
-                    Body=content,
-                    StorageClass=storage_config.get('class', 'STANDARD'),
-                    Metadata=metadata,
-                    **(
-                        {'ServerSideEncryption': storage_config['encryption']}
-                        if storage_config.get('encryption')
-                        else {}
-                    ),
-                ),
-            )
-
-            return {'bucket': bucket, 'key': key, 'size': len(content), 'metadata': metadata}
-
-        except Exception as e:
-            raise Exception(f'Failed to upload to S3: {str(e)}')
@@ -0,0 +1,432 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+
+"""Streaming writers encoding tables chunk by chunk into files and S3 objects."""
+
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, List, Optional
+
+
+# Number of records encoded at once, which is also the size of Parquet row groups
+CHUNK_ROWS = 100_000
+
+# Size of the parts of S3 multipart uploads, S3 requires at least 5 MiB except for the last part
+PART_SIZE = 8 * 1024 * 1024
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+# Number of parts of an object uploaded at the same time
+MAX_PENDING_PARTS = 4
+
+
+class Sink(ABC):
+    """Destination of the bytes of an encoded table.
+
+    The bytes are only visible at the destination once the sink is finished, so a failed
+    table does not leave a partial file or object behind. Sinks are write-only file objects,
+    so that Parquet writers can write to them.
+    """
+
+    closed = False
+
+    def __init__(self):
+        """Initialize the sink."""
+        self.size = 0
+
+    def writable(self) -> bool:
+        """Sinks are writable."""
+        return True
+
+    def flush(self):
+        """Bytes are flushed when the sink is finished."""
+        pass
+
+    @abstractmethod
+    def write(self, b) -> int:
+        """Write bytes to the sink.
+
+        Args:
+            b: Bytes to write
+
+        Returns:
+            Number of bytes written
+        """
+        pass
+
+    @abstractmethod
+    def finish(self) -> Dict[str, Any]:
+        """Make the written bytes visible at the destination.
+
+        Returns:
+            Dictionary describing the written file or object
+        """
+        pass
+
+    @abstractmethod
+    def abort(self):
+        """Discard the written bytes."""
+        pass
+
+
+class LocalFileSink(Sink):
+    """Sink writing a local file."""
+
+    def __init__(self, path: str):
+        """Open a temporary file next to the file to write.
+
+        Args:
+            path: Path of the file
+        """
+        super().__init__()
+        self.path = path
+        self._temporary_path = f'{path}.{os.getpid()}.tmp'
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = open(self._temporary_path, 'wb')
+
+    def write(self, b) -> int:
+        """Write bytes to the temporary file."""
+        written = self._file.write(b)
+        self.size += written
+        return written
+
+    def finish(self) -> Dict[str, Any]:
+        """Move the temporary file to the path of the file."""
+        self._file.close()
+        os.replace(self._temporary_path, self.path)
+        return {'path': self.path, 'size': self.size}
+
+    def abort(self):
+        """Remove the temporary file."""
+        self._file.close()
+        if os.path.exists(self._temporary_path):
+            os.remove(self._temporary_path)
+
+
+class S3MultipartSink(Sink):
+    """Sink uploading an S3 object in parts, several parts at a time.
+
+    Written bytes are buffered until they fill a part, which is then uploaded in the executor.
+    At most max_pending parts are in flight, so the memory used by an upload is bounded by a
+    few parts whatever the size of the object. Objects smaller than a part are uploaded with a
+    single request when the sink is finished.
+    """
+
+    def __init__(
+        self,
+        s3_client: Any,
+        bucket: str,
+        key: str,
+        extra_args: Dict[str, Any],
+        executor: Executor,
+        part_size: int = PART_SIZE,
+        max_pending: int = MAX_PENDING_PARTS,
+    ):
+        """Initialize the upload.
+
+        Args:
+            s3_client: S3 client
+            bucket: S3 bucket name
+            key: S3 object key
+            extra_args: Storage class, encryption and metadata of the object
+            executor: Executor uploading the parts
+            part_size: Size of the parts
+            max_pending: Maximum number of parts uploaded at the same time
+        """
+        super().__init__()
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.extra_args = extra_args
+        self.executor = executor
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._parts: List[Future] = []
+        self._pending = threading.Semaphore(max_pending)
+
+    def write(self, b) -> int:
+        """Buffer bytes, uploading each part once it is full."""
+        self._buffer += b
+        self.size += len(b)
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[: self.part_size]))
+            del self._buffer[: self.part_size]
+        return len(b)
+
+    def _upload_part(self, body: bytes):
+        """Upload a part in the executor, waiting while too many parts are in flight."""
+        if self._upload_id is None:
+            response = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket, Key=self.key, **self.extra_args
+            )
+            self._upload_id = response['UploadId']
+
+        self._pending.acquire()
+        part_number = len(self._parts) + 1
+        try:
+            future = self.executor.submit(
+                self.s3_client.upload_part,
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+        except Exception:
+            self._pending.release()
+            raise
+        future.add_done_callback(lambda _: self._pending.release())
+        self._parts.append(future)
+
+    def finish(self) -> Dict[str, Any]:
+        """Upload the last part and complete the upload."""
+        if self._upload_id is None:
+            self.s3_client.put_object(
+                Bucket=self.bucket, Key=self.key, Body=bytes(self._buffer), **self.extra_args
+            )
+        else:
+            if self._buffer:
+                self._upload_part(bytes(self._buffer))
+            parts = [
+                {'ETag': future.result()['ETag'], 'PartNumber': part_number}
+                for part_number, future in enumerate(self._parts, start=1)
+            ]
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                MultipartUpload={'Parts': parts},
+            )
+        self._buffer = bytearray()
+        return {
+            'bucket': self.bucket,
+            'key': self.key,
+            'size': self.size,
+            'parts': max(len(self._parts), 1),
+            'metadata': self.extra_args.get('Metadata', {}),
+        }
+
+    def abort(self):
+        """Abort the upload, deleting the uploaded parts."""
+        self._buffer = bytearray()
+        if self._upload_id is None:
+            return
+        for future in self._parts:
+            future.cancel()
+        for future in self._parts:
+            if not future.cancelled():
+                future.exception()
+        self.s3_client.abort_multipart_upload(
+            Bucket=self.bucket, Key=self.key, UploadId=self._upload_id
+        )
+
+
+class TableWriter:
+    """Writer encoding the chunks of a table into a sink in a file format."""
+
+    def __init__(
+        self,
+        sink: Sink,
+        format: str,
+        columns: List[str],
+        schema: Optional[pa.Schema] = None,
+        compression: Optional[str] = None,
+    ):
+        """Initialize the writer.
+
+        Args:
+            sink: Destination of the encoded table
+            format: File format (csv, json, parquet)
+            columns: Columns of the table
+            schema: Arrow schema of the table, required for Parquet
+            compression: Optional Parquet compression type
+        """
+        if format not in ('csv', 'json', 'parquet'):
+            raise ValueError(f'Unsupported format: {format}')
+        self.sink = sink
+        self.format = format
+        self.columns = columns
+        self.schema = schema
+        self.compression = compression
+        self.rows = 0
+        self._chunks = 0
+        self._parquet_writer: Optional[pq.ParquetWriter] = None
+
+    def write(self, df: pd.DataFrame):
+        """Encode a chunk of the table.
+
+        Args:
+            df: Rows of the chunk
+        """
+        df = df.reindex(columns=self.columns)
+        if self.format == 'parquet':
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(
+                    self.sink, self.schema, compression=self.compression or 'snappy'
+                )
+            table = pa.Table.from_pandas(df, schema=self.schema, preserve_index=False)
+            self._parquet_writer.write_table(table, row_group_size=max(len(df), 1))
+        elif self.format == 'csv':
+            self.sink.write(df.to_csv(index=False, header=self._chunks == 0).encode())
+        elif len(df):
+            records = df.to_json(orient='records')
+            self.sink.write(b',' if self.rows else b'[')
+            self.sink.write(records[1:-1].encode())
+        self.rows += len(df)
+        self._chunks += 1
+
+    def finish(self) -> Dict[str, Any]:
+        """Finish encoding the table and make it visible at the destination.
+
+        Returns:
+            Dictionary describing the written file or object
+        """
+        if self._chunks == 0:
+            # Write the header of an empty table
+            self.write(pd.DataFrame(columns=self.columns))
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        if self.format == 'json':
+            self.sink.write(b']' if self.rows else b'[]')
+        return {**self.sink.finish(), 'records': self.rows}
+
+    def abort(self):
+        """Discard the encoded table."""
+        self.sink.abort()
+
+
+def get_columns(records: List[Dict]) -> List[str]:
+    """Get the columns of records, in the order they first appear."""
+    return list(dict.fromkeys(column for record in records for column in record))
+
+
+def infer_schema(records: List[Dict], columns: List[str], chunk_rows: int) -> pa.Schema:
+    """Infer the Arrow schema of records chunk by chunk.
+
+    Args:
+        records: Records of the table
+        columns: Columns of the table
+        chunk_rows: Number of records converted at once
+
+    Returns:
+        Schema holding the values of every chunk
+    """
+    schemas = [
+        pa.Schema.from_pandas(
+            pd.DataFrame(records[start : start + chunk_rows], columns=columns),
+            preserve_index=False,
+        )
+        for start in range(0, max(len(records), 1), chunk_rows)
+    ]
+    return pa.unify_schemas(schemas, promote_options='permissive').remove_metadata()
+
+
+def split_partitions(
+    df: pd.DataFrame, partition_config: Dict[str, Any]
+) -> Dict[str, pd.DataFrame]:
+    """Split rows by the values of the partition columns.
+
+    Args:
+        df: Rows to split
+        partition_config: Partitioning configuration
+
+    Returns:
+        Dictionary of partition key to rows, the rows in the default partition if the
+        partition columns do not exist
+    """
+    partition_cols = partition_config['columns']
+    if not all(col in df.columns for col in partition_cols):
+        return {'': df}
+
+    partitions = {}
+    for group_key, group_df in df.groupby(partition_cols):
+        if isinstance(group_key, tuple):
+            partition_key = '/'.join(str(k) for k in group_key)
+        else:
+            partition_key = str(group_key)
+
+        # Remove partition columns if specified
+        if partition_config.get('drop_columns', False):
+            group_df = group_df.drop(columns=partition_cols)
+
+        partitions[partition_key] = group_df
+    return partitions
+
+
+def stream_table(
+    table_name: str,
+    records: List[Dict],
+    config: Dict[str, Any],
+    open_sink: Callable[[str], Sink],
+) -> List[Dict[str, Any]]:
+    """Encode a table chunk by chunk into one sink per partition.
+
+    Only one chunk of the table is converted to a DataFrame at a time, and each encoded chunk
+    is handed to the sink of its partition, so encoding does not copy the whole table.
+
+    Args:
+        table_name: Name of the table
+        records: Records of the table
+        config: Target configuration including:
+            - format: Output format (csv, json, parquet)
+            - partitioning: Optional partitioning configuration
+            - compression: Optional Parquet compression type
+            - chunk_rows: Optional number of records encoded at once
+        open_sink: Function opening the sink of a path relative to the target, such as
+            'orders/pending/orders.csv'
+
+    Returns:
+        Dictionaries describing the written files or objects
+    """
+    format = config['format']
+    chunk_rows = max(int(config.get('chunk_rows') or CHUNK_ROWS), 1)
+    partition_config = config.get('partitioning', {})
+    partitioned = bool(partition_config.get('enabled'))
+
+    columns = get_columns(records)
+    if partitioned and partition_config.get('drop_columns', False):
+        if all(col in columns for col in partition_config['columns']):
+            columns = [col for col in columns if col not in partition_config['columns']]
+    schema = infer_schema(records, columns, chunk_rows) if format == 'parquet' else None
+
+    writers: Dict[str, TableWriter] = {}
+
+    def get_writer(partition_key: str) -> TableWriter:
+        if partition_key not in writers:
+            partition_path = f'{partition_key}/' if partition_key else ''
+            sink = open_sink(f'{table_name}/{partition_path}{table_name}.{format}')
+            writers[partition_key] = TableWriter(
+                sink, format, columns, schema, config.get('compression')
+            )
+        return writers[partition_key]
+
+    try:
+        for start in range(0, len(records), chunk_rows):
+            df = pd.DataFrame(records[start : start + chunk_rows])
+            partitions = split_partitions(df, partition_config) if partitioned else {'': df}
+            for partition_key, partition_df in partitions.items():
+                get_writer(partition_key).write(partition_df)
+        if not writers:
+            get_writer('')
+        return [writer.finish() for writer in writers.values()]
+    except Exception:
+        for writer in writers.values():
+            try:
+                writer.abort()
+            except Exception:
+                pass
+        raise
@@ -11,6 +11,25 @@ from moto import mock_aws
 from typing import Dict, Generator, List
 
 
+def pytest_addoption(parser):
+    """Add command-line options to pytest."""
+    parser.addoption(
+        '--run-benchmarks',
+        action='store_true',
+        default=False,
+        help='Run benchmarks on large generated tables',
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless --run-benchmarks is specified."""
+    if not config.getoption('--run-benchmarks'):
+        skip_benchmark = pytest.mark.skip(reason='need --run-benchmarks option to run')
+        for item in items:
+            if 'benchmark' in item.keywords:
+                item.add_marker(skip_benchmark)
+
+
 @pytest.fixture
 def temp_dir() -> Generator[str, None, None]:
     """Create a temporary directory for test files.
@@ -0,0 +1,167 @@
+"""Tests for the expansion of seed tables into large datasets."""
+
+import numpy as np
+import os
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+from awslabs.syntheticdata_mcp_server.expansion import (
+    CategoricalModel,
+    ColumnModel,
+    DatetimeModel,
+    KeyModel,
+    NumericModel,
+    expand_tables,
+    find_relationships,
+    fit_column,
+    sort_tables,
+)
+
+
+def seed_tables() -> dict:
+    """Get seed tables of customers and their orders."""
+    customers = pd.DataFrame(
+        {
+            'customer_id': ['C001', 'C002', 'C003', 'C004'],
+            'city': ['New York', 'Chicago', 'Chicago', 'Boston'],
+            'signup_date': ['2023-01-05', '2023-02-11', '2023-03-20', '2023-04-02'],
+        }
+    )
+    orders = pd.DataFrame(
+        {
+            'order_id': [101, 102, 103, 104, 105],
+            'customer_id': ['C001', 'C001', 'C002', 'C001', 'C003'],
+            'amount': [99.99, 149.5, 29.99, 19.99, None],
+            'quantity': [1, 2, 1, 3, 1],
+        }
+    )
+    return {'customers': customers, 'orders': orders}
+
+
+def test_fit_column_keys() -> None:
+    """Test that key columns become sequences following the seed format."""
+    model = fit_column(pd.Series(['C001', 'C002', 'C003'], name='customer_id'), True)
+    assert isinstance(model, KeyModel)
+    assert model.values_at(np.array([0, 1, 999])).tolist() == ['C001', 'C002', 'C1000']
+
+    model = fit_column(pd.Series([101, 102], name='order_id'), True)
+    assert model.generate(np.random.default_rng(0), 5, 3).tolist() == [106, 107, 108]
+
+
+def test_column_model_requires_generate() -> None:
+    """Test that a column model without generate cannot be created."""
+
+    class IncompleteModel(ColumnModel):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteModel()  # type: ignore[abstract]
+
+
+def test_fit_column_values() -> None:
+    """Test the models fitted to value columns."""
+    rng = np.random.default_rng(0)
+
+    model = fit_column(pd.Series(['a', 'b', 'a', 'a']), False)
+    assert isinstance(model, CategoricalModel)
+    values = model.generate(rng, 0, 100_000)
+    assert abs((values == 'a').mean() - 0.75) < 0.01
+
+    model = fit_column(pd.Series([99.99, 149.5, 29.99, None]), False)
+    assert isinstance(model, NumericModel)
+    assert model.null_fraction == 0.25
+    values = model.generate(rng, 0, 1000)
+    assert values.min() >= 0
+    assert np.allclose(values, np.round(values, 2))
+
+    model = fit_column(pd.Series(['2023-01-05', '2023-04-02']), False)
+    assert isinstance(model, DatetimeModel)
+    values = model.generate(rng, 0, 1000)
+    assert values.dtype == np.dtype('datetime64[D]')
+    assert values.min() >= np.datetime64('2023-01-05')
+    assert values.max() <= np.datetime64('2023-04-02')
+
+
+@pytest.mark.parametrize('dtype', ['str', 'string'])
+def test_fit_column_string_dates(dtype: str) -> None:
+    """Test fitting dates held in a column with a string dtype."""
+    model = fit_column(pd.Series(['2023-01-05', '2023-04-02'], dtype=dtype), False)
+    assert isinstance(model, DatetimeModel)
+    values = model.generate(np.random.default_rng(0), 0, 1000)
+    assert values.min() >= np.datetime64('2023-01-05')
+    assert values.max() <= np.datetime64('2023-04-02')
+
+
+def test_find_relationships() -> None:
+    """Test finding the columns referencing another table and ordering the tables."""
+    seeds = seed_tables()
+    relationships = find_relationships(seeds)
+    assert [tuple(r) for r in relationships] == [('orders', 'customer_id', 'customers')]
+
+    tables = ['orders', 'customers']
+    assert sort_tables(tables, relationships) == relationships
+    assert tables == ['customers', 'orders']
+
+
+def test_find_relationships_between_independent_tables(temp_dir: str) -> None:
+    """Test that tables which each have their own id and name are not related."""
+    seeds = {
+        'customers': pd.DataFrame(
+            {'id': [1, 2, 3], 'name': ['Ann', 'Bob', 'Cid'], 'city': ['NY', 'SF', 'NY']}
+        ),
+        'products': pd.DataFrame({'id': [1, 2], 'name': ['Pen', 'Cup'], 'price': [1.5, 4.0]}),
+    }
+    assert find_relationships(seeds) == []
+
+    result = expand_tables(seeds, temp_dir, row_counts={'customers': 30, 'products': 20})
+    assert result['relationships'] == []
+    products = pd.read_parquet(result['tables']['products']['path'])
+    assert len(products) == 20
+    assert set(products['name']) <= {'Pen', 'Cup'}
+
+    # A table with a key of its own references another one by a unique column
+    seeds['profiles'] = pd.DataFrame({'profile_id': [7, 8], 'id': [1, 2]})
+    assert [tuple(r) for r in find_relationships(seeds)] == [('profiles', 'id', 'customers')]
+
+
+def test_expand_tables(temp_dir: str) -> None:
+    """Test expanding seed tables while keeping their relationships."""
+    result = expand_tables(
+        seed_tables(),
+        temp_dir,
+        row_counts={'customers': 10_000},
+        chunk_rows=3000,
+        random_seed=1,
+    )
+
+    customers = result['tables']['customers']
+    assert customers['rows'] == 10_000
+    assert customers['row_groups'] == 4
+    assert pq.ParquetFile(customers['path']).metadata.num_row_groups == 4
+    assert result['relationships'][0]['mean_fan_out'] == 1.25
+
+    customers_df = pd.read_parquet(customers['path'])
+    orders_df = pd.read_parquet(result['tables']['orders']['path'])
+    assert len(orders_df) == result['tables']['orders']['rows']
+    assert customers_df['customer_id'].is_unique
+    assert orders_df['order_id'].is_unique
+    assert orders_df['customer_id'].isin(customers_df['customer_id']).all()
+
+    # Every customer places as many orders as some customer of the seed
+    fan_out = orders_df['customer_id'].value_counts()
+    assert set(fan_out.unique()) <= {1, 3}
+    assert abs(len(fan_out) / len(customers_df) - 0.75) < 0.02
+    assert abs(len(orders_df) / len(customers_df) - 1.25) < 0.05
+
+
+def test_expand_tables_scale_factor(temp_dir: str) -> None:
+    """Test expanding tables without row counts and reproducing a dataset."""
+    seeds = seed_tables()
+    first = expand_tables(seeds, os.path.join(temp_dir, 'a'), scale_factor=10, random_seed=7)
+    second = expand_tables(seeds, os.path.join(temp_dir, 'b'), scale_factor=10, random_seed=7)
+
+    assert first['tables']['customers']['rows'] == 40
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(first['tables']['orders']['path']),
+        pd.read_parquet(second['tables']['orders']['path']),
+    )
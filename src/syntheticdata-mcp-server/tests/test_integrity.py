@@ -0,0 +1,133 @@
+"""Tests for the vectorized key and dependency analysis."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from awslabs.syntheticdata_mcp_server.integrity import (
+    determines,
+    factorize_column,
+    find_functional_dependencies,
+    find_missing_values,
+)
+
+
+def groupby_dependencies(df: pd.DataFrame) -> list:
+    """Find functional dependencies by grouping the table for every column pair."""
+    return [
+        (col1, col2)
+        for col1 in df.columns
+        for col2 in df.columns
+        if col1 != col2 and (df.groupby(col1)[col2].nunique() == 1).all()
+    ]
+
+
+def test_factorize_column() -> None:
+    """Test encoding a column with null values."""
+    column = factorize_column(pd.Series(['a', None, 'b', 'a']))
+    assert column.codes.tolist() == [0, -1, 1, 0]
+    assert column.cardinality == 2
+    assert column.has_nulls is True
+
+
+def test_determines() -> None:
+    """Test checking a functional dependency between two columns."""
+    city = factorize_column(pd.Series(['NY', 'NY', 'SF', 'SF']))
+    zip_code = factorize_column(pd.Series(['10001', '10001', '94103', '94103']))
+    name = factorize_column(pd.Series(['a', 'b', 'c', 'd']))
+
+    assert determines(city, zip_code)
+    assert determines(zip_code, city)
+    assert not determines(city, name)
+    # A key determines every column
+    assert determines(name, city)
+
+
+def test_determines_with_nulls() -> None:
+    """Test that values only found with null dependents break the dependency."""
+    city = factorize_column(pd.Series(['NY', 'NY', 'SF']))
+    zip_code = factorize_column(pd.Series(['10001', None, None]))
+
+    assert not determines(city, zip_code)
+    # SF may be found with a zip code in rows outside of a sample
+    assert determines(city, zip_code, exact=False)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_find_functional_dependencies_matches_groupby(seed: int) -> None:
+    """Test that dependencies match those found by grouping, with and without sampling."""
+    rng = np.random.default_rng(seed)
+    rows = 40
+    values = rng.integers(0, 4, rows).astype(float)
+    values_with_nulls = values.copy()
+    values_with_nulls[rng.random(rows) < 0.2] = np.nan
+    df = pd.DataFrame(
+        {
+            'id': np.arange(rows),
+            'group': values,
+            'group_name': [f'g{int(value)}' for value in values],
+            'sparse': values_with_nulls,
+            'flag': rng.integers(0, 2, rows),
+            'constant': 'x',
+        }
+    )
+
+    expected = groupby_dependencies(df)
+
+    assert find_functional_dependencies(df) == expected
+    assert find_functional_dependencies(df, sample_rows=10) == expected
+
+
+def test_find_functional_dependencies_large_table() -> None:
+    """Test that dependencies broken outside of the sample are not reported on large tables."""
+    rng = np.random.default_rng(0)
+    rows = 150_000
+    customer_ids = rng.integers(0, 5000, rows)
+    regions = customer_ids % 10
+    # A single row breaks customer_id -> region, which the sample is unlikely to include
+    regions[rows - 1] = (regions[rows - 1] + 1) % 10
+    status = rng.choice(np.array(['new', 'paid', 'shipped'], dtype=object), rows)
+    status[rng.random(rows) < 0.1] = None
+    df = pd.DataFrame(
+        {
+            'order_id': np.arange(rows),
+            'customer_id': customer_ids,
+            'customer_name': pd.Series(customer_ids).map('c{}'.format),
+            'region': regions,
+            'amount': np.round(rng.random(rows) * 100, 2),
+            'status': status,
+        }
+    )
+
+    dependencies = find_functional_dependencies(df, sample_rows=10_000)
+
+    assert dependencies == groupby_dependencies(df)
+    assert ('customer_id', 'customer_name') in dependencies
+    assert ('customer_id', 'region') not in dependencies
+
+
+def test_find_missing_values_numeric() -> None:
+    """Test finding missing numeric values with a binary search."""
+    source = pd.Series([1, 4, 5, None, 6, 4])
+    target = pd.Series([3, 2, 1, 6])
+    assert sorted(find_missing_values(source, target).tolist()) == [4, 5]
+
+
+def test_find_missing_values_strings() -> None:
+    """Test finding missing string values."""
+    source = pd.Series(['a', 'b', None, 'c'])
+    target = pd.Series(['c', 'a'])
+    assert find_missing_values(source, target).tolist() == ['b']
+
+
+def test_find_missing_values_mixed_types() -> None:
+    """Test that values of different types do not match."""
+    source = pd.Series(['1', '2'])
+    target = pd.Series([1, 2])
+    assert find_missing_values(source, target).tolist() == ['1', '2']
+
+
+def test_find_missing_values_empty_target() -> None:
+    """Test that every value is missing from an empty target."""
+    source = pd.Series([1, 2])
+    target = pd.Series([], dtype=float)
+    assert find_missing_values(source, target).tolist() == [1, 2]
@@ -0,0 +1,112 @@
+"""Benchmark of the vectorized integrity checks against the set and groupby checks they replace.
+
+Run with: pytest tests/test_integrity_benchmark.py --run-benchmarks -s
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import time
+from awslabs.syntheticdata_mcp_server.pandas_interpreter import check_referential_integrity
+from typing import Any, Dict, List
+
+
+def baseline_integrity_issues(dataframes: Dict[str, pd.DataFrame]) -> List[Dict[str, Any]]:
+    """Check referential integrity with Python sets and one groupby per column pair."""
+    issues = []
+    for source_name, source_df in dataframes.items():
+        for target_name, target_df in dataframes.items():
+            if source_name == target_name:
+                continue
+            for col in [col for col in source_df.columns if col in target_df.columns]:
+                if target_df[col].nunique() == len(target_df):
+                    missing_values = set(source_df[col].dropna()) - set(target_df[col])
+                    if missing_values:
+                        issues.append(
+                            {
+                                'type': 'referential_integrity',
+                                'source_table': source_name,
+                                'target_table': target_name,
+                                'column': col,
+                                'missing_values': missing_values,
+                                'missing_count': len(missing_values),
+                            }
+                        )
+
+    for df_name, df in dataframes.items():
+        for col1 in df.columns:
+            for col2 in df.columns:
+                if col1 != col2 and (df.groupby(col1)[col2].nunique() == 1).all():
+                    issues.append(
+                        {
+                            'type': 'functional_dependency',
+                            'table': df_name,
+                            'determinant': col1,
+                            'dependent': col2,
+                        }
+                    )
+    return issues
+
+
+def customers_and_orders(customers: int, orders: int) -> Dict[str, pd.DataFrame]:
+    """Build customers and orders tables, with orders of some unknown customers."""
+    rng = np.random.default_rng(0)
+    cities = np.array([f'city{i}' for i in range(50)], dtype=object)
+    city_codes = rng.integers(0, len(cities), customers)
+    customers_df = pd.DataFrame(
+        {
+            'customer_id': np.arange(customers),
+            'name': pd.Series(np.arange(customers)).map('customer{}'.format),
+            'city': cities[city_codes],
+            'state': city_codes % 10,
+            'signup_date': pd.Timestamp('2023-01-01')
+            + pd.to_timedelta(rng.integers(0, 365, customers), unit='D'),
+            'segment': rng.choice(
+                np.array(['retail', 'smb', 'enterprise'], dtype=object), customers
+            ),
+        }
+    )
+    # About 0.1% of the orders reference customers that do not exist
+    customer_ids = rng.integers(0, int(customers * 1.001), orders)
+    orders_df = pd.DataFrame(
+        {
+            'order_id': np.arange(orders),
+            'customer_id': customer_ids,
+            'amount': np.round(rng.random(orders) * 500, 2),
+            'quantity': rng.integers(1, 10, orders),
+            'status': rng.choice(np.array(['new', 'paid', 'shipped'], dtype=object), orders),
+            'order_date': pd.Timestamp('2024-01-01')
+            + pd.to_timedelta(rng.integers(0, 365, orders), unit='D'),
+        }
+    )
+    return {'customers': customers_df, 'orders': orders_df}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('customers,orders', [(10_000, 100_000), (100_000, 1_000_000)])
+def test_benchmark_check_referential_integrity(customers: int, orders: int) -> None:
+    """Time the integrity checks on customers and orders tables and compare their issues."""
+    dataframes = customers_and_orders(customers, orders)
+
+    started = time.perf_counter()
+    issues = check_referential_integrity(dataframes)
+    vectorized_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    expected = baseline_integrity_issues(dataframes)
+    baseline_seconds = time.perf_counter() - started
+
+    print(
+        f'\n{customers} customers, {orders} orders: vectorized {vectorized_seconds:.2f}s, '
+        f'sets and groupby {baseline_seconds:.2f}s'
+    )
+
+    def summary(issue: Dict[str, Any]) -> tuple:
+        return tuple(
+            value for key, value in issue.items() if key not in ('missing_values', 'message')
+        )
+
+    assert sorted(map(summary, issues)) == sorted(map(summary, expected))
+    for issue, expected_issue in zip(sorted(issues, key=summary), sorted(expected, key=summary)):
+        if issue['type'] == 'referential_integrity':
+            assert set(issue['missing_values']) <= expected_issue['missing_values']
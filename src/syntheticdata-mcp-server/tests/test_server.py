@@ -3,6 +3,7 @@
 import os
 from awslabs.syntheticdata_mcp_server.server import (
     ExecutePandasCodeInput,
+    ExpandSeedDataInput,
     LoadToStorageInput,
     ValidateAndSaveDataInput,
     _extract_key_entities,
@@ -12,6 +13,7 @@ from awslabs.syntheticdata_mcp_server.server import (
     _get_recommended_record_counts,
     _validate_table_data,
     execute_pandas_code,
+    expand_seed_data,
     get_data_gen_instructions,
     load_to_storage,
     main,
@@ -214,6 +216,36 @@ async def test_execute_pandas_code_with_output_dir(temp_dir: str, sample_pandas_
     assert os.path.exists(os.path.join(temp_dir, output_dir))
 
 
+@mark.asyncio
+async def test_expand_seed_data(temp_dir: str, sample_data: dict) -> None:
+    """Test expanding saved seed tables into Parquet files."""
+    await validate_and_save_data(
+        ValidateAndSaveDataInput(data=sample_data, workspace_dir=temp_dir, output_dir='seed')
+    )
+
+    input_data = ExpandSeedDataInput(
+        workspace_dir=temp_dir, seed_dir='seed', scale_factor=100, random_seed=0
+    )
+    result = await expand_seed_data(input_data)
+
+    assert result['success'] is True
+    assert result['output_dir'] == os.path.join(temp_dir, 'expanded')
+    for table_name, records in sample_data.items():
+        table = result['tables'][table_name]
+        assert os.path.exists(table['path'])
+        assert table['rows'] > 0
+
+
+@mark.asyncio
+async def test_expand_seed_data_missing_table(temp_dir: str) -> None:
+    """Test expanding a seed table that was not saved."""
+    input_data = ExpandSeedDataInput(workspace_dir=temp_dir, tables=['customers'])
+    result = await expand_seed_data(input_data)
+
+    assert result['success'] is False
+    assert 'customers' in result['error']
+
+
 def test_validate_table_data() -> None:
     """Test table data validation function."""
     # Valid data
@@ -0,0 +1,62 @@
+"""Tests for local filesystem storage functionality."""
+
+import os
+import pandas as pd
+import pytest
+from awslabs.syntheticdata_mcp_server.storage.loader import UnifiedDataLoader
+from awslabs.syntheticdata_mcp_server.storage.local import LocalTarget
+from pytest import mark
+
+
+@pytest.fixture
+def local_target() -> LocalTarget:
+    """Create a LocalTarget instance."""
+    return LocalTarget()
+
+
+@pytest.mark.parametrize(
+    'config,expected',
+    [
+        ({'path': 'data', 'format': 'csv'}, True),
+        ({'path': 'data', 'format': 'xml'}, False),
+        ({'format': 'csv'}, False),
+    ],
+)
+@mark.asyncio
+async def test_validate(
+    local_target: LocalTarget, sample_data: dict, config: dict, expected: bool
+) -> None:
+    """Test validation of local configurations."""
+    assert await local_target.validate(sample_data, config) is expected
+
+
+@mark.asyncio
+async def test_load(local_target: LocalTarget, temp_dir: str, sample_data: dict) -> None:
+    """Test writing tables with the layout of the S3 target."""
+    config = {
+        'path': temp_dir,
+        'format': 'parquet',
+        'partitioning': {'enabled': True, 'columns': ['status']},
+    }
+
+    result = await local_target.load(sample_data, config)
+
+    assert result['success'] is True
+    assert result['total_records'] == sum(len(records) for records in sample_data.values())
+    paths = [written['path'] for written in result['written_files']]
+    assert os.path.join(temp_dir, 'customers', 'customers.parquet') in paths
+    assert os.path.join(temp_dir, 'orders', 'pending', 'orders.parquet') in paths
+    customers = pd.read_parquet(os.path.join(temp_dir, 'customers', 'customers.parquet'))
+    assert customers.to_dict('records') == sample_data['customers']
+
+
+@mark.asyncio
+async def test_load_with_unified_loader(temp_dir: str, sample_data: dict) -> None:
+    """Test loading data to a local target through the unified loader."""
+    targets = [{'type': 'local', 'config': {'path': temp_dir, 'format': 'json'}}]
+
+    result = await UnifiedDataLoader().load_data(sample_data, targets)
+
+    assert result['success'] is True
+    assert result['results']['local']['success'] is True
+    assert os.path.exists(os.path.join(temp_dir, 'orders', 'orders.json'))
@@ -0,0 +1,381 @@
+"""Tests for streaming table writers."""
+
+import io
+import json
+import os
+import pandas as pd
+import pyarrow as pa
+import pytest
+from awslabs.syntheticdata_mcp_server.storage.s3 import S3Target
+from awslabs.syntheticdata_mcp_server.storage.streaming import (
+    MIN_PART_SIZE,
+    LocalFileSink,
+    S3MultipartSink,
+    Sink,
+    TableWriter,
+    split_partitions,
+    stream_table,
+)
+from concurrent.futures import ThreadPoolExecutor
+from pytest import mark
+from typing import Any, Dict
+
+
+def make_records(count: int) -> list:
+    """Make records with a text column large enough to fill upload parts."""
+    return [
+        {'id': i, 'status': 'even' if i % 2 == 0 else 'odd', 'text': f'{i:08d}' * 16}
+        for i in range(count)
+    ]
+
+
+class BytesSink(Sink):
+    """Sink keeping the written bytes in memory."""
+
+    def __init__(self):
+        """Initialize the sink."""
+        super().__init__()
+        self.content = b''
+        self.finished = False
+
+    def write(self, b) -> int:
+        """Keep the written bytes."""
+        self.content += bytes(b)
+        self.size += len(b)
+        return len(b)
+
+    def finish(self) -> Dict[str, Any]:
+        """Mark the sink finished."""
+        self.finished = True
+        return {'size': self.size}
+
+    def abort(self):
+        """Discard the written bytes."""
+        self.content = b''
+
+
+def write_table(df: pd.DataFrame, format: str, compression: Any = None) -> bytes:
+    """Encode a DataFrame with a table writer."""
+    sink = BytesSink()
+    schema = pa.Schema.from_pandas(df, preserve_index=False) if format == 'parquet' else None
+    writer = TableWriter(sink, format, df.columns.tolist(), schema, compression)
+    writer.write(df)
+    result = writer.finish()
+    assert sink.finished
+    assert result == {'size': len(sink.content), 'records': len(df)}
+    return sink.content
+
+
+def test_sink_requires_finish_and_abort() -> None:
+    """Test a sink cannot be created without finishing and aborting."""
+
+    class IncompleteSink(Sink):
+        def finish(self) -> Dict[str, Any]:
+            return {}
+
+    with pytest.raises(TypeError):
+        IncompleteSink()  # type: ignore[abstract]
+
+
+@pytest.mark.parametrize(
+    'format,compression', [('csv', None), ('json', None), ('parquet', 'snappy')]
+)
+def test_table_writer_formats(format: str, compression: Any) -> None:
+    """Test encoding a DataFrame in each format."""
+    df = pd.DataFrame({'id': [1, 2], 'name': ['test1', 'test2']})
+
+    content = write_table(df, format, compression)
+
+    if format == 'csv':
+        assert content == df.to_csv(index=False).encode()
+    elif format == 'json':
+        assert json.loads(content) == df.to_dict(orient='records')
+    else:
+        assert pd.read_parquet(io.BytesIO(content)).equals(df)
+
+
+def test_table_writer_empty_table() -> None:
+    """Test encoding a table without rows."""
+    df = pd.DataFrame(data={}, columns=pd.Index(['id', 'value']))
+
+    assert write_table(df, 'csv') == b'id,value\n'
+    assert write_table(df, 'json') == b'[]'
+    result_df = pd.read_parquet(io.BytesIO(write_table(df, 'parquet')))
+    assert result_df.columns.tolist() == ['id', 'value']
+    assert len(result_df) == 0
+
+
+def test_table_writer_special_characters() -> None:
+    """Test handling of special characters in data."""
+    df = pd.DataFrame(
+        {
+            'id': [1, 2],
+            'text': ['Test, with comma', 'Test\nwith\nnewlines'],
+            'unicode': ['测试', '🌟'],
+        }
+    )
+
+    csv_content = write_table(df, 'csv')
+    assert b'"Test, with comma"' in csv_content
+    assert b'"Test\nwith\nnewlines"' in csv_content
+
+    json_content = write_table(df, 'json')
+    assert b'Test, with comma' in json_content
+    assert b'Test\\nwith\\nnewlines' in json_content
+    assert json.loads(json_content) == df.to_dict(orient='records')
+
+
+@pytest.mark.parametrize('compression', ['snappy', 'gzip', 'none'])
+def test_table_writer_parquet_compression(compression: str) -> None:
+    """Test Parquet compression options."""
+    df = pd.DataFrame(
+        {'id': range(100), 'text': ['test text ' * 10] * 100, 'numbers': [1.23456789] * 100}
+    )
+
+    content = write_table(df, 'parquet', compression)
+
+    assert len(content) <= len(write_table(df, 'parquet', 'none'))
+    assert pd.read_parquet(io.BytesIO(content)).equals(df)
+
+
+def test_table_writer_parquet_complex_data() -> None:
+    """Test Parquet with complex data types."""
+    df = pd.DataFrame(
+        {
+            'int_col': [1, 2, 3],
+            'float_col': [1.1, 2.2, 3.3],
+            'str_col': ['a', 'b', 'c'],
+            'bool_col': [True, False, True],
+            'datetime_col': pd.date_range('2024-01-01', periods=3),
+            'category_col': pd.Series(['A', 'B', 'A']).astype('category'),
+            'nullable_int': pd.array([1, None, 3], dtype='Int64'),
+            'unicode_col': ['测试', '🌟', 'ascii'],
+        }
+    )
+
+    result_df = pd.read_parquet(io.BytesIO(write_table(df, 'parquet', 'snappy')))
+
+    assert result_df.columns.tolist() == df.columns.tolist()
+    assert len(result_df) == len(df)
+    assert result_df['unicode_col'].tolist() == df['unicode_col'].tolist()
+
+
+def test_table_writer_invalid_format() -> None:
+    """Test a table writer rejects unsupported formats."""
+    with pytest.raises(ValueError, match='Unsupported format'):
+        TableWriter(BytesSink(), 'invalid', ['id'])
+
+
+def test_split_partitions() -> None:
+    """Test splitting rows by a partition column and dropping it."""
+    df = pd.DataFrame(
+        {
+            'order_id': [1, 2, 3, 4],
+            'status': ['pending', 'completed', 'pending', 'shipped'],
+            'amount': [100, 200, 300, 400],
+        }
+    )
+
+    partitions = split_partitions(df, {'columns': ['status'], 'drop_columns': True})
+
+    assert sorted(partitions) == ['completed', 'pending', 'shipped']
+    assert partitions['pending']['order_id'].tolist() == [1, 3]
+    for partition_df in partitions.values():
+        assert 'status' not in partition_df.columns
+
+
+def test_split_partitions_multiple_columns() -> None:
+    """Test partitioning by multiple columns."""
+    df = pd.DataFrame(
+        {
+            'order_id': range(1, 5),
+            'region': ['US', 'US', 'EU', 'EU'],
+            'status': ['completed', 'pending', 'completed', 'pending'],
+            'amount': [100, 200, 300, 400],
+        }
+    )
+
+    partitions = split_partitions(df, {'columns': ['region', 'status'], 'drop_columns': True})
+
+    assert sorted(partitions) == ['EU/completed', 'EU/pending', 'US/completed', 'US/pending']
+    for partition_df in partitions.values():
+        assert partition_df.columns.tolist() == ['order_id', 'amount']
+
+
+def test_split_partitions_missing_columns() -> None:
+    """Test partitioning when the partition columns do not exist."""
+    df = pd.DataFrame({'id': [1, 2], 'value': ['a', 'b']})
+
+    partitions = split_partitions(df, {'columns': ['missing_column'], 'drop_columns': True})
+
+    assert list(partitions) == ['']
+    assert partitions[''].equals(df)
+
+
+def test_split_partitions_with_null_values() -> None:
+    """Test rows with null partition values are skipped."""
+    df = pd.DataFrame(
+        {'id': [1, 2, 3, 4], 'category': ['A', None, 'B', pd.NA], 'value': [10, 20, 30, 40]}
+    )
+
+    partitions = split_partitions(df, {'columns': ['category'], 'drop_columns': True})
+
+    assert sorted(partitions) == ['A', 'B']
+
+
+def test_stream_table_formats(temp_dir: str) -> None:
+    """Test encoding a table in chunks matches encoding it at once."""
+    records = make_records(25)
+    df = pd.DataFrame(records)
+
+    def open_sink(path: str) -> LocalFileSink:
+        return LocalFileSink(os.path.join(temp_dir, path))
+
+    for format in ['csv', 'json', 'parquet']:
+        config = {'format': format, 'chunk_rows': 10}
+        written = stream_table('items', records, config, open_sink)
+        assert len(written) == 1
+        assert written[0]['records'] == 25
+        path = written[0]['path']
+        assert path == os.path.join(temp_dir, 'items', f'items.{format}')
+        assert os.path.getsize(path) == written[0]['size']
+
+        if format == 'csv':
+            with open(path, 'rb') as f:
+                assert f.read() == df.to_csv(index=False).encode()
+        elif format == 'json':
+            with open(path) as f:
+                assert json.load(f) == records
+        else:
+            assert pd.read_parquet(path).equals(df)
+
+
+def test_stream_table_partitions_and_missing_values(temp_dir: str) -> None:
+    """Test partitioning chunks and keeping columns missing from some records."""
+    records = [
+        {'id': 1, 'status': 'a'},
+        {'id': 2, 'status': 'b', 'amount': 1.5},
+        {'id': 3, 'status': 'a', 'amount': None},
+    ]
+    config = {
+        'format': 'parquet',
+        'chunk_rows': 1,
+        'partitioning': {'enabled': True, 'columns': ['status'], 'drop_columns': True},
+    }
+
+    written = stream_table(
+        'orders', records, config, lambda path: LocalFileSink(os.path.join(temp_dir, path))
+    )
+
+    assert sorted(w['records'] for w in written) == [1, 2]
+    df = pd.read_parquet(os.path.join(temp_dir, 'orders', 'a', 'orders.parquet'))
+    assert df.columns.tolist() == ['id', 'amount']
+    assert df['id'].tolist() == [1, 3]
+    assert df['amount'].isna().all()
+
+
+def test_stream_table_error_leaves_no_file(temp_dir: str) -> None:
+    """Test a failed table does not leave partial files behind."""
+    records = [{'id': 1, 'status': 'a'}, {'id': 2, 'status': 'b'}]
+    config = {
+        'format': 'csv',
+        'chunk_rows': 1,
+        'partitioning': {'enabled': True, 'columns': ['status']},
+    }
+
+    def open_sink(path: str) -> LocalFileSink:
+        if '/b/' in path:
+            raise OSError('Disk full')
+        return LocalFileSink(os.path.join(temp_dir, path))
+
+    with pytest.raises(OSError, match='Disk full'):
+        stream_table('bad', records, config, open_sink)
+
+    assert os.listdir(os.path.join(temp_dir, 'bad', 'a')) == []
+
+
+def test_s3_multipart_sink(mock_s3) -> None:
+    """Test uploading an object in several parts."""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        sink = S3MultipartSink(
+            mock_s3, 'test-bucket', 'big.bin', {}, executor, MIN_PART_SIZE, max_pending=2
+        )
+        content = os.urandom(MIN_PART_SIZE * 2 + 100)
+        stream = io.BytesIO(content)
+        while chunk := stream.read(1024 * 1024):
+            sink.write(chunk)
+        result = sink.finish()
+
+    assert result['parts'] == 3
+    assert result['size'] == len(content)
+    body = mock_s3.get_object(Bucket='test-bucket', Key='big.bin')['Body'].read()
+    assert body == content
+
+
+def test_s3_multipart_sink_small_object(mock_s3) -> None:
+    """Test an object smaller than a part is uploaded with its storage options."""
+    extra_args = {
+        'StorageClass': 'STANDARD_IA',
+        'ServerSideEncryption': 'AES256',
+        'Metadata': {'test': 'value'},
+    }
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        sink = S3MultipartSink(mock_s3, 'test-bucket', 'test/file.txt', extra_args, executor)
+        sink.write(b'test content')
+        result = sink.finish()
+
+    assert result == {
+        'bucket': 'test-bucket',
+        'key': 'test/file.txt',
+        'size': 12,
+        'parts': 1,
+        'metadata': {'test': 'value'},
+    }
+    response = mock_s3.get_object(Bucket='test-bucket', Key='test/file.txt')
+    assert response['Body'].read() == b'test content'
+    assert response['StorageClass'] == 'STANDARD_IA'
+    assert response['ServerSideEncryption'] == 'AES256'
+    assert response['Metadata'] == {'test': 'value'}
+
+
+def test_s3_multipart_sink_error(mock_s3) -> None:
+    """Test an upload to a missing bucket fails."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        sink = S3MultipartSink(mock_s3, 'nonexistent-bucket', 'key', {}, executor)
+        sink.write(b'content')
+        with pytest.raises(Exception, match='NoSuchBucket'):
+            sink.finish()
+
+
+def test_s3_multipart_sink_abort(mock_s3) -> None:
+    """Test aborting an upload after some parts were uploaded."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sink = S3MultipartSink(mock_s3, 'test-bucket', 'aborted.bin', {}, executor)
+        sink.write(b'x' * MIN_PART_SIZE)
+        sink.abort()
+
+    assert mock_s3.list_multipart_uploads(Bucket='test-bucket').get('Uploads', []) == []
+    assert 'Contents' not in mock_s3.list_objects_v2(Bucket='test-bucket')
+
+
+@mark.asyncio
+async def test_s3_load_multipart(mock_s3) -> None:
+    """Test loading a table larger than a part with parallel part uploads."""
+    records = make_records(60_000)
+    config = {
+        'bucket': 'test-bucket',
+        'prefix': 'data/',
+        'format': 'csv',
+        'chunk_rows': 5000,
+        'part_size_mb': 5,
+        'storage': {'class': 'STANDARD'},
+    }
+
+    result = await S3Target().load({'items': records}, config)
+
+    assert result['success'] is True
+    uploaded = result['uploaded_files'][0]
+    assert uploaded['key'] == 'data/items/items.csv'
+    assert uploaded['parts'] > 1
+    body = mock_s3.get_object(Bucket='test-bucket', Key='data/items/items.csv')['Body']
+    assert body.read() == pd.DataFrame(records).to_csv(index=False).encode()